@@ -8,6 +8,7 @@ Architecture:
 1. Engine nodes: Convert to pandas (e.g., dataset.to_pandas(), toPandas())
 2. orchestrator.py: Generate cumulative tiles
 3. tile_subtraction.py: Convert cumulative tiles to windowed aggregations
+   (both built on the vectorized NumPy kernels of kernels.py)
 4. Engine nodes: Convert back to engine format (e.g., from_pandas(), createDataFrame())
 """
 
@@ -1,7 +1,7 @@
 """
 Base utilities for tiling.
 
-- Orchestrator works in pure pandas
+- Orchestrator works on pandas data with vectorized NumPy kernels
 - Engine-specific nodes do direct DataFrame conversions.
 """
 
@@ -17,7 +17,7 @@ class IRMetadata:
     Metadata about intermediate representations for an aggregation.
 
     Attributes:
-        type: "algebraic" (sum, count, max, min) or "holistic" (avg, std, var)
+        type: "algebraic" (sum, count, max, min, last) or "holistic" (avg, std, var)
         ir_columns: List of IR column names (e.g., ["sum", "count"] for avg)
         computation: String describing how to compute final value from IRs
     """
@@ -51,7 +51,7 @@ def get_ir_metadata_for_aggregation(
     agg_type = agg.function.lower()
 
     # Algebraic aggregations
-    if agg_type in ["sum", "count", "max", "min"]:
+    if agg_type in ["sum", "count", "max", "min", "last"]:
         return ([], IRMetadata(type="algebraic"))
 
     # Holistic aggregations (need intermediate representations)
@@ -0,0 +1,190 @@
+"""
+Vectorized kernels for tiling.
+
+Rows are sorted once by (entity, hop) and every aggregation is computed with a single NumPy segment
+reduction (`ufunc.reduceat`) over the sorted values, instead of a pandas groupby with per-group Python
+callables. Tiles are laid out on a dense (entity, hop) grid, which turns cumulative sums into `cumsum`
+along the hop axis and window merges into shifted differences or sliding reductions.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Aggregations whose tiles hold per-hop values merged over the window, rather than cumulative values
+# subtracted at the window boundaries.
+WINDOW_MERGED_FUNCTIONS = ("min", "max", "last")
+
+SUPPORTED_FUNCTIONS = (
+    "sum",
+    "count",
+    "avg",
+    "mean",
+    "std",
+    "stddev",
+    "var",
+    "variance",
+) + WINDOW_MERGED_FUNCTIONS
+
+
+def to_epoch_ms(timestamps: pd.Series) -> np.ndarray:
+    """Converts a timestamp column of any datetime unit or timezone to epoch milliseconds."""
+    return pd.to_datetime(timestamps).to_numpy(dtype="datetime64[ms]").astype(np.int64)
+
+
+def entity_codes(df: pd.DataFrame, keys: List[str]) -> Tuple[np.ndarray, pd.DataFrame]:
+    """
+    Assigns a dense integer code to every distinct combination of entity keys.
+
+    Codes follow the sort order of the keys. Rows with a missing key get the code -1.
+
+    Returns:
+        The code of every row, and a DataFrame with the key values of every code.
+    """
+    codes = df.groupby(keys, sort=True).ngroup().to_numpy(dtype=np.int64)
+    valid = codes >= 0
+    first_rows = np.full(codes.max() + 1 if valid.any() else 0, -1, dtype=np.int64)
+    # Writing positions in reverse order leaves the first row of every code.
+    first_rows[codes[valid][::-1]] = np.flatnonzero(valid)[::-1]
+    return codes, df[keys].iloc[first_rows].reset_index(drop=True)
+
+
+def segment_starts(sorted_segments: np.ndarray) -> np.ndarray:
+    """Returns the index of the first element of every run of equal values in a sorted array."""
+    if len(sorted_segments) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(
+        np.concatenate(([True], sorted_segments[1:] != sorted_segments[:-1]))
+    )
+
+
+def reduce_segments(
+    function: str, values: pd.Series, starts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces every segment of values sorted by segment and time, ignoring missing values.
+
+    Args:
+        function: One of "sum", "count", "sum_sq", "min", "max" or "last".
+        values: The values, sorted by segment and then by time.
+        starts: The index of the first value of every segment.
+
+    Returns:
+        The reduced value of every segment, and whether the segment had any non-missing value.
+    """
+    present = values.notna().to_numpy()
+    present_counts = np.add.reduceat(present.astype(np.int64), starts)
+    has_values = present_counts > 0
+
+    if function == "count":
+        return present_counts.astype(np.float64), has_values
+    if function == "last":
+        positions = np.where(present, np.arange(len(present)), -1)
+        last_positions = np.maximum.reduceat(positions, starts)
+        result = _as_array(values)[np.maximum(last_positions, 0)]
+        result[~has_values] = None if result.dtype == object else np.nan
+        return result, has_values
+
+    numeric = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    if function == "sum":
+        return np.add.reduceat(np.where(present, numeric, 0.0), starts), has_values
+    if function == "sum_sq":
+        return (
+            np.add.reduceat(np.where(present, numeric * numeric, 0.0), starts),
+            has_values,
+        )
+    if function == "min":
+        return np.fmin.reduceat(numeric, starts), has_values
+    if function == "max":
+        return np.fmax.reduceat(numeric, starts), has_values
+    raise ValueError(f"Unsupported segment reduction {function}")
+
+
+def scatter_to_grid(
+    values: np.ndarray, positions: np.ndarray, shape: Tuple[int, int], fill_value
+) -> np.ndarray:
+    """Places values at flat positions of a dense (entity, hop) grid, filling the rest with `fill_value`."""
+    grid = np.full(shape[0] * shape[1], fill_value, dtype=values.dtype)
+    grid[positions] = values
+    return grid.reshape(shape)
+
+
+def shift_hops(grid: np.ndarray, hops: int, fill_value) -> np.ndarray:
+    """Returns the grid value `hops` hops earlier for every cell, or `fill_value` before the first hop."""
+    shifted = np.full_like(grid, fill_value)
+    if hops < grid.shape[1]:
+        shifted[:, hops:] = grid[:, : grid.shape[1] - hops]
+    return shifted
+
+
+def sliding_reduce(
+    function: str, grid: np.ndarray, present: np.ndarray, window_hops: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merges per-hop values over the last `window_hops` hops of every cell of a dense (entity, hop) grid.
+
+    Args:
+        function: One of "min", "max" or "last".
+        grid: The per-hop values.
+        present: Whether every hop had any value.
+        window_hops: The number of hops in a window, including the current one.
+
+    Returns:
+        The merged values, and whether any hop of the window had a value.
+    """
+    num_hops = grid.shape[1]
+    hop_index = np.arange(num_hops)
+    last_present = np.maximum.accumulate(np.where(present, hop_index, -1), axis=1)
+    window_present = (last_present >= 0) & (hop_index - last_present < window_hops)
+
+    if function == "last":
+        rows = np.arange(grid.shape[0])[:, None]
+        merged = grid[rows, np.maximum(last_present, 0)]
+        if merged.dtype == object:
+            merged[~window_present] = None
+        else:
+            merged = np.where(window_present, merged, np.nan)
+        return merged, window_present
+
+    ufunc = np.fmin if function == "min" else np.fmax
+    padded = np.concatenate(
+        (np.full((grid.shape[0], window_hops - 1), np.nan), grid), axis=1
+    )
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window_hops, axis=1)
+    return ufunc.reduce(windows, axis=-1), window_present
+
+
+def finalize_from_irs(function: str, irs: List[np.ndarray]) -> np.ndarray:
+    """
+    Computes the final value of a holistic aggregation from its IRs.
+
+    Args:
+        function: The aggregation function, e.g. "avg" or "std".
+        irs: The values of the IR columns, in the order of `IRMetadata.ir_columns` (sum, count and for
+            std and var the sum of squares).
+    """
+    sums, counts = irs[0], irs[1]
+    if function in ("avg", "mean"):
+        return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+    squared_sums_over_counts = np.divide(
+        sums * sums, counts, out=np.zeros_like(sums), where=counts > 0
+    )
+    variance = np.divide(
+        irs[2] - squared_sums_over_counts,
+        counts - 1,
+        out=np.zeros_like(sums),
+        where=counts > 1,
+    )
+    # Clip the tiny negative values left by floating point cancellation.
+    variance = np.maximum(variance, 0.0)
+    return np.sqrt(variance) if function in ("std", "stddev") else variance
+
+
+def _as_array(values: pd.Series) -> np.ndarray:
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(
+        values.dtype
+    ):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values.to_numpy(dtype=object)
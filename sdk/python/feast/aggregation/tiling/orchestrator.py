@@ -1,18 +1,28 @@
 """
 Tiling orchestrator.
 
-This module provides the core tiling logic using pure pandas operations.
+This module provides the core tiling logic, computed with vectorized NumPy kernels on pandas data.
 Engines (Spark, Ray, etc.) just need to convert to/from pandas.
 """
 
 from datetime import timedelta
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Dict, List
 
 import numpy as np
 import pandas as pd
 
 from feast.aggregation import Aggregation
 from feast.aggregation.tiling.base import get_ir_metadata_for_aggregation
+from feast.aggregation.tiling.kernels import (
+    SUPPORTED_FUNCTIONS,
+    WINDOW_MERGED_FUNCTIONS,
+    entity_codes,
+    finalize_from_irs,
+    reduce_segments,
+    scatter_to_grid,
+    segment_starts,
+    to_epoch_ms,
+)
 
 
 def apply_sawtooth_window_tiling(
@@ -30,6 +40,12 @@ def apply_sawtooth_window_tiling(
     merged to compute sliding window aggregations. For sawtooth windows, tiles
     at time T contain the aggregation from the start of the window to T.
 
+    Tiles are computed on a dense grid of hops per entity: rows are sorted once by
+    entity, hop and timestamp, each aggregation is reduced per hop with a single
+    segment reduction, and cumulative values are running sums along the hops.
+    Tiles of min, max and last hold the value of their own hop instead, since those
+    can't be subtracted; they are merged over the window in tile subtraction.
+
     Args:
         df: Pandas DataFrame with input data
         aggregations: List of aggregation specifications
@@ -44,150 +60,82 @@ def apply_sawtooth_window_tiling(
     if df.empty:
         return df
 
-    # Step 1: Add hop interval column
     hop_size_ms = int(hop_size.total_seconds() * 1000)
-
-    # Convert timestamp to milliseconds
-    if pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
-        timestamp_ms = df[timestamp_col].astype("int64") // 10**6
-    else:
-        timestamp_ms = pd.to_datetime(df[timestamp_col]).astype("int64") // 10**6
-
-    # Compute hop interval (inclusive lower boundaries)
-    df["_hop_interval"] = (timestamp_ms // hop_size_ms) * hop_size_ms
-
-    # Step 2: Group by entity keys + hop interval and aggregate
-    agg_dict: Dict[str, Tuple[str, Union[str, Callable[[Any], Any]]]] = {}
-    ir_metadata_dict = {}
-
+    window_seconds = int(window_size.total_seconds())
     for agg in aggregations:
-        feature_name = (
-            f"{agg.function}_{agg.column}_{int(window_size.total_seconds())}s"
-        )
-        _, metadata = get_ir_metadata_for_aggregation(agg, feature_name)
-        ir_metadata_dict[feature_name] = metadata
-
-        # Build pandas aggregation dict based on IR metadata
-        if metadata.type == "algebraic":
-            # Algebraic aggregations: just aggregate directly
-            if agg.function == "sum":
-                agg_dict[f"_tail_{feature_name}"] = (agg.column, "sum")
-            elif agg.function == "count":
-                agg_dict[f"_tail_{feature_name}"] = (agg.column, "count")
-            elif agg.function == "max":
-                agg_dict[f"_tail_{feature_name}"] = (agg.column, "max")
-            elif agg.function == "min":
-                agg_dict[f"_tail_{feature_name}"] = (agg.column, "min")
-
-        elif metadata.type in ("holistic", "avg", "std", "var"):
-            # Holistic aggregations: compute IRs
-            if metadata.ir_columns:
-                ir_column_names = metadata.ir_columns
-
-                # For avg: compute sum and count
-                if len(ir_column_names) >= 2:
-                    agg_dict[ir_column_names[0]] = (agg.column, "sum")  # sum
-                    agg_dict[ir_column_names[1]] = (agg.column, "count")  # count
-
-                    # For std/var: also compute sum of squares
-                    if len(ir_column_names) >= 3:
-                        agg_dict[ir_column_names[2]] = (
-                            agg.column,
-                            lambda x: (x**2).sum(),
-                        )  # sum_sq
-
-    # Perform aggregation within each hop
-    grouped = df.groupby(group_by_keys + ["_hop_interval"], as_index=False)
-    hop_aggregated = grouped.agg(**agg_dict) if agg_dict else grouped.first()
-
-    # Step 3: Compute cumulative sums (convert hop aggregations to cumulative tiles)
-    result = hop_aggregated.copy()
-
-    # Sort by entity keys and hop interval
-    result = result.sort_values(by=group_by_keys + ["_hop_interval"]).reset_index(
-        drop=True
-    )
-
-    # For each IR column, compute cumulative sum within each entity group
-    ir_columns = [
-        col for col in result.columns if col not in group_by_keys + ["_hop_interval"]
-    ]
-
-    if ir_columns:
-        # Generate a complete grid of hop intervals for forward-filling
-        # This ensures we have tiles even where no data exists
-        min_hop = result["_hop_interval"].min()
-        max_hop = result["_hop_interval"].max()
-        all_hops = range(int(min_hop), int(max_hop) + hop_size_ms, hop_size_ms)
-
-        # Create cumulative tiles for each entity
-        cumulative_results = []
-        for entity_values, group_df in result.groupby(group_by_keys):
-            # Create complete hop grid for this entity
-            entity_dict = dict(
-                zip(
-                    group_by_keys,
-                    entity_values
-                    if isinstance(entity_values, tuple)
-                    else (entity_values,),
-                )
-            )
-            complete_grid = pd.DataFrame(
-                {**entity_dict, "_hop_interval": list(all_hops)}
+        if agg.function.lower() not in SUPPORTED_FUNCTIONS:
+            raise ValueError(
+                f"Aggregation function '{agg.function}' is not supported with tiling. "
+                f"Supported functions are {list(SUPPORTED_FUNCTIONS)}."
             )
 
-            # Left join actual data
-            merged = complete_grid.merge(
-                group_df, on=group_by_keys + ["_hop_interval"], how="left"
-            )
+    # Step 1: Assign every row to an entity and a hop interval (inclusive lower boundaries)
+    codes, entities = entity_codes(df, group_by_keys)
+    valid_rows = np.flatnonzero(codes >= 0)
+    codes = codes[valid_rows]
+    timestamp_ms = to_epoch_ms(df[timestamp_col])[valid_rows]
+    hop_interval = (timestamp_ms // hop_size_ms) * hop_size_ms
+
+    min_hop = int(hop_interval.min())
+    num_hops = (int(hop_interval.max()) - min_hop) // hop_size_ms + 1
+    grid_shape = (len(entities), num_hops)
+
+    # Step 2: Sort rows by (entity, hop, timestamp), so that every hop of every entity is a contiguous segment
+    segments = codes * num_hops + (hop_interval - min_hop) // hop_size_ms
+    order = np.lexsort((timestamp_ms, segments))
+    sorted_segments = segments[order]
+    starts = segment_starts(sorted_segments)
+    grid_positions = sorted_segments[starts]
+    sorted_rows = valid_rows[order]
+
+    # Step 3: Reduce every hop, and compute cumulative tiles along the hops of every entity
+    columns: Dict[str, np.ndarray] = {}
+
+    def cumulative_tiles(reduction: str, values: pd.Series) -> np.ndarray:
+        reduced, _ = reduce_segments(reduction, values, starts)
+        grid = scatter_to_grid(reduced, grid_positions, grid_shape, 0.0)
+        return np.cumsum(grid, axis=1).ravel()
 
-            # Fill NaN with 0 for IR columns
-            for col in ir_columns:
-                if col in merged.columns:
-                    merged[col] = merged[col].fillna(0)
-
-            # Compute cumulative sum for IR columns
-            for col in ir_columns:
-                if col in merged.columns:
-                    merged[col] = merged[col].cumsum()
-
-            cumulative_results.append(merged)
-
-        result = pd.concat(cumulative_results, ignore_index=True)
-
-    # Step 4: Add tile metadata
-    result["_tile_start"] = result["_hop_interval"]
-    result["_tile_end"] = result["_hop_interval"] + hop_size_ms
-
-    # Step 5: Compute final feature values from IRs (for algebraic aggs, just rename)
     for agg in aggregations:
-        feature_name = (
-            f"{agg.function}_{agg.column}_{int(window_size.total_seconds())}s"
-        )
-        metadata = ir_metadata_dict[feature_name]
-
-        if metadata.type == "algebraic":
-            # For algebraic, final value = IR value
-            ir_col = f"_tail_{feature_name}"
-            if ir_col in result.columns:
-                result[feature_name] = result[ir_col]
-
-        elif metadata.type in ("holistic", "avg", "std", "var"):
-            # For holistic, compute final value from IRs
-            if metadata.ir_columns:
-                # Use IR column names directly (they have _tail_ prefix)
-                ir_column_names = metadata.ir_columns
-
-                if len(ir_column_names) >= 2:
-                    sum_col = ir_column_names[0]
-                    count_col = ir_column_names[1]
-
-                    if sum_col in result.columns and count_col in result.columns:
-                        # Compute avg = sum / count
-                        result[feature_name] = np.where(
-                            result[count_col] > 0,
-                            result[sum_col] / result[count_col],
-                            0,
-                        )
-
-    return result
+        function = agg.function.lower()
+        feature_name = f"{agg.function}_{agg.column}_{window_seconds}s"
+        _, metadata = get_ir_metadata_for_aggregation(agg, feature_name)
+        values = df[agg.column].iloc[sorted_rows]
+
+        if metadata.ir_columns:
+            # Holistic aggregations: cumulative IRs, final value computed from them
+            for ir_column, reduction in zip(
+                metadata.ir_columns, ("sum", "count", "sum_sq")
+            ):
+                columns[ir_column] = cumulative_tiles(reduction, values)
+            columns[feature_name] = finalize_from_irs(
+                function, [columns[c] for c in metadata.ir_columns]
+            )
+        elif function in WINDOW_MERGED_FUNCTIONS:
+            reduced, _ = reduce_segments(function, values, starts)
+            fill_value = None if reduced.dtype == object else np.nan
+            columns[f"_tail_{feature_name}"] = scatter_to_grid(
+                reduced, grid_positions, grid_shape, fill_value
+            ).ravel()
+            columns[feature_name] = columns[f"_tail_{feature_name}"]
+        else:
+            # Algebraic aggregations: the final value is the IR
+            columns[f"_tail_{feature_name}"] = cumulative_tiles(function, values)
+            columns[feature_name] = columns[f"_tail_{feature_name}"]
+
+    # Step 4: Lay out one tile per entity and hop, with tile metadata
+    hop_intervals = np.tile(
+        min_hop + np.arange(num_hops, dtype=np.int64) * hop_size_ms, len(entities)
+    )
+    tiles = {
+        "_hop_interval": hop_intervals,
+        **{name: v for name, v in columns.items() if name.startswith("_tail_")},
+        "_tile_start": hop_intervals,
+        "_tile_end": hop_intervals + hop_size_ms,
+        **{name: v for name, v in columns.items() if not name.startswith("_tail_")},
+    }
+    result = entities.iloc[np.repeat(np.arange(len(entities)), num_hops)]
+    return pd.concat(
+        [result.reset_index(drop=True), pd.DataFrame(tiles)],
+        axis=1,
+    )
@@ -8,10 +8,23 @@ to windowed aggregations. All compute engines use this shared logic.
 from datetime import timedelta
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from feast.aggregation import Aggregation
 from feast.aggregation.tiling.base import get_ir_metadata_for_aggregation
+from feast.aggregation.tiling.kernels import (
+    WINDOW_MERGED_FUNCTIONS,
+    entity_codes,
+    finalize_from_irs,
+    scatter_to_grid,
+    segment_starts,
+    shift_hops,
+    sliding_reduce,
+)
+
+# Internal tile metadata columns, which are dropped from windowed aggregations
+TILE_METADATA_COLUMNS = ["_tile_start", "_tile_end", "_hop_interval"]
 
 
 def convert_cumulative_to_windowed(
@@ -47,112 +60,102 @@ def convert_cumulative_to_windowed(
         return tiles_df
 
     window_size_ms = int(window_size.total_seconds() * 1000)
-
-    windowed_results = []
-
-    # Group by entity keys to process each entity separately
-    for entity_group, group_df in tiles_df.groupby(entity_keys):
-        # Sort by _tile_end to ensure correct temporal ordering
-        group_df = group_df.sort_values("_tile_end").reset_index(drop=True)
-
-        # For each tile, compute windowed aggregation by subtracting previous tile
-        for idx, row in group_df.iterrows():
-            tile_end = int(row["_tile_end"])
-            window_start = tile_end - window_size_ms
-
-            exact_match = group_df[group_df["_tile_end"] == window_start]
-            if len(exact_match) > 0:
-                prev_tile = exact_match.iloc[0]
-                has_prev_tile = True
-            else:
-                # Only use exact matches to ensure correct window boundaries
-                # If no exact match exists, any previous tile would end before
-                # window_start, which would compute an incorrect window that's
-                # larger than requested
-                has_prev_tile = False
-
-            # Create windowed row (will contain windowed aggregations)
-            windowed_row = row.to_dict()
-
-            # Subtract previous tile values from current tile for each aggregation
-            for agg in aggregations:
-                feature_name = (
-                    f"{agg.function}_{agg.column}_{int(window_size.total_seconds())}s"
-                )
-                _, metadata = get_ir_metadata_for_aggregation(agg, feature_name)
-
-                if metadata.type == "algebraic":
-                    # For algebraic aggregations: sum and count can be subtracted
-                    if feature_name in group_df.columns:
-                        current_val = float(row[feature_name])
-
-                        if agg.function.lower() in ("max", "min"):
-                            if has_prev_tile and feature_name in prev_tile.index:
-                                prev_val = float(prev_tile[feature_name])
-                                windowed_row[feature_name] = current_val
-                            else:
-                                windowed_row[feature_name] = current_val
-                        else:
-                            # For sum and count: subtract previous from current
-                            if has_prev_tile and feature_name in prev_tile.index:
-                                prev_val = float(prev_tile[feature_name])
-                            else:
-                                prev_val = 0.0
-                            windowed_row[feature_name] = current_val - prev_val
-
-                elif metadata.type in ("holistic", "avg", "std", "var"):
-                    # For holistic aggregations:
-                    # 1. Subtract each IR component: windowed_IR = current_IR - previous_IR
-                    # 2. Recompute final value from windowed IRs
-                    if metadata.ir_columns:
-                        ir_column_names = metadata.ir_columns
-
-                        # Subtract each IR component
-                        for ir_col in ir_column_names:
-                            if ir_col in group_df.columns:
-                                current_ir = row[ir_col]
-                                if has_prev_tile and ir_col in prev_tile.index:
-                                    prev_ir = prev_tile[ir_col]
-                                else:
-                                    prev_ir = 0
-                                windowed_row[ir_col] = current_ir - prev_ir
-
-                        # Recompute final value from windowed IRs
-                        if len(ir_column_names) >= 2:
-                            sum_col = ir_column_names[
-                                0
-                            ]  # e.g., "_tail_avg_amount_3600s_sum"
-                            count_col = ir_column_names[
-                                1
-                            ]  # e.g., "_tail_avg_amount_3600s_count"
-
-                            if sum_col in windowed_row and count_col in windowed_row:
-                                count_val = windowed_row[count_col]
-                                if count_val <= 0:
-                                    windowed_row[feature_name] = 0
-                                else:
-                                    # avg = windowed_sum / windowed_count
-                                    windowed_row[feature_name] = (
-                                        windowed_row[sum_col] / count_val
-                                    )
-
-            # Set event_timestamp to the tile end time
-            windowed_row[timestamp_col] = pd.to_datetime(tile_end, unit="ms")
-
-            windowed_results.append(windowed_row)
-
-    if not windowed_results:
-        return pd.DataFrame()
-
-    # Create DataFrame from windowed results
-    result_df = pd.DataFrame(windowed_results)
-
-    # Drop internal tile metadata columns
-    cols_to_drop = ["_tile_start", "_tile_end", "_hop_interval"]
+    window_seconds = int(window_size.total_seconds())
+
+    codes, entities = entity_codes(tiles_df, entity_keys)
+    valid_rows = np.flatnonzero(codes >= 0)
+    codes = codes[valid_rows]
+    tile_end = tiles_df["_tile_end"].to_numpy(dtype=np.int64)[valid_rows]
+    tile_start = tiles_df["_tile_start"].to_numpy(dtype=np.int64)[valid_rows]
+    if not len(valid_rows):
+        # Every tile has a missing entity key
+        result_df = tiles_df.iloc[:0].reset_index(drop=True)
+        result_df[timestamp_col] = pd.to_datetime(tile_end, unit="ms")
+        return result_df.drop(
+            columns=[c for c in TILE_METADATA_COLUMNS if c in result_df.columns]
+        )
+
+    # Lay the tiles out on a dense (entity, hop) grid
+    hop_size_ms = int(tile_end[0] - tile_start[0])
+    min_tile_end = int(tile_end.min())
+    if np.any((tile_end - min_tile_end) % hop_size_ms):
+        raise ValueError("Tile ends must be aligned on the hop size.")
+    hop_index = (tile_end - min_tile_end) // hop_size_ms
+    num_hops = int(hop_index.max()) + 1
+    grid_shape = (len(entities), num_hops)
+    grid_positions = codes * num_hops + hop_index
+
+    # Only use exact matches to ensure correct window boundaries. If no tile ends exactly at the window start,
+    # any previous tile would end before it and give a window that's larger than requested, so nothing is
+    # subtracted.
+    has_tile = scatter_to_grid(
+        np.ones(len(codes), dtype=bool), grid_positions, grid_shape, False
+    )
+    window_hops = -(-window_size_ms // hop_size_ms)
+    if window_size_ms % hop_size_ms == 0:
+        has_prev_tile = shift_hops(has_tile, window_hops, False)
+    else:
+        has_prev_tile = np.zeros(grid_shape, dtype=bool)
+
+    def subtract_previous_tile(column: str) -> np.ndarray:
+        grid = scatter_to_grid(
+            tiles_df[column].to_numpy(dtype=np.float64)[valid_rows],
+            grid_positions,
+            grid_shape,
+            0.0,
+        )
+        prev_grid = np.where(has_prev_tile, shift_hops(grid, window_hops, 0.0), 0.0)
+        return (grid - prev_grid).ravel()[grid_positions]
+
+    windowed = {}
+    for agg in aggregations:
+        function = agg.function.lower()
+        feature_name = f"{agg.function}_{agg.column}_{window_seconds}s"
+        _, metadata = get_ir_metadata_for_aggregation(agg, feature_name)
+
+        if metadata.ir_columns:
+            # For holistic aggregations:
+            # 1. Subtract each IR component: windowed_IR = current_IR - previous_IR
+            # 2. Recompute final value from windowed IRs
+            if not all(c in tiles_df.columns for c in metadata.ir_columns):
+                continue
+            for ir_column in metadata.ir_columns:
+                windowed[ir_column] = subtract_previous_tile(ir_column)
+            windowed[feature_name] = finalize_from_irs(
+                function, [windowed[c] for c in metadata.ir_columns]
+            )
+            continue
+
+        if feature_name not in tiles_df.columns:
+            continue
+        if function in WINDOW_MERGED_FUNCTIONS:
+            # Min, max and last tiles hold per-hop values, merged over the hops of the window
+            hop_values = tiles_df[feature_name].to_numpy()[valid_rows]
+            if hop_values.dtype != object:
+                hop_values = hop_values.astype(np.float64)
+            fill_value = None if hop_values.dtype == object else np.nan
+            grid = scatter_to_grid(hop_values, grid_positions, grid_shape, fill_value)
+            merged, _ = sliding_reduce(
+                function, grid, pd.notna(grid), max(window_hops, 1)
+            )
+            windowed[feature_name] = merged.ravel()[grid_positions]
+        else:
+            # For sum and count: subtract previous from current
+            windowed[feature_name] = subtract_previous_tile(feature_name)
+        if f"_tail_{feature_name}" in tiles_df.columns:
+            windowed[f"_tail_{feature_name}"] = windowed[feature_name]
+
+    result_df = tiles_df.iloc[valid_rows].reset_index(drop=True)
+    for column, values in windowed.items():
+        result_df[column] = values
+    # Set event_timestamp to the tile end time
+    result_df[timestamp_col] = pd.to_datetime(tile_end, unit="ms")
+
+    # Drop internal tile metadata columns, and order the rows by entity and tile end
     result_df = result_df.drop(
-        columns=[c for c in cols_to_drop if c in result_df.columns]
+        columns=[c for c in TILE_METADATA_COLUMNS if c in result_df.columns]
     )
-    return result_df
+    return result_df.iloc[np.lexsort((tile_end, codes))].reset_index(drop=True)
 
 
 def deduplicate_keep_latest(
@@ -172,8 +175,15 @@ def deduplicate_keep_latest(
     if df.empty or timestamp_col not in df.columns:
         return df
 
-    return (
-        df.sort_values(by=timestamp_col, ascending=False)
-        .groupby(entity_keys, as_index=False)
-        .first()
+    codes, _ = entity_codes(df, entity_keys)
+    valid_rows = np.flatnonzero(codes >= 0)
+    timestamps = (
+        pd.to_datetime(df[timestamp_col])
+        .to_numpy(dtype="datetime64[ns]")
+        .astype(np.int64)[valid_rows]
     )
+
+    # Sort by entity and timestamp, and keep the last row of every entity
+    order = valid_rows[np.lexsort((timestamps, codes[valid_rows]))]
+    last_rows = np.append(segment_starts(codes[order])[1:], len(order)) - 1
+    return df.iloc[order[last_rows]].reset_index(drop=True)
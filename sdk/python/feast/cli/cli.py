@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -494,17 +495,41 @@ def init_command(project_directory, minimal: bool, template: str, repo_path: str
     default=5,
     show_default=True,
 )
+@click.option(
+    "--async",
+    "use_async",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Serve with grpc.aio, reading online features asynchronously when the online store supports it",
+)
+@click.option(
+    "--stream_window",
+    type=click.INT,
+    default=32,
+    show_default=True,
+    help="Number of requests of a GetOnlineFeaturesStream call served concurrently in async mode",
+)
 @click.pass_context
 def listen_command(
     ctx: click.Context,
     address: str,
     max_workers: int,
     registry_ttl_sec: int,
+    use_async: bool,
+    stream_window: int,
 ):
     """Start a gRPC feature server to ingest streaming features on given address"""
-    from feast.infra.contrib.grpc_server import get_grpc_server
+    from feast.infra.contrib.grpc_server import get_grpc_server, serve_async_grpc
 
     store = create_feature_store(ctx)
+    if use_async:
+        asyncio.run(
+            serve_async_grpc(
+                address, store, max_workers, registry_ttl_sec, stream_window
+            )
+        )
+        return
     server = get_grpc_server(address, store, max_workers, registry_ttl_sec)
     server.start()
     server.wait_for_termination()
@@ -1,5 +1,6 @@
 import logging
 import multiprocessing
+from typing import Optional
 
 import click
 
@@ -115,6 +116,12 @@ logging.basicConfig(level=logging.INFO)
     show_default=True,
     help="Enable the Metrics Server",
 )
+@click.option(
+    "--share-registry",
+    is_flag=True,
+    show_default=True,
+    help="Refresh the registry once in the main process and share it with the workers through a memory-mapped snapshot",
+)
 @click.pass_context
 def serve_command(
     ctx: click.Context,
@@ -131,6 +138,7 @@ def serve_command(
     tls_key_path: str,
     tls_cert_path: str,
     metrics: bool,
+    share_registry: bool,
 ):
     """Start a feature server locally on a given port."""
     if (tls_key_path and not tls_cert_path) or (not tls_key_path and tls_cert_path):
@@ -157,6 +165,7 @@ def serve_command(
         tls_key_path=tls_key_path,
         tls_cert_path=tls_cert_path,
         registry_ttl_sec=registry_ttl_sec,
+        share_registry=share_registry,
     )
 
 
@@ -168,12 +177,21 @@ def serve_command(
     default=DEFAULT_FEATURE_TRANSFORMATION_SERVER_PORT,
     help="Specify a port for the server",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.INT,
+    default=None,
+    help="Number of threads handling requests. Defaults to a pool sized to the machine",
+)
 @click.pass_context
-def serve_transformations_command(ctx: click.Context, port: int):
+def serve_transformations_command(
+    ctx: click.Context, port: int, workers: Optional[int]
+):
     """[Experimental] Start a feature consumption server locally on a given port."""
     store = create_feature_store(ctx)
 
-    store.serve_transformations(port)
+    store.serve_transformations(port, workers)
 
 
 @click.command("serve_registry")
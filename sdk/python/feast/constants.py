@@ -32,6 +32,11 @@ FULL_REPO_CONFIGS_MODULE_ENV_NAME: str = "FULL_REPO_CONFIGS_MODULE"
 # Environment variable for overwriting FTS port
 FEATURE_TRANSFORMATION_SERVER_PORT_ENV_NAME: str = "FEATURE_TRANSFORMATION_SERVER_PORT"
 
+# Environment variable for the number of threads of the FTS
+FEATURE_TRANSFORMATION_SERVER_MAX_WORKERS_ENV_NAME: str = (
+    "FEATURE_TRANSFORMATION_SERVER_MAX_WORKERS"
+)
+
 # Default FTS port
 DEFAULT_FEATURE_TRANSFORMATION_SERVER_PORT = 6569
 
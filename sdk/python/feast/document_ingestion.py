@@ -0,0 +1,450 @@
+# Copyright 2025 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Document ingestion for vector search: documents are split into chunks, the chunks are embedded, and their vectors
+are written to the online store.
+
+Documents stream through bounded queues, so that memory use does not depend on the size of the corpus:
+
+- The calling thread chunks the documents and groups the chunks of consecutive documents into embedding batches.
+- A pool of workers embeds the batches.
+- A single writer groups the embedded chunks into write batches and writes them to the online store.
+
+Once all the chunks of a document are written, its id is appended to the checkpoint file, if any, and the
+document is skipped when the ingestion is run again.
+"""
+
+import json
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+
+from feast.utils import _utc_now
+
+if TYPE_CHECKING:
+    from feast.feature_store import FeatureStore
+
+# Splits the text of a document into chunks.
+Chunker = Callable[[str], List[str]]
+# Returns the embeddings of a batch of texts.
+Embedder = Callable[[List[str]], Sequence[Sequence[float]]]
+
+_QUEUE_POLL_SECONDS = 0.1
+
+
+class TextChunker:
+    """
+    Split text into chunks of at most `chunk_size` characters, at whitespace when possible.
+
+    Consecutive chunks overlap by about `chunk_overlap` characters, so that sentences spanning two chunks are
+    embedded whole in at least one of them.
+    """
+
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be between 0 and chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def __call__(self, text: str) -> List[str]:
+        text = text.strip()
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = min(start + self.chunk_size, len(text))
+            if end < len(text):
+                # Ends the chunk at the last whitespace, unless it is a single word longer than the chunk size.
+                split = text.rfind(" ", start + 1, end + 1)
+                if split > start:
+                    end = split
+            chunks.append(text[start:end].strip())
+            if end == len(text):
+                break
+            next_start = max(end - self.chunk_overlap, start + 1)
+            if text[next_start - 1] != " ":
+                # Starts the next chunk at a word boundary within the overlap.
+                word_start = text.find(" ", next_start, end)
+                if word_start != -1:
+                    next_start = word_start + 1
+            start = next_start
+        return [chunk for chunk in chunks if chunk]
+
+
+class SentenceTransformerEmbedder:
+    """
+    Embed texts with a sentence-transformers model, loaded on the first call.
+
+    The model is shared by the embedding workers of a pipeline; sentence-transformers releases the GIL while
+    encoding, so that batches are embedded concurrently.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        normalize_embeddings: bool = True,
+        device: Optional[str] = None,
+    ):
+        self.model_name = model_name
+        self.normalize_embeddings = normalize_embeddings
+        self.device = device
+        self._model = None
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: List[str]) -> Sequence[Sequence[float]]:
+        return self._get_model().encode(
+            texts,
+            normalize_embeddings=self.normalize_embeddings,
+            convert_to_numpy=True,
+        )
+
+    def _get_model(self):
+        with self._lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError:
+                    raise ImportError(
+                        "sentence-transformers is not installed. "
+                        "Please install it with: pip install sentence-transformers"
+                    )
+                self._model = SentenceTransformer(self.model_name, device=self.device)
+            return self._model
+
+
+class IngestionCheckpoint:
+    """
+    The ids of the documents whose chunks are all written, appended to a file as JSON lines.
+
+    The file is only appended to, so that an interrupted ingestion loses at most the documents being written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._document_ids: Set[str] = set()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    # The last line is incomplete if the process stopped while appending it.
+                    try:
+                        self._document_ids.add(json.loads(line))
+                    except json.JSONDecodeError:
+                        pass
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self._document_ids
+
+    def __len__(self) -> int:
+        return len(self._document_ids)
+
+    def add(self, document_ids: Sequence[str]):
+        if not document_ids:
+            return
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.writelines(
+                    json.dumps(document_id) + "\n" for document_id in document_ids
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            self._document_ids.update(document_ids)
+
+
+@dataclass
+class IngestionResult:
+    """
+    Attributes:
+        documents: The number of documents ingested.
+        chunks: The number of chunks written.
+        skipped_documents: The number of documents skipped, because the checkpoint holds them.
+    """
+
+    documents: int = 0
+    chunks: int = 0
+    skipped_documents: int = 0
+
+
+# A chunk to embed: the id of its document, and its row without the vector
+_Chunk = Tuple[str, Dict[str, Any]]
+
+
+class DocumentIngestionPipeline:
+    """
+    Chunk, embed and write documents to the online store of a feature view.
+
+    Each chunk is written as a row holding the fields of its document, with:
+
+    - its text in `text_field`, in place of the text of the document,
+    - its embedding in `vector_field`,
+    - its id, "<document id>-<chunk index>", in `chunk_id_field`, which defaults to the join key of the
+      feature view,
+    - the ingestion time in the timestamp fields of the feature view source, unless the document sets them.
+    """
+
+    def __init__(
+        self,
+        store: "FeatureStore",
+        feature_view_name: str,
+        embedder: Embedder,
+        chunker: Optional[Chunker] = None,
+        document_id_field: str = "document_id",
+        text_field: str = "text",
+        vector_field: str = "vector",
+        chunk_id_field: Optional[str] = None,
+        embedding_batch_size: int = 64,
+        write_batch_size: int = 1000,
+        num_workers: int = 4,
+        max_queue_size: int = 16,
+        checkpoint_path: Optional[str] = None,
+    ):
+        if embedding_batch_size <= 0 or write_batch_size <= 0:
+            raise ValueError("Batch sizes must be positive")
+        if num_workers <= 0 or max_queue_size <= 0:
+            raise ValueError("num_workers and max_queue_size must be positive")
+
+        self.store = store
+        self.feature_view = store.get_feature_view(feature_view_name)
+        self.embedder = embedder
+        self.chunker = chunker or TextChunker()
+        self.document_id_field = document_id_field
+        self.text_field = text_field
+        self.vector_field = vector_field
+        if chunk_id_field is None:
+            join_keys = self.feature_view.join_keys
+            if len(join_keys) != 1:
+                raise ValueError(
+                    f"Feature view {feature_view_name} has {len(join_keys)} join keys, "
+                    "chunk_id_field must be set to the one holding the chunk ids"
+                )
+            chunk_id_field = join_keys[0]
+        self.chunk_id_field = chunk_id_field
+        self.embedding_batch_size = embedding_batch_size
+        self.write_batch_size = write_batch_size
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self.checkpoint = (
+            IngestionCheckpoint(checkpoint_path) if checkpoint_path else None
+        )
+
+    def run(
+        self, documents: Union[pd.DataFrame, Iterable[Dict[str, Any]]]
+    ) -> IngestionResult:
+        """
+        Ingest documents, given as a dataframe or an iterable of dicts, which is consumed as it is ingested.
+
+        Raises:
+            Exception: The first error raised by the chunker, the embedder or the online store, once the
+                pipeline is stopped. The checkpoint holds the documents written before it.
+        """
+        return _IngestionRun(self).run(
+            documents.to_dict("records")
+            if isinstance(documents, pd.DataFrame)
+            else documents
+        )
+
+
+class _IngestionRun:
+    """The queues, workers and state of a single run of a pipeline."""
+
+    def __init__(self, pipeline: DocumentIngestionPipeline):
+        self.pipeline = pipeline
+        self.result = IngestionResult()
+        self._embedding_queue: "queue.Queue[Optional[List[_Chunk]]]" = queue.Queue(
+            pipeline.max_queue_size
+        )
+        self._write_queue: "queue.Queue[Optional[List[_Chunk]]]" = queue.Queue(
+            pipeline.max_queue_size
+        )
+        # The number of chunks of each document in progress that are not written yet
+        self._pending_chunks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._stopped = threading.Event()
+
+    def run(self, documents: Iterable[Dict[str, Any]]) -> IngestionResult:
+        threads = [
+            threading.Thread(
+                target=self._guard, args=(self._embed,), name=f"feast-embedding-{i}"
+            )
+            for i in range(self.pipeline.num_workers)
+        ]
+        threads.append(
+            threading.Thread(
+                target=self._guard, args=(self._write,), name="feast-online-write"
+            )
+        )
+        for thread in threads:
+            thread.start()
+        try:
+            self._guard(self._chunk, documents)
+        finally:
+            for _ in range(self.pipeline.num_workers):
+                self._put(self._embedding_queue, None, force=True)
+            for thread in threads:
+                thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.result
+
+    def _guard(self, target: Callable, *args):
+        """Runs a stage of the pipeline, stopping the other stages if it fails."""
+        try:
+            target(*args)
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+            self._stopped.set()
+
+    def _put(self, q: queue.Queue, item: Any, force: bool = False):
+        """Puts an item on a bounded queue, waiting for room unless the pipeline is stopped."""
+        while True:
+            if self._stopped.is_set() and not force:
+                raise _PipelineStopped()
+            try:
+                q.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return
+            except queue.Full:
+                if self._stopped.is_set() and force:
+                    # The consumers are stopping, so they no longer need the item.
+                    return
+
+    def _get(self, q: queue.Queue) -> Any:
+        while True:
+            try:
+                return q.get(timeout=_QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                if self._stopped.is_set():
+                    raise _PipelineStopped()
+
+    def _chunk(self, documents: Iterable[Dict[str, Any]]):
+        pipeline = self.pipeline
+        timestamp_fields = [
+            field
+            for field in (
+                pipeline.feature_view.batch_source.timestamp_field,
+                pipeline.feature_view.batch_source.created_timestamp_column,
+            )
+            if field
+        ]
+        batch: List[_Chunk] = []
+        for document in documents:
+            document_id = str(document[pipeline.document_id_field])
+            if pipeline.checkpoint is not None and document_id in pipeline.checkpoint:
+                self.result.skipped_documents += 1
+                continue
+
+            texts = pipeline.chunker(document.get(pipeline.text_field) or "")
+            if not texts:
+                self._complete([document_id])
+                continue
+            with self._lock:
+                self._pending_chunks[document_id] = self._pending_chunks.get(
+                    document_id, 0
+                ) + len(texts)
+            now = _utc_now()
+            for index, text in enumerate(texts):
+                row = dict(document)
+                row[pipeline.text_field] = text
+                row[pipeline.chunk_id_field] = f"{document_id}-{index}"
+                for field in timestamp_fields:
+                    if row.get(field) is None:
+                        row[field] = now
+                batch.append((document_id, row))
+                if len(batch) == pipeline.embedding_batch_size:
+                    self._put(self._embedding_queue, batch)
+                    batch = []
+        if batch:
+            self._put(self._embedding_queue, batch)
+
+    def _embed(self):
+        pipeline = self.pipeline
+        try:
+            while True:
+                batch = self._get(self._embedding_queue)
+                if batch is None:
+                    return
+                embeddings = pipeline.embedder(
+                    [row[pipeline.text_field] for _, row in batch]
+                )
+                if len(embeddings) != len(batch):
+                    raise ValueError(
+                        f"The embedder returned {len(embeddings)} embeddings for {len(batch)} texts"
+                    )
+                for (_, row), embedding in zip(batch, embeddings):
+                    row[pipeline.vector_field] = [float(value) for value in embedding]
+                self._put(self._write_queue, batch)
+        finally:
+            # Tells the writer that this worker is done.
+            self._put(self._write_queue, None, force=True)
+
+    def _write(self):
+        pipeline = self.pipeline
+        rows: List[_Chunk] = []
+        running_workers = pipeline.num_workers
+        while running_workers:
+            batch = self._get(self._write_queue)
+            if batch is None:
+                running_workers -= 1
+                continue
+            rows.extend(batch)
+            while len(rows) >= pipeline.write_batch_size:
+                self._write_rows(rows[: pipeline.write_batch_size])
+                rows = rows[pipeline.write_batch_size :]
+        if rows and not self._stopped.is_set():
+            self._write_rows(rows)
+
+    def _write_rows(self, rows: List[_Chunk]):
+        pipeline = self.pipeline
+        pipeline.store.write_to_online_store(
+            pipeline.feature_view.name, df=pd.DataFrame([row for _, row in rows])
+        )
+        completed = []
+        with self._lock:
+            for document_id, _ in rows:
+                self._pending_chunks[document_id] -= 1
+                if not self._pending_chunks[document_id]:
+                    del self._pending_chunks[document_id]
+                    completed.append(document_id)
+            self.result.chunks += len(rows)
+        self._complete(completed)
+
+    def _complete(self, document_ids: List[str]):
+        with self._lock:
+            self.result.documents += len(document_ids)
+        if self.pipeline.checkpoint is not None:
+            self.pipeline.checkpoint.add(document_ids)
+
+
+class _PipelineStopped(Exception):
+    """Raised in the stages of a pipeline when another stage failed."""
@@ -461,6 +461,49 @@ class PushSourceNotFoundException(FeastError):
         return HttpStatusCode.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+class OnDemandFeatureViewTimeoutError(FeastError):
+    def __init__(self, odfv_names: List[str], timeout_seconds: float):
+        super().__init__(
+            f"On demand feature views {odfv_names} did not finish within the {timeout_seconds}s budget."
+        )
+
+    def grpc_status_code(self) -> "GrpcStatusCode":
+        from grpc import StatusCode as GrpcStatusCode
+
+        return GrpcStatusCode.DEADLINE_EXCEEDED
+
+    def http_status_code(self) -> int:
+        return HttpStatusCode.HTTP_504_GATEWAY_TIMEOUT
+
+
+class OnlineWriteQueueFullError(FeastError):
+    def __init__(self, queued_rows: int, max_queued_rows: int):
+        super().__init__(
+            f"The online write queue holds {queued_rows} rows, the maximum is {max_queued_rows}. Retry the push later."
+        )
+
+    def grpc_status_code(self) -> "GrpcStatusCode":
+        from grpc import StatusCode as GrpcStatusCode
+
+        return GrpcStatusCode.RESOURCE_EXHAUSTED
+
+    def http_status_code(self) -> int:
+        return HttpStatusCode.HTTP_429_TOO_MANY_REQUESTS
+
+
+class OnlineWriteUnavailableError(FeastError):
+    def __init__(self, reason: str):
+        super().__init__(f"Online writes are unavailable: {reason}")
+
+    def grpc_status_code(self) -> "GrpcStatusCode":
+        from grpc import StatusCode as GrpcStatusCode
+
+        return GrpcStatusCode.UNAVAILABLE
+
+    def http_status_code(self) -> int:
+        return HttpStatusCode.HTTP_503_SERVICE_UNAVAILABLE
+
+
 class ReadOnlyRegistryException(FeastError):
     def __init__(self):
         super().__init__("Registry implementation is read-only.")
@@ -19,6 +19,7 @@ import threading
 import time
 import traceback
 from collections import defaultdict
+from concurrent.futures import Future
 from contextlib import asynccontextmanager
 from datetime import datetime
 from importlib import resources as importlib_resources
@@ -42,18 +43,31 @@ from fastapi.logger import logger
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from google.protobuf.json_format import MessageToDict
-from prometheus_client import Gauge, start_http_server
-from pydantic import BaseModel
+from prometheus_client import Gauge
+from pydantic import Base64Bytes, BaseModel
 
 import feast
+from feast import metrics as feast_metrics
 from feast import proto_json, utils
 from feast.constants import DEFAULT_FEATURE_SERVER_REGISTRY_TTL
 from feast.data_source import PushMode
 from feast.errors import (
     FeastError,
     FeatureViewNotFoundException,
+    OnlineWriteQueueFullError,
+    OnlineWriteUnavailableError,
 )
 from feast.feast_object import FeastObject
+from feast.infra.registry.snapshot import (
+    RegistrySnapshotReader,
+    publish_registry_snapshots,
+)
+from feast.online_response import OnlineResponse
+from feast.online_response_encoding import (
+    JSON_MEDIA_TYPE,
+    encode_online_response,
+    negotiate_media_type,
+)
 from feast.permissions.action import WRITE, AuthzedAction
 from feast.permissions.security_manager import assert_permissions
 from feast.permissions.server.rest import inject_user_details
@@ -64,6 +78,9 @@ from feast.permissions.server.utils import (
     str_to_auth_manager_type,
 )
 
+# How often workers check for a new registry snapshot when the registry is shared.
+REGISTRY_SNAPSHOT_POLL_SECONDS = 1.0
+
 # Define prometheus metrics
 cpu_usage_gauge = Gauge(
     "feast_feature_server_cpu_usage", "CPU usage of the Feast feature server"
@@ -117,6 +134,9 @@ class GetOnlineDocumentsRequest(BaseModel):
     top_k: Optional[int] = None
     query: Optional[List[float]] = None
     query_string: Optional[str] = None
+    # Base64-encoded query image, embedded by the image models of the feature server (api_version 2 only)
+    query_image_bytes: Optional[Base64Bytes] = None
+    query_image_model: Optional[str] = None
     api_version: Optional[int] = 1
 
 
@@ -171,6 +191,24 @@ async def _get_features(
     return features
 
 
+async def _encode_online_response(
+    response: OnlineResponse, http_request: Request
+) -> Union[Dict[str, Any], Response]:
+    media_type = negotiate_media_type(http_request.headers.get("accept"))
+    with feast_metrics.stage("get_online_features", "serialize"):
+        if media_type == JSON_MEDIA_TYPE:
+            # Convert the Protobuf object to JSON and return it
+            return await run_in_threadpool(
+                MessageToDict,
+                response.proto,
+                preserving_proto_field_name=True,
+                float_precision=18,
+            )
+
+        content = await run_in_threadpool(encode_online_response, response, media_type)
+    return Response(content=content, media_type=media_type)
+
+
 async def load_static_artifacts(app: FastAPI, store):
     """
     Load static artifacts (models, lookup tables, etc.) into app.state.
@@ -220,6 +258,7 @@ async def load_static_artifacts(app: FastAPI, store):
 def get_app(
     store: "feast.FeatureStore",
     registry_ttl_sec: int = DEFAULT_FEATURE_SERVER_REGISTRY_TTL,
+    registry_snapshot: Optional[RegistrySnapshotReader] = None,
 ):
     """
     Creates a FastAPI app that can be used to start a feature server.
@@ -227,6 +266,8 @@ def get_app(
     Args:
         store: The FeatureStore to use for serving features
         registry_ttl_sec: The TTL in seconds for the registry cache
+        registry_snapshot: If set, the registry is loaded from the snapshots published by a supervisor
+            process instead of being refreshed by the app
 
     Returns:
         A FastAPI app
@@ -293,6 +334,26 @@ def get_app(
     else:
         logger.debug("Offline write batching is DISABLED")
 
+    # --- Online write batching config and batcher ---
+    online_batcher: Optional[OnlineWriteBatcher] = None
+    if (
+        fs_cfg is not None
+        and getattr(fs_cfg, "online_push_batching_enabled", False) is True
+    ):
+        online_batcher = OnlineWriteBatcher(
+            store=store,
+            cfg=SimpleNamespace(
+                batch_size=fs_cfg.online_push_batching_batch_size,
+                batch_interval_ms=fs_cfg.online_push_batching_batch_interval_ms,
+                max_queued_rows=fs_cfg.online_push_batching_max_queued_rows,
+                max_concurrent_writes=fs_cfg.online_push_batching_max_concurrent_writes,
+                durability=fs_cfg.online_push_batching_durability,
+            ),
+        )
+        logger.debug("Online write batching is ENABLED")
+    else:
+        logger.debug("Online write batching is DISABLED")
+
     def stop_refresh():
         nonlocal shutting_down
         shutting_down = True
@@ -303,13 +364,26 @@ def get_app(
         if shutting_down:
             return
 
-        store.refresh_registry()
         nonlocal registry_proto
-        registry_proto = store.registry.proto()
+        if registry_snapshot is not None:
+            try:
+                registry_snapshot.load_if_changed(store.registry)
+            except Exception:
+                logger.exception("Failed to load the registry snapshot")
+            # Forked workers already hold the snapshot they were forked with, and don't load it again.
+            registry_proto = store.registry.cached_registry_proto  # type: ignore[attr-defined]
+        else:
+            store.refresh_registry()
+            registry_proto = store.registry.proto()
 
         if registry_ttl_sec:
             nonlocal active_timer
-            active_timer = threading.Timer(registry_ttl_sec, async_refresh)
+            active_timer = threading.Timer(
+                min(registry_ttl_sec, REGISTRY_SNAPSHOT_POLL_SECONDS)
+                if registry_snapshot is not None
+                else registry_ttl_sec,
+                async_refresh,
+            )
             active_timer.start()
 
     @asynccontextmanager
@@ -318,11 +392,24 @@ def get_app(
         await load_static_artifacts(app, store)
 
         await store.initialize()
+        if registry_snapshot is not None:
+            RegistrySnapshotReader.attach(store.registry)
         async_refresh()
+        if fs_cfg is not None and getattr(fs_cfg, "image_models", None):
+            from feast.image_utils import image_model_registry
+
+            image_model_registry.configure(
+                max_models=max(fs_cfg.image_model_cache_size, len(fs_cfg.image_models)),
+                max_batch_size=fs_cfg.image_embedding_batch_size,
+                batch_interval_ms=fs_cfg.image_embedding_batch_interval_ms,
+            )
+            await run_in_threadpool(image_model_registry.warm_up, fs_cfg.image_models)
         try:
             yield
         finally:
             stop_refresh()
+            if online_batcher is not None:
+                online_batcher.shutdown()
             if offline_batcher is not None:
                 offline_batcher.shutdown()
             await store.close()
@@ -332,8 +419,11 @@ def get_app(
     @app.post(
         "/get-online-features",
         dependencies=[Depends(inject_user_details)],
+        response_model=None,
     )
-    async def get_online_features(request: GetOnlineFeaturesRequest) -> Dict[str, Any]:
+    async def get_online_features(
+        request: GetOnlineFeaturesRequest, http_request: Request
+    ) -> Union[Dict[str, Any], Response]:
         # Initialize parameters for FeatureStore.get_online_features(...) call
         features = await _get_features(request, store)
 
@@ -350,22 +440,16 @@ def get_app(
                 lambda: store.get_online_features(**read_params)  # type: ignore
             )
 
-        # Convert the Protobuf object to JSON and return it
-        response_dict = await run_in_threadpool(
-            MessageToDict,
-            response.proto,
-            preserving_proto_field_name=True,
-            float_precision=18,
-        )
-        return response_dict
+        return await _encode_online_response(response, http_request)
 
     @app.post(
         "/retrieve-online-documents",
         dependencies=[Depends(inject_user_details)],
+        response_model=None,
     )
     async def retrieve_online_documents(
-        request: GetOnlineDocumentsRequest,
-    ) -> Dict[str, Any]:
+        request: GetOnlineDocumentsRequest, http_request: Request
+    ) -> Union[Dict[str, Any], Response]:
         logger.warning(
             "This endpoint is in alpha and will be moved to /get-online-features when stable."
         )
@@ -375,6 +459,12 @@ def get_app(
         read_params = dict(features=features, query=request.query, top_k=request.top_k)
         if request.api_version == 2 and request.query_string is not None:
             read_params["query_string"] = request.query_string
+        if request.query_image_bytes is not None:
+            if request.api_version != 2:
+                raise ValueError("Query images are only supported with api_version 2.")
+            read_params["query_image_bytes"] = request.query_image_bytes
+            if request.query_image_model is not None:
+                read_params["query_image_model"] = request.query_image_model
 
         if request.api_version == 2:
             response = await run_in_threadpool(
@@ -385,14 +475,7 @@ def get_app(
                 lambda: store.retrieve_online_documents(**read_params)  # type: ignore
             )
 
-        # Convert the Protobuf object to JSON and return it
-        response_dict = await run_in_threadpool(
-            MessageToDict,
-            response.proto,
-            preserving_proto_field_name=True,
-            float_precision=18,
-        )
-        return response_dict
+        return await _encode_online_response(response, http_request)
 
     @app.post("/push", dependencies=[Depends(inject_user_details)])
     async def push(request: PushFeaturesRequest) -> Response:
@@ -412,20 +495,9 @@ def get_app(
                 f"{request.to} is not a supported push format. Please specify one of these ['online', 'offline', 'online_and_offline']."
             )
 
-        from feast.data_source import PushSource
-
-        all_fvs = store.list_feature_views(
-            allow_cache=request.allow_registry_cache
-        ) + store.list_stream_feature_views(allow_cache=request.allow_registry_cache)
-        fvs_with_push_sources = {
-            fv
-            for fv in all_fvs
-            if (
-                fv.stream_source is not None
-                and isinstance(fv.stream_source, PushSource)
-                and fv.stream_source.name == request.push_source_name
-            )
-        }
+        fvs_with_push_sources = store._fvs_for_push_source_or_raise(
+            request.push_source_name, request.allow_registry_cache
+        )
 
         for feature_view in fvs_with_push_sources:
             assert_permissions(resource=feature_view, actions=actions)
@@ -472,6 +544,20 @@ def get_app(
 
         status_code = status.HTTP_200_OK
 
+        if online_batcher is not None and needs_online:
+            written = await online_batcher.push(
+                push_source_name=request.push_source_name,
+                df=df,
+                allow_registry_cache=request.allow_registry_cache,
+                transform_on_write=request.transform_on_write,
+            )
+            if not written:
+                status_code = status.HTTP_202_ACCEPTED
+            if not needs_offline:
+                return Response(status_code=status_code)
+            needs_online = False
+            to = PushMode.OFFLINE
+
         if offline_batcher is None or not needs_offline:
             await _push_with_to(to)
         else:
@@ -759,6 +845,7 @@ if sys.platform != "win32":
             self._app = get_app(
                 store=store,
                 registry_ttl_sec=options["registry_ttl_sec"],
+                registry_snapshot=options.get("registry_snapshot"),
             )
             self._options = options
             super().__init__()
@@ -790,6 +877,17 @@ def monitor_resources(self, interval: int = 5):
         time.sleep(interval)
 
 
+def _start_metrics_server():
+    logger.info("Starting Prometheus Server")
+    feast_metrics.start_metrics_server(8000)
+
+    logger.debug("Starting background thread to monitor CPU and memory usage")
+    monitoring_thread = threading.Thread(
+        target=monitor_resources, args=(5,), daemon=True
+    )
+    monitoring_thread.start()
+
+
 def start_server(
     store: "feast.FeatureStore",
     host: str,
@@ -804,20 +902,28 @@ def start_server(
     tls_key_path: str,
     tls_cert_path: str,
     metrics: bool,
+    share_registry: bool = False,
 ):
     if (tls_key_path and not tls_cert_path) or (not tls_key_path and tls_cert_path):
         raise ValueError(
             "Both key and cert file paths are required to start server in TLS mode."
         )
+    # Serving metrics are recorded by the processes handling the requests. A single gunicorn worker exposes
+    # them itself, while several workers need a shared PROMETHEUS_MULTIPROC_DIR aggregated by the master.
+    expose_metrics_in_worker = (
+        metrics
+        and sys.platform != "win32"
+        and workers == 1
+        and not os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    )
     if metrics:
-        logger.info("Starting Prometheus Server")
-        start_http_server(8000)
-
-        logger.debug("Starting background thread to monitor CPU and memory usage")
-        monitoring_thread = threading.Thread(
-            target=monitor_resources, args=(5,), daemon=True
-        )
-        monitoring_thread.start()
+        feast_metrics.enable()
+        if workers > 1 and not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            logger.warning(
+                "Serving metrics of multiple workers are only exposed if PROMETHEUS_MULTIPROC_DIR is set."
+            )
+        if not expose_metrics_in_worker:
+            _start_metrics_server()
 
     logger.debug("start_server called")
     auth_type = str_to_auth_manager_type(store.config.auth_config.type)
@@ -832,7 +938,7 @@ def start_server(
     logger.debug("Auth manager initialized successfully")
 
     if sys.platform != "win32":
-        options = {
+        options: Dict[str, Any] = {
             "bind": f"{host}:{port}",
             "accesslog": None if no_access_log else "-",
             "workers": workers,
@@ -842,6 +948,13 @@ def start_server(
             "keepalive": keep_alive_timeout,
             "registry_ttl_sec": registry_ttl_sec,
         }
+        if share_registry:
+            options["registry_snapshot"] = publish_registry_snapshots(
+                store, registry_ttl_sec
+            )
+
+        if expose_metrics_in_worker:
+            options["post_worker_init"] = lambda worker: _start_metrics_server()
 
         # Add SSL options if the paths exist
         if tls_key_path and tls_cert_path:
@@ -851,6 +964,10 @@ def start_server(
     else:
         import uvicorn
 
+        if share_registry:
+            logger.warning(
+                "Sharing the registry between workers is not supported on Windows."
+            )
         app = get_app(store, registry_ttl_sec)
         if tls_key_path and tls_cert_path:
             uvicorn.run(
@@ -1070,3 +1187,305 @@ class OfflineWriteBatcher:
                 key,
                 pending_rows,
             )
+
+
+class _OnlineBatchKey(NamedTuple):
+    push_source_name: str
+    allow_registry_cache: bool
+    transform_on_write: bool
+
+
+class _PendingPush(NamedTuple):
+    df: pd.DataFrame
+    written: Optional[Future]
+
+
+class OnlineWriteBatcher:
+    """
+    In-process online write batcher for /push requests.
+
+    - Buffers DataFrames per (push_source_name, allow_registry_cache, transform_on_write), so that many small
+      pushes become a single online write, and a single `online_write_batch`, per feature view.
+    - Flushes a buffer when it holds batch_size rows, or when its oldest rows are batch_interval_ms old.
+    - Buffers hold at most max_queued_rows rows: further pushes are rejected with `OnlineWriteQueueFullError`.
+    - Writes of the same buffer key never run concurrently and keep the order of the pushes, and only the
+      latest row of every entity key of a batch is written, so that every entity key ends up with its last push.
+    - With the "written" durability, pushes complete once their batch is written and fail with its error. With
+      "accepted", they complete once queued: failed batches are put back in front of their buffer and retried
+      with exponential backoff, and pushes are rejected with `OnlineWriteUnavailableError` until a write
+      succeeds. Batches still failing after MAX_RETRIES retries are dropped and logged.
+    """
+
+    RETRY_DELAY_SECONDS = 1.0
+    MAX_RETRIES = 5
+
+    def __init__(self, store: "feast.FeatureStore", cfg: Any):
+        self._store = store
+        self._cfg = cfg
+        self._interval = cfg.batch_interval_ms / 1000
+
+        self._buffers: DefaultDict[_OnlineBatchKey, List[_PendingPush]] = defaultdict(
+            list
+        )
+        self._buffered_rows: DefaultDict[_OnlineBatchKey, int] = defaultdict(int)
+        # Monotonic time at which every buffer must be flushed
+        self._deadlines: Dict[_OnlineBatchKey, float] = {}
+        self._inflight: Set[_OnlineBatchKey] = set()
+        self._queued_rows = 0
+        # Number of failed writes of the buffers being retried
+        self._retries: Dict[_OnlineBatchKey, int] = {}
+        self._failing = False
+        self._stopped = False
+        self._condition = threading.Condition()
+
+        self._threads = [
+            threading.Thread(
+                target=self._run, name=f"online_write_batcher_{i}", daemon=True
+            )
+            for i in range(max(1, cfg.max_concurrent_writes))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        logger.debug(
+            "OnlineWriteBatcher initialized: batch_size=%s, batch_interval_ms=%s, max_queued_rows=%s, durability=%s",
+            cfg.batch_size,
+            cfg.batch_interval_ms,
+            cfg.max_queued_rows,
+            cfg.durability,
+        )
+
+    # ---------- Public API ----------
+
+    async def push(
+        self,
+        push_source_name: str,
+        df: pd.DataFrame,
+        allow_registry_cache: bool,
+        transform_on_write: bool,
+    ) -> bool:
+        """
+        Queue a dataframe for online write, grouped by push source + flags.
+
+        Returns:
+            bool: `True` if the rows were written to the online store, `False` if they were only queued.
+
+        Raises:
+            OnlineWriteQueueFullError: If the queue is full.
+            OnlineWriteUnavailableError: If the batcher is stopped or the online store is failing.
+        """
+        written = self.enqueue(
+            push_source_name, df, allow_registry_cache, transform_on_write
+        )
+        if written is None:
+            return False
+        await asyncio.wrap_future(written)
+        return True
+
+    def enqueue(
+        self,
+        push_source_name: str,
+        df: pd.DataFrame,
+        allow_registry_cache: bool,
+        transform_on_write: bool,
+    ) -> Optional[Future]:
+        """
+        Queue a dataframe for online write without blocking.
+
+        Returns:
+            Optional[Future]: With the "written" durability, a future completed once the rows are written.
+        """
+        key = _OnlineBatchKey(
+            push_source_name=push_source_name,
+            allow_registry_cache=allow_registry_cache,
+            transform_on_write=transform_on_write,
+        )
+        written: Optional[Future] = (
+            Future() if self._cfg.durability == "written" else None
+        )
+
+        with self._condition:
+            if self._stopped:
+                raise OnlineWriteUnavailableError("the feature server is shutting down")
+            if self._failing:
+                raise OnlineWriteUnavailableError(
+                    "the online store is failing, queued rows are being retried"
+                )
+            # A single push larger than the queue is accepted when the queue is empty.
+            if self._queued_rows and (
+                self._queued_rows + len(df) > self._cfg.max_queued_rows
+            ):
+                raise OnlineWriteQueueFullError(
+                    self._queued_rows, self._cfg.max_queued_rows
+                )
+
+            self._buffers[key].append(_PendingPush(df=df, written=written))
+            self._buffered_rows[key] += len(df)
+            self._queued_rows += len(df)
+            if key not in self._deadlines:
+                self._deadlines[key] = time.monotonic() + self._interval
+                self._condition.notify()
+            elif self._buffered_rows[key] >= self._cfg.batch_size:
+                self._condition.notify()
+
+        return written
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Reject new pushes, write the queued rows and stop the writer threads.
+        """
+        logger.debug("Shutting down OnlineWriteBatcher")
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        with self._condition:
+            if self._queued_rows:
+                logger.warning(
+                    "OnlineWriteBatcher stopped with %s rows not written",
+                    self._queued_rows,
+                )
+
+    # ---------- Internal helpers ----------
+
+    def _next_key_locked(self) -> tuple[Optional[_OnlineBatchKey], Optional[float]]:
+        """
+        Returns the next buffer to flush, or the time to wait for the next deadline; caller must hold the lock.
+        """
+        now = time.monotonic()
+        timeout: Optional[float] = None
+        for key, deadline in self._deadlines.items():
+            if key in self._inflight:
+                continue
+            if (
+                self._stopped
+                or deadline <= now
+                or self._buffered_rows[key] >= self._cfg.batch_size
+            ):
+                return key, None
+            timeout = (
+                deadline - now if timeout is None else min(timeout, deadline - now)
+            )
+        return None, timeout
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                key, timeout = self._next_key_locked()
+                while key is None:
+                    if self._stopped and not self._deadlines:
+                        return
+                    self._condition.wait(timeout=timeout)
+                    key, timeout = self._next_key_locked()
+                pending = self._buffers.pop(key)
+                rows = self._buffered_rows.pop(key)
+                del self._deadlines[key]
+                self._inflight.add(key)
+
+            try:
+                self._write(key, pending)
+            except Exception as e:
+                logger.exception("Error writing online batch for %s", key)
+                self._on_write_error(key, pending, rows, e)
+            else:
+                with self._condition:
+                    self._retries.pop(key, None)
+                    self._failing = bool(self._retries)
+                    self._queued_rows -= rows
+                for p in pending:
+                    if p.written is not None:
+                        p.written.set_result(None)
+            finally:
+                with self._condition:
+                    self._inflight.discard(key)
+                    self._condition.notify_all()
+
+    def _write(self, key: _OnlineBatchKey, pending: List[_PendingPush]) -> None:
+        batch_df = pd.concat([p.df for p in pending], ignore_index=True)
+        for fv in self._store._fvs_for_push_source_or_raise(
+            key.push_source_name, key.allow_registry_cache
+        ):
+            self._store.write_to_online_store(
+                fv.name,
+                _latest_rows_per_entity_key(fv, batch_df),
+                allow_registry_cache=key.allow_registry_cache,
+                transform_on_write=key.transform_on_write,
+            )
+        logger.debug(
+            "Wrote online batch for push_source=%s with %s rows from %s pushes",
+            key.push_source_name,
+            len(batch_df),
+            len(pending),
+        )
+
+    def _on_write_error(
+        self,
+        key: _OnlineBatchKey,
+        pending: List[_PendingPush],
+        rows: int,
+        error: Exception,
+    ) -> None:
+        if self._cfg.durability == "written":
+            with self._condition:
+                self._queued_rows -= rows
+            for p in pending:
+                if p.written is not None:
+                    p.written.set_exception(error)
+            return
+
+        with self._condition:
+            if self._stopped:
+                self._queued_rows -= rows
+                return
+            retries = self._retries.get(key, 0)
+            if retries >= self.MAX_RETRIES:
+                # The batch is unlikely to ever be written, e.g. because it doesn't match the schema.
+                logger.error(
+                    "Dropping online batch for push_source=%s with %s rows from %s pushes after %s retries: %s",
+                    key.push_source_name,
+                    rows,
+                    len(pending),
+                    retries,
+                    error,
+                )
+                self._retries.pop(key, None)
+                self._failing = bool(self._retries)
+                self._queued_rows -= rows
+                return
+            self._retries[key] = retries + 1
+            self._failing = True
+            self._buffers[key] = pending + self._buffers.get(key, [])
+            self._buffered_rows[key] += rows
+            self._deadlines[key] = (
+                time.monotonic() + self.RETRY_DELAY_SECONDS * 2**retries
+            )
+
+
+def _latest_rows_per_entity_key(
+    feature_view: "feast.FeatureView", df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Keeps the last row of every entity key by event timestamp, then by push order.
+
+    Rows without a valid event timestamp are ranked before all the others.
+    """
+    join_keys = [c.name for c in feature_view.entity_columns if c.name in df.columns]
+    if len(df) < 2 or not join_keys:
+        return df
+
+    timestamp_field = (
+        feature_view.batch_source.timestamp_field
+        if feature_view.batch_source is not None
+        else None
+    )
+    if timestamp_field and timestamp_field in df.columns:
+        timestamps = pd.to_datetime(df[timestamp_field], utc=True, errors="coerce")
+        order = (
+            timestamps.reset_index(drop=True)
+            .sort_values(kind="stable", na_position="first")
+            .index
+        )
+        df = df.iloc[order]
+    return df.drop_duplicates(subset=join_keys, keep="last")
@@ -25,6 +25,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
@@ -36,6 +37,7 @@ from typing import (
 if TYPE_CHECKING:
     from feast.diff.apply_progress import ApplyProgressContext
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 from colorama import Fore, Style
@@ -43,7 +45,7 @@ from fastapi.concurrency import run_in_threadpool
 from google.protobuf.timestamp_pb2 import Timestamp
 from tqdm import tqdm
 
-from feast import feature_server, flags_helper, ui_server, utils
+from feast import feature_server, flags_helper, metrics, tracing, ui_server, utils
 from feast.base_feature_view import BaseFeatureView
 from feast.batch_feature_view import BatchFeatureView
 from feast.data_source import (
@@ -55,6 +57,12 @@ from feast.data_source import (
 )
 from feast.diff.infra_diff import InfraDiff, diff_infra_protos
 from feast.diff.registry_diff import RegistryDiff, apply_diff_to_registry, diff_between
+from feast.document_ingestion import (
+    Chunker,
+    DocumentIngestionPipeline,
+    Embedder,
+    IngestionResult,
+)
 from feast.dqm.errors import ValidationFailed
 from feast.entity import Entity
 from feast.errors import (
@@ -75,8 +83,13 @@ from feast.infra.infra_object import Infra
 from feast.infra.offline_stores.offline_utils import (
     DEFAULT_ENTITY_DF_EVENT_TIMESTAMP_COL,
 )
+from feast.infra.online_stores.hybrid_search import (
+    HYBRID_SCORE_FEATURE,
+    HybridFusion,
+)
 from feast.infra.provider import Provider, RetrievalJob, get_provider
 from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.proto_registry_utils import cached_registry_proto_key
 from feast.infra.registry.registry import Registry
 from feast.infra.registry.sql import SqlRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
@@ -181,6 +194,9 @@ class FeatureStore:
             )
 
         self._provider = get_provider(self.config)
+        self._feature_view_index: Optional[
+            Tuple[tuple, Dict[str, BaseFeatureView], Dict[str, List[FeatureView]]]
+        ] = None
 
     def __repr__(self) -> str:
         return (
@@ -1276,16 +1292,26 @@ class FeatureStore:
         if end_date is not None:
             kwargs["end_date"] = end_date
 
-        job = provider.get_historical_features(
-            self.config,
-            feature_views,
-            _feature_refs,
-            entity_df,
-            self._registry,
-            self.project,
-            full_feature_names,
-            **kwargs,
-        )
+        with tracing.span(
+            "feast.provider.get_historical_features",
+            {
+                "feast.project": self.project,
+                "feast.entity_count": len(entity_df)
+                if isinstance(entity_df, pd.DataFrame)
+                else None,
+                "feast.feature_count": len(_feature_refs),
+            },
+        ):
+            job = provider.get_historical_features(
+                self.config,
+                feature_views,
+                _feature_refs,
+                entity_df,
+                self._registry,
+                self.project,
+                full_feature_names,
+                **kwargs,
+            )
 
         return job
 
@@ -1602,15 +1628,18 @@ class FeatureStore:
             start_date = utils.make_tzaware(start_date)
             end_date = utils.make_tzaware(end_date) or _utc_now()
 
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
-            )
+            with metrics.stage(
+                "materialize", "materialize", self.config, feature_view.name
+            ):
+                provider.materialize_single_feature_view(
+                    config=self.config,
+                    feature_view=feature_view,
+                    start_date=start_date,
+                    end_date=end_date,
+                    registry=self._registry,
+                    project=self.project,
+                    tqdm_builder=tqdm_builder,
+                )
             if not isinstance(feature_view, OnDemandFeatureView):
                 self._registry.apply_materialization(
                     feature_view,
@@ -1693,16 +1722,19 @@ class FeatureStore:
             start_date = utils.make_tzaware(start_date)
             end_date = utils.make_tzaware(end_date)
 
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
-                disable_event_timestamp=disable_event_timestamp,
-            )
+            with metrics.stage(
+                "materialize", "materialize", self.config, feature_view.name
+            ):
+                provider.materialize_single_feature_view(
+                    config=self.config,
+                    feature_view=feature_view,
+                    start_date=start_date,
+                    end_date=end_date,
+                    registry=self._registry,
+                    project=self.project,
+                    tqdm_builder=tqdm_builder,
+                    disable_event_timestamp=disable_event_timestamp,
+                )
 
             self._registry.apply_materialization(
                 feature_view,
@@ -1711,23 +1743,53 @@ class FeatureStore:
                 end_date,
             )
 
-    def _fvs_for_push_source_or_raise(
-        self, push_source_name: str, allow_cache: bool
-    ) -> set[FeatureView]:
+    def _get_feature_view_index(
+        self, allow_cache: bool
+    ) -> Tuple[Dict[str, BaseFeatureView], Dict[str, List[FeatureView]]]:
+        """
+        Returns all the feature views by name, and the feature views of every push source.
+
+        When the cached registry is allowed, the index is built once per cached registry proto and rebuilt after
+        the registry is refreshed, so that pushes and online writes don't list all the feature views.
+        """
         from feast.data_source import PushSource
 
-        all_fvs = self.list_feature_views(allow_cache=allow_cache)
-        all_fvs += self.list_stream_feature_views(allow_cache=allow_cache)
+        index = getattr(self, "_feature_view_index", None)
+        if (
+            allow_cache
+            and index is not None
+            and index[0] == cached_registry_proto_key(self._registry)
+        ):
+            return index[1], index[2]
 
-        fvs_with_push_sources = {
-            fv
-            for fv in all_fvs
-            if (
-                fv.stream_source is not None
-                and isinstance(fv.stream_source, PushSource)
-                and fv.stream_source.name == push_source_name
-            )
+        feature_views_by_name = {
+            fv.name: fv for fv in self.list_all_feature_views(allow_cache)
         }
+        feature_views_by_push_source: Dict[str, List[FeatureView]] = {}
+        for fv in self.list_feature_views(
+            allow_cache=allow_cache
+        ) + self.list_stream_feature_views(allow_cache=allow_cache):
+            if fv.stream_source is not None and isinstance(
+                fv.stream_source, PushSource
+            ):
+                feature_views_by_push_source.setdefault(
+                    fv.stream_source.name, []
+                ).append(fv)
+
+        key = cached_registry_proto_key(self._registry)
+        if allow_cache and key is not None:
+            self._feature_view_index = (
+                key,
+                feature_views_by_name,
+                feature_views_by_push_source,
+            )
+        return feature_views_by_name, feature_views_by_push_source
+
+    def _fvs_for_push_source_or_raise(
+        self, push_source_name: str, allow_cache: bool
+    ) -> List[FeatureView]:
+        _, feature_views_by_push_source = self._get_feature_view_index(allow_cache)
+        fvs_with_push_sources = feature_views_by_push_source.get(push_source_name)
 
         if not fvs_with_push_sources:
             raise PushSourceNotFoundException(push_source_name)
@@ -1752,20 +1814,21 @@ class FeatureStore:
             to: Whether to push to online or offline store. Defaults to online store only.
             transform_on_write: Whether to transform the data before pushing.
         """
-        for fv in self._fvs_for_push_source_or_raise(
-            push_source_name, allow_registry_cache
-        ):
-            if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
-                self.write_to_online_store(
-                    fv.name,
-                    df,
-                    allow_registry_cache=allow_registry_cache,
-                    transform_on_write=transform_on_write,
-                )
-            if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
-                self.write_to_offline_store(
-                    fv.name, df, allow_registry_cache=allow_registry_cache
-                )
+        with metrics.stage("push", "total", self.config):
+            for fv in self._fvs_for_push_source_or_raise(
+                push_source_name, allow_registry_cache
+            ):
+                if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                    self.write_to_online_store(
+                        fv.name,
+                        df,
+                        allow_registry_cache=allow_registry_cache,
+                        transform_on_write=transform_on_write,
+                    )
+                if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                    self.write_to_offline_store(
+                        fv.name, df, allow_registry_cache=allow_registry_cache
+                    )
 
     async def push_async(
         self,
@@ -1775,27 +1838,30 @@ class FeatureStore:
         to: PushMode = PushMode.ONLINE,
         **kwargs,
     ):
-        fvs = self._fvs_for_push_source_or_raise(push_source_name, allow_registry_cache)
-
-        if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
-            _ = await asyncio.gather(
-                *[
-                    self.write_to_online_store_async(
-                        fv.name, df, allow_registry_cache=allow_registry_cache
-                    )
-                    for fv in fvs
-                ]
+        with metrics.stage("push", "total", self.config):
+            fvs = self._fvs_for_push_source_or_raise(
+                push_source_name, allow_registry_cache
             )
 
-        if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
+            if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                _ = await asyncio.gather(
+                    *[
+                        self.write_to_online_store_async(
+                            fv.name, df, allow_registry_cache=allow_registry_cache
+                        )
+                        for fv in fvs
+                    ]
+                )
 
-            def _offline_write():
-                for fv in fvs:
-                    self.write_to_offline_store(
-                        fv.name, df, allow_registry_cache=allow_registry_cache
-                    )
+            if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
 
-            await run_in_threadpool(_offline_write)
+                def _offline_write():
+                    for fv in fvs:
+                        self.write_to_offline_store(
+                            fv.name, df, allow_registry_cache=allow_registry_cache
+                        )
+
+                await run_in_threadpool(_offline_write)
 
     def _validate_and_convert_input_data(
         self,
@@ -1960,13 +2026,10 @@ class FeatureStore:
         allow_registry_cache: bool = True,
         transform_on_write: bool = True,
     ):
-        feature_view_dict = {
-            fv_proto.name: fv_proto
-            for fv_proto in self.list_all_feature_views(allow_registry_cache)
-        }
+        feature_view_dict, _ = self._get_feature_view_index(allow_registry_cache)
         try:
             feature_view = feature_view_dict[feature_view_name]
-        except FeatureViewNotFoundException:
+        except KeyError:
             raise FeatureViewNotFoundException(feature_view_name, self.project)
 
         # Convert inputs/df to a consistent DataFrame format
@@ -2029,7 +2092,16 @@ class FeatureStore:
                     return  # Early return for empty feature columns
 
         provider = self._get_provider()
-        provider.ingest_df(feature_view, df)
+        with metrics.stage("push", "online_write", self.config, feature_view.name):
+            provider.ingest_df(feature_view, df)
+        if df is not None:
+            metrics.count(
+                "push",
+                self.config,
+                feature_view.name,
+                len(df),
+                len(df) * len(feature_view.features),
+            )
 
     async def write_to_online_store_async(
         self,
@@ -2072,7 +2144,80 @@ class FeatureStore:
                     return  # Early return for empty feature columns
 
         provider = self._get_provider()
-        await provider.ingest_df_async(feature_view, df)
+        with metrics.stage("push", "online_write", self.config, feature_view.name):
+            await provider.ingest_df_async(feature_view, df)
+        if df is not None:
+            metrics.count(
+                "push",
+                self.config,
+                feature_view.name,
+                len(df),
+                len(df) * len(feature_view.features),
+            )
+
+    def ingest_documents(
+        self,
+        feature_view_name: str,
+        documents: Union[pd.DataFrame, Iterable[Dict[str, Any]]],
+        embedder: Embedder,
+        chunker: Optional[Chunker] = None,
+        document_id_field: str = "document_id",
+        text_field: str = "text",
+        vector_field: str = "vector",
+        chunk_id_field: Optional[str] = None,
+        embedding_batch_size: int = 64,
+        write_batch_size: int = 1000,
+        num_workers: int = 4,
+        max_queue_size: int = 16,
+        checkpoint_path: Optional[str] = None,
+    ) -> IngestionResult:
+        """
+        Chunks documents, embeds their chunks and writes them to the online store.
+
+        Documents are streamed through bounded queues: chunks of consecutive documents are embedded in batches
+        by a pool of workers, and written to the online store in batches by a single writer. Each chunk is
+        written as a row holding the fields of its document, with its text in `text_field`, its embedding in
+        `vector_field` and its id, "<document id>-<chunk index>", in `chunk_id_field`.
+
+        Args:
+            feature_view_name: The feature view to which the chunks are written.
+            documents: The documents, as a dataframe or an iterable of dicts, which is consumed as it is
+                ingested.
+            embedder: Returns the embeddings of a batch of texts, e.g. a `SentenceTransformerEmbedder`. It is
+                called concurrently by the embedding workers.
+            chunker (optional): Splits the text of a document into chunks. Defaults to a `TextChunker` of
+                1000 characters overlapping by 200 characters.
+            document_id_field (optional): The field holding the id of each document.
+            text_field (optional): The field holding the text of each document, and then of each chunk.
+            vector_field (optional): The field to which the embedding of each chunk is written.
+            chunk_id_field (optional): The field to which the id of each chunk is written. Defaults to the
+                join key of the feature view.
+            embedding_batch_size (optional): The number of chunks embedded with a single call to the embedder.
+            write_batch_size (optional): The number of chunks written to the online store at once.
+            num_workers (optional): The number of embedding workers.
+            max_queue_size (optional): The number of batches that can wait to be embedded, and to be written.
+            checkpoint_path (optional): A file to which the ids of the documents are appended once all their
+                chunks are written. Documents it holds are skipped, so that an interrupted ingestion can be
+                resumed.
+
+        Returns:
+            The number of documents and chunks ingested, and of documents skipped.
+        """
+        return DocumentIngestionPipeline(
+            self,
+            feature_view_name,
+            embedder,
+            chunker=chunker,
+            document_id_field=document_id_field,
+            text_field=text_field,
+            vector_field=vector_field,
+            chunk_id_field=chunk_id_field,
+            embedding_batch_size=embedding_batch_size,
+            write_batch_size=write_batch_size,
+            num_workers=num_workers,
+            max_queue_size=max_queue_size,
+            checkpoint_path=checkpoint_path,
+        ).run(documents)
 
     def write_to_offline_store(
         self,
@@ -2124,7 +2269,8 @@ class FeatureStore:
             df = df.reindex(columns=source_columns)
 
         table = pa.Table.from_pandas(df)
-        provider.ingest_df_to_offline_store(feature_view, table)
+        with metrics.stage("push", "offline_write", self.config, feature_view.name):
+            provider.ingest_df_to_offline_store(feature_view, table)
 
     def get_online_features(
         self,
@@ -2178,14 +2324,21 @@ class FeatureStore:
         """
         provider = self._get_provider()
 
-        return provider.get_online_features(
-            config=self.config,
-            features=features,
-            entity_rows=entity_rows,
-            registry=self._registry,
-            project=self.project,
-            full_feature_names=full_feature_names,
-        )
+        with (
+            metrics.stage("get_online_features", "total", self.config),
+            tracing.span(
+                "feast.feature_store.get_online_features",
+                tracing.online_request_attributes(self.config, features, entity_rows),
+            ),
+        ):
+            return provider.get_online_features(
+                config=self.config,
+                features=features,
+                entity_rows=entity_rows,
+                registry=self._registry,
+                project=self.project,
+                full_feature_names=full_feature_names,
+            )
 
     async def get_online_features_async(
         self,
@@ -2224,14 +2377,21 @@ class FeatureStore:
         """
         provider = self._get_provider()
 
-        return await provider.get_online_features_async(
-            config=self.config,
-            features=features,
-            entity_rows=entity_rows,
-            registry=self._registry,
-            project=self.project,
-            full_feature_names=full_feature_names,
-        )
+        with (
+            metrics.stage("get_online_features", "total", self.config),
+            tracing.span(
+                "feast.feature_store.get_online_features",
+                tracing.online_request_attributes(self.config, features, entity_rows),
+            ),
+        ):
+            return await provider.get_online_features_async(
+                config=self.config,
+                features=features,
+                entity_rows=entity_rows,
+                registry=self._registry,
+                project=self.project,
+                full_feature_names=full_feature_names,
+            )
 
     def retrieve_online_documents(
         self,
@@ -2414,11 +2574,12 @@ class FeatureStore:
         image_embedding = None
         if query_image_bytes is not None:
             try:
-                from feast.image_utils import ImageFeatureExtractor
+                from feast.image_utils import DEFAULT_IMAGE_MODEL, image_model_registry
 
-                model_name = query_image_model or "resnet34"
-                extractor = ImageFeatureExtractor(model_name)
-                image_embedding = extractor.extract_embedding(query_image_bytes)
+                # Models are cached across calls, and concurrent calls are embedded together.
+                image_embedding = image_model_registry.extract_embedding(
+                    query_image_bytes, query_image_model or DEFAULT_IMAGE_MODEL
+                )
             except ImportError:
                 raise ImportError(
                     "Image processing dependencies are not installed. "
@@ -2455,6 +2616,177 @@ class FeatureStore:
             "Either query embedding or query_string must be provided."
         )
 
+        requested_feature_view, requested_features = self._get_document_feature_view(
+            features
+        )
+
+        provider = self._get_provider()
+        return self._retrieve_from_online_store_v2(
+            provider,
+            requested_feature_view,
+            requested_features,
+            effective_query,
+            top_k,
+            distance_metric,
+            query_string,
+        )
+
+    def retrieve_online_documents_v2_batch(
+        self,
+        features: List[str],
+        top_k: int,
+        queries: Optional[Union[np.ndarray, List[List[float]]]] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+        distance_metric: Optional[str] = "L2",
+    ) -> List[OnlineResponse]:
+        """
+        Retrieves the top k closest document features of several queries.
+
+        Online stores which support it search all the query embeddings at once; other online stores run the
+        queries concurrently.
+
+        Args:
+            features: The list of features that should be retrieved from the online document store, as in
+                `retrieve_online_documents_v2`.
+            top_k: The number of closest document features to retrieve for each query.
+            queries: The query embeddings, as an array of shape (number of queries, embedding dimension) or a
+                list of embeddings.
+            query_strings: The text query of each query, for keyword or hybrid search.
+            distance_metric: The distance metric to use for retrieval.
+
+        Returns:
+            An OnlineResponse per query, in the order of the queries.
+
+        Examples:
+            Search several text embeddings::
+
+                responses = store.retrieve_online_documents_v2_batch(
+                    features=["documents:embedding", "documents:title"],
+                    queries=np.array([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]),
+                    top_k=5,
+                )
+        """
+        if queries is None and query_strings is None:
+            raise ValueError("Must provide either queries or query_strings")
+        query_list: Optional[List[List[float]]] = None
+        if isinstance(queries, np.ndarray):
+            query_list = queries.tolist()
+        elif queries is not None:
+            query_list = [list(query) for query in queries]
+        if (
+            query_list is not None
+            and query_strings is not None
+            and len(query_list) != len(query_strings)
+        ):
+            raise ValueError(
+                f"Got {len(query_list)} queries but {len(query_strings)} query strings"
+            )
+
+        table, requested_features = self._get_document_feature_view(features)
+        vector_field_metadata = _get_feature_view_vector_field_metadata(table)
+        if vector_field_metadata:
+            distance_metric = vector_field_metadata.vector_search_metric
+
+        batch_documents = self._get_provider().retrieve_online_documents_v2_batch(
+            config=self.config,
+            table=table,
+            requested_features=requested_features,
+            queries=query_list,
+            top_k=top_k,
+            distance_metric=distance_metric,
+            query_strings=query_strings,
+        )
+        return [
+            self._documents_to_online_response(
+                table,
+                requested_features,
+                documents,
+                query_strings[i] if query_strings is not None else None,
+            )
+            for i, documents in enumerate(batch_documents)
+        ]
+
+    def retrieve_online_documents_hybrid(
+        self,
+        features: List[str],
+        query: Union[np.ndarray, List[float]],
+        query_string: str,
+        top_k: int,
+        fusion: Literal["rrf", "weighted"] = "rrf",
+        vector_weight: float = 0.5,
+        rrf_k: int = 60,
+        oversample: int = 4,
+        distance_metric: Optional[str] = "L2",
+    ) -> OnlineResponse:
+        """
+        Retrieves the top k documents that best match both a query embedding and a query string.
+
+        The vector search and the keyword search each retrieve `top_k * oversample` candidates, which are fused
+        into a single ranking with reciprocal rank fusion ("rrf") or with the weighted sum of their normalized
+        scores ("weighted"). Online stores which support it run both searches and the fusion themselves; other
+        online stores run the searches concurrently.
+
+        Args:
+            features: The list of features that should be retrieved from the online document store, as in
+                `retrieve_online_documents_v2`.
+            query: The query embedding.
+            query_string: The query string, to search for using keyword search.
+            top_k: The number of documents to retrieve.
+            fusion: The fusion method, "rrf" or "weighted".
+            vector_weight: The weight of the vector search, between 0 and 1. The keyword search weighs the rest.
+            rrf_k: The rank constant of reciprocal rank fusion.
+            oversample: The number of candidates retrieved by each search, as a multiple of top_k.
+            distance_metric: The distance metric to use for the vector search.
+
+        Returns:
+            An OnlineResponse with the requested features and the fused score of each document, as the
+            "hybrid_score" feature, from the best match.
+
+        Examples:
+            Search documents by meaning and keywords, favoring the keywords::
+
+                response = store.retrieve_online_documents_hybrid(
+                    features=["documents:embedding", "documents:title"],
+                    query=[0.1, 0.2, 0.3],
+                    query_string="feature store",
+                    top_k=5,
+                    fusion="weighted",
+                    vector_weight=0.3,
+                )
+        """
+        hybrid_fusion = HybridFusion(
+            method=fusion,
+            vector_weight=vector_weight,
+            rrf_k=rrf_k,
+            oversample=oversample,
+        )
+        table, requested_features = self._get_document_feature_view(features)
+        vector_field_metadata = _get_feature_view_vector_field_metadata(table)
+        if vector_field_metadata:
+            distance_metric = vector_field_metadata.vector_search_metric
+
+        documents = self._get_provider().retrieve_online_documents_hybrid(
+            config=self.config,
+            table=table,
+            requested_features=requested_features,
+            query=query.tolist() if isinstance(query, np.ndarray) else list(query),
+            query_string=query_string,
+            top_k=top_k,
+            fusion=hybrid_fusion,
+            distance_metric=distance_metric,
+        )
+        return self._documents_to_online_response(
+            table,
+            requested_features,
+            documents,
+            query_string,
+            score_features=[HYBRID_SCORE_FEATURE],
+        )
+
+    def _get_document_feature_view(
+        self, features: List[str]
+    ) -> Tuple[FeatureView, List[str]]:
+        """Returns the feature view of a document retrieval, and the names of the requested features."""
         (
             available_feature_views,
             available_odfv_views,
@@ -2488,17 +2820,7 @@ class FeatureStore:
             raise ValueError(
                 f"Feature view {requested_feature_view} not found in the registry."
             )
-
-        provider = self._get_provider()
-        return self._retrieve_from_online_store_v2(
-            provider,
-            requested_feature_view,
-            requested_features,
-            effective_query,
-            top_k,
-            distance_metric,
-            query_string,
-        )
+        return requested_feature_view, requested_features
 
     def _retrieve_from_online_store(
         self,
@@ -2579,7 +2901,24 @@ class FeatureStore:
             distance_metric=distance_metric,
             query_string=query_string,
         )
+        return self._documents_to_online_response(
+            table, requested_features, documents, query_string
+        )
+
+    def _documents_to_online_response(
+        self,
+        table: FeatureView,
+        requested_features: List[str],
+        documents: List,
+        query_string: Optional[str],
+        score_features: Optional[List[str]] = None,
+    ) -> OnlineResponse:
+        """
+        Builds the response of a document retrieval from the documents returned by the provider.
 
+        The response holds the requested features followed by the scores of the documents, which are
+        "distance", and "text_rank" for text search queries, unless other score features are given.
+        """
         entity_key_dict: Dict[str, List[ValueProto]] = {}
         datevals, entityvals, list_of_feature_dicts = [], [], []
         for row_ts, entity_key, feature_dict in documents:  # type: ignore[misc]
@@ -2593,17 +2932,12 @@ class FeatureStore:
                         entity_key_dict[key] = []
                     entity_key_dict[key].append(python_value)
 
-        features_to_request: List[str] = []
-        if requested_features:
-            features_to_request = requested_features + ["distance"]
+        if score_features is None:
+            score_features = ["distance"]
             # Add text_rank for text search queries
             if query_string is not None:
-                features_to_request.append("text_rank")
-        else:
-            features_to_request = ["distance"]
-            # Add text_rank for text search queries
-            if query_string is not None:
-                features_to_request.append("text_rank")
+                score_features.append("text_rank")
+        features_to_request: List[str] = list(requested_features) + score_features
 
         if not datevals:
             online_features_response = GetOnlineFeaturesResponse(results=[])
@@ -2621,9 +2955,13 @@ class FeatureStore:
             entity_key_dict,
         )
 
+        # The unique entities are sorted, so their rows are read in the same order to keep every document with
+        # its own entity key.
         feature_data = utils._convert_rows_to_protobuf(
             requested_features=features_to_request,
-            read_rows=list(zip(datevals, list_of_feature_dicts)),
+            read_rows=[
+                (datevals[idx[0]], list_of_feature_dicts[idx[0]]) for idx in idxs
+            ],
         )
 
         online_features_response = GetOnlineFeaturesResponse(results=[])
@@ -2659,6 +2997,7 @@ class FeatureStore:
         tls_key_path: str = "",
         tls_cert_path: str = "",
         registry_ttl_sec: int = 60,
+        share_registry: bool = False,
     ) -> None:
         """Start the feature consumption server locally on a given port."""
         type_ = type_.lower()
@@ -2681,6 +3020,7 @@ class FeatureStore:
             tls_key_path=tls_key_path,
             tls_cert_path=tls_cert_path,
             registry_ttl_sec=registry_ttl_sec,
+            share_registry=share_registry,
         )
 
     def get_feature_server_endpoint(self) -> Optional[str]:
@@ -2751,8 +3091,16 @@ class FeatureStore:
 
         offline_server.start_server(self, host, port, tls_key_path, tls_cert_path)
 
-    def serve_transformations(self, port: int) -> None:
-        """Start the feature transformation server locally on a given port."""
+    def serve_transformations(
+        self, port: int, max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Start the feature transformation server locally on a given port.
+
+        Args:
+            port: The port to listen on.
+            max_workers: The number of threads handling requests. Defaults to a pool sized to the machine.
+        """
         warnings.warn(
             "On demand feature view is an experimental feature. "
             "This API is stable, but the functionality does not scale well for offline retrieval",
@@ -2761,7 +3109,7 @@ class FeatureStore:
 
         from feast import transformation_server
 
-        transformation_server.start_server(self, port)
+        transformation_server.start_server(self, port, max_workers)
 
     def write_logged_features(
         self, logs: Union[pa.Table, Path], source: FeatureService
@@ -17,6 +17,9 @@ from typing import Dict, Optional
 from typeguard import typechecked
 
 from feast.feature import Feature
+from feast.infra.online_stores.vector_quantization import (
+    validate_vector_quantization,
+)
 from feast.protos.feast.core.Feature_pb2 import FeatureSpecV2 as FieldProto
 from feast.types import FeastType, from_value_type
 from feast.value_type import ValueType
@@ -35,6 +38,7 @@ class Field:
         vector_index: If set to True the field will be indexed for vector similarity search.
         vector_length: The length of the vector if the vector index is set to True.
         vector_search_metric: The metric used for vector similarity search.
+        vector_quantization: The quantization of the vector index, "int8", "float16" or "binary", if any.
     """
 
     name: str
@@ -44,6 +48,7 @@ class Field:
     vector_index: bool
     vector_length: int
     vector_search_metric: Optional[str]
+    vector_quantization: Optional[str]
 
     def __init__(
         self,
@@ -55,6 +60,7 @@ class Field:
         vector_index: bool = False,
         vector_length: int = 0,
         vector_search_metric: Optional[str] = None,
+        vector_quantization: Optional[str] = None,
     ):
         """
         Creates a Field object.
@@ -66,7 +72,10 @@ class Field:
             tags (optional): User-defined metadata in dictionary form.
             vector_index (optional): If set to True the field will be indexed for vector similarity search.
             vector_search_metric (optional): The metric used for vector similarity search.
+            vector_quantization (optional): The quantization of the vector index: "int8", "float16" or "binary".
+                Searches rank the candidates of the quantized index by their full-precision vectors.
         """
+        validate_vector_quantization(vector_quantization)
         self.name = name
         self.dtype = dtype
         self.description = description
@@ -74,6 +83,7 @@ class Field:
         self.vector_index = vector_index
         self.vector_length = vector_length
         self.vector_search_metric = vector_search_metric
+        self.vector_quantization = vector_quantization or None
 
     def __eq__(self, other):
         if type(self) != type(other):
@@ -85,6 +95,7 @@ class Field:
             or self.description != other.description
             or self.tags != other.tags
             or self.vector_length != other.vector_length
+            or self.vector_quantization != other.vector_quantization
             # or self.vector_index != other.vector_index
             # or self.vector_search_metric != other.vector_search_metric
         ):
@@ -107,6 +118,7 @@ class Field:
             f"    vector_index={self.vector_index!r}\n"
             f"    vector_length={self.vector_length!r}\n"
             f"    vector_search_metric={self.vector_search_metric!r}\n"
+            f"    vector_quantization={self.vector_quantization!r}\n"
             f")"
         )
 
@@ -125,6 +137,7 @@ class Field:
             vector_index=self.vector_index,
             vector_length=self.vector_length,
             vector_search_metric=vector_search_metric,
+            vector_quantization=self.vector_quantization or "",
         )
 
     @classmethod
@@ -139,6 +152,7 @@ class Field:
         vector_search_metric = getattr(field_proto, "vector_search_metric", "")
         vector_index = getattr(field_proto, "vector_index", False)
         vector_length = getattr(field_proto, "vector_length", 0)
+        vector_quantization = getattr(field_proto, "vector_quantization", "")
         return cls(
             name=field_proto.name,
             dtype=from_value_type(value_type=value_type),
@@ -147,6 +161,7 @@ class Field:
             vector_index=vector_index,
             vector_length=vector_length,
             vector_search_metric=vector_search_metric,
+            vector_quantization=vector_quantization or None,
         )
 
     @classmethod
@@ -18,7 +18,12 @@ Provides image embedding generation and combination functions for multi-modal se
 """
 
 import io
-from typing import List
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import timm
@@ -35,6 +40,8 @@ except ImportError:
 
 COMBINATION_STRATEGIES = ["weighted_sum", "concatenate", "average"]
 
+DEFAULT_IMAGE_MODEL = "resnet34"
+
 
 def _check_image_dependencies():
     """Check if image processing dependencies are available."""
@@ -158,6 +165,211 @@ class ImageFeatureExtractor:
         return embeddings
 
 
+class ImageEmbeddingBatcher:
+    """
+    Micro-batch the image embedding requests of concurrent callers.
+
+    Requests are queued and embedded by a background thread, which embeds every request
+    queued within `batch_interval_ms` of the first one, up to `max_batch_size` requests,
+    with a single call to `batch_extract_embeddings`.
+    """
+
+    def __init__(
+        self,
+        extractor: ImageFeatureExtractor,
+        max_batch_size: int = 32,
+        batch_interval_ms: int = 5,
+    ):
+        self.extractor = extractor
+        self.max_batch_size = max_batch_size
+        self.batch_interval_ms = batch_interval_ms
+        self._queue: "queue.Queue[Optional[Tuple[bytes, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def extract_embedding(self, image_bytes: bytes) -> List[float]:
+        """
+        Extract the embedding of an image along with those of concurrent requests.
+        Args:
+            image_bytes: Image data as bytes
+        Returns:
+            Normalized embedding vector as list of floats
+        Raises:
+            ValueError: If the image cannot be processed
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="feast-image-embedding", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((image_bytes, future))
+        return future.result()
+
+    def close(self):
+        """Stop the background thread once the queued requests are embedded."""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread = None
+
+    def _run(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = time.monotonic() + self.batch_interval_ms / 1000
+            while len(batch) < self.max_batch_size:
+                try:
+                    request = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if request is None:
+                    # Stop once this batch is embedded.
+                    self._queue.put(None)
+                    break
+                batch.append(request)
+            self._embed(batch)
+
+    def _embed(self, batch: List[Tuple[bytes, Future]]):
+        if len(batch) > 1:
+            try:
+                embeddings = self.extractor.batch_extract_embeddings(
+                    [image_bytes for image_bytes, _ in batch]
+                )
+            except Exception:
+                # Embed the images one by one, so that only requests with invalid images fail.
+                pass
+            else:
+                for (_, future), embedding in zip(batch, embeddings):
+                    future.set_result(embedding)
+                return
+
+        for image_bytes, future in batch:
+            try:
+                future.set_result(self.extractor.extract_embedding(image_bytes))
+            except Exception as e:
+                future.set_exception(e)
+
+
+class ImageModelRegistry:
+    """
+    Process-wide cache of image embedding models, keyed by model name.
+
+    Each model is loaded once and shared by all callers, which are micro-batched by an
+    ImageEmbeddingBatcher. When more than `max_models` models are loaded, the least
+    recently used one is unloaded.
+
+    Examples:
+        Load a model at startup, then embed query images::
+
+            image_model_registry.warm_up(["resnet50"])
+            embedding = image_model_registry.extract_embedding(image_bytes, "resnet50")
+    """
+
+    def __init__(
+        self,
+        max_models: int = 4,
+        max_batch_size: int = 32,
+        batch_interval_ms: int = 5,
+        loader: Callable[[str], ImageFeatureExtractor] = ImageFeatureExtractor,
+    ):
+        self.max_models = max_models
+        self.max_batch_size = max_batch_size
+        self.batch_interval_ms = batch_interval_ms
+        self._loader = loader
+        self._batchers: "OrderedDict[str, ImageEmbeddingBatcher]" = OrderedDict()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        max_models: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        batch_interval_ms: Optional[int] = None,
+    ):
+        """Update the settings of the registry, which apply to models loaded afterwards."""
+        with self._lock:
+            if max_models is not None:
+                self.max_models = max_models
+            if max_batch_size is not None:
+                self.max_batch_size = max_batch_size
+            if batch_interval_ms is not None:
+                self.batch_interval_ms = batch_interval_ms
+
+    def get(self, model_name: str = DEFAULT_IMAGE_MODEL) -> ImageEmbeddingBatcher:
+        """
+        Get the batcher of a model, loading the model if needed.
+        Args:
+            model_name: Model name from timm library
+        Returns:
+            The ImageEmbeddingBatcher of the model
+        """
+        with self._lock:
+            batcher = self._get_loaded(model_name)
+            if batcher is not None:
+                return batcher
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+
+        # Models are loaded outside of the registry lock, so that other models stay available.
+        with load_lock:
+            with self._lock:
+                batcher = self._get_loaded(model_name)
+                if batcher is not None:
+                    return batcher
+
+            extractor = self._loader(model_name)
+
+            with self._lock:
+                batcher = ImageEmbeddingBatcher(
+                    extractor, self.max_batch_size, self.batch_interval_ms
+                )
+                self._batchers[model_name] = batcher
+                self._load_locks.pop(model_name, None)
+                while len(self._batchers) > self.max_models:
+                    _, evicted = self._batchers.popitem(last=False)
+                    evicted.close()
+                return batcher
+
+    def extract_embedding(
+        self, image_bytes: bytes, model_name: str = DEFAULT_IMAGE_MODEL
+    ) -> List[float]:
+        """
+        Extract the embedding of an image with a cached model.
+        Args:
+            image_bytes: Image data as bytes
+            model_name: Model name from timm library
+        Returns:
+            Normalized embedding vector as list of floats
+        """
+        return self.get(model_name).extract_embedding(image_bytes)
+
+    def warm_up(self, model_names: Iterable[str]):
+        """Load models ahead of the first requests that use them."""
+        for model_name in model_names:
+            self.get(model_name)
+
+    def clear(self):
+        """Unload all models."""
+        with self._lock:
+            for batcher in self._batchers.values():
+                batcher.close()
+            self._batchers.clear()
+
+    def _get_loaded(self, model_name: str) -> Optional[ImageEmbeddingBatcher]:
+        batcher = self._batchers.get(model_name)
+        if batcher is not None:
+            self._batchers.move_to_end(model_name)
+        return batcher
+
+
+image_model_registry = ImageModelRegistry()
+
+
 def combine_embeddings(
     text_embedding: List[float],
     image_embedding: List[float],
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import threading
 from concurrent import futures
@@ -34,6 +35,28 @@ def parse(features):
     return pd.DataFrame.from_dict(df)
 
 
+def _parse_push_mode(to: str) -> PushMode:
+    if to == "offline":
+        return PushMode.OFFLINE
+    elif to == "online":
+        return PushMode.ONLINE
+    elif to == "online_and_offline":
+        return PushMode.ONLINE_AND_OFFLINE
+    raise ValueError(
+        f"{to} is not a supported push format. Please specify one of these ['online', 'offline', "
+        f"'online_and_offline']."
+    )
+
+
+def _get_features(
+    fs: FeatureStore, request: GetOnlineFeaturesRequest
+) -> Union[list[str], FeatureService]:
+    if request.HasField("feature_service"):
+        logger.info(f"Requesting feature service: {request.feature_service}")
+        return fs.get_feature_service(request.feature_service, allow_cache=True)
+    return list(request.features.val)
+
+
 class GrpcFeatureServer(GrpcFeatureServerServicer):
     fs: FeatureStore
 
@@ -50,17 +73,7 @@ class GrpcFeatureServer(GrpcFeatureServerServicer):
     def Push(self, request, context):
         try:
             df = parse(request.features)
-            if request.to == "offline":
-                to = PushMode.OFFLINE
-            elif request.to == "online":
-                to = PushMode.ONLINE
-            elif request.to == "online_and_offline":
-                to = PushMode.ONLINE_AND_OFFLINE
-            else:
-                raise ValueError(
-                    f"{request.to} is not a supported push format. Please specify one of these ['online', 'offline', "
-                    f"'online_and_offline']."
-                )
+            to = _parse_push_mode(request.to)
             self.fs.push(
                 push_source_name=request.push_source_name,
                 df=df,
@@ -98,21 +111,13 @@ class GrpcFeatureServer(GrpcFeatureServerServicer):
         return WriteToOnlineStoreResponse(status=True)
 
     def GetOnlineFeatures(self, request: GetOnlineFeaturesRequest, context):
-        if request.HasField("feature_service"):
-            logger.info(f"Requesting feature service: {request.feature_service}")
-            try:
-                features: Union[list[str], FeatureService] = (
-                    self.fs.get_feature_service(
-                        request.feature_service, allow_cache=True
-                    )
-                )
-            except FeatureServiceNotFoundException as e:
-                logger.error(f"Feature service {request.feature_service} not found")
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(str(e))
-                return GetOnlineFeaturesResponse()
-        else:
-            features = list(request.features.val)
+        try:
+            features = _get_features(self.fs, request)
+        except FeatureServiceNotFoundException as e:
+            logger.error(f"Feature service {request.feature_service} not found")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return GetOnlineFeaturesResponse()
 
         result = self.fs.get_online_features(
             features,
@@ -122,6 +127,19 @@ class GrpcFeatureServer(GrpcFeatureServerServicer):
 
         return result
 
+    def GetOnlineFeaturesStream(self, request_iterator, context):
+        for request in request_iterator:
+            try:
+                features = _get_features(self.fs, request)
+            except FeatureServiceNotFoundException as e:
+                logger.error(f"Feature service {request.feature_service} not found")
+                context.abort(grpc.StatusCode.INTERNAL, str(e))
+            yield self.fs.get_online_features(
+                features,
+                request.entities,
+                request.full_feature_names,
+            ).proto
+
     def _async_refresh(self):
         self.fs.refresh_registry()
         if self._shuting_down:
@@ -130,6 +148,162 @@ class GrpcFeatureServer(GrpcFeatureServerServicer):
         self._active_timer.start()
 
 
+class AsyncGrpcFeatureServer(GrpcFeatureServerServicer):
+    """
+    gRPC feature server running on `grpc.aio`.
+
+    Online features are read with `FeatureStore.get_online_features_async` when the online store supports
+    async reads, so the number of requests in flight isn't bounded by a thread pool. Blocking calls run in
+    the default executor of the event loop.
+    """
+
+    fs: FeatureStore
+
+    def __init__(
+        self, fs: FeatureStore, registry_ttl_sec: int = 5, stream_window: int = 32
+    ):
+        """
+        Args:
+            fs: The feature store to serve.
+            registry_ttl_sec: Number of seconds after which the registry is refreshed.
+            stream_window: Maximum number of requests of a GetOnlineFeaturesStream call that are read
+                concurrently, ahead of the response being sent.
+        """
+        self.fs = fs
+        self.registry_ttl_sec = registry_ttl_sec
+        self.stream_window = stream_window
+        self._refresh_task: Optional[asyncio.Task] = None
+        super().__init__()
+
+    async def start(self):
+        """Initializes the feature store and starts refreshing the registry in the background."""
+        await self.fs.initialize()
+        self._refresh_task = asyncio.create_task(self._refresh_registry_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        await self.fs.close()
+
+    async def _refresh_registry_loop(self):
+        while True:
+            await asyncio.sleep(self.registry_ttl_sec)
+            try:
+                await asyncio.to_thread(self.fs.refresh_registry)
+            except Exception:
+                logger.exception("Failed to refresh the registry")
+
+    async def Push(self, request, context):
+        try:
+            df = parse(request.features)
+            to = _parse_push_mode(request.to)
+            if self.fs._get_provider().async_supported.online.write:
+                await self.fs.push_async(
+                    push_source_name=request.push_source_name,
+                    df=df,
+                    allow_registry_cache=request.allow_registry_cache,
+                    to=to,
+                )
+            else:
+                await asyncio.to_thread(
+                    self.fs.push,
+                    push_source_name=request.push_source_name,
+                    df=df,
+                    allow_registry_cache=request.allow_registry_cache,
+                    to=to,
+                )
+        except PushSourceNotFoundException as e:
+            logger.exception(str(e))
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return PushResponse(status=False)
+        except Exception as e:
+            logger.exception(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return PushResponse(status=False)
+        return PushResponse(status=True)
+
+    async def WriteToOnlineStore(self, request, context):
+        logger.warning(
+            "write_to_online_store is deprecated. Please consider using Push instead"
+        )
+        try:
+            await asyncio.to_thread(
+                self.fs.write_to_online_store,
+                feature_view_name=request.feature_view_name,
+                df=parse(request.features),
+                allow_registry_cache=request.allow_registry_cache,
+            )
+        except Exception as e:
+            logger.exception(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return PushResponse(status=False)
+        return WriteToOnlineStoreResponse(status=True)
+
+    async def GetOnlineFeatures(self, request: GetOnlineFeaturesRequest, context):
+        try:
+            return await self._get_online_features(request)
+        except FeatureServiceNotFoundException as e:
+            logger.error(f"Feature service {request.feature_service} not found")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return GetOnlineFeaturesResponse()
+
+    async def GetOnlineFeaturesStream(self, request_iterator, context):
+        # Requests are read and served concurrently, up to `stream_window` ahead of the responses, which
+        # are sent in the order of the requests.
+        in_flight: asyncio.Queue = asyncio.Queue(maxsize=self.stream_window)
+
+        async def read_requests():
+            try:
+                async for request in request_iterator:
+                    await in_flight.put(
+                        asyncio.ensure_future(self._get_online_features(request))
+                    )
+            finally:
+                # The stream is always ended, so that a failed read is raised by `await reader` below
+                # instead of leaving the handler waiting for requests.
+                await in_flight.put(None)
+
+        reader = asyncio.ensure_future(read_requests())
+        try:
+            while True:
+                task = await in_flight.get()
+                if task is None:
+                    break
+                try:
+                    yield await task
+                except FeatureServiceNotFoundException as e:
+                    await context.abort(grpc.StatusCode.INTERNAL, str(e))
+            await reader
+        finally:
+            reader.cancel()
+            while not in_flight.empty():
+                task = in_flight.get_nowait()
+                if task is not None:
+                    task.cancel()
+
+    async def _get_online_features(
+        self, request: GetOnlineFeaturesRequest
+    ) -> GetOnlineFeaturesResponse:
+        features = _get_features(self.fs, request)
+        if self.fs._get_provider().async_supported.online.read:
+            response = await self.fs.get_online_features_async(
+                features, request.entities, request.full_feature_names
+            )
+        else:
+            response = await asyncio.to_thread(
+                self.fs.get_online_features,
+                features,
+                request.entities,
+                request.full_feature_names,
+            )
+        return response.proto
+
+
 def get_grpc_server(
     address: str,
     fs: FeatureStore,
@@ -149,3 +323,43 @@ def get_grpc_server(
     health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
     server.add_insecure_port(address)
     return server
+
+
+async def serve_async_grpc(
+    address: str,
+    fs: FeatureStore,
+    max_workers: int,
+    registry_ttl_sec: int,
+    stream_window: int = 32,
+):
+    """
+    Runs a `grpc.aio` feature server until it is terminated.
+
+    Args:
+        address: Address of the gRPC server.
+        fs: The feature store to serve.
+        max_workers: Maximum number of threads used for blocking calls, e.g. reads from online stores
+            without async support.
+        registry_ttl_sec: Number of seconds after which the registry is refreshed.
+        stream_window: Maximum number of requests of a GetOnlineFeaturesStream call that are served
+            concurrently.
+    """
+    logger.info(f"Initializing async gRPC server on {address}")
+    asyncio.get_running_loop().set_default_executor(
+        futures.ThreadPoolExecutor(max_workers=max_workers)
+    )
+    server = grpc.aio.server()
+    servicer = AsyncGrpcFeatureServer(
+        fs, registry_ttl_sec=registry_ttl_sec, stream_window=stream_window
+    )
+    add_GrpcFeatureServerServicer_to_server(servicer, server)
+    health_pb2_grpc.add_HealthServicer_to_server(health.aio.HealthServicer(), server)
+    server.add_insecure_port(address)
+
+    await servicer.start()
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=None)
+        await servicer.stop()
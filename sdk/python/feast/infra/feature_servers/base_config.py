@@ -11,9 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import StrictBool, StrictInt
+from pydantic import StrictBool, StrictInt, StrictStr
 
 from feast.repo_config import FeastConfigBaseModel
 
@@ -54,3 +54,34 @@ class BaseFeatureServerConfig(FeastConfigBaseModel):
 
     offline_push_batching_batch_interval_seconds: Optional[StrictInt] = None
     """The batch interval between offline writes via `/push`."""
+
+    online_push_batching_enabled: StrictBool = False
+    """Whether to coalesce writes to the online store via the `/push` endpoint into larger batches."""
+
+    online_push_batching_batch_size: StrictInt = 1000
+    """The number of rows queued for a push source that triggers an online write."""
+
+    online_push_batching_batch_interval_ms: StrictInt = 50
+    """The maximum time rows may remain queued before an online write."""
+
+    online_push_batching_max_queued_rows: StrictInt = 100000
+    """The maximum number of rows waiting for an online write. Pushes beyond it are rejected with HTTP 429."""
+
+    online_push_batching_max_concurrent_writes: StrictInt = 4
+    """The number of online writes running in parallel. The writes of a push source always run one at a time."""
+
+    online_push_batching_durability: Literal["written", "accepted"] = "written"
+    """When `/push` returns: "written" once its rows are in the online store, "accepted" (HTTP 202) once they are
+    queued. Failed "accepted" batches are retried, and pushes are rejected with HTTP 503 until a write succeeds."""
+
+    image_models: List[StrictStr] = []
+    """Image embedding models loaded at startup, for document retrieval with query images."""
+
+    image_model_cache_size: StrictInt = 4
+    """The maximum number of image embedding models held in memory, when `image_models` is set."""
+
+    image_embedding_batch_size: StrictInt = 32
+    """The maximum number of query images embedded together, when `image_models` is set."""
+
+    image_embedding_batch_interval_ms: StrictInt = 5
+    """The maximum time a query image waits for other query images to be embedded with, when `image_models` is set."""
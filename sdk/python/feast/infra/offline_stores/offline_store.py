@@ -30,7 +30,7 @@ from typing import (
 import pandas as pd
 import pyarrow
 
-from feast import flags_helper
+from feast import flags_helper, tracing
 from feast.data_source import DataSource
 from feast.dataframe import DataFrameEngine, FeastDataFrame
 from feast.dqm.errors import ValidationFailed
@@ -152,12 +152,22 @@ class RetrievalJob(ABC):
             validation_reference (optional): The validation to apply against the retrieved dataframe.
             timeout (optional): The query timeout if applicable.
         """
-        features_table = self._to_arrow_internal(timeout=timeout)
+        with tracing.span(
+            "feast.retrieval_job.execute", {"feast.retrieval_job": type(self).__name__}
+        ):
+            features_table = self._to_arrow_internal(timeout=timeout)
         if self.on_demand_feature_views:
             for odfv in self.on_demand_feature_views:
-                transformed_arrow = odfv.transform_arrow(
-                    features_table, self.full_feature_names
-                )
+                with tracing.span(
+                    "feast.on_demand_feature_view.transform",
+                    {
+                        "feast.feature_view": odfv.name,
+                        "feast.entity_count": features_table.num_rows,
+                    },
+                ):
+                    transformed_arrow = odfv.transform_arrow(
+                        features_table, self.full_feature_names
+                    )
 
                 for col in transformed_arrow.column_names:
                     if col.startswith("__index"):
@@ -15,7 +15,7 @@ from feast.infra.key_encoding_utils import (
     get_list_val_str,
     serialize_entity_key,
 )
-from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.online_store import OnlineStore, _document_queries
 from feast.infra.online_stores.vector_store import VectorStoreConfig
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -332,7 +332,7 @@ class ElasticSearchOnlineStore(OnlineStore):
                     _build_retrieve_online_document_record(
                         base64.b64decode(entity_key),
                         base64.b64decode(feature_value),
-                        str(vector_value),
+                        vector_value,
                         distance,
                         timestamp,
                         config.entity_key_serialization_version,
@@ -359,106 +359,201 @@ class ElasticSearchOnlineStore(OnlineStore):
         """
         Retrieve documents using vector similarity or keyword search from Elasticsearch.
         """
-        result: List[
+        body = _document_search_body(
+            config,
+            table,
+            requested_features,
+            embedding,
+            top_k,
+            distance_metric,
+            query_string,
+        )
+        response = self._get_client(config).search(index=table.name, body=body)
+        return _hits_to_documents(
+            config, requested_features, response["hits"]["hits"][0:top_k], query_string
+        )
+
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
             Tuple[
                 Optional[datetime],
                 Optional[EntityKeyProto],
                 Optional[Dict[str, ValueProto]],
             ]
-        ] = []
-        if not config.online_store.vector_enabled:
-            raise ValueError("Vector search is not enabled in the online store config")
+        ]
+    ]:
+        """
+        Retrieve documents for several queries with a single multi search request to Elasticsearch.
+        """
+        queries = _document_queries(embeddings, query_strings)
+        searches: List[Dict[str, Any]] = []
+        for embedding, query_string in queries:
+            searches.append({"index": table.name})
+            searches.append(
+                _document_search_body(
+                    config,
+                    table,
+                    requested_features,
+                    embedding,
+                    top_k,
+                    distance_metric,
+                    query_string,
+                )
+            )
+        response = self._get_client(config).msearch(searches=searches)
 
-        if embedding is None and query_string is None:
-            raise ValueError("Either embedding or query_string must be provided")
+        results = []
+        for (_, query_string), query_response in zip(queries, response["responses"]):
+            if "error" in query_response:
+                raise ValueError(
+                    f"Elasticsearch document search failed: {query_response['error']}"
+                )
+            results.append(
+                _hits_to_documents(
+                    config,
+                    requested_features,
+                    query_response["hits"]["hits"][0:top_k],
+                    query_string,
+                )
+            )
+        return results
 
-        es_index = table.name
-        body: Dict[str, Any] = {
-            "size": top_k,
-        }
-        composite_key_name = _get_composite_key_name(table)
 
-        source_fields = requested_features.copy()
-        source_fields += ["entity_key", "timestamp"]
-        source_fields += composite_key_name
-        body["_source"] = source_fields
+def _document_search_body(
+    config: RepoConfig,
+    table: FeatureView,
+    requested_features: List[str],
+    embedding: Optional[List[float]],
+    top_k: int,
+    distance_metric: Optional[str] = None,
+    query_string: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the body of a vector similarity, keyword or hybrid search request.
+    """
+    if not config.online_store.vector_enabled:
+        raise ValueError("Vector search is not enabled in the online store config")
 
-        if embedding:
-            similarity = (distance_metric or config.online_store.similarity).lower()
-            vector_field_path = (
-                config.online_store.vector_field_path or "embedding.vector_value"
-            )
-            if similarity == "cosine":
-                script = f"cosineSimilarity(params.query_vector, '{vector_field_path}') + 1.0"
-            elif similarity == "dot_product":
-                script = f"dotProduct(params.query_vector, '{vector_field_path}')"
-            elif similarity in ("l2", "l2_norm", "euclidean"):
-                script = f"1 / (1 + l2norm(params.query_vector, '{vector_field_path}'))"
-            else:
-                raise ValueError(
-                    f"Unsupported similarity/distance_metric: {similarity}"
-                )
+    if embedding is None and query_string is None:
+        raise ValueError("Either embedding or query_string must be provided")
 
-        # Hybrid search
-        if embedding and query_string:
-            body["query"] = {
-                "script_score": {
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {"query_string": {"query": f'"{query_string}"'}},
-                                {"exists": {"field": vector_field_path}},
-                            ]
-                        }
-                    },
-                    "script": {
-                        "source": script,
-                        "params": {"query_vector": embedding},
-                    },
-                }
-            }
-        # Vector search only
-        elif embedding:
-            body["query"] = {
-                "script_score": {
-                    "query": {
-                        "bool": {"filter": [{"exists": {"field": vector_field_path}}]}
-                    },
-                    "script": {"source": script, "params": {"query_vector": embedding}},
-                }
-            }
-        # Keyword search only
-        elif query_string:
-            body["query"] = {"query_string": {"query": f'"{query_string}"'}}
+    body: Dict[str, Any] = {
+        "size": top_k,
+    }
+    composite_key_name = _get_composite_key_name(table)
 
-        response = self._get_client(config).search(index=es_index, body=body)
+    source_fields = requested_features.copy()
+    source_fields += ["entity_key", "timestamp"]
+    source_fields += composite_key_name
+    body["_source"] = source_fields
 
-        rows = response["hits"]["hits"][0:top_k]
-        for row in rows:
-            entity_key = row["_source"]["entity_key"]
-            entity_key_proto = deserialize_entity_key(
-                base64.b64decode(entity_key),
-                entity_key_serialization_version=config.entity_key_serialization_version,
+    if embedding:
+        similarity = (distance_metric or config.online_store.similarity).lower()
+        vector_field_path = (
+            config.online_store.vector_field_path or "embedding.vector_value"
+        )
+        if similarity == "cosine":
+            script = (
+                f"cosineSimilarity(params.query_vector, '{vector_field_path}') + 1.0"
             )
-            timestamp = row["_source"]["timestamp"]
-            timestamp = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f")
-
-            # Create feature dict with all requested features
-            feature_dict = {"distance": _to_value_proto(float(row["_score"]))}
-            if query_string is not None:
-                feature_dict["text_rank"] = _to_value_proto(float(row["_score"]))
-            join_key_values = _extract_join_keys(entity_key_proto)
-            feature_dict.update(join_key_values)
-
-            for feature in requested_features:
-                if feature in ("distance", "text_rank"):
-                    continue
-                value = row["_source"].get(feature, None)
-                if value is not None:
-                    feature_dict[feature] = _to_value_proto(value)
+        elif similarity == "dot_product":
+            script = f"dotProduct(params.query_vector, '{vector_field_path}')"
+        elif similarity in ("l2", "l2_norm", "euclidean"):
+            script = f"1 / (1 + l2norm(params.query_vector, '{vector_field_path}'))"
+        else:
+            raise ValueError(f"Unsupported similarity/distance_metric: {similarity}")
 
-            result.append((timestamp, entity_key_proto, feature_dict))
-        return result
+    # Hybrid search
+    if embedding and query_string:
+        body["query"] = {
+            "script_score": {
+                "query": {
+                    "bool": {
+                        "must": [
+                            {"query_string": {"query": f'"{query_string}"'}},
+                            {"exists": {"field": vector_field_path}},
+                        ]
+                    }
+                },
+                "script": {
+                    "source": script,
+                    "params": {"query_vector": embedding},
+                },
+            }
+        }
+    # Vector search only
+    elif embedding:
+        body["query"] = {
+            "script_score": {
+                "query": {
+                    "bool": {"filter": [{"exists": {"field": vector_field_path}}]}
+                },
+                "script": {"source": script, "params": {"query_vector": embedding}},
+            }
+        }
+    # Keyword search only
+    elif query_string:
+        body["query"] = {"query_string": {"query": f'"{query_string}"'}}
+
+    return body
+
+
+def _hits_to_documents(
+    config: RepoConfig,
+    requested_features: List[str],
+    rows: List[Dict[str, Any]],
+    query_string: Optional[str],
+) -> List[
+    Tuple[
+        Optional[datetime],
+        Optional[EntityKeyProto],
+        Optional[Dict[str, ValueProto]],
+    ]
+]:
+    """
+    Convert the hits of a document search into documents.
+    """
+    result: List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ] = []
+    for row in rows:
+        entity_key = row["_source"]["entity_key"]
+        entity_key_proto = deserialize_entity_key(
+            base64.b64decode(entity_key),
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
+        timestamp = row["_source"]["timestamp"]
+        timestamp = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f")
+
+        # Create feature dict with all requested features
+        feature_dict = {"distance": _to_value_proto(float(row["_score"]))}
+        if query_string is not None:
+            feature_dict["text_rank"] = _to_value_proto(float(row["_score"]))
+        join_key_values = _extract_join_keys(entity_key_proto)
+        feature_dict.update(join_key_values)
+
+        for feature in requested_features:
+            if feature in ("distance", "text_rank"):
+                continue
+            value = row["_source"].get(feature, None)
+            if value is not None:
+                feature_dict[feature] = _to_value_proto(value)
+
+        result.append((timestamp, entity_key_proto, feature_dict))
+    return result
 
 
 def _to_value_proto(value: Any) -> ValueProto:
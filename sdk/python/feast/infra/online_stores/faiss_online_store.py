@@ -1,39 +1,112 @@
+import json
 import logging
+import os
+import tempfile
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple
 
 import faiss
 import numpy as np
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from feast import Entity, FeatureView, RepoConfig
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import (
+    deserialize_entity_key,
+    serialize_entity_key,
+)
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.vector_quantization import rescore, rescore_candidates
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import FloatList as FloatListProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import FeastConfigBaseModel
 
+SUPPORTED_INDEX_TYPES = ["Flat", "IVFFlat", "IVFPQ", "HNSW"]
+
+# Number of training vectors per centroid recommended by faiss for k-means clustering
+TRAINING_VECTORS_PER_CENTROID = 39
+
+SCALAR_QUANTIZER_TYPES: Dict[str, Any] = {
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+    "float16": faiss.ScalarQuantizer.QT_fp16,
+}
+
 
 class FaissOnlineStoreConfig(FeastConfigBaseModel):
+    type: Literal[
+        "faiss", "feast.infra.online_stores.faiss_online_store.FaissOnlineStore"
+    ] = "faiss"
     dimension: int
+    # Path of the index files. Each save writes a new version of the index, with a .<version> suffix, then
+    # replaces the manifest, with a .json suffix, which holds the entity keys of the index and its version.
     index_path: str
+    # One of Flat, IVFFlat, IVFPQ or HNSW
     index_type: str = "IVFFlat"
+    # IVF parameters: the number of inverted lists, and the number of lists probed by searches
     nlist: int = 100
+    nprobe: int = 1
+    # IVFPQ parameters: the number of sub-quantizers, and the number of bits per sub-quantizer code
+    pq_m: int = 8
+    pq_nbits: int = 8
+    # HNSW parameters: the number of neighbors per node, and the size of the candidate lists
+    # when building the graph and when searching it
+    hnsw_m: int = 32
+    hnsw_ef_construction: int = 40
+    hnsw_ef_search: int = 16
+    # Whether to memory-map the index file for reads instead of loading it in memory, so that the
+    # processes serving the same index share its pages. The index is loaded in memory for writes.
+    mmap: bool = False
+    # Quantization of the vectors of the index: int8 or float16 scalar quantization, or binary quantization
+    # (the sign of each dimension, for Flat indexes). int8 quantization maps each dimension from [-1, 1], the range
+    # of normalized embeddings, except for IVF indexes, which learn the range from their training vectors. IVFPQ
+    # indexes are already quantized. Full-precision vectors are kept next to the index file, with a
+    # .<version>.vectors.npy suffix, to read features and to rescore the candidates of searches.
+    quantization: Optional[Literal["int8", "float16", "binary"]] = None
+    # The number of candidates retrieved from quantized indexes, as a multiple of top_k
+    rescore_oversample: int = 4
 
 
 class InMemoryStore:
+    """
+    Maps the entity keys of an index to their ids in the index.
+
+    Ids are int64 values assigned in increasing order; an entity gets a new id whenever it is written. The ids
+    of overwritten entities are removed from the index, or recorded in `deleted_ids` and filtered out of search
+    results for indexes which do not support removal.
+    """
+
     def __init__(self):
         self.feature_names: List[str] = []
         self.entity_keys: Dict[str, int] = {}
+        self.entity_keys_by_id: Dict[int, str] = {}
+        self.next_id: int = 0
+        self.deleted_ids: Set[int] = set()
 
     def update(self, feature_names: List[str], entity_keys: Dict[str, int]):
         self.feature_names = feature_names
         self.entity_keys = entity_keys
+        self.entity_keys_by_id = {idx: key for key, idx in entity_keys.items()}
+
+    def assign_ids(self, entity_keys: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Assigns new ids to entity keys, returning the new ids and the previous ids of the entities."""
+        new_ids = np.arange(
+            self.next_id, self.next_id + len(entity_keys), dtype=np.int64
+        )
+        previous_ids = []
+        for entity_key, new_id in zip(entity_keys, new_ids):
+            previous_id = self.entity_keys.get(entity_key)
+            if previous_id is not None:
+                previous_ids.append(previous_id)
+                del self.entity_keys_by_id[previous_id]
+            self.entity_keys[entity_key] = int(new_id)
+            self.entity_keys_by_id[int(new_id)] = entity_key
+        self.next_id += len(entity_keys)
+        return new_ids, np.array(previous_ids, dtype=np.int64)
 
     def delete(self, entity_keys: List[str]):
         for entity_key in entity_keys:
             if entity_key in self.entity_keys:
-                del self.entity_keys[entity_key]
+                del self.entity_keys_by_id[self.entity_keys.pop(entity_key)]
 
     def read(self, entity_keys: List[str]) -> List[Optional[int]]:
         return [self.entity_keys.get(entity_key) for entity_key in entity_keys]
@@ -41,18 +114,133 @@ class InMemoryStore:
     def teardown(self):
         self.feature_names = []
         self.entity_keys = {}
+        self.entity_keys_by_id = {}
+        self.next_id = 0
+        self.deleted_ids = set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "feature_names": self.feature_names,
+            "entity_keys": self.entity_keys,
+            "next_id": self.next_id,
+            "deleted_ids": sorted(self.deleted_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InMemoryStore":
+        store = cls()
+        store.update(data["feature_names"], data["entity_keys"])
+        store.next_id = data["next_id"]
+        store.deleted_ids = set(data["deleted_ids"])
+        return store
 
 
 class FaissOnlineStore(OnlineStore):
-    _index: Optional[faiss.IndexIVFFlat] = None
+    """
+    Faiss implementation of the online store interface.
+
+    The feature values of an entity form its vector in a single faiss index, saved after every write so that it
+    survives restarts and can be shared by several processes, which reload it when it changes. Each save writes
+    the whole index to a new version of its file and then swaps the manifest pointing to it, so that readers
+    always load an index along with its own entity keys.
+
+    IVF indexes are trained automatically: until enough vectors are written to train them, vectors are held in
+    a flat index, which is then used to train the IVF index and replaced by it.
+
+    Quantized indexes only hold approximate vectors; their full-precision vectors, indexed by id, are saved
+    next to the index file and memory-mapped along with it.
+    """
+
+    _index: Optional[faiss.Index] = None
+    _vectors: Optional[np.ndarray] = None
     _in_memory_store: InMemoryStore = InMemoryStore()
     _config: Optional[FaissOnlineStoreConfig] = None
     _logger: logging.Logger = logging.getLogger(__name__)
-
-    def _get_index(self, config: RepoConfig) -> faiss.IndexIVFFlat:
-        if self._index is None or self._config is None:
-            raise ValueError("Index is not initialized")
-        return self._index
+    _index_file_id: Optional[Tuple[int, int, int]] = None
+    _index_version: int = 0
+    _mmapped: bool = False
+
+    def _get_index(
+        self, config: RepoConfig, writable: bool = False
+    ) -> Optional[faiss.Index]:
+        """
+        Returns the index, loading it from its file if it is not loaded yet or if the file changed.
+
+        Args:
+            config: The config for the current feature store.
+            writable: Whether the index is going to be written, in which case it is loaded in memory.
+        """
+        self._config = config.online_store
+        manifest_path = _metadata_path(self._config.index_path)
+        while True:
+            try:
+                stat = os.stat(manifest_path)
+            except FileNotFoundError:
+                return self._index
+            file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if self._index is not None and file_id == self._index_file_id:
+                if not (writable and self._mmapped):
+                    return self._index
+            try:
+                self._load(manifest_path, writable)
+            except FileNotFoundError:
+                # The version of the manifest was removed by a newer save; load the manifest again.
+                continue
+            self._index_file_id = file_id
+            return self._index
+
+    def _load(self, manifest_path: str, writable: bool) -> None:
+        assert self._config is not None
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        version = manifest["version"]
+        version_path = _version_path(self._config.index_path, version)
+        mmapped = self._config.mmap and not writable
+        vectors = None
+        if self._config.quantization:
+            vectors = np.load(
+                _vectors_path(version_path), mmap_mode="r" if mmapped else None
+            )
+        index = faiss.read_index(
+            version_path,
+            faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmapped else 0,
+        )
+        _set_search_parameters(index, self._config)
+        self._index = index
+        self._vectors = vectors
+        self._in_memory_store = InMemoryStore.from_dict(manifest)
+        self._index_version = version
+        self._mmapped = mmapped
+
+    def _save(self) -> None:
+        """
+        Saves the index and its vectors to a new version of their files, then replaces the manifest atomically.
+
+        The previous version is kept, so that processes which just read the previous manifest can still load it.
+        """
+        assert self._config is not None and self._index is not None
+        index, vectors = self._index, self._vectors
+        index_path = self._config.index_path
+        version = self._index_version + 1
+        version_path = _version_path(index_path, version)
+        if vectors is not None:
+            _replace_file(
+                _vectors_path(version_path), lambda path: _write_vectors(path, vectors)
+            )
+        _replace_file(version_path, lambda path: faiss.write_index(index, path))
+        manifest_path = _metadata_path(index_path)
+        _replace_file(
+            manifest_path,
+            lambda path: _write_json(
+                path, {**self._in_memory_store.to_dict(), "version": version}
+            ),
+        )
+        self._index_version = version
+        stat = os.stat(manifest_path)
+        self._index_file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        for path_version, path in _versioned_paths(index_path):
+            if path_version < version - 1:
+                os.remove(path)
 
     def update(
         self,
@@ -68,18 +256,19 @@ class FaissOnlineStore(OnlineStore):
             return
 
         feature_names = [f.name for f in feature_views[0].features]
-        dimension = len(feature_names)
-
-        self._config = FaissOnlineStoreConfig(**config.online_store.dict())
-        if self._index is None or not partial:
-            quantizer = faiss.IndexFlatL2(dimension)
-            self._index = faiss.IndexIVFFlat(quantizer, dimension, self._config.nlist)
-            self._index.train(
-                np.random.rand(self._config.nlist * 100, dimension).astype(np.float32)
-            )
-            self._in_memory_store = InMemoryStore()
+        index = self._get_index(config, writable=True)
+        if index is not None and self._in_memory_store.feature_names == feature_names:
+            return
 
+        assert self._config is not None
+        self._index = _create_index(self._config, len(feature_names))
+        self._vectors = None
+        if self._config.quantization:
+            self._vectors = np.empty((0, len(feature_names)), dtype=np.float32)
+        self._in_memory_store = InMemoryStore()
         self._in_memory_store.update(feature_names, {})
+        self._mmapped = False
+        self._save()
 
     def teardown(
         self,
@@ -88,7 +277,15 @@ class FaissOnlineStore(OnlineStore):
         entities: Sequence[Entity],
     ):
         self._index = None
+        self._vectors = None
+        self._index_file_id = None
+        self._index_version = 0
         self._in_memory_store.teardown()
+        index_path = config.online_store.index_path
+        if os.path.exists(_metadata_path(index_path)):
+            os.remove(_metadata_path(index_path))
+        for _, path in _versioned_paths(index_path):
+            os.remove(path)
 
     def online_read(
         self,
@@ -97,7 +294,8 @@ class FaissOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        if self._index is None:
+        index = self._get_index(config)
+        if index is None:
             return [(None, None)] * len(entity_keys)
 
         results: List[Tuple[Optional[datetime], Optional[Dict[str, Any]]]] = []
@@ -109,7 +307,11 @@ class FaissOnlineStore(OnlineStore):
             if idx == -1:
                 results.append((None, None))
             else:
-                feature_vector = self._index.reconstruct(int(idx))
+                feature_vector = (
+                    self._vectors[idx]
+                    if self._vectors is not None
+                    else index.reconstruct(int(idx))
+                )
                 feature_dict = {
                     name: ValueProto(double_val=value)
                     for name, value in zip(
@@ -128,12 +330,14 @@ class FaissOnlineStore(OnlineStore):
         ],
         progress: Optional[Callable[[int], Any]],
     ) -> None:
-        if self._index is None:
+        index = self._get_index(config, writable=True)
+        if index is None:
             self._logger.warning("Index is not initialized. Skipping write operation.")
             return
+        assert self._config is not None
 
-        feature_vectors = []
-        serialized_keys = []
+        # Only the last row of each entity key is written, so that each entity has a single vector in the index.
+        feature_vectors: Dict[str, np.ndarray] = {}
 
         for entity_key, feature_dict, _, _ in data:
             serialized_key = serialize_entity_key(
@@ -147,27 +351,29 @@ class FaissOnlineStore(OnlineStore):
                 dtype=np.float32,
             )
 
-            feature_vectors.append(feature_vector)
-            serialized_keys.append(serialized_key)
+            feature_vectors[serialized_key] = feature_vector
 
-        feature_vectors_array = np.array(feature_vectors)
-
-        existing_indices = [
-            self._in_memory_store.entity_keys.get(sk, -1) for sk in serialized_keys
-        ]
-        mask = np.array(existing_indices) != -1
-        if np.any(mask):
-            self._index.remove_ids(
-                np.array([idx for idx in existing_indices if idx != -1])
-            )
-
-        new_indices = np.arange(
-            self._index.ntotal, self._index.ntotal + len(feature_vectors_array)
-        )
-        self._index.add(feature_vectors_array)
+        new_ids, previous_ids = self._in_memory_store.assign_ids(list(feature_vectors))
+        if len(previous_ids):
+            if self._config.index_type == "HNSW":
+                # HNSW graphs do not support removal.
+                self._in_memory_store.deleted_ids.update(previous_ids.tolist())
+            else:
+                index.remove_ids(
+                    faiss.IDSelectorArray(
+                        len(previous_ids), faiss.swig_ptr(previous_ids)
+                    )
+                )
+        vectors = np.array(list(feature_vectors.values()), dtype=np.float32)
+        index.add_with_ids(vectors, new_ids)
+        if self._vectors is not None:
+            # Ids are assigned in increasing order, so the vector of each id is at its position.
+            self._vectors = np.concatenate([self._vectors, vectors])
 
-        for sk, idx in zip(serialized_keys, new_indices):
-            self._in_memory_store.entity_keys[sk] = idx
+        if _is_training_size_reached(index, self._config):
+            assert isinstance(index, faiss.IndexIDMap2)
+            self._index = _train_index(index, self._config, self._vectors)
+        self._save()
 
         if progress:
             progress(len(data))
@@ -189,14 +395,20 @@ class FaissOnlineStore(OnlineStore):
             Optional[ValueProto],
         ]
     ]:
-        if self._index is None:
-            self._logger.warning("Index is not initialized. Returning empty result.")
-            return []
-
-        query_vector = np.array(embedding, dtype=np.float32).reshape(1, -1)
-        distances, indices = self._index.search(query_vector, top_k)
+        return self.retrieve_online_documents_batch(
+            config, table, requested_featres, [embedding], top_k, distance_metric
+        )[0]
 
-        results: List[
+    def retrieve_online_documents_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: List[List[float]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+    ) -> List[
+        List[
             Tuple[
                 Optional[datetime],
                 Optional[EntityKeyProto],
@@ -204,30 +416,200 @@ class FaissOnlineStore(OnlineStore):
                 Optional[ValueProto],
                 Optional[ValueProto],
             ]
-        ] = []
-        for i, idx in enumerate(indices[0]):
-            if idx == -1:
-                continue
+        ]
+    ]:
+        """
+        Retrieves the top k documents of several query embeddings with a single search of the index.
+
+        Returns:
+            The documents of each query embedding, in the format of `retrieve_online_documents`.
+        """
+        timestamp = Timestamp()
+        timestamp.GetCurrentTime()
+        results = []
+        for query_documents in self._search_documents(config, embeddings, top_k):
+            query_results: List[
+                Tuple[
+                    Optional[datetime],
+                    Optional[EntityKeyProto],
+                    Optional[ValueProto],
+                    Optional[ValueProto],
+                    Optional[ValueProto],
+                ]
+            ] = []
+            for entity_key, feature_vector, distance in query_documents:
+                vector_value = ValueProto(
+                    float_list_val=FloatListProto(val=feature_vector.tolist())
+                )
+                feature_value = vector_value
+                distance_value = ValueProto(float_val=distance)
+
+                query_results.append(
+                    (
+                        timestamp.ToDatetime(),
+                        entity_key,
+                        feature_value,
+                        vector_value,
+                        distance_value,
+                    )
+                )
+            results.append(query_results)
 
-            feature_vector = self._index.reconstruct(int(idx))
+        return results
 
-            timestamp = Timestamp()
-            timestamp.GetCurrentTime()
-            entity_value = EntityKeyProto()
-            feature_value = ValueProto(string_val=",".join(map(str, feature_vector)))
-            vector_value = ValueProto(string_val=",".join(map(str, feature_vector)))
-            distance_value = ValueProto(float_val=distances[0][i])
+    def retrieve_online_documents_v2(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embedding: Optional[List[float]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_string: Optional[str] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ]:
+        return self.retrieve_online_documents_v2_batch(
+            config,
+            table,
+            requested_features,
+            [embedding] if embedding is not None else None,
+            top_k,
+            distance_metric,
+            [query_string] if query_string is not None else None,
+        )[0]
+
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[EntityKeyProto],
+                Optional[Dict[str, ValueProto]],
+            ]
+        ]
+    ]:
+        """
+        Retrieves the top k documents of several query embeddings with a single search of the index.
+
+        The features of each document are the values of its vector, along with the "distance" to the query.
+        """
+        if embeddings is None or (
+            query_strings is not None and any(q is not None for q in query_strings)
+        ):
+            raise ValueError("FaissOnlineStore does not support keyword search")
+
+        timestamp = Timestamp()
+        timestamp.GetCurrentTime()
+        results = []
+        for query_documents in self._search_documents(config, embeddings, top_k):
+            query_results: List[
+                Tuple[
+                    Optional[datetime],
+                    Optional[EntityKeyProto],
+                    Optional[Dict[str, ValueProto]],
+                ]
+            ] = []
+            for entity_key, feature_vector, distance in query_documents:
+                features = {
+                    name: ValueProto(double_val=value)
+                    for name, value in zip(
+                        self._in_memory_store.feature_names, feature_vector
+                    )
+                    if not requested_features or name in requested_features
+                }
+                features["distance"] = ValueProto(float_val=distance)
+                query_results.append((timestamp.ToDatetime(), entity_key, features))
+            results.append(query_results)
 
-            results.append(
+        return results
+
+    def _search_documents(
+        self, config: RepoConfig, embeddings: List[List[float]], top_k: int
+    ) -> List[List[Tuple[EntityKeyProto, np.ndarray, float]]]:
+        """Searches the index for each query embedding, returning the entity key, vector and distance of its documents."""
+        index = self._get_index(config)
+        if index is None:
+            self._logger.warning("Index is not initialized. Returning empty result.")
+            return [[] for _ in embeddings]
+        assert self._config is not None
+
+        query_vectors = np.array(embeddings, dtype=np.float32).reshape(
+            len(embeddings), -1
+        )
+        if self._vectors is not None:
+            return self._search_quantized_documents(config, index, query_vectors, top_k)
+        distances, indices = _search(
+            index, self._config, query_vectors, top_k, self._in_memory_store.deleted_ids
+        )
+
+        return [
+            [
                 (
-                    timestamp.ToDatetime(),
-                    entity_value,
-                    feature_value,
-                    vector_value,
-                    distance_value,
+                    deserialize_entity_key(
+                        bytes.fromhex(
+                            self._in_memory_store.entity_keys_by_id[int(idx)]
+                        ),
+                        config.entity_key_serialization_version,
+                    ),
+                    index.reconstruct(int(idx)),
+                    float(distance),
                 )
-            )
+                for distance, idx in zip(query_distances, query_indices)
+                if idx != -1
+            ]
+            for query_distances, query_indices in zip(distances, indices)
+        ]
 
+    def _search_quantized_documents(
+        self,
+        config: RepoConfig,
+        index: faiss.Index,
+        query_vectors: np.ndarray,
+        top_k: int,
+    ) -> List[List[Tuple[EntityKeyProto, np.ndarray, float]]]:
+        """Searches a quantized index for candidates, which are ranked by the L2 distance of their full-precision vector."""
+        assert self._config is not None and self._vectors is not None
+        _, indices = _search(
+            index,
+            self._config,
+            query_vectors,
+            rescore_candidates(top_k, self._config.rescore_oversample),
+            self._in_memory_store.deleted_ids,
+        )
+
+        results = []
+        for query_vector, query_indices in zip(query_vectors, indices):
+            ids = query_indices[query_indices != -1]
+            vectors = np.asarray(self._vectors[ids])
+            order, distances = rescore(query_vector, vectors, "L2", top_k)
+            results.append(
+                [
+                    (
+                        deserialize_entity_key(
+                            bytes.fromhex(
+                                self._in_memory_store.entity_keys_by_id[int(ids[i])]
+                            ),
+                            config.entity_key_serialization_version,
+                        ),
+                        vectors[i],
+                        float(distance),
+                    )
+                    for i, distance in zip(order, distances)
+                ]
+            )
         return results
 
     async def online_read_async(
@@ -239,3 +621,176 @@ class FaissOnlineStore(OnlineStore):
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
         # Implement async read if needed
         raise NotImplementedError("Async read is not implemented for FaissOnlineStore")
+
+
+def _create_index(config: FaissOnlineStoreConfig, dimension: int) -> faiss.Index:
+    """
+    Creates an empty index with ids.
+
+    IVF indexes, which must be trained before vectors are added, start as flat indexes.
+    """
+    if config.index_type not in SUPPORTED_INDEX_TYPES:
+        raise ValueError(
+            f"Index type {config.index_type} is not supported. Supported index types are {SUPPORTED_INDEX_TYPES}"
+        )
+    if config.quantization == "binary" and config.index_type != "Flat":
+        raise ValueError("Binary quantization is only supported by Flat indexes")
+    if config.quantization and config.index_type == "IVFPQ":
+        raise ValueError("IVFPQ indexes do not support quantization")
+
+    if config.index_type == "HNSW":
+        hnsw_index: Any
+        if config.quantization:
+            hnsw_index = faiss.IndexHNSWSQ(
+                dimension, SCALAR_QUANTIZER_TYPES[config.quantization], config.hnsw_m
+            )
+            _train_unit_range(hnsw_index, dimension)
+        else:
+            hnsw_index = faiss.IndexHNSWFlat(dimension, config.hnsw_m)
+        hnsw_index.hnsw.efConstruction = config.hnsw_ef_construction
+        index = faiss.IndexIDMap2(hnsw_index)
+    elif config.quantization == "binary":
+        # Without rotation nor trained thresholds, each bit of an LSH code is the sign of a dimension.
+        index = faiss.IndexIDMap2(faiss.IndexLSH(dimension, dimension))
+    elif config.quantization:
+        flat_index = faiss.IndexScalarQuantizer(
+            dimension, SCALAR_QUANTIZER_TYPES[config.quantization]
+        )
+        _train_unit_range(flat_index, dimension)
+        index = faiss.IndexIDMap2(flat_index)
+    else:
+        index = faiss.IndexIDMap2(faiss.IndexFlatL2(dimension))
+    _set_search_parameters(index, config)
+    return index
+
+
+def _is_training_size_reached(
+    index: faiss.Index, config: FaissOnlineStoreConfig
+) -> bool:
+    if config.index_type not in ("IVFFlat", "IVFPQ") or isinstance(
+        index, faiss.IndexIVF
+    ):
+        return False
+    centroids = config.nlist
+    if config.index_type == "IVFPQ":
+        centroids = max(centroids, 2**config.pq_nbits)
+    return index.ntotal >= centroids * TRAINING_VECTORS_PER_CENTROID
+
+
+def _train_unit_range(index: faiss.Index, dimension: int) -> None:
+    """Trains the scalar quantizer of an index to map each dimension from [-1, 1]."""
+    index.train(np.array([[-1.0] * dimension, [1.0] * dimension], dtype=np.float32))
+
+
+def _train_index(
+    flat_index: faiss.IndexIDMap2,
+    config: FaissOnlineStoreConfig,
+    full_precision_vectors: Optional[np.ndarray] = None,
+) -> faiss.IndexIVF:
+    """
+    Trains an IVF index on the vectors of a flat index, and moves the vectors to it.
+
+    Quantized flat indexes only hold approximate vectors, so the IVF index is trained on the full-precision
+    vectors of their ids, if given.
+    """
+    ids = faiss.vector_to_array(flat_index.id_map)
+    if full_precision_vectors is not None:
+        vectors = np.asarray(full_precision_vectors[ids], dtype=np.float32)
+    else:
+        vectors = flat_index.index.reconstruct_n(0, flat_index.ntotal)
+
+    quantizer = faiss.IndexFlatL2(flat_index.d)
+    index: faiss.IndexIVF
+    if config.quantization:
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer,
+            flat_index.d,
+            config.nlist,
+            SCALAR_QUANTIZER_TYPES[config.quantization],
+        )
+    elif config.index_type == "IVFPQ":
+        index = faiss.IndexIVFPQ(
+            quantizer, flat_index.d, config.nlist, config.pq_m, config.pq_nbits
+        )
+    else:
+        index = faiss.IndexIVFFlat(quantizer, flat_index.d, config.nlist)
+    index.train(vectors)
+    # IVF indexes hold their own ids; a hash table maps them to vectors for reconstruction and removal.
+    index.set_direct_map_type(faiss.DirectMap.Hashtable)  # type: ignore[attr-defined]
+    index.add_with_ids(vectors, ids)
+    _set_search_parameters(index, config)
+    return index
+
+
+def _set_search_parameters(index: faiss.Index, config: FaissOnlineStoreConfig) -> None:
+    if isinstance(index, faiss.IndexIVF):
+        index.nprobe = config.nprobe
+    elif isinstance(index, faiss.IndexIDMap2) and config.index_type == "HNSW":
+        hnsw_index: Any = faiss.downcast_index(index.index)
+        hnsw_index.hnsw.efSearch = config.hnsw_ef_search
+
+
+def _search(
+    index: faiss.Index,
+    config: FaissOnlineStoreConfig,
+    query_vectors: np.ndarray,
+    top_k: int,
+    deleted_ids: Set[int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    if not deleted_ids:
+        return index.search(query_vectors, top_k)
+    selector = faiss.IDSelectorNot(
+        faiss.IDSelectorBatch(np.array(sorted(deleted_ids), dtype=np.int64))
+    )
+    params = faiss.SearchParametersHNSW(  # type: ignore[attr-defined]
+        sel=selector, efSearch=config.hnsw_ef_search
+    )
+    return index.search(query_vectors, top_k, params=params)
+
+
+def _metadata_path(index_path: str) -> str:
+    return f"{index_path}.json"
+
+
+def _version_path(index_path: str, version: int) -> str:
+    return f"{index_path}.{version}"
+
+
+def _vectors_path(version_path: str) -> str:
+    return f"{version_path}.vectors.npy"
+
+
+def _versioned_paths(index_path: str) -> List[Tuple[int, str]]:
+    """Returns the versions of the index and vectors files of an index, along with their paths."""
+    directory, name = os.path.split(os.path.abspath(index_path))
+    paths = []
+    for file_name in os.listdir(directory):
+        if not file_name.startswith(f"{name}."):
+            continue
+        version = file_name[len(name) + 1 :].split(".")[0]
+        if version.isdigit():
+            paths.append((int(version), os.path.join(directory, file_name)))
+    return paths
+
+
+def _write_vectors(path: str, vectors: np.ndarray) -> None:
+    with open(path, "wb") as f:
+        np.save(f, vectors)
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def _replace_file(path: str, write: Callable[[str], None]) -> None:
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".feast-faiss-"
+    )
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,220 @@
+"""
+Rank fusion for hybrid document retrieval, which combines a vector similarity search and a keyword search.
+
+Both searches return `HybridFusion.candidates(top_k)` documents, ordered from the best match, which are fused
+into a single ranking with either:
+
+- Reciprocal rank fusion ("rrf"): a document scores `weight / (rrf_k + rank)` in each search it is found by.
+- Weighted fusion ("weighted"): the scores of each search are normalized to [0, 1], from its worst candidate
+  to its best one, and a document scores `weight * normalized score` in each search it is found by.
+
+Only the ranks and scores of the candidates are used, so fusion does not depend on whether a store returns
+distances or similarities.
+"""
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+
+K = TypeVar("K", bound=Hashable)
+
+Document = Tuple[
+    Optional[datetime],
+    Optional[EntityKeyProto],
+    Optional[Dict[str, ValueProto]],
+]
+
+HYBRID_SCORE_FEATURE = "hybrid_score"
+
+
+@dataclass(frozen=True)
+class HybridFusion:
+    """
+    How the results of the vector and keyword searches of a hybrid retrieval are fused.
+
+    Attributes:
+        method: "rrf" for reciprocal rank fusion, or "weighted" for the weighted sum of normalized scores.
+        vector_weight: The weight of the vector search, between 0 and 1. The keyword search weighs the rest.
+        rrf_k: The rank constant of reciprocal rank fusion.
+        oversample: The number of candidates retrieved by each search, as a multiple of the number of documents
+            to return.
+    """
+
+    method: Literal["rrf", "weighted"] = "rrf"
+    vector_weight: float = 0.5
+    rrf_k: int = 60
+    oversample: int = 4
+
+    def __post_init__(self):
+        if self.method not in ("rrf", "weighted"):
+            raise ValueError(
+                f"Unsupported fusion method {self.method}, expected 'rrf' or 'weighted'"
+            )
+        if not 0 <= self.vector_weight <= 1:
+            raise ValueError("vector_weight must be between 0 and 1")
+        if self.rrf_k < 0:
+            raise ValueError("rrf_k must not be negative")
+        if self.oversample < 1:
+            raise ValueError("oversample must be at least 1")
+
+    @property
+    def text_weight(self) -> float:
+        return 1 - self.vector_weight
+
+    def candidates(self, top_k: int) -> int:
+        """Returns the number of candidates each search should retrieve."""
+        return top_k * self.oversample
+
+
+def fuse_rankings(
+    vector_ranking: Sequence[Tuple[K, float]],
+    text_ranking: Sequence[Tuple[K, float]],
+    fusion: HybridFusion,
+    top_k: int,
+) -> List[Tuple[K, float]]:
+    """
+    Fuses the rankings of the vector and keyword searches.
+
+    Args:
+        vector_ranking: The keys and scores of the vector search candidates, from the best match.
+        text_ranking: The keys and scores of the keyword search candidates, from the best match.
+        fusion: How to fuse the rankings.
+        top_k: The number of keys to return.
+
+    Returns:
+        The top k keys and their fused scores, from the highest score.
+    """
+    scores: Dict[K, float] = defaultdict(float)
+    for weight, ranking in (
+        (fusion.vector_weight, vector_ranking),
+        (fusion.text_weight, text_ranking),
+    ):
+        for key, score in _ranking_scores(ranking, fusion):
+            scores[key] += weight * score
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def _ranking_scores(
+    ranking: Sequence[Tuple[K, float]], fusion: HybridFusion
+) -> List[Tuple[K, float]]:
+    seen = set()
+    unique_ranking = []
+    for key, score in ranking:
+        if key not in seen:
+            seen.add(key)
+            unique_ranking.append((key, score))
+    if not unique_ranking:
+        return []
+
+    if fusion.method == "rrf":
+        return [
+            (key, 1 / (fusion.rrf_k + rank))
+            for rank, (key, _) in enumerate(unique_ranking, start=1)
+        ]
+
+    best, worst = unique_ranking[0][1], unique_ranking[-1][1]
+    if best == worst:
+        return [(key, 1.0) for key, _ in unique_ranking]
+    return [(key, (score - worst) / (best - worst)) for key, score in unique_ranking]
+
+
+def fuse_documents(
+    vector_documents: Sequence[Document],
+    text_documents: Sequence[Document],
+    fusion: HybridFusion,
+    top_k: int,
+) -> List[Document]:
+    """
+    Fuses the documents returned by the vector and keyword searches, from the best match.
+
+    The features of a document found by both searches are merged, and its fused score is added as the
+    "hybrid_score" feature. Documents are scored with their "distance" feature in the vector search, and with
+    their "text_rank" feature, or "distance" if the store does not return it, in the keyword search.
+    """
+    documents: Dict[bytes, Document] = {}
+
+    def ranking(
+        search_documents: Sequence[Document], score_features: Sequence[str]
+    ) -> List[Tuple[bytes, float]]:
+        keys = []
+        for document in search_documents:
+            _, entity_key, features = document
+            if entity_key is None:
+                continue
+            key = entity_key.SerializeToString()
+            if key in documents:
+                merged = dict(documents[key][2] or {})
+                merged.update(features or {})
+                documents[key] = (document[0], entity_key, merged)
+            else:
+                documents[key] = document
+            keys.append((key, _feature_score(features or {}, score_features)))
+        return keys
+
+    fused = fuse_rankings(
+        ranking(vector_documents, ["distance"]),
+        ranking(text_documents, ["text_rank", "distance"]),
+        fusion,
+        top_k,
+    )
+
+    results: List[Document] = []
+    for key, score in fused:
+        timestamp, entity_key, features = documents[key]
+        features = dict(features or {})
+        features[HYBRID_SCORE_FEATURE] = ValueProto(double_val=score)
+        results.append((timestamp, entity_key, features))
+    return results
+
+
+def _feature_score(
+    features: Dict[str, ValueProto], score_features: Sequence[str]
+) -> float:
+    for name in score_features:
+        value = features.get(name)
+        field = value.WhichOneof("val") if value is not None else None
+        if field is not None:
+            return float(getattr(value, field))
+    return 0.0
+
+
+def retrieve_hybrid_documents(
+    retrieve: Callable[[Optional[List[float]], Optional[str], int], List[Document]],
+    embedding: List[float],
+    query_string: str,
+    top_k: int,
+    fusion: HybridFusion,
+) -> List[Document]:
+    """
+    Runs the vector and keyword searches of a hybrid retrieval concurrently and fuses their documents.
+
+    Args:
+        retrieve: Retrieves documents for an embedding or a query string, with the number of documents to
+            return, from the best match.
+        embedding: The query embedding.
+        query_string: The query string.
+        top_k: The number of documents to return.
+        fusion: How to fuse the documents.
+    """
+    candidates = fusion.candidates(top_k)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        vector_documents = executor.submit(retrieve, embedding, None, candidates)
+        text_documents = executor.submit(retrieve, None, query_string, candidates)
+        return fuse_documents(
+            vector_documents.result(), text_documents.result(), fusion, top_k
+        )
@@ -3,6 +3,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from pydantic import StrictStr
 from pymilvus import (
     CollectionSchema,
@@ -13,12 +14,14 @@ from pymilvus import (
 
 from feast import Entity
 from feast.feature_view import FeatureView
+from feast.field import Field
 from feast.infra.infra_object import InfraObject
 from feast.infra.key_encoding_utils import (
     deserialize_entity_key,
     serialize_entity_key,
 )
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.vector_quantization import rescore, rescore_candidates
 from feast.infra.online_stores.vector_store import VectorStoreConfig
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
@@ -214,13 +217,16 @@ class MilvusOnlineStore(OnlineStore):
                         metric = vector_field_dict[
                             vector_field.name
                         ].vector_search_metric
+                        index_type, params = _vector_index_params(
+                            vector_field_dict[vector_field.name], config.online_store
+                        )
                         index_params.add_index(
                             collection_name=collection_name,
                             field_name=vector_field.name,
                             metric_type=metric or config.online_store.metric_type,
-                            index_type=config.online_store.index_type,
+                            index_type=index_type,
                             index_name=f"vector_index_{vector_field.name}",
-                            params={"nlist": config.online_store.nlist},
+                            params=params,
                         )
                 if len(index_params) > 0:
                     self.client.create_index(
@@ -516,31 +522,18 @@ class MilvusOnlineStore(OnlineStore):
             raise ValueError("Either embedding or query_string must be provided")
 
         composite_key_name = _get_composite_key_name(table)
-
-        output_fields = (
-            [composite_key_name]
-            + (requested_features if requested_features else [])
-            + ["created_ts", "event_ts"]
-        )
-        assert all(
-            field in [f["name"] for f in collection["fields"]]
-            for field in output_fields
-        ), (
-            f"field(s) [{[field for field in output_fields if field not in [f['name'] for f in collection['fields']]]}] not found in collection schema"
+        output_fields, ann_search_field = _search_output_fields(
+            collection, composite_key_name, requested_features
         )
 
-        # Find the vector search field if we need it
-        ann_search_field = None
-        if embedding is not None:
-            for field in collection["fields"]:
-                if (
-                    field["type"] in [DataType.FLOAT_VECTOR, DataType.BINARY_VECTOR]
-                    and field["name"] in output_fields
-                ):
-                    ann_search_field = field["name"]
-                    break
-
         self.client.load_collection(collection_name)
+        metric = _search_metric(table, ann_search_field, config, distance_metric)
+        quantized = _is_quantized(table, ann_search_field)
+        limit = (
+            rescore_candidates(top_k, config.online_store.vector_rescore_oversample)
+            if quantized
+            else top_k
+        )
 
         if (
             embedding is not None
@@ -580,10 +573,15 @@ class MilvusOnlineStore(OnlineStore):
                 data=[embedding],
                 anns_field=ann_search_field,
                 search_params=search_params,
-                limit=top_k,
+                limit=limit,
                 output_fields=output_fields,
                 filter=filter_expr if filter_expr else None,
             )
+            if quantized:
+                results = [
+                    _rescore_hits(hits, ann_search_field, embedding, metric, top_k)
+                    for hits in results
+                ]
 
         elif embedding is not None and config.online_store.vector_enabled:
             # Vector search only
@@ -597,9 +595,14 @@ class MilvusOnlineStore(OnlineStore):
                 data=[embedding],
                 anns_field=ann_search_field,
                 search_params=search_params,
-                limit=top_k,
+                limit=limit,
                 output_fields=output_fields,
             )
+            if quantized:
+                results = [
+                    _rescore_hits(hits, ann_search_field, embedding, metric, top_k)
+                    for hits in results
+                ]
 
         elif query_string is not None:
             string_field_list = [
@@ -643,67 +646,269 @@ class MilvusOnlineStore(OnlineStore):
 
         result_list = []
         for hits in results:
-            for hit in hits:
-                res = {}
-                res_ts = None
-                entity_key_bytes = bytes.fromhex(
-                    hit.get("entity", {}).get(composite_key_name, None)
+            result_list.extend(
+                _hits_to_documents(
+                    hits,
+                    output_fields,
+                    composite_key_name,
+                    ann_search_field,
+                    embedding,
+                    entity_name_feast_primitive_type_map,
                 )
-                entity_key_proto = (
-                    deserialize_entity_key(entity_key_bytes)
-                    if entity_key_bytes
-                    else None
+            )
+        return result_list
+
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[EntityKeyProto],
+                Optional[Dict[str, ValueProto]],
+            ]
+        ]
+    ]:
+        """
+        Retrieves documents for several query embeddings with a single Milvus search request.
+
+        Batches with query strings are run query by query.
+        """
+        if (
+            embeddings is None
+            or (query_strings is not None and any(query_strings))
+            or not config.online_store.vector_enabled
+        ):
+            return super().retrieve_online_documents_v2_batch(
+                config,
+                table,
+                requested_features,
+                embeddings,
+                top_k,
+                distance_metric,
+                query_strings,
+            )
+
+        entity_name_feast_primitive_type_map = {
+            k.name: k.dtype for k in table.entity_columns
+        }
+        self.client = self._connect(config)
+        collection_name = _table_id(config.project, table)
+        collection = self._get_or_create_collection(config, table)
+        composite_key_name = _get_composite_key_name(table)
+        output_fields, ann_search_field = _search_output_fields(
+            collection, composite_key_name, requested_features
+        )
+
+        self.client.load_collection(collection_name)
+        metric = _search_metric(table, ann_search_field, config, distance_metric)
+        quantized = _is_quantized(table, ann_search_field)
+        results = self.client.search(
+            collection_name=collection_name,
+            data=embeddings,
+            anns_field=ann_search_field,
+            search_params={
+                "metric_type": distance_metric or config.online_store.metric_type,
+                "params": {"nprobe": 10},
+            },
+            limit=rescore_candidates(
+                top_k, config.online_store.vector_rescore_oversample
+            )
+            if quantized
+            else top_k,
+            output_fields=output_fields,
+        )
+        if quantized:
+            results = [
+                _rescore_hits(hits, ann_search_field, embedding, metric, top_k)
+                for hits, embedding in zip(results, embeddings)
+            ]
+        return [
+            _hits_to_documents(
+                hits,
+                output_fields,
+                composite_key_name,
+                ann_search_field,
+                embedding,
+                entity_name_feast_primitive_type_map,
+            )
+            for hits, embedding in zip(results, embeddings)
+        ]
+
+
+def _search_output_fields(
+    collection: Dict[str, Any],
+    composite_key_name: str,
+    requested_features: List[str],
+) -> Tuple[List[str], Optional[str]]:
+    """Returns the output fields of a document search, and the vector field searched among them."""
+    output_fields = (
+        [composite_key_name]
+        + (requested_features if requested_features else [])
+        + ["created_ts", "event_ts"]
+    )
+    assert all(
+        field in [f["name"] for f in collection["fields"]] for field in output_fields
+    ), (
+        f"field(s) [{[field for field in output_fields if field not in [f['name'] for f in collection['fields']]]}] not found in collection schema"
+    )
+
+    ann_search_field = None
+    for field in collection["fields"]:
+        if (
+            field["type"] in [DataType.FLOAT_VECTOR, DataType.BINARY_VECTOR]
+            and field["name"] in output_fields
+        ):
+            ann_search_field = field["name"]
+            break
+    return output_fields, ann_search_field
+
+
+def _vector_index_params(
+    field: Field, online_store: MilvusOnlineStoreConfig
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Returns the index type and parameters of a vector field.
+
+    Quantized fields are indexed with the quantized index of their quantization: IVF_SQ8 for int8, HNSW_SQ with
+    float16 scalar quantization for float16, and IVF_RABITQ, which keeps one bit per dimension, for binary.
+    """
+    if field.vector_quantization == "int8":
+        return "IVF_SQ8", {"nlist": online_store.nlist}
+    if field.vector_quantization == "float16":
+        return "HNSW_SQ", {"sq_type": "FP16"}
+    if field.vector_quantization == "binary":
+        return "IVF_RABITQ", {"nlist": online_store.nlist}
+    return online_store.index_type or "FLAT", {"nlist": online_store.nlist}
+
+
+def _is_quantized(table: FeatureView, vector_field: Optional[str]) -> bool:
+    return any(
+        field.name == vector_field and field.vector_quantization
+        for field in table.schema
+    )
+
+
+def _search_metric(
+    table: FeatureView,
+    vector_field: Optional[str],
+    config: RepoConfig,
+    distance_metric: Optional[str],
+) -> str:
+    """Returns the metric of a search: the requested one, or else the metric of the vector field index."""
+    if distance_metric:
+        return distance_metric
+    for field in table.schema:
+        if field.name == vector_field and field.vector_search_metric:
+            return field.vector_search_metric
+    return config.online_store.metric_type
+
+
+def _rescore_hits(
+    hits,
+    vector_field: Optional[str],
+    embedding: Sequence[float],
+    metric: str,
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """Ranks the hits of a quantized index by the full-precision distance of their vector and keeps the top k."""
+    hits = list(hits)
+    if not hits:
+        return []
+    vectors = np.array([hit["entity"][vector_field] for hit in hits], dtype=np.float32)
+    order, distances = rescore(embedding, vectors, metric, top_k)
+    rescored = []
+    for i, distance in zip(order, distances):
+        hit = dict(hits[i])
+        hit["distance"] = float(distance)
+        rescored.append(hit)
+    return rescored
+
+
+def _hits_to_documents(
+    hits,
+    output_fields: List[str],
+    composite_key_name: str,
+    ann_search_field: Optional[str],
+    embedding: Optional[List[float]],
+    entity_name_feast_primitive_type_map: Dict[str, Any],
+) -> List[
+    Tuple[
+        Optional[datetime],
+        Optional[EntityKeyProto],
+        Optional[Dict[str, ValueProto]],
+    ]
+]:
+    """Converts the hits of a query into documents."""
+    documents: List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ] = []
+    for hit in hits:
+        res = {}
+        res_ts = None
+        entity_key_bytes = bytes.fromhex(
+            hit.get("entity", {}).get(composite_key_name, None)
+        )
+        entity_key_proto = (
+            deserialize_entity_key(entity_key_bytes) if entity_key_bytes else None
+        )
+        for field in output_fields:
+            val = ValueProto()
+            field_value = hit.get("entity", {}).get(field, None)
+            # entity_key_proto = None
+            if field in ["created_ts", "event_ts"]:
+                res_ts = datetime.fromtimestamp(field_value / 1e6)
+            elif field == ann_search_field and embedding is not None:
+                serialized_embedding = _serialize_vector_to_float_list(embedding)
+                res[ann_search_field] = serialized_embedding
+            elif (
+                entity_name_feast_primitive_type_map.get(
+                    field, PrimitiveFeastType.INVALID
                 )
-                for field in output_fields:
-                    val = ValueProto()
-                    field_value = hit.get("entity", {}).get(field, None)
-                    # entity_key_proto = None
-                    if field in ["created_ts", "event_ts"]:
-                        res_ts = datetime.fromtimestamp(field_value / 1e6)
-                    elif field == ann_search_field and embedding is not None:
-                        serialized_embedding = _serialize_vector_to_float_list(
-                            embedding
-                        )
-                        res[ann_search_field] = serialized_embedding
-                    elif (
-                        entity_name_feast_primitive_type_map.get(
-                            field, PrimitiveFeastType.INVALID
-                        )
-                        == PrimitiveFeastType.STRING
-                    ):
-                        res[field] = ValueProto(string_val=str(field_value))
-                    elif (
-                        entity_name_feast_primitive_type_map.get(
-                            field, PrimitiveFeastType.INVALID
-                        )
-                        == PrimitiveFeastType.BYTES
-                    ):
-                        try:
-                            decoded_bytes = base64.b64decode(field_value)
-                            res[field] = ValueProto(bytes_val=decoded_bytes)
-                        except Exception:
-                            res[field] = ValueProto(string_val=str(field_value))
-                    elif entity_name_feast_primitive_type_map.get(
-                        field, PrimitiveFeastType.INVALID
-                    ) in [
-                        PrimitiveFeastType.INT64,
-                        PrimitiveFeastType.INT32,
-                    ]:
-                        res[field] = ValueProto(int64_val=int(field_value))
-                    elif field == composite_key_name:
-                        pass
-                    elif isinstance(field_value, bytes):
-                        val.ParseFromString(field_value)
-                        res[field] = val
-                    else:
-                        val.string_val = field_value
-                        res[field] = val
-                distance = hit.get("distance", None)
-                res["distance"] = (
-                    ValueProto(float_val=distance) if distance else ValueProto()
+                == PrimitiveFeastType.STRING
+            ):
+                res[field] = ValueProto(string_val=str(field_value))
+            elif (
+                entity_name_feast_primitive_type_map.get(
+                    field, PrimitiveFeastType.INVALID
                 )
-                result_list.append((res_ts, entity_key_proto, res if res else None))
-        return result_list
+                == PrimitiveFeastType.BYTES
+            ):
+                try:
+                    decoded_bytes = base64.b64decode(field_value)
+                    res[field] = ValueProto(bytes_val=decoded_bytes)
+                except Exception:
+                    res[field] = ValueProto(string_val=str(field_value))
+            elif entity_name_feast_primitive_type_map.get(
+                field, PrimitiveFeastType.INVALID
+            ) in [
+                PrimitiveFeastType.INT64,
+                PrimitiveFeastType.INT32,
+            ]:
+                res[field] = ValueProto(int64_val=int(field_value))
+            elif field == composite_key_name:
+                pass
+            elif isinstance(field_value, bytes):
+                val.ParseFromString(field_value)
+                res[field] = val
+            else:
+                val.string_val = field_value
+                res[field] = val
+        distance = hit.get("distance", None)
+        res["distance"] = ValueProto(float_val=distance) if distance else ValueProto()
+        documents.append((res_ts, entity_key_proto, res if res else None))
+    return documents
 
 
 def _table_id(project: str, table: FeatureView) -> str:
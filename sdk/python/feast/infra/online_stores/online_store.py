@@ -13,14 +13,19 @@
 # limitations under the License.
 import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
-from feast import Entity, utils
+from feast import Entity, metrics, tracing, utils
 from feast.batch_feature_view import BatchFeatureView
 from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import InfraObject
+from feast.infra.online_stores.hybrid_search import (
+    HybridFusion,
+    retrieve_hybrid_documents,
+)
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.supported_async_methods import SupportedAsyncMethods
 from feast.online_response import OnlineResponse
@@ -31,6 +36,9 @@ from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RepoConfig
 from feast.stream_feature_view import StreamFeatureView
 
+# Maximum number of queries run concurrently by the default `retrieve_online_documents_v2_batch`
+DOCUMENT_RETRIEVAL_MAX_WORKERS = 16
+
 
 class OnlineStore(ABC):
     """
@@ -155,81 +163,114 @@ class OnlineStore(ABC):
         project: str,
         full_feature_names: bool = False,
     ) -> OnlineResponse:
-        if isinstance(entity_rows, list):
-            columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
-            for entity_row in entity_rows:
-                for key, value in entity_row.items():
-                    try:
-                        columnar[key].append(value)
-                    except KeyError as e:
-                        raise ValueError(
-                            "All entity_rows must have the same keys."
-                        ) from e
-
-            entity_rows = columnar
-
-        (
-            join_key_values,
-            grouped_refs,
-            entity_name_to_join_key_map,
-            requested_on_demand_feature_views,
-            feature_refs,
-            requested_result_row_names,
-            online_features_response,
-        ) = utils._prepare_entities_to_read_from_online_store(
-            registry=registry,
-            project=project,
-            features=features,
-            entity_values=entity_rows,
-            full_feature_names=full_feature_names,
-            native_entity_values=True,
-        )
-
-        for table, requested_features in grouped_refs:
-            # Get the correct set of entity values with the correct join keys.
-            table_entity_values, idxs, output_len = utils._get_unique_entities(
-                table,
-                join_key_values,
-                entity_name_to_join_key_map,
-            )
-
-            entity_key_protos = utils._get_entity_key_protos(table_entity_values)
-
-            # Fetch data for Entities.
-            read_rows = self.online_read(
-                config=config,
-                table=table,
-                entity_keys=entity_key_protos,
-                requested_features=requested_features,
-            )
-
-            feature_data = utils._convert_rows_to_protobuf(
-                requested_features, read_rows
-            )
-
-            # Populate the result_rows with the Features from the OnlineStore inplace.
-            utils._populate_response_from_feature_data(
-                feature_data,
-                idxs,
-                online_features_response,
-                full_feature_names,
-                requested_features,
-                table,
-                output_len,
-            )
-
-        if requested_on_demand_feature_views:
-            utils._augment_response_with_on_demand_transforms(
-                online_features_response,
-                feature_refs,
-                requested_on_demand_feature_views,
-                full_feature_names,
+        with tracing.span(
+            "feast.online_store.get_online_features",
+            tracing.online_request_attributes(config, features, entity_rows),
+        ):
+            if isinstance(entity_rows, list):
+                columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
+                for entity_row in entity_rows:
+                    for key, value in entity_row.items():
+                        try:
+                            columnar[key].append(value)
+                        except KeyError as e:
+                            raise ValueError(
+                                "All entity_rows must have the same keys."
+                            ) from e
+
+                entity_rows = columnar
+
+            with metrics.stage("get_online_features", "prepare_entities", config):
+                (
+                    join_key_values,
+                    grouped_refs,
+                    entity_name_to_join_key_map,
+                    requested_on_demand_feature_views,
+                    feature_refs,
+                    requested_result_row_names,
+                    online_features_response,
+                ) = utils._prepare_entities_to_read_from_online_store(
+                    registry=registry,
+                    project=project,
+                    features=features,
+                    entity_values=entity_rows,
+                    full_feature_names=full_feature_names,
+                    native_entity_values=True,
+                )
+
+            for table, requested_features in grouped_refs:
+                # Get the correct set of entity values with the correct join keys.
+                table_entity_values, idxs, output_len = utils._get_unique_entities(
+                    table,
+                    join_key_values,
+                    entity_name_to_join_key_map,
+                )
+
+                entity_key_protos = utils._get_entity_key_protos(table_entity_values)
+
+                # Fetch data for Entities.
+                with (
+                    metrics.stage(
+                        "get_online_features", "online_read", config, table.name
+                    ),
+                    tracing.span(
+                        "feast.online_store.online_read",
+                        {
+                            "feast.online_store": metrics.online_store_type(config),
+                            "feast.feature_view": table.name,
+                            "feast.entity_count": len(entity_key_protos),
+                            "feast.feature_count": len(requested_features),
+                        },
+                    ),
+                ):
+                    read_rows = self.online_read(
+                        config=config,
+                        table=table,
+                        entity_keys=entity_key_protos,
+                        requested_features=requested_features,
+                    )
+                metrics.count(
+                    "get_online_features",
+                    config,
+                    table.name,
+                    len(entity_key_protos),
+                    len(entity_key_protos) * len(requested_features),
+                )
+
+                with metrics.stage(
+                    "get_online_features", "convert", config, table.name
+                ):
+                    feature_data = utils._convert_rows_to_protobuf(
+                        requested_features, read_rows
+                    )
+
+                    # Populate the result_rows with the Features from the OnlineStore inplace.
+                    utils._populate_response_from_feature_data(
+                        feature_data,
+                        idxs,
+                        online_features_response,
+                        full_feature_names,
+                        requested_features,
+                        table,
+                        output_len,
+                    )
+
+            if requested_on_demand_feature_views:
+                with metrics.stage(
+                    "get_online_features", "on_demand_transforms", config
+                ):
+                    utils._augment_response_with_on_demand_transforms(
+                        online_features_response,
+                        feature_refs,
+                        requested_on_demand_feature_views,
+                        full_feature_names,
+                        config.on_demand_transformation_config,
+                    )
+
+            utils._drop_unneeded_columns(
+                online_features_response, requested_result_row_names
             )
-
-        utils._drop_unneeded_columns(
-            online_features_response, requested_result_row_names
-        )
-        return OnlineResponse(online_features_response)
+            return OnlineResponse(online_features_response)
 
     async def get_online_features_async(
         self,
@@ -243,93 +284,126 @@ class OnlineStore(ABC):
         project: str,
         full_feature_names: bool = False,
     ) -> OnlineResponse:
-        if isinstance(entity_rows, list):
-            columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
-            for entity_row in entity_rows:
-                for key, value in entity_row.items():
-                    try:
-                        columnar[key].append(value)
-                    except KeyError as e:
-                        raise ValueError(
-                            "All entity_rows must have the same keys."
-                        ) from e
-
-            entity_rows = columnar
-
-        (
-            join_key_values,
-            grouped_refs,
-            entity_name_to_join_key_map,
-            requested_on_demand_feature_views,
-            feature_refs,
-            requested_result_row_names,
-            online_features_response,
-        ) = utils._prepare_entities_to_read_from_online_store(
-            registry=registry,
-            project=project,
-            features=features,
-            entity_values=entity_rows,
-            full_feature_names=full_feature_names,
-            native_entity_values=True,
-        )
-
-        async def query_table(table, requested_features):
-            # Get the correct set of entity values with the correct join keys.
-            table_entity_values, idxs, output_len = utils._get_unique_entities(
-                table,
-                join_key_values,
-                entity_name_to_join_key_map,
-            )
-
-            entity_key_protos = utils._get_entity_key_protos(table_entity_values)
-
-            # Fetch data for Entities.
-            read_rows = await self.online_read_async(
-                config=config,
-                table=table,
-                entity_keys=entity_key_protos,
-                requested_features=requested_features,
-            )
-
-            return idxs, read_rows, output_len
-
-        all_responses = await asyncio.gather(
-            *[
-                query_table(table, requested_features)
-                for table, requested_features in grouped_refs
-            ]
-        )
-
-        for (idxs, read_rows, output_len), (table, requested_features) in zip(
-            all_responses, grouped_refs
+        with tracing.span(
+            "feast.online_store.get_online_features",
+            tracing.online_request_attributes(config, features, entity_rows),
         ):
-            feature_data = utils._convert_rows_to_protobuf(
-                requested_features, read_rows
-            )
-
-            # Populate the result_rows with the Features from the OnlineStore inplace.
-            utils._populate_response_from_feature_data(
-                feature_data,
-                idxs,
-                online_features_response,
-                full_feature_names,
-                requested_features,
-                table,
-                output_len,
+            if isinstance(entity_rows, list):
+                columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
+                for entity_row in entity_rows:
+                    for key, value in entity_row.items():
+                        try:
+                            columnar[key].append(value)
+                        except KeyError as e:
+                            raise ValueError(
+                                "All entity_rows must have the same keys."
+                            ) from e
+
+                entity_rows = columnar
+
+            with metrics.stage("get_online_features", "prepare_entities", config):
+                (
+                    join_key_values,
+                    grouped_refs,
+                    entity_name_to_join_key_map,
+                    requested_on_demand_feature_views,
+                    feature_refs,
+                    requested_result_row_names,
+                    online_features_response,
+                ) = utils._prepare_entities_to_read_from_online_store(
+                    registry=registry,
+                    project=project,
+                    features=features,
+                    entity_values=entity_rows,
+                    full_feature_names=full_feature_names,
+                    native_entity_values=True,
+                )
+
+            async def query_table(table, requested_features):
+                # Get the correct set of entity values with the correct join keys.
+                table_entity_values, idxs, output_len = utils._get_unique_entities(
+                    table,
+                    join_key_values,
+                    entity_name_to_join_key_map,
+                )
+
+                entity_key_protos = utils._get_entity_key_protos(table_entity_values)
+
+                # Fetch data for Entities.
+                with (
+                    metrics.stage(
+                        "get_online_features", "online_read", config, table.name
+                    ),
+                    tracing.span(
+                        "feast.online_store.online_read",
+                        {
+                            "feast.online_store": metrics.online_store_type(config),
+                            "feast.feature_view": table.name,
+                            "feast.entity_count": len(entity_key_protos),
+                            "feast.feature_count": len(requested_features),
+                        },
+                    ),
+                ):
+                    read_rows = await self.online_read_async(
+                        config=config,
+                        table=table,
+                        entity_keys=entity_key_protos,
+                        requested_features=requested_features,
+                    )
+                metrics.count(
+                    "get_online_features",
+                    config,
+                    table.name,
+                    len(entity_key_protos),
+                    len(entity_key_protos) * len(requested_features),
+                )
+
+                return idxs, read_rows, output_len
+
+            all_responses = await asyncio.gather(
+                *[
+                    query_table(table, requested_features)
+                    for table, requested_features in grouped_refs
+                ]
             )
 
-        if requested_on_demand_feature_views:
-            utils._augment_response_with_on_demand_transforms(
-                online_features_response,
-                feature_refs,
-                requested_on_demand_feature_views,
-                full_feature_names,
+            for (idxs, read_rows, output_len), (table, requested_features) in zip(
+                all_responses, grouped_refs
+            ):
+                with metrics.stage(
+                    "get_online_features", "convert", config, table.name
+                ):
+                    feature_data = utils._convert_rows_to_protobuf(
+                        requested_features, read_rows
+                    )
+
+                    # Populate the result_rows with the Features from the OnlineStore inplace.
+                    utils._populate_response_from_feature_data(
+                        feature_data,
+                        idxs,
+                        online_features_response,
+                        full_feature_names,
+                        requested_features,
+                        table,
+                        output_len,
+                    )
+
+            if requested_on_demand_feature_views:
+                with metrics.stage(
+                    "get_online_features", "on_demand_transforms", config
+                ):
+                    utils._augment_response_with_on_demand_transforms(
+                        online_features_response,
+                        feature_refs,
+                        requested_on_demand_feature_views,
+                        full_feature_names,
+                        config.on_demand_transformation_config,
+                    )
+
+            utils._drop_unneeded_columns(
+                online_features_response, requested_result_row_names
             )
-
-        utils._drop_unneeded_columns(
-            online_features_response, requested_result_row_names
-        )
-        return OnlineResponse(online_features_response)
+            return OnlineResponse(online_features_response)
 
     @abstractmethod
     def update(
@@ -467,8 +541,156 @@ class OnlineStore(ABC):
             f"Online store {self.__class__.__name__} does not support online retrieval"
         )
 
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[EntityKeyProto],
+                Optional[Dict[str, ValueProto]],
+            ]
+        ]
+    ]:
+        """
+        Retrieves online feature values for several queries.
+
+        Online stores which can search several embeddings at once should override this method. By default,
+        the queries are run concurrently with `retrieve_online_documents_v2`.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            requested_features: The list of features whose embeddings should be used for retrieval.
+            embeddings: The embedding of each query (optional).
+            top_k: The number of documents to retrieve for each query.
+            distance_metric: distance metric to use for retrieval.
+            query_strings: The query string of each query, to search for using keyword search (optional).
+
+        Returns:
+            The documents of each query, in the format of `retrieve_online_documents_v2`.
+        """
+        queries = _document_queries(embeddings, query_strings)
+        if len(queries) <= 1:
+            return [
+                self.retrieve_online_documents_v2(
+                    config,
+                    table,
+                    requested_features,
+                    embedding,
+                    top_k,
+                    distance_metric,
+                    query_string,
+                )
+                for embedding, query_string in queries
+            ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(queries), DOCUMENT_RETRIEVAL_MAX_WORKERS)
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda query: self.retrieve_online_documents_v2(
+                        config,
+                        table,
+                        requested_features,
+                        query[0],
+                        top_k,
+                        distance_metric,
+                        query[1],
+                    ),
+                    queries,
+                )
+            )
+
+    def retrieve_online_documents_hybrid(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embedding: List[float],
+        query_string: str,
+        top_k: int,
+        fusion: HybridFusion,
+        distance_metric: Optional[str] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ]:
+        """
+        Retrieves the documents that best match both an embedding and a query string.
+
+        Online stores which can fuse the vector and keyword searches themselves should override this method.
+        By default, both searches are run concurrently with `retrieve_online_documents_v2`, each returning
+        `fusion.candidates(top_k)` documents, and their results are fused with `fusion`.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            requested_features: The list of features whose embeddings should be used for retrieval.
+            embedding: The query embedding.
+            query_string: The query string, to search for using keyword search.
+            top_k: The number of documents to retrieve.
+            fusion: How to fuse the results of the vector and keyword searches.
+            distance_metric: distance metric to use for retrieval.
+
+        Returns:
+            The documents in the format of `retrieve_online_documents_v2`, from the best match, with their
+            fused score as the "hybrid_score" feature.
+        """
+        return retrieve_hybrid_documents(
+            lambda query, text, limit: self.retrieve_online_documents_v2(
+                config,
+                table,
+                requested_features,
+                query,
+                limit,
+                distance_metric,
+                text,
+            ),
+            embedding,
+            query_string,
+            top_k,
+            fusion,
+        )
+
     async def initialize(self, config: RepoConfig) -> None:
         pass
 
     async def close(self) -> None:
         pass
+
+
+def _document_queries(
+    embeddings: Optional[List[List[float]]],
+    query_strings: Optional[List[Optional[str]]],
+) -> List[Tuple[Optional[List[float]], Optional[str]]]:
+    """Pairs the embeddings and query strings of a batch of document retrieval queries."""
+    if embeddings is None and query_strings is None:
+        raise ValueError("Either embeddings or query_strings must be specified")
+    if (
+        embeddings is not None
+        and query_strings is not None
+        and len(embeddings) != len(query_strings)
+    ):
+        raise ValueError(
+            f"Got {len(embeddings)} embeddings but {len(query_strings)} query strings"
+        )
+    n_queries = len(embeddings) if embeddings is not None else len(query_strings)  # type: ignore[arg-type]
+    return [
+        (
+            embeddings[i] if embeddings is not None else None,
+            query_strings[i] if query_strings is not None else None,
+        )
+        for i in range(n_queries)
+    ]
@@ -21,9 +21,20 @@ from psycopg.connection import Connection
 from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 from feast import Entity, FeatureView, ValueType
-from feast.infra.key_encoding_utils import get_list_val_str, serialize_entity_key
+from feast.field import Field
+from feast.infra.key_encoding_utils import (
+    deserialize_entity_key,
+    get_list_val_str,
+    serialize_entity_key,
+)
 from feast.infra.online_stores.helpers import _to_naive_utc
+from feast.infra.online_stores.hybrid_search import (
+    HYBRID_SCORE_FEATURE,
+    HybridFusion,
+    fuse_rankings,
+)
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.vector_quantization import rescore_candidates
 from feast.infra.online_stores.vector_store import VectorStoreConfig
 from feast.infra.utils.postgres.connection_utils import (
     _get_conn,
@@ -35,7 +46,10 @@ from feast.infra.utils.postgres.postgres_config import ConnectionType, PostgreSQ
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RepoConfig
-from feast.utils import _build_retrieve_online_document_record
+from feast.utils import (
+    _build_retrieve_online_document_record,
+    _get_feature_view_vector_field_metadata,
+)
 
 SUPPORTED_DISTANCE_METRICS_DICT = {
     "cosine": "<=>",
@@ -44,10 +58,35 @@ SUPPORTED_DISTANCE_METRICS_DICT = {
     "inner_product": "<#>",
 }
 
+# pgvector operator classes of each distance metric, for HNSW and IVFFlat indexes
+VECTOR_INDEX_OPERATOR_CLASSES = {
+    "cosine": "vector_cosine_ops",
+    "L1": "vector_l1_ops",
+    "L2": "vector_l2_ops",
+    "inner_product": "vector_ip_ops",
+}
+
 
 class PostgreSQLOnlineStoreConfig(PostgreSQLConfig, VectorStoreConfig):
     type: Literal["postgres"] = "postgres"
 
+    # The pgvector index of the vector field of each feature view, if any. Without an index,
+    # vector search scans every vector of the feature view.
+    vector_index_type: Optional[Literal["hnsw", "ivfflat"]] = None
+
+    # HNSW build parameters: the number of connections per layer, and the size of the
+    # candidate list while building the graph.
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    # The size of the candidate list at query time (hnsw.ef_search, 40 by default in pgvector).
+    hnsw_ef_search: Optional[int] = None
+
+    # IVFFlat build parameter: the number of inverted lists. IVFFlat indexes should be created
+    # once the feature view holds data, since lists are computed from the existing vectors.
+    ivfflat_lists: int = 100
+    # The number of lists probed at query time (ivfflat.probes, 1 by default in pgvector).
+    ivfflat_probes: Optional[int] = None
+
 
 class PostgreSQLOnlineStore(OnlineStore):
     _conn: Optional[Connection] = None
@@ -354,6 +393,18 @@ class PostgreSQLOnlineStore(OnlineStore):
                         )
                     )
 
+                vector_field = _get_feature_view_vector_field_metadata(table)
+                if (
+                    config.online_store.vector_enabled
+                    and config.online_store.vector_index_type
+                    and vector_field is not None
+                ):
+                    cur.execute(
+                        _create_vector_index(
+                            config.online_store, table_name, vector_field
+                        )
+                    )
+
             conn.commit()
 
     def teardown(
@@ -420,7 +471,9 @@ class PostgreSQLOnlineStore(OnlineStore):
                 [feature for feature in requested_features]
             )
 
-        distance_metric_sql = SUPPORTED_DISTANCE_METRICS_DICT[distance_metric]
+        distance, vector_filter = _vector_distance(
+            _get_feature_view_vector_field_metadata(table), distance_metric
+        )
 
         result: List[
             Tuple[
@@ -431,8 +484,13 @@ class PostgreSQLOnlineStore(OnlineStore):
                 Optional[ValueProto],
             ]
         ] = []
-        with self._get_conn(config, autocommit=True) as conn, conn.cursor() as cur:
+        with (
+            self._get_conn(config, autocommit=True) as conn,
+            _vector_search_transaction(conn, config.online_store),
+            conn.cursor() as cur,
+        ):
             table_name = _table_id(project, table)
+            _set_vector_search_parameters(cur, config.online_store)
 
             # Search query template to find the top k items that are closest to the given embedding
             # SELECT * FROM items ORDER BY embedding <-> '[3,1,2]' LIMIT 5;
@@ -444,14 +502,16 @@ class PostgreSQLOnlineStore(OnlineStore):
                         {feature_names},
                         value,
                         vector_value,
-                        vector_value {distance_metric_sql} %s::vector as distance,
+                        {distance} as distance,
                         event_ts FROM {table_name}
+                    {vector_filter}
                     ORDER BY distance
                     LIMIT {top_k};
                     """
                 ).format(
-                    distance_metric_sql=sql.SQL(distance_metric_sql),
+                    distance=distance,
                     table_name=sql.Identifier(table_name),
+                    vector_filter=vector_filter,
                     feature_names=required_feature_names,
                     top_k=sql.Literal(top_k),
                 ),
@@ -534,7 +594,11 @@ class PostgreSQLOnlineStore(OnlineStore):
 
         table_name = _table_id(config.project, table)
 
-        with self._get_conn(config, autocommit=True) as conn, conn.cursor() as cur:
+        with (
+            self._get_conn(config, autocommit=True) as conn,
+            _vector_search_transaction(conn, config.online_store),
+            conn.cursor() as cur,
+        ):
             query = None
             params: Any = None
 
@@ -566,6 +630,7 @@ class PostgreSQLOnlineStore(OnlineStore):
 
             elif embedding is not None:
                 # Case 2: Vector Search Only
+                _set_vector_search_parameters(cur, config.online_store)
                 query = sql.SQL(
                     """
                     SELECT
@@ -573,18 +638,21 @@ class PostgreSQLOnlineStore(OnlineStore):
                         feature_name,
                         value,
                         vector_value,
-                        vector_value {distance_metric_sql} %s::vector as distance,
+                        distance,
                         NULL as text_rank, -- Keep consistent columns
                         event_ts,
                         created_ts
-                    FROM {table_name}
+                    FROM ({nearest_vectors}) d
                     ORDER BY distance
-                    LIMIT {top_k}
                     """
                 ).format(
-                    distance_metric_sql=sql.SQL(distance_metric_sql),
-                    table_name=sql.Identifier(table_name),
-                    top_k=sql.Literal(top_k),
+                    nearest_vectors=_nearest_vectors(
+                        table_name,
+                        _get_feature_view_vector_field_metadata(table),
+                        distance_metric,
+                        top_k,
+                        config.online_store.vector_rescore_oversample,
+                    ),
                 )
                 params = (embedding,)
 
@@ -628,110 +696,657 @@ class PostgreSQLOnlineStore(OnlineStore):
             cur.execute(query, params)
             rows = cur.fetchall()
 
-            # Group by entity_key to build feature records
-            entities_dict: Dict[str, Dict[str, Any]] = defaultdict(
-                lambda: {
-                    "features": {},
-                    "timestamp": None,
-                    "entity_key_proto": None,
-                    "vector_distance": float("inf"),
-                    "text_rank": 0.0,
-                }
+        return _rows_to_documents(
+            rows,
+            top_k,
+            vector_search=embedding is not None,
+            text_search=embedding is None or query_string is not None,
+        )
+
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[EntityKeyProto],
+                Optional[Dict[str, ValueProto]],
+            ]
+        ]
+    ]:
+        """
+        Retrieves documents for several query embeddings with a single statement.
+
+        Each embedding is joined laterally with its nearest vectors, so every query still uses the vector index.
+        Batches with query strings are run query by query.
+        """
+        if (
+            embeddings is None
+            or (query_strings is not None and any(query_strings))
+            or not config.online_store.vector_enabled
+        ):
+            return super().retrieve_online_documents_v2_batch(
+                config,
+                table,
+                requested_features,
+                embeddings,
+                top_k,
+                distance_metric,
+                query_strings,
             )
 
-            for (
-                entity_key_bytes,
-                feature_name,
-                feature_val_bytes,
-                vector_val,
-                distance,
-                text_rank,
-                event_ts,
-                created_ts,
-            ) in rows:
-                entity_key_proto = None
-                if entity_key_bytes:
-                    from feast.infra.key_encoding_utils import deserialize_entity_key
+        distance_metric = distance_metric or "L2"
+        if distance_metric not in SUPPORTED_DISTANCE_METRICS_DICT:
+            raise ValueError(
+                f"Distance metric {distance_metric} is not supported. Supported distance metrics are {SUPPORTED_DISTANCE_METRICS_DICT.keys()}"
+            )
 
-                    entity_key_proto = deserialize_entity_key(entity_key_bytes)
+        query = sql.SQL(
+            """
+            SELECT
+                q.query_index,
+                d.entity_key,
+                d.feature_name,
+                d.value,
+                d.vector_value,
+                d.distance,
+                NULL as text_rank,
+                d.event_ts,
+                d.created_ts
+            FROM unnest(%s::text[]) WITH ORDINALITY AS q(embedding, query_index)
+            CROSS JOIN LATERAL ({nearest_vectors}) d
+            """
+        ).format(
+            nearest_vectors=_nearest_vectors(
+                _table_id(config.project, table),
+                _get_feature_view_vector_field_metadata(table),
+                distance_metric,
+                top_k,
+                config.online_store.vector_rescore_oversample,
+                query=sql.SQL("q.embedding"),
+            ),
+        )
+        params = (
+            [
+                "[" + ",".join(str(value) for value in embedding) + "]"
+                for embedding in embeddings
+            ],
+        )
 
-                key = entity_key_bytes.hex() if entity_key_bytes else None
+        with (
+            self._get_conn(config, autocommit=True) as conn,
+            _vector_search_transaction(conn, config.online_store),
+            conn.cursor() as cur,
+        ):
+            _set_vector_search_parameters(cur, config.online_store)
+            cur.execute(query, params)
+            rows = cur.fetchall()
 
-                if key is None:
-                    continue
+        rows_by_query: List[List[Tuple]] = [[] for _ in embeddings]
+        for query_index, *row in rows:
+            rows_by_query[query_index - 1].append(tuple(row))
+        return [
+            _rows_to_documents(query_rows, top_k, vector_search=True, text_search=False)
+            for query_rows in rows_by_query
+        ]
 
-                entities_dict[key]["entity_key_proto"] = entity_key_proto
+    def retrieve_online_documents_hybrid(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embedding: List[float],
+        query_string: str,
+        top_k: int,
+        fusion: HybridFusion,
+        distance_metric: Optional[str] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ]:
+        """
+        Retrieves the documents that best match both an embedding and a query string.
 
-                if (
-                    entities_dict[key]["timestamp"] is None
-                    or event_ts > entities_dict[key]["timestamp"]
-                ):
-                    entities_dict[key]["timestamp"] = event_ts
+        The candidates of the vector and text searches are ranked with a single statement, which only returns
+        their entity keys and scores. The features are then read for the fused documents only.
+        """
+        if not config.online_store.vector_enabled:
+            raise ValueError("Vector search is not enabled in the online store config")
 
-                val = ValueProto()
-                if feature_val_bytes:
-                    val.ParseFromString(feature_val_bytes)
+        distance_metric = distance_metric or "L2"
+        if distance_metric not in SUPPORTED_DISTANCE_METRICS_DICT:
+            raise ValueError(
+                f"Distance metric {distance_metric} is not supported. Supported distance metrics are {SUPPORTED_DISTANCE_METRICS_DICT.keys()}"
+            )
 
-                entities_dict[key]["features"][feature_name] = val
+        string_fields = [
+            feature.name
+            for feature in table.features
+            if feature.dtype.to_value_type().value == 2
+            and feature.name in requested_features
+        ]
+        table_name = _table_id(config.project, table)
+        candidates_query = _hybrid_candidates_query(
+            table_name,
+            _get_feature_view_vector_field_metadata(table),
+            distance_metric,
+            fusion.candidates(top_k),
+            config.online_store.vector_rescore_oversample,
+            text_search=bool(string_fields),
+        )
+        params: Tuple = (embedding,)
+        if string_fields:
+            tsquery_str = " & ".join(query_string.split())
+            params = (embedding, tsquery_str, string_fields, tsquery_str)
+
+        with (
+            self._get_conn(config, autocommit=True) as conn,
+            _vector_search_transaction(conn, config.online_store),
+            conn.cursor() as cur,
+        ):
+            _set_vector_search_parameters(cur, config.online_store)
+            cur.execute(candidates_query, params)
+            candidates = cur.fetchall()
+
+            vector_ranking = sorted(
+                [
+                    (key, score)
+                    for search, key, score in candidates
+                    if search == "vector" and score is not None
+                ],
+                key=lambda candidate: candidate[1],
+            )
+            text_ranking = sorted(
+                [(key, score) for search, key, score in candidates if search == "text"],
+                key=lambda candidate: candidate[1],
+                reverse=True,
+            )
+            fused = fuse_rankings(vector_ranking, text_ranking, fusion, top_k)
+            if not fused:
+                return []
 
-                if distance is not None:
-                    entities_dict[key]["vector_distance"] = min(
-                        entities_dict[key]["vector_distance"], float(distance)
-                    )
-                if text_rank is not None:
-                    entities_dict[key]["text_rank"] = max(
-                        entities_dict[key]["text_rank"], float(text_rank)
-                    )
+            cur.execute(
+                sql.SQL(
+                    """
+                    SELECT entity_key, feature_name, value, event_ts
+                    FROM {table_name}
+                    WHERE entity_key = ANY(%s) AND feature_name = ANY(%s)
+                    """
+                ).format(table_name=sql.Identifier(table_name)),
+                ([bytes(key) for key, _ in fused], requested_features),
+            )
+            rows = cur.fetchall()
 
-            sorted_entities = sorted(
-                entities_dict.values(),
-                key=lambda x: x["vector_distance"]
-                if embedding is not None
-                else x["text_rank"],
-                reverse=(embedding is None),
-            )[:top_k]
-
-            result: List[
-                Tuple[
-                    Optional[datetime],
-                    Optional[EntityKeyProto],
-                    Optional[Dict[str, ValueProto]],
-                ]
-            ] = []
-            for entity_data in sorted_entities:
-                features = (
-                    entity_data["features"].copy()
-                    if isinstance(entity_data["features"], dict)
-                    else None
-                )
+        documents: Dict[bytes, Dict[str, Any]] = {
+            bytes(key): {
+                "timestamp": None,
+                "features": {HYBRID_SCORE_FEATURE: ValueProto(double_val=score)},
+            }
+            for key, score in fused
+        }
+        for entity_key_bytes, feature_name, feature_val_bytes, event_ts in rows:
+            document = documents[bytes(entity_key_bytes)]
+            val = ValueProto()
+            if feature_val_bytes:
+                val.ParseFromString(feature_val_bytes)
+            document["features"][feature_name] = val
+            if document["timestamp"] is None or event_ts > document["timestamp"]:
+                document["timestamp"] = event_ts
 
-                if features is not None:
-                    if "vector_distance" in entity_data and entity_data[
-                        "vector_distance"
-                    ] != float("inf"):
-                        dist_val = ValueProto()
-                        dist_val.double_val = entity_data["vector_distance"]
-                        features["distance"] = dist_val
+        return [
+            (
+                document["timestamp"],
+                deserialize_entity_key(key),
+                document["features"],
+            )
+            for key, document in documents.items()
+        ]
 
-                    if embedding is None or query_string is not None:
-                        rank_val = ValueProto()
-                        rank_val.double_val = entity_data["text_rank"]
-                        features["text_rank"] = rank_val
 
-                result.append(
-                    (
-                        entity_data["timestamp"],
-                        entity_data["entity_key_proto"],
-                        features,
-                    )
-                )
-        return result
+def _rows_to_documents(
+    rows: List[Tuple],
+    top_k: int,
+    vector_search: bool,
+    text_search: bool,
+) -> List[
+    Tuple[
+        Optional[datetime],
+        Optional[EntityKeyProto],
+        Optional[Dict[str, ValueProto]],
+    ]
+]:
+    """
+    Groups the rows of a document search by entity key into its top k documents.
+
+    Documents are ordered by vector distance for vector searches and by text rank otherwise.
+    """
+    # Group by entity_key to build feature records
+    entities_dict: Dict[str, Dict[str, Any]] = defaultdict(
+        lambda: {
+            "features": {},
+            "timestamp": None,
+            "entity_key_proto": None,
+            "vector_distance": float("inf"),
+            "text_rank": 0.0,
+        }
+    )
+
+    for (
+        entity_key_bytes,
+        feature_name,
+        feature_val_bytes,
+        vector_val,
+        distance,
+        text_rank,
+        event_ts,
+        created_ts,
+    ) in rows:
+        entity_key_proto = None
+        if entity_key_bytes:
+            from feast.infra.key_encoding_utils import deserialize_entity_key
+
+            entity_key_proto = deserialize_entity_key(entity_key_bytes)
+
+        key = entity_key_bytes.hex() if entity_key_bytes else None
+
+        if key is None:
+            continue
+
+        entities_dict[key]["entity_key_proto"] = entity_key_proto
+
+        if (
+            entities_dict[key]["timestamp"] is None
+            or event_ts > entities_dict[key]["timestamp"]
+        ):
+            entities_dict[key]["timestamp"] = event_ts
+
+        val = ValueProto()
+        if feature_val_bytes:
+            val.ParseFromString(feature_val_bytes)
+
+        entities_dict[key]["features"][feature_name] = val
+
+        if distance is not None:
+            entities_dict[key]["vector_distance"] = min(
+                entities_dict[key]["vector_distance"], float(distance)
+            )
+        if text_rank is not None:
+            entities_dict[key]["text_rank"] = max(
+                entities_dict[key]["text_rank"], float(text_rank)
+            )
+
+    sorted_entities = sorted(
+        entities_dict.values(),
+        key=lambda x: x["vector_distance"] if vector_search else x["text_rank"],
+        reverse=not vector_search,
+    )[:top_k]
+
+    result: List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ] = []
+    for entity_data in sorted_entities:
+        features = (
+            entity_data["features"].copy()
+            if isinstance(entity_data["features"], dict)
+            else None
+        )
+
+        if features is not None:
+            if "vector_distance" in entity_data and entity_data[
+                "vector_distance"
+            ] != float("inf"):
+                dist_val = ValueProto()
+                dist_val.double_val = entity_data["vector_distance"]
+                features["distance"] = dist_val
+
+            if text_search:
+                rank_val = ValueProto()
+                rank_val.double_val = entity_data["text_rank"]
+                features["text_rank"] = rank_val
+
+        result.append(
+            (
+                entity_data["timestamp"],
+                entity_data["entity_key_proto"],
+                features,
+            )
+        )
+    return result
 
 
 def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
 
+def _vector_search_metric(field: Field) -> str:
+    """Returns the distance metric of a vector field, L2 unless the field sets one."""
+    metric = field.vector_search_metric or "L2"
+    for supported_metric in SUPPORTED_DISTANCE_METRICS_DICT:
+        if supported_metric.lower() == metric.lower():
+            return supported_metric
+    raise ValueError(
+        f"Distance metric {metric} of field {field.name} is not supported. Supported distance metrics are {SUPPORTED_DISTANCE_METRICS_DICT.keys()}"
+    )
+
+
+def _vector_expression(field: Field) -> sql.Composable:
+    """
+    Returns the expression of the vectors of a field.
+
+    The vector_value column holds vectors of any dimension, so vectors are cast to the dimension of the field,
+    which pgvector indexes require.
+    """
+    if not field.vector_length:
+        return sql.SQL("vector_value")
+    return sql.SQL("(vector_value::vector({}))").format(
+        sql.Literal(field.vector_length)
+    )
+
+
+def _create_vector_index(
+    online_store_config: PostgreSQLOnlineStoreConfig, table_name: str, field: Field
+) -> sql.Composed:
+    """
+    Returns the statement creating the HNSW or IVFFlat index of a vector field.
+
+    The index is partial: it only holds the vectors of the field, and is used by queries filtering on the field
+    and ordering by the distance metric of the field.
+    """
+    index_type = online_store_config.vector_index_type
+    assert index_type is not None
+    metric = _vector_search_metric(field)
+    if not field.vector_length:
+        raise ValueError(
+            f"The vector_length of field {field.name} must be set to create a {index_type} index."
+        )
+    vector = _vector_expression(field)
+    operator_class = VECTOR_INDEX_OPERATOR_CLASSES[metric]
+    index_name = f"{table_name}_{field.name}_{index_type}_{metric}"
+    if field.vector_quantization:
+        vector = _quantized_vector_expression(field)
+        operator_class = _quantized_operator_class(field, metric)
+        index_name = f"{index_name}_{field.vector_quantization}"
+    if index_type == "hnsw":
+        parameters = sql.SQL("m = {}, ef_construction = {}").format(
+            sql.Literal(online_store_config.hnsw_m),
+            sql.Literal(online_store_config.hnsw_ef_construction),
+        )
+    else:
+        if metric == "L1" and field.vector_quantization != "binary":
+            raise ValueError("ivfflat indexes do not support the L1 distance metric.")
+        parameters = sql.SQL("lists = {}").format(
+            sql.Literal(online_store_config.ivfflat_lists)
+        )
+
+    return sql.SQL(
+        """
+        CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}
+        USING {index_type} ({vector} {operator_class}) WITH ({parameters})
+        WHERE feature_name = {feature_name};
+        """
+    ).format(
+        index_name=sql.Identifier(index_name),
+        table_name=sql.Identifier(table_name),
+        index_type=sql.SQL(index_type),
+        vector=vector,
+        operator_class=sql.SQL(operator_class),
+        parameters=parameters,
+        feature_name=sql.Literal(field.name),
+    )
+
+
+def _vector_distance(
+    field: Optional[Field],
+    distance_metric: str,
+    query: sql.Composable = sql.SQL("%s"),
+) -> Tuple[sql.Composable, sql.Composable]:
+    """
+    Returns the distance between the vectors of a field and the query embedding, and the filter on the field.
+
+    The expressions match the index of the field, so that the planner can use it. The query embedding is a
+    placeholder unless another expression is given.
+    """
+    if field is None:
+        return (
+            sql.SQL("vector_value {} {}::vector").format(
+                sql.SQL(SUPPORTED_DISTANCE_METRICS_DICT[distance_metric]), query
+            ),
+            sql.SQL(""),
+        )
+    return (
+        sql.SQL("{} {} {}::vector").format(
+            _vector_expression(field),
+            sql.SQL(SUPPORTED_DISTANCE_METRICS_DICT[distance_metric]),
+            query,
+        ),
+        sql.SQL("WHERE feature_name = {}").format(sql.Literal(field.name)),
+    )
+
+
+def _quantized_vector_expression(field: Field) -> sql.Composable:
+    """
+    Returns the expression of the quantized vectors of a field, which its index holds.
+
+    pgvector indexes float16 vectors as halfvec, and binary vectors as bit strings of the sign of each dimension.
+    """
+    if field.vector_quantization == "int8":
+        raise ValueError(
+            "pgvector does not support int8 vectors, use float16 or binary quantization instead"
+        )
+    if not field.vector_length:
+        raise ValueError(
+            f"The vector_length of field {field.name} must be set to quantize its vectors."
+        )
+    if field.vector_quantization == "float16":
+        return sql.SQL("(vector_value::halfvec({}))").format(
+            sql.Literal(field.vector_length)
+        )
+    return sql.SQL(
+        "(binary_quantize(vector_value::vector({length}))::bit({length}))"
+    ).format(length=sql.Literal(field.vector_length))
+
+
+def _quantized_vector_distance(
+    field: Field, distance_metric: str, query: sql.Composable
+) -> sql.Composable:
+    """Returns the distance between the quantized vectors of a field and the quantized query embedding."""
+    if field.vector_quantization == "float16":
+        return sql.SQL("{} {} {}::halfvec({})").format(
+            _quantized_vector_expression(field),
+            sql.SQL(SUPPORTED_DISTANCE_METRICS_DICT[distance_metric]),
+            query,
+            sql.Literal(field.vector_length),
+        )
+    # Binary vectors are compared with the hamming distance, whatever the metric of the field.
+    return sql.SQL(
+        "{} <~> binary_quantize({}::vector({length}))::bit({length})"
+    ).format(
+        _quantized_vector_expression(field),
+        query,
+        length=sql.Literal(field.vector_length),
+    )
+
+
+def _quantized_operator_class(field: Field, metric: str) -> str:
+    if field.vector_quantization == "binary":
+        return "bit_hamming_ops"
+    return VECTOR_INDEX_OPERATOR_CLASSES[metric].replace("vector_", "halfvec_")
+
+
+def _nearest_vectors(
+    table_name: str,
+    field: Optional[Field],
+    distance_metric: str,
+    top_k: int,
+    rescore_oversample: Optional[int],
+    query: Optional[sql.Composable] = None,
+) -> sql.Composed:
+    """
+    Returns the statement selecting the rows of the top k vectors nearest to the query embedding, with their
+    distance.
+
+    Fields with a `vector_quantization` are searched with their quantized index for
+    `top_k * rescore_oversample` candidates, which are then ranked by their full-precision distance. The query
+    embedding is a placeholder unless another expression is given.
+    """
+    if query is None and field is not None and field.vector_quantization:
+        # The query embedding is compared to both the quantized and the full-precision vectors.
+        return sql.SQL(
+            "SELECT d.* FROM (SELECT %s::vector AS embedding) q CROSS JOIN LATERAL ({}) d"
+        ).format(
+            _nearest_vectors(
+                table_name,
+                field,
+                distance_metric,
+                top_k,
+                rescore_oversample,
+                query=sql.SQL("q.embedding"),
+            )
+        )
+
+    query = query or sql.SQL("%s")
+    distance, vector_filter = _vector_distance(field, distance_metric, query)
+    if field is None or not field.vector_quantization:
+        return sql.SQL(
+            """
+            SELECT
+                entity_key,
+                feature_name,
+                value,
+                vector_value,
+                {distance} AS distance,
+                event_ts,
+                created_ts
+            FROM {table_name}
+            {vector_filter}
+            ORDER BY distance
+            LIMIT {top_k}
+            """
+        ).format(
+            distance=distance,
+            table_name=sql.Identifier(table_name),
+            vector_filter=vector_filter,
+            top_k=sql.Literal(top_k),
+        )
+
+    return sql.SQL(
+        """
+        SELECT
+            entity_key,
+            feature_name,
+            value,
+            vector_value,
+            {distance} AS distance,
+            event_ts,
+            created_ts
+        FROM (
+            SELECT entity_key, feature_name, value, vector_value, event_ts, created_ts
+            FROM {table_name}
+            {vector_filter}
+            ORDER BY {quantized_distance}
+            LIMIT {candidates}
+        ) candidates
+        ORDER BY distance
+        LIMIT {top_k}
+        """
+    ).format(
+        distance=distance,
+        table_name=sql.Identifier(table_name),
+        vector_filter=vector_filter,
+        quantized_distance=_quantized_vector_distance(field, distance_metric, query),
+        candidates=sql.Literal(rescore_candidates(top_k, rescore_oversample)),
+        top_k=sql.Literal(top_k),
+    )
+
+
+def _hybrid_candidates_query(
+    table_name: str,
+    field: Optional[Field],
+    distance_metric: str,
+    candidates: int,
+    rescore_oversample: Optional[int],
+    text_search: bool,
+) -> sql.Composed:
+    """
+    Returns the statement ranking the candidates of the vector and text searches of a hybrid retrieval.
+
+    Each row holds the search ("vector" or "text"), the entity key and its score: the vector distance, or
+    the best text rank of the string features of the entity.
+    """
+    query = sql.SQL(
+        """
+        (
+            SELECT 'vector' AS search, entity_key, distance AS score
+            FROM ({nearest_vectors}) d
+        )
+        """
+    ).format(
+        nearest_vectors=_nearest_vectors(
+            table_name, field, distance_metric, candidates, rescore_oversample
+        ),
+    )
+    if not text_search:
+        return query
+    return query + sql.SQL(
+        """
+        UNION ALL
+        (
+            SELECT 'text' AS search, entity_key, max(ts_rank(to_tsvector('english', value_text), to_tsquery('english', %s))) AS score
+            FROM {table_name}
+            WHERE feature_name = ANY(%s) AND to_tsvector('english', value_text) @@ to_tsquery('english', %s)
+            GROUP BY entity_key
+            ORDER BY score DESC
+            LIMIT {candidates}
+        )
+        """
+    ).format(
+        table_name=sql.Identifier(table_name),
+        candidates=sql.Literal(candidates),
+    )
+
+
+def _vector_search_settings(
+    online_store_config: PostgreSQLOnlineStoreConfig,
+) -> Dict[str, int]:
+    settings = {}
+    if online_store_config.hnsw_ef_search is not None:
+        settings["hnsw.ef_search"] = online_store_config.hnsw_ef_search
+    if online_store_config.ivfflat_probes is not None:
+        settings["ivfflat.probes"] = online_store_config.ivfflat_probes
+    return settings
+
+
+def _vector_search_transaction(
+    conn: Connection, online_store_config: PostgreSQLOnlineStoreConfig
+) -> contextlib.AbstractContextManager:
+    """Returns a transaction scoping the vector search settings, if any are configured."""
+    if _vector_search_settings(online_store_config):
+        return conn.transaction()
+    return contextlib.nullcontext()
+
+
+def _set_vector_search_parameters(
+    cur, online_store_config: PostgreSQLOnlineStoreConfig
+) -> None:
+    """Sets the configured vector search settings for the current transaction."""
+    for name, value in _vector_search_settings(online_store_config).items():
+        cur.execute("SELECT set_config(%s, %s, true)", (name, str(value)))
+
+
 def _drop_table_and_index(table_name):
     return sql.SQL(
         """
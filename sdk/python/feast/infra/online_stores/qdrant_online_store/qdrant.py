@@ -304,11 +304,12 @@ class QdrantOnlineStore(OnlineStore):
             timestamp_str = str(payload.get("timestamp"))
             timestamp = datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%f")
             distance = point.score
-            vector_value = str(
+            vector = (
                 point.vector[config.online_store.vector_name]
                 if isinstance(point.vector, Dict)
                 else point.vector
             )
+            vector_value = _dense_vector(vector, table.name)
 
             result.append(
                 _build_retrieve_online_document_record(
@@ -321,3 +322,17 @@ class QdrantOnlineStore(OnlineStore):
                 )
             )
         return result
+
+
+def _dense_vector(vector: Any, collection_name: str) -> Optional[List[float]]:
+    """Returns the dense vector of a point, which is the only kind of vector written by Feast."""
+    if vector is None:
+        return None
+    if isinstance(vector, models.SparseVector) or any(
+        isinstance(value, list) for value in vector
+    ):
+        raise ValueError(
+            f"Collection {collection_name} returned a sparse or multi-vector, "
+            "only dense vectors are supported"
+        )
+    return vector
@@ -11,20 +11,47 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import json
 import logging
 from collections import defaultdict
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import requests
 from pydantic import StrictStr
 
-from feast import Entity, FeatureView, RepoConfig
+from feast import Entity, FeatureView, RepoConfig, utils
+from feast.errors import FeastError
+from feast.feature_service import FeatureService
 from feast.infra.online_stores.helpers import _to_naive_utc
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.supported_async_methods import SupportedAsyncMethods
+from feast.online_response import OnlineResponse
+from feast.online_response_encoding import PROTOBUF_MEDIA_TYPE
+from feast.permissions.auth.auth_type import AuthType
+from feast.permissions.client.client_auth_token import get_auth_token
 from feast.permissions.client.http_auth_requests_wrapper import HttpSessionManager
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FeatureList,
+    FieldStatus,
+    GetOnlineFeaturesResponse,
+    GetOnlineFeaturesResponseMetadata,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import RepeatedValue
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import FeastConfigBaseModel
 from feast.rest_error_handler import rest_error_handling_decorator
@@ -64,12 +91,24 @@ class RemoteOnlineStoreConfig(FeastConfigBaseModel):
     connection_retries: int = 3
     """ int: Number of retries for failed requests with exponential backoff (default 3). """
 
+    response_format: Literal["json", "protobuf"] = "protobuf"
+    """ str: Encoding requested from the online server for online features (default 'protobuf'). 'protobuf' asks
+    for the serialized GetOnlineFeaturesResponse, which skips JSON encoding on the server and keeps the value
+    types of the features. JSON values are decoded with the types declared in the feature view schemas. """
+
 
 class RemoteOnlineStore(OnlineStore):
     """
     remote online store implementation wrapper to communicate with feast online server.
     """
 
+    _async_client: Optional[Any] = None
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def async_supported(self) -> SupportedAsyncMethods:
+        return SupportedAsyncMethods(read=True)
+
     def online_write_batch(
         self,
         config: RepoConfig,
@@ -143,47 +182,227 @@ class RemoteOnlineStore(OnlineStore):
             entity_keys, table, requested_features
         )
         response = get_remote_online_features(config=config, req_body=req_body)
-        if response.status_code == 200:
-            logger.debug("Able to retrieve the online features from feature server.")
-            response_json = json.loads(response.text)
-            event_ts = self._get_event_ts(response_json)
-            # Iterating over results and converting the API results in column format to row format.
-            result_tuples: List[
-                Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
-            ] = []
-            for feature_value_index in range(len(entity_keys)):
-                feature_values_dict: Dict[str, ValueProto] = dict()
-                for index, feature_name in enumerate(
-                    response_json["metadata"]["feature_names"]
-                ):
-                    if (
-                        requested_features is not None
-                        and feature_name in requested_features
-                    ):
-                        if (
-                            response_json["results"][index]["statuses"][
-                                feature_value_index
-                            ]
-                            == "PRESENT"
-                        ):
-                            message = python_values_to_proto_values(
-                                [
-                                    response_json["results"][index]["values"][
-                                        feature_value_index
-                                    ]
-                                ],
-                                ValueType.UNKNOWN,
-                            )
-                            feature_values_dict[feature_name] = message[0]
-                        else:
-                            feature_values_dict[feature_name] = ValueProto()
-                result_tuples.append((event_ts, feature_values_dict))
-            return result_tuples
-        else:
+        return self._online_read_result(
+            response, table, len(entity_keys), requested_features
+        )
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        assert isinstance(config.online_store, RemoteOnlineStoreConfig)
+        config.online_store.__class__ = RemoteOnlineStoreConfig
+
+        req_body = self._construct_online_read_api_json_request(
+            entity_keys, table, requested_features
+        )
+        response = await self._post_async(config, "/get-online-features", req_body)
+        return self._online_read_result(
+            response, table, len(entity_keys), requested_features
+        )
+
+    def get_online_features(
+        self,
+        config: RepoConfig,
+        features: Union[List[str], FeatureService],
+        entity_rows: Union[
+            List[Dict[str, Any]],
+            Mapping[str, Union[Sequence[Any], Sequence[ValueProto], RepeatedValue]],
+        ],
+        registry: BaseRegistry,
+        project: str,
+        full_feature_names: bool = False,
+    ) -> OnlineResponse:
+        """
+        Retrieves online features with a single request to the online server for all the feature views.
+
+        On demand feature views are computed by the online server.
+        """
+        assert isinstance(config.online_store, RemoteOnlineStoreConfig)
+        config.online_store.__class__ = RemoteOnlineStoreConfig
+
+        req_body = self._construct_get_online_features_api_json_request(
+            features, entity_rows, full_feature_names
+        )
+        response = get_remote_online_features(config=config, req_body=req_body)
+        return OnlineResponse(
+            self._get_online_features_response_proto(
+                response, features, registry, project, full_feature_names
+            )
+        )
+
+    async def get_online_features_async(
+        self,
+        config: RepoConfig,
+        features: Union[List[str], FeatureService],
+        entity_rows: Union[
+            List[Dict[str, Any]],
+            Mapping[str, Union[Sequence[Any], Sequence[ValueProto], RepeatedValue]],
+        ],
+        registry: BaseRegistry,
+        project: str,
+        full_feature_names: bool = False,
+    ) -> OnlineResponse:
+        """
+        Retrieves online features asynchronously with a single request to the online server for all the feature
+        views, over a pooled HTTP/2 connection.
+
+        On demand feature views are computed by the online server.
+        """
+        assert isinstance(config.online_store, RemoteOnlineStoreConfig)
+        config.online_store.__class__ = RemoteOnlineStoreConfig
+
+        req_body = self._construct_get_online_features_api_json_request(
+            features, entity_rows, full_feature_names
+        )
+        response = await self._post_async(config, "/get-online-features", req_body)
+        return OnlineResponse(
+            self._get_online_features_response_proto(
+                response, features, registry, project, full_feature_names
+            )
+        )
+
+    def _online_read_result(
+        self,
+        response,
+        table: FeatureView,
+        num_entity_keys: int,
+        requested_features: Optional[List[str]],
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        if response.status_code != 200:
             error_msg = f"Unable to retrieve the online store data using feature server API. Error_code={response.status_code}, error_message={response.text}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+        logger.debug("Able to retrieve the online features from feature server.")
+        value_types = {
+            feature.name: feature.dtype.to_value_type() for feature in table.features
+        }
+        return self._online_read_result_from_proto(
+            _response_proto(response, value_types), num_entity_keys, requested_features
+        )
+
+    def _get_online_features_response_proto(
+        self,
+        response,
+        features: Union[List[str], FeatureService],
+        registry: BaseRegistry,
+        project: str,
+        full_feature_names: bool,
+    ) -> GetOnlineFeaturesResponse:
+        if response.status_code != 200:
+            error_msg = f"Unable to retrieve the online store data using feature server API. Error_code={response.status_code}, error_message={response.text}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        if response.headers.get("content-type") == PROTOBUF_MEDIA_TYPE:
+            return GetOnlineFeaturesResponse.FromString(response.content)
+
+        # JSON values are decoded with the types declared by the requested feature views.
+        feature_views, on_demand_feature_views = utils._get_feature_views_to_use(
+            registry, project, features, allow_cache=True, hide_dummy_entity=False
+        )
+        value_types: Dict[str, ValueType] = {}
+        for view in [*feature_views, *on_demand_feature_views]:
+            for field in view.features:
+                name = (
+                    f"{view.projection.name_to_use()}__{field.name}"
+                    if full_feature_names
+                    else field.name
+                )
+                value_types[name] = field.dtype.to_value_type()
+            for field in getattr(view, "entity_columns", []):
+                value_types[field.name] = field.dtype.to_value_type()
+        return _response_proto(response, value_types)
+
+    async def _post_async(self, config: RepoConfig, endpoint: str, req_body: str):
+        client = self._get_async_client(config)
+        headers = {}
+        if config.online_store.response_format == "protobuf":
+            headers["Accept"] = PROTOBUF_MEDIA_TYPE
+        if config.auth_config.type != AuthType.NONE.value:
+            auth_token = await asyncio.to_thread(get_auth_token, config.auth_config)
+            headers["Authorization"] = f"Bearer {auth_token}"
+
+        response = await client.post(
+            f"{config.online_store.path}{endpoint}", content=req_body, headers=headers
+        )
+        if response.status_code >= 400:
+            try:
+                mapped_error = FeastError.from_error_detail(response.json())
+            except ValueError:
+                mapped_error = None
+            if mapped_error is not None:
+                raise mapped_error
+        return response
+
+    def _get_async_client(self, config: RepoConfig):
+        # Clients are bound to the event loop they were created in.
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_client_loop is loop:
+            return self._async_client
+
+        try:
+            import httpx
+        except ImportError as e:
+            from feast.errors import FeastExtrasDependencyImportError
+
+            raise FeastExtrasDependencyImportError("http2", str(e))
+
+        online_store_config = config.online_store
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            verify=online_store_config.cert or True,
+            retries=online_store_config.connection_retries,
+            limits=httpx.Limits(
+                max_connections=online_store_config.connection_pool_size,
+                keepalive_expiry=online_store_config.connection_idle_timeout or None,
+            ),
+        )
+        self._async_client = httpx.AsyncClient(transport=transport)
+        self._async_client_loop = loop
+        return self._async_client
+
+    @staticmethod
+    def _online_read_result_from_proto(
+        response_proto: GetOnlineFeaturesResponse,
+        num_entity_keys: int,
+        requested_features: Optional[List[str]],
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        event_ts: Optional[datetime] = None
+        if len(response_proto.results) > 1:
+            event_ts = (
+                response_proto.results[1]
+                .event_timestamps[0]
+                .ToDatetime(tzinfo=timezone.utc)
+            )
+
+        # The values are already typed protos, so they are used as they are instead of being rebuilt from JSON.
+        requested_columns = [
+            (feature_name, response_proto.results[index])
+            for index, feature_name in enumerate(
+                response_proto.metadata.feature_names.val
+            )
+            if requested_features is not None and feature_name in requested_features
+        ]
+        result_tuples: List[
+            Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
+        ] = []
+        for feature_value_index in range(num_entity_keys):
+            feature_values_dict: Dict[str, ValueProto] = dict()
+            for feature_name, feature_vector in requested_columns:
+                if feature_vector.statuses[feature_value_index] == FieldStatus.PRESENT:
+                    feature_values_dict[feature_name] = feature_vector.values[
+                        feature_value_index
+                    ]
+                else:
+                    feature_values_dict[feature_name] = ValueProto()
+            result_tuples.append((event_ts, feature_values_dict))
+        return result_tuples
+
     def retrieve_online_documents(
         self,
         config: RepoConfig,
@@ -440,6 +659,43 @@ class RemoteOnlineStore(OnlineStore):
         )
         return req_body
 
+    def _construct_get_online_features_api_json_request(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_rows: Union[
+            List[Dict[str, Any]],
+            Mapping[str, Union[Sequence[Any], Sequence[ValueProto], RepeatedValue]],
+        ],
+        full_feature_names: bool,
+    ) -> str:
+        if isinstance(entity_rows, list):
+            columnar: Dict[str, List[Any]] = defaultdict(list)
+            for entity_row in entity_rows:
+                for key, value in entity_row.items():
+                    columnar[key].append(value)
+            entity_rows = columnar
+
+        entities = {}
+        for key, values in entity_rows.items():
+            if isinstance(values, RepeatedValue):
+                values = values.val
+            entities[key] = [
+                feast_value_type_to_python_type(value)
+                if isinstance(value, ValueProto)
+                else value
+                for value in values
+            ]
+
+        request: Dict[str, Any] = {
+            "entities": entities,
+            "full_feature_names": full_feature_names,
+        }
+        if isinstance(features, FeatureService):
+            request["feature_service"] = features.name
+        else:
+            request["features"] = features
+        return json.dumps(request, default=_json_default)
+
     def _construct_online_documents_api_json_request(
         self,
         table: FeatureView,
@@ -569,22 +825,81 @@ class RemoteOnlineStore(OnlineStore):
         fine for SDK usage where there's usually one FeatureStore per process.
         """
         HttpSessionManager.close_session()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
         logger.debug("RemoteOnlineStore HTTP session closed")
 
 
+def _json_default(value: Any) -> Any:
+    # Entity values may be numpy scalars or timestamps.
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _response_proto(
+    response, value_types: Dict[str, ValueType]
+) -> GetOnlineFeaturesResponse:
+    """Decodes a protobuf or JSON online features response of the online server."""
+    if response.headers.get("content-type") == PROTOBUF_MEDIA_TYPE:
+        return GetOnlineFeaturesResponse.FromString(response.content)
+
+    response_json = json.loads(response.text)
+    feature_names = response_json["metadata"]["feature_names"]
+    response_proto = GetOnlineFeaturesResponse(
+        metadata=GetOnlineFeaturesResponseMetadata(
+            feature_names=FeatureList(val=feature_names)
+        )
+    )
+    for feature_name, result in zip(feature_names, response_json.get("results", [])):
+        statuses = [FieldStatus.Value(status) for status in result.get("statuses", [])]
+        values = result.get("values", [])
+        present = [
+            value is not None and status == FieldStatus.PRESENT
+            for value, status in zip(values, statuses)
+        ]
+        # Values of a column are converted together with the declared type of the feature.
+        present_values = [value for value, keep in zip(values, present) if keep]
+        converted = iter(
+            python_values_to_proto_values(
+                present_values, value_types.get(feature_name, ValueType.UNKNOWN)
+            )
+            if present_values
+            else []
+        )
+        feature_vector = response_proto.results.add()
+        feature_vector.values.extend(
+            next(converted) if keep else ValueProto() for keep in present
+        )
+        feature_vector.statuses.extend(statuses)
+        for event_timestamp in result.get("event_timestamps", []):
+            feature_vector.event_timestamps.add().FromJsonString(event_timestamp)
+    return response_proto
+
+
 @rest_error_handling_decorator
 def get_remote_online_features(
     session: requests.Session, config: RepoConfig, req_body: str
 ) -> requests.Response:
+    headers = {}
+    if getattr(config.online_store, "response_format", "json") == "protobuf":
+        headers["Accept"] = PROTOBUF_MEDIA_TYPE
     if config.online_store.cert:
         return session.post(
             f"{config.online_store.path}/get-online-features",
             data=req_body,
+            headers=headers,
             verify=config.online_store.cert,
         )
     else:
         return session.post(
-            f"{config.online_store.path}/get-online-features", data=req_body
+            f"{config.online_store.path}/get-online-features",
+            data=req_body,
+            headers=headers,
         )
 
 
@@ -42,7 +42,13 @@ from feast.infra.key_encoding_utils import (
     serialize_entity_key,
     serialize_f32,
 )
-from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.hybrid_search import (
+    HYBRID_SCORE_FEATURE,
+    HybridFusion,
+    fuse_rankings,
+)
+from feast.infra.online_stores.online_store import OnlineStore, _document_queries
+from feast.infra.online_stores.vector_quantization import rescore_candidates
 from feast.infra.online_stores.vector_store import VectorStoreConfig
 from feast.protos.feast.core.InfraObject_pb2 import InfraObject as InfraObjectProto
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
@@ -123,6 +129,9 @@ class SqliteOnlineStore(OnlineStore):
     """
 
     _conn: Optional[sqlite3.Connection] = None
+    _search_indexes: Optional[
+        Dict[Tuple[str, Optional[str], Optional[str]], Tuple[Optional[str], List[str]]]
+    ] = None
 
     @staticmethod
     def _get_db_path(config: RepoConfig) -> str:
@@ -147,6 +156,103 @@ class SqliteOnlineStore(OnlineStore):
 
         return self._conn
 
+    def _ensure_search_indexes(
+        self, conn: sqlite3.Connection, config: RepoConfig, table: FeatureView
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Creates the vector and text search indexes of a feature view, or recreates them if the schema of the
+        feature view changed since they were created.
+
+        The sqlite-vec `vec0` table holds the vector of every entity, and the FTS5 table the string features
+        of every entity, with the rowid of the corresponding row of the feature view table. The schema of an
+        index is the statement that created it, as recorded in `sqlite_master`. Indexes created for existing
+        feature view tables are filled from their rows; afterwards they are maintained by `online_write_batch`.
+
+        Returns:
+            The indexed vector field, if any, and the indexed string fields.
+        """
+        if self._search_indexes is None:
+            self._search_indexes = {}
+        table_name = _table_id(config.project, table)
+        text_search_enabled = getattr(config.online_store, "text_search_enabled", False)
+
+        vector_field = None
+        vec_table_sql = None
+        if config.online_store.vector_enabled:
+            vector_fields = [
+                f.name for f in table.features if getattr(f, "vector_index", None)
+            ]
+            vector_field = vector_fields[0] if len(vector_fields) == 1 else None
+        if vector_field is not None:
+            vector_field_metadata = _get_feature_view_vector_field_metadata(table)
+            vec_table_sql = _vec_table_sql(
+                table_name,
+                getattr(vector_field_metadata, "vector_length", 512),
+                _vector_quantization(table),
+            )
+        string_fields: List[str] = []
+        if text_search_enabled:
+            string_fields = [
+                f.name for f in table.features if f.dtype == PrimitiveFeastType.STRING
+            ]
+        fts_table_sql = (
+            _fts_table_sql(table_name, string_fields) if string_fields else None
+        )
+
+        key = (table_name, vec_table_sql, fts_table_sql)
+        if key in self._search_indexes:
+            return self._search_indexes[key]
+
+        existing_tables = dict(
+            conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE name IN (?, ?, ?)",
+                (table_name, _vec_table_id(table_name), _fts_table_id(table_name)),
+            ).fetchall()
+        )
+        if table_name not in existing_tables:
+            # The feature view table is created by `update`.
+            return vector_field, string_fields
+
+        # The table of every index, the statement creating it and the query filling it, with its parameters
+        indexes: List[Tuple[str, Optional[str], str, Tuple]] = []
+        if config.online_store.vector_enabled:
+            indexes.append(
+                (
+                    _vec_table_id(table_name),
+                    vec_table_sql,
+                    f"""
+                    INSERT INTO {_vec_table_id(table_name)} (rowid, vector_value)
+                    SELECT rowid, {_quantize_vector("vector_value", _vector_quantization(table))} FROM {table_name}
+                    WHERE feature_name = ?
+                    """,
+                    (vector_field,),
+                )
+            )
+        if text_search_enabled:
+            indexes.append(
+                (
+                    _fts_table_id(table_name),
+                    fts_table_sql,
+                    _generate_bm25_search_insert_query(table_name, string_fields)
+                    if string_fields
+                    else "",
+                    (),
+                )
+            )
+        with conn:
+            for index_table, index_sql, fill_query, fill_params in indexes:
+                if existing_tables.get(index_table) == index_sql:
+                    continue
+                # The indexed fields, vector length or quantization changed, so the index is rebuilt.
+                if index_table in existing_tables:
+                    conn.execute(f"DROP TABLE {index_table}")
+                if index_sql is not None:
+                    conn.execute(index_sql)
+                    conn.execute(fill_query, fill_params)
+
+        self._search_indexes[key] = (vector_field, string_fields)
+        return vector_field, string_fields
+
     def online_write_batch(
         self,
         config: RepoConfig,
@@ -164,6 +270,8 @@ class SqliteOnlineStore(OnlineStore):
         conn = self._get_conn(config)
         project = config.project
         feature_type_dict = {f.name: f.dtype for f in table.features}
+        table_name = _table_id(project, table)
+        vector_field, string_fields = self._ensure_search_indexes(conn, config, table)
         with conn:
             for entity_key, values, timestamp, created_ts in data:
                 entity_key_bin = serialize_entity_key(
@@ -174,7 +282,6 @@ class SqliteOnlineStore(OnlineStore):
                 if created_ts is not None:
                     created_ts = to_naive_utc(created_ts)
 
-                table_name = _table_id(project, table)
                 for feature_name, val in values.items():
                     if config.online_store.vector_enabled:
                         if (
@@ -229,6 +336,17 @@ class SqliteOnlineStore(OnlineStore):
                             ),
                         )
 
+                if vector_field is not None and vector_field in values:
+                    _index_vector(
+                        conn,
+                        table_name,
+                        entity_key_bin,
+                        vector_field,
+                        _vector_quantization(table),
+                    )
+                if any(field in values for field in string_fields):
+                    _index_text(conn, table_name, entity_key_bin, string_fields)
+
                 if progress:
                     progress(1)
 
@@ -305,9 +423,17 @@ class SqliteOnlineStore(OnlineStore):
             conn.execute(
                 f"CREATE INDEX IF NOT EXISTS {_table_id(project, table)}_ek ON {_table_id(project, table)} (entity_key);"
             )
+            self._ensure_search_indexes(conn, config, table)
 
         for table in tables_to_delete:
-            conn.execute(f"DROP TABLE IF EXISTS {_table_id(project, table)}")
+            table_name = _table_id(project, table)
+            conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+            if config.online_store.vector_enabled:
+                conn.execute(f"DROP TABLE IF EXISTS {_vec_table_id(table_name)}")
+            conn.execute(f"DROP TABLE IF EXISTS {_fts_table_id(table_name)}")
+            if self._search_indexes is not None:
+                for key in [k for k in self._search_indexes if k[0] == table_name]:
+                    del self._search_indexes[key]
 
     def plan(
         self, config: RepoConfig, desired_registry_proto: RegistryProto
@@ -380,56 +506,27 @@ class SqliteOnlineStore(OnlineStore):
         # Convert the embedding to a binary format instead of using SerializeToString()
         query_embedding_bin = serialize_f32(embedding, vector_field_length)
         table_name = _table_id(project, table)
-        vector_field = _get_vector_field(table)
-
-        cur.execute(
-            f"""
-            CREATE VIRTUAL TABLE vec_table using vec0(
-                vector_value float[{vector_field_length}]
-        );
-        """
-        )
+        _get_vector_field(table)
+        self._ensure_search_indexes(conn, config, table)
 
-        # Currently I can only insert the embedding value without crashing SQLite, will report a bug
-        cur.execute(
-            f"""
-            INSERT INTO vec_table(rowid, vector_value)
-            select rowid, vector_value from {table_name}
-            where feature_name = "{vector_field}"
-        """
+        nearest_vectors, nearest_vectors_params = _nearest_vectors(
+            config, table, table_name, query_embedding_bin, top_k
         )
-        cur.execute(
-            f"""
-            CREATE VIRTUAL TABLE IF NOT EXISTS vec_table using vec0(
-                vector_value float[{vector_field_length}]
-            );
-            """
-        )
-
         # Have to join this with the {table_name} to get the feature name and entity_key
         # Also the `top_k` doesn't appear to be working for some reason
         cur.execute(
             f"""
             select
                 fv.entity_key,
-                f.vector_value,
+                fv.vector_value,
                 fv.value,
                 f.distance,
                 fv.event_ts
-            from (
-                select
-                    rowid,
-                    vector_value,
-                    distance
-                from vec_table
-                where vector_value match ?
-                order by distance
-                limit ?
-            ) f
+            from ({nearest_vectors}) f
             left join {table_name} fv
             on f.rowid = fv.rowid
         """,
-            (query_embedding_bin, top_k),
+            nearest_vectors_params,
         )
 
         rows = cur.fetchall()
@@ -506,53 +603,22 @@ class SqliteOnlineStore(OnlineStore):
         table_name = _table_id(config.project, table)
         vector_field = _get_vector_field(table)
 
+        _, string_field_list = self._ensure_search_indexes(conn, config, table)
         if online_store.vector_enabled:
             query_embedding_bin = serialize_f32(query, vector_field_length)  # type: ignore
-            cur.execute(
-                f"""
-                CREATE VIRTUAL TABLE IF NOT EXISTS vec_table using vec0(
-                    vector_value float[{vector_field_length}]
-                );
-                """
-            )
-            cur.execute(
-                f"""
-                INSERT INTO vec_table (rowid, vector_value)
-                select rowid, vector_value from {table_name}
-                where feature_name = "{vector_field}"
-                """
-            )
         elif online_store.text_search_enabled:
-            string_field_list = [
-                f.name for f in table.features if f.dtype == PrimitiveFeastType.STRING
-            ]
             string_fields = ", ".join(string_field_list)
             # TODO: swap this for a value configurable in each Field()
-            BM25_DEFAULT_WEIGHTS = ", ".join(
-                [
-                    str(1.0)
-                    for f in table.features
-                    if f.dtype == PrimitiveFeastType.STRING
-                ]
-            )
-            cur.execute(
-                f"""
-                CREATE VIRTUAL TABLE IF NOT EXISTS search_table using fts5(
-                    entity_key, fv_rowid, {string_fields}, tokenize="porter unicode61"
-                );
-                """
-            )
-            insert_query = _generate_bm25_search_insert_query(
-                table_name, string_field_list
-            )
-            cur.execute(insert_query)
-
+            BM25_DEFAULT_WEIGHTS = ", ".join([str(1.0) for _ in string_field_list])
         else:
             raise ValueError(
                 "Neither vector search nor text search are enabled in the online store config"
             )
 
         if online_store.vector_enabled:
+            nearest_vectors, nearest_vectors_params = _nearest_vectors(
+                config, table, table_name, query_embedding_bin, top_k
+            )
             cur.execute(
                 f"""
                 select
@@ -563,26 +629,14 @@ class SqliteOnlineStore(OnlineStore):
                     f.distance,
                     fv.event_ts,
                     fv.created_ts
-                from (
-                    select
-                        rowid,
-                        vector_value,
-                        distance
-                    from vec_table
-                    where vector_value match ?
-                    order by distance
-                    limit ?
-                ) f
+                from ({nearest_vectors}) f
                 left join {table_name} fv
                     on f.rowid = fv.rowid
                 left join {table_name} fv2
                     on fv.entity_key = fv2.entity_key
                 where fv2.feature_name != "{vector_field}"
                 """,
-                (
-                    query_embedding_bin,
-                    top_k,
-                ),
+                nearest_vectors_params,
             )
         elif online_store.text_search_enabled:
             cur.execute(
@@ -601,9 +655,9 @@ class SqliteOnlineStore(OnlineStore):
                         fv_rowid,
                         entity_key,
                         {string_fields},
-                        bm25(search_table, {BM25_DEFAULT_WEIGHTS}) as distance
-                    from search_table
-                    where search_table match ? order by distance limit ?
+                        bm25({_fts_table_id(table_name)}, {BM25_DEFAULT_WEIGHTS}) as distance
+                    from {_fts_table_id(table_name)}
+                    where {_fts_table_id(table_name)} match ? order by distance limit ?
                 ) f
                     on f.entity_key = fv.entity_key
                 """,
@@ -681,6 +735,138 @@ class SqliteOnlineStore(OnlineStore):
             )
         return results
 
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embeddings: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[EntityKeyProto],
+                Optional[Dict[str, ValueProto]],
+            ]
+        ]
+    ]:
+        # The queries share a single connection, so they are run one after the other.
+        return [
+            self.retrieve_online_documents_v2(
+                config,
+                table,
+                requested_features,
+                embedding,
+                top_k,
+                distance_metric,
+                query_string,
+            )
+            for embedding, query_string in _document_queries(embeddings, query_strings)
+        ]
+
+    def retrieve_online_documents_hybrid(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        embedding: List[float],
+        query_string: str,
+        top_k: int,
+        fusion: HybridFusion,
+        distance_metric: Optional[str] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ]:
+        online_store = config.online_store
+        if not isinstance(online_store, SqliteOnlineStoreConfig):
+            raise ValueError("online_store must be SqliteOnlineStoreConfig")
+        if not online_store.vector_enabled or not online_store.text_search_enabled:
+            raise ValueError(
+                "Hybrid retrieval requires both vector search and text search to be enabled in the online store config"
+            )
+
+        conn = self._get_conn(config)
+        table_name = _table_id(config.project, table)
+        vector_field_length = getattr(
+            _get_feature_view_vector_field_metadata(table), "vector_length", 512
+        )
+        _, string_field_list = self._ensure_search_indexes(conn, config, table)
+        candidates = fusion.candidates(top_k)
+
+        # Both searches only rank entity keys; the features are read once, for the fused documents.
+        nearest_vectors, nearest_vectors_params = _nearest_vectors(
+            config,
+            table,
+            table_name,
+            serialize_f32(embedding, vector_field_length),
+            candidates,
+        )
+        vector_ranking = conn.execute(
+            f"""
+            select fv.entity_key, f.distance
+            from ({nearest_vectors}) f
+            inner join {table_name} fv
+                on f.rowid = fv.rowid
+            order by f.distance
+            """,
+            nearest_vectors_params,
+        ).fetchall()
+        text_ranking = []
+        if string_field_list:
+            bm25_weights = ", ".join([str(1.0) for _ in string_field_list])
+            text_ranking = conn.execute(
+                f"""
+                select entity_key, bm25({_fts_table_id(table_name)}, {bm25_weights}) as rank
+                from {_fts_table_id(table_name)}
+                where {_fts_table_id(table_name)} match ?
+                order by rank
+                limit ?
+                """,
+                (query_string, candidates),
+            ).fetchall()
+
+        fused = fuse_rankings(vector_ranking, text_ranking, fusion, top_k)
+        if not fused:
+            return []
+
+        documents: Dict[bytes, Tuple[Optional[datetime], Dict[str, ValueProto]]] = {
+            entity_key: (None, {HYBRID_SCORE_FEATURE: ValueProto(double_val=score)})
+            for entity_key, score in fused
+        }
+        rows = conn.execute(
+            f"""
+            select entity_key, feature_name, value, event_ts
+            from {table_name}
+            where entity_key in ({", ".join("?" * len(documents))})
+            """,
+            list(documents),
+        ).fetchall()
+        for entity_key, feature_name, value_bin, event_ts in rows:
+            feature_val = ValueProto()
+            feature_val.ParseFromString(value_bin)
+            features = documents[entity_key][1]
+            features[feature_name] = feature_val
+            documents[entity_key] = (event_ts, features)
+
+        return [
+            (
+                event_ts,
+                deserialize_entity_key(
+                    entity_key,
+                    entity_key_serialization_version=config.entity_key_serialization_version,
+                ),
+                features,
+            )
+            for entity_key, (event_ts, features) in documents.items()
+        ]
+
 
 def _initialize_conn(
     db_path: str, enable_sqlite_vec: bool = False
@@ -707,6 +893,168 @@ def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
 
+def _vec_table_id(table_name: str) -> str:
+    return f"{table_name}_vec"
+
+
+def _fts_table_id(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def _vec_table_sql(
+    table_name: str, vector_length: int, quantization: Optional[str]
+) -> str:
+    return (
+        f"CREATE VIRTUAL TABLE {_vec_table_id(table_name)} using vec0("
+        f"vector_value {_vec_column_type(quantization)}[{vector_length}])"
+    )
+
+
+def _fts_table_sql(table_name: str, string_fields: List[str]) -> str:
+    return (
+        f"CREATE VIRTUAL TABLE {_fts_table_id(table_name)} using fts5("
+        f'entity_key, fv_rowid, {", ".join(string_fields)}, tokenize="porter unicode61")'
+    )
+
+
+def _index_vector(
+    conn: sqlite3.Connection,
+    table_name: str,
+    entity_key_bin: bytes,
+    vector_field: str,
+    quantization: Optional[str] = None,
+) -> None:
+    """Copies the vector of an entity to the vector index, replacing its previous vector."""
+    (rowid,) = conn.execute(
+        f"SELECT rowid FROM {table_name} WHERE entity_key = ? AND feature_name = ?",
+        (entity_key_bin, vector_field),
+    ).fetchone()
+    # vec0 tables do not support upserts.
+    conn.execute(f"DELETE FROM {_vec_table_id(table_name)} WHERE rowid = ?", (rowid,))
+    conn.execute(
+        f"""
+        INSERT INTO {_vec_table_id(table_name)} (rowid, vector_value)
+        SELECT rowid, {_quantize_vector("vector_value", quantization)} FROM {table_name} WHERE rowid = ?
+        """,
+        (rowid,),
+    )
+
+
+def _vector_quantization(table: FeatureView) -> Optional[str]:
+    """Returns the quantization of the vector field of a feature view, if any."""
+    quantization = getattr(
+        _get_feature_view_vector_field_metadata(table), "vector_quantization", None
+    )
+    if quantization == "float16":
+        raise ValueError(
+            "sqlite-vec does not support float16 vectors, use int8 or binary quantization instead"
+        )
+    return quantization
+
+
+def _vec_column_type(quantization: Optional[str]) -> str:
+    return {"int8": "int8", "binary": "bit"}.get(quantization or "", "float")
+
+
+def _quantize_vector(expression: str, quantization: Optional[str]) -> str:
+    """Returns the SQL expression quantizing a float32 vector for a vec0 column of the given quantization."""
+    if quantization == "int8":
+        # Quantizes each dimension of unit vectors, between -1 and 1, to an 8-bit integer.
+        return f"vec_quantize_int8({expression}, 'unit')"
+    if quantization == "binary":
+        return f"vec_quantize_binary({expression})"
+    return expression
+
+
+def _nearest_vectors(
+    config: RepoConfig,
+    table: FeatureView,
+    table_name: str,
+    query_embedding_bin: bytes,
+    top_k: int,
+) -> Tuple[str, Tuple]:
+    """
+    Returns the query selecting the rowid and the distance of the top k vectors nearest to a query embedding,
+    and its parameters.
+
+    Quantized vector indexes are searched for `top_k * vector_rescore_oversample` candidates, which are ranked
+    by the L2 distance between their full-precision vector, kept in the feature view table, and the query.
+    """
+    quantization = _vector_quantization(table)
+    if not quantization:
+        return (
+            f"""
+            select rowid, distance
+            from {_vec_table_id(table_name)}
+            where vector_value match ?
+            order by distance
+            limit ?
+            """,
+            (query_embedding_bin, top_k),
+        )
+    return (
+        f"""
+        select c.rowid, vec_distance_l2(fv.vector_value, ?) as distance
+        from (
+            select rowid
+            from {_vec_table_id(table_name)}
+            where vector_value match {_quantize_vector("?", quantization)}
+            order by distance
+            limit ?
+        ) c
+        inner join {table_name} fv
+            on fv.rowid = c.rowid
+        order by distance
+        limit ?
+        """,
+        (
+            query_embedding_bin,
+            query_embedding_bin,
+            rescore_candidates(
+                top_k, getattr(config.online_store, "vector_rescore_oversample", None)
+            ),
+            top_k,
+        ),
+    )
+
+
+def _index_text(
+    conn: sqlite3.Connection,
+    table_name: str,
+    entity_key_bin: bytes,
+    string_fields: List[str],
+) -> None:
+    """
+    Replaces the text index entry of an entity with its current string features.
+
+    Entries are keyed by the rowid of the first string feature of the entity, as in
+    `_generate_bm25_search_insert_query`.
+    """
+    rows = conn.execute(
+        f"SELECT rowid, feature_name, value FROM {table_name} "
+        f"WHERE entity_key = ? AND feature_name IN ({','.join('?' * len(string_fields))})",
+        (entity_key_bin, *string_fields),
+    ).fetchall()
+    values = {feature_name: (rowid, value) for rowid, feature_name, value in rows}
+    if string_fields[0] not in values:
+        return
+    fts_rowid = values[string_fields[0]][0]
+    conn.execute(
+        f"DELETE FROM {_fts_table_id(table_name)} WHERE rowid = ?", (fts_rowid,)
+    )
+    conn.execute(
+        f"INSERT INTO {_fts_table_id(table_name)} "
+        f"(rowid, entity_key, fv_rowid, {', '.join(string_fields)}) "
+        f"VALUES (?, ?, ?, {', '.join('?' * len(string_fields))})",
+        (
+            fts_rowid,
+            entity_key_bin,
+            fts_rowid,
+            *(values.get(field, (None, None))[1] for field in string_fields),
+        ),
+    )
+
+
 class SqliteTable(InfraObject):
     """
     A Sqlite table managed by Feast.
@@ -803,7 +1151,7 @@ def _generate_bm25_search_insert_query(
     table_name: str, string_field_list: List[str]
 ) -> str:
     """
-    Generates an SQL insertion query for the given table and string fields.
+    Generates an SQL query filling the text search index of the given table from its string fields.
 
     Args:
         table_name (str): The name of the table to select data from.
@@ -813,7 +1161,7 @@ def _generate_bm25_search_insert_query(
         str: The generated SQL insertion query.
     """
     _string_fields = ", ".join(string_field_list)
-    query = f"INSERT INTO search_table (entity_key, fv_rowid, {_string_fields})\nSELECT\n\tDISTINCT fv0.entity_key,\n\tfv0.rowid as fv_rowid"
+    query = f"INSERT INTO {_fts_table_id(table_name)} (rowid, entity_key, fv_rowid, {_string_fields})\nSELECT\n\tDISTINCT fv0.rowid,\n\tfv0.entity_key,\n\tfv0.rowid as fv_rowid"
     from_query = f"\nFROM (select rowid, * from {table_name} where feature_name = '{string_field_list[0]}') fv0"
 
     for i, string_field in enumerate(string_field_list):
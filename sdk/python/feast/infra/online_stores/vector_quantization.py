@@ -0,0 +1,81 @@
+"""
+Quantized vector search.
+
+Vector fields with a `vector_quantization` are indexed with quantized vectors:
+
+- "int8": every dimension is quantized to an 8-bit integer.
+- "float16": every dimension is stored in half precision.
+- "binary": every dimension is reduced to a single bit, its sign.
+
+Quantized indexes are smaller and faster to search, but their distances are approximate. Online stores keep the
+full-precision vectors next to the index, search the index for `top_k * vector_rescore_oversample` candidates, and
+rank the candidates by their full-precision distance to return the top k.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+VECTOR_QUANTIZATIONS = ["int8", "float16", "binary"]
+
+# The number of candidates retrieved from quantized indexes, as a multiple of top_k, unless configured otherwise.
+DEFAULT_RESCORE_OVERSAMPLE = 4
+
+_SIMILARITY_METRICS = {"IP", "INNER_PRODUCT", "DOT_PRODUCT", "COSINE"}
+_DISTANCE_METRICS = {"L2", "EUCLIDEAN"}
+
+
+def validate_vector_quantization(quantization: Optional[str]) -> None:
+    if quantization and quantization not in VECTOR_QUANTIZATIONS:
+        raise ValueError(
+            f"Vector quantization {quantization} is not supported. Supported vector quantizations are {VECTOR_QUANTIZATIONS}"
+        )
+
+
+def rescore_candidates(top_k: int, rescore_oversample: Optional[int]) -> int:
+    """Returns the number of candidates to retrieve from a quantized index to return the top k vectors."""
+    return top_k * max(rescore_oversample or DEFAULT_RESCORE_OVERSAMPLE, 1)
+
+
+def exact_distances(
+    query: Sequence[float], vectors: np.ndarray, metric: str
+) -> np.ndarray:
+    """
+    Returns the full-precision distances between a query embedding and vectors.
+
+    The distances follow the conventions of faiss and Milvus: the squared euclidean distance for "L2", and the
+    inner product or the cosine similarity, for which larger values are closer, for "IP" and "COSINE".
+    """
+    query_vector = np.asarray(query, dtype=np.float32)
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, query_vector.shape[0])
+    metric = metric.upper()
+    if metric in _DISTANCE_METRICS:
+        return ((vectors - query_vector) ** 2).sum(axis=1)
+    if metric == "COSINE":
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector)
+        return np.divide(
+            vectors @ query_vector,
+            norms,
+            out=np.zeros(len(vectors), dtype=np.float32),
+            where=norms > 0,
+        )
+    if metric in _SIMILARITY_METRICS:
+        return vectors @ query_vector
+    raise ValueError(f"Distance metric {metric} is not supported for rescoring")
+
+
+def rescore(
+    query: Sequence[float], vectors: np.ndarray, metric: str, top_k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ranks candidate vectors by their full-precision distance to a query embedding.
+
+    Returns:
+        The positions of the top k candidates, from the closest, and their distances.
+    """
+    distances = exact_distances(query, vectors, metric)
+    order = np.argsort(
+        -distances if metric.upper() in _SIMILARITY_METRICS else distances,
+        kind="stable",
+    )[:top_k]
+    return order, distances[order]
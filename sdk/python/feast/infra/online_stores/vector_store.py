@@ -14,3 +14,7 @@ class VectorStoreConfig:
     # Qdrant:
     # https://qdrant.tech/documentation/concepts/search/#metrics
     similarity: Optional[str] = "cosine"
+
+    # The number of candidates retrieved from the quantized index of vector fields with a
+    # `vector_quantization`, as a multiple of top_k, which are then ranked by their full-precision vectors
+    vector_rescore_oversample: Optional[int] = 4
@@ -16,7 +16,7 @@ import pandas as pd
 import pyarrow as pa
 from tqdm import tqdm
 
-from feast import OnDemandFeatureView, importer
+from feast import OnDemandFeatureView, importer, tracing
 from feast.base_feature_view import BaseFeatureView
 from feast.batch_feature_view import BatchFeatureView
 from feast.data_source import DataSource
@@ -35,6 +35,7 @@ from feast.infra.infra_object import Infra, InfraObject
 from feast.infra.offline_stores.offline_store import RetrievalJob
 from feast.infra.offline_stores.offline_utils import get_offline_store_from_config
 from feast.infra.online_stores.helpers import get_online_store_from_config
+from feast.infra.online_stores.hybrid_search import HybridFusion
 from feast.infra.provider import Provider
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.supported_async_methods import ProviderAsyncMethods
@@ -248,14 +249,18 @@ class PassthroughProvider(Provider):
         project: str,
         full_feature_names: bool = False,
     ) -> OnlineResponse:
-        return self.online_store.get_online_features(
-            config=config,
-            features=features,
-            entity_rows=entity_rows,
-            registry=registry,
-            project=project,
-            full_feature_names=full_feature_names,
-        )
+        with tracing.span(
+            "feast.provider.get_online_features",
+            tracing.online_request_attributes(config, features, entity_rows),
+        ):
+            return self.online_store.get_online_features(
+                config=config,
+                features=features,
+                entity_rows=entity_rows,
+                registry=registry,
+                project=project,
+                full_feature_names=full_feature_names,
+            )
 
     async def get_online_features_async(
         self,
@@ -269,14 +274,18 @@ class PassthroughProvider(Provider):
         project: str,
         full_feature_names: bool = False,
     ) -> OnlineResponse:
-        return await self.online_store.get_online_features_async(
-            config=config,
-            features=features,
-            entity_rows=entity_rows,
-            registry=registry,
-            project=project,
-            full_feature_names=full_feature_names,
-        )
+        with tracing.span(
+            "feast.provider.get_online_features",
+            tracing.online_request_attributes(config, features, entity_rows),
+        ):
+            return await self.online_store.get_online_features_async(
+                config=config,
+                features=features,
+                entity_rows=entity_rows,
+                registry=registry,
+                project=project,
+                full_feature_names=full_feature_names,
+            )
 
     async def online_read_async(
         self,
@@ -336,6 +345,54 @@ class PassthroughProvider(Provider):
             )
         return result
 
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        queries: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List:
+        result = []
+        if self.online_store:
+            result = self.online_store.retrieve_online_documents_v2_batch(
+                config,
+                table,
+                requested_features,
+                queries,
+                top_k,
+                distance_metric,
+                query_strings,
+            )
+        return result
+
+    def retrieve_online_documents_hybrid(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        query: List[float],
+        query_string: str,
+        top_k: int,
+        fusion: HybridFusion,
+        distance_metric: Optional[str] = None,
+    ) -> List:
+        result = []
+        if self.online_store:
+            result = self.online_store.retrieve_online_documents_hybrid(
+                config,
+                table,
+                requested_features,
+                query,
+                query_string,
+                top_k,
+                fusion,
+                distance_metric,
+            )
+        return result
+
     @staticmethod
     def _prep_rows_to_write_for_ingestion(
         feature_view: Union[BaseFeatureView, FeatureView, OnDemandFeatureView],
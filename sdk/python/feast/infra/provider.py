@@ -26,6 +26,10 @@ from feast.feature_view import FeatureView
 from feast.importer import import_class
 from feast.infra.infra_object import Infra
 from feast.infra.offline_stores.offline_store import OfflineStore, RetrievalJob
+from feast.infra.online_stores.hybrid_search import (
+    HybridFusion,
+    retrieve_hybrid_documents,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.supported_async_methods import ProviderAsyncMethods
@@ -493,6 +497,103 @@ class Provider(ABC):
         """
         pass
 
+    def retrieve_online_documents_v2_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        queries: Optional[List[List[float]]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[EntityKeyProto],
+                Optional[Dict[str, ValueProto]],
+            ]
+        ]
+    ]:
+        """
+        Searches for the top-k most similar documents of several queries in the online document store.
+
+        Args:
+            distance_metric: distance metric to use for the search.
+            config: The config for the current feature store.
+            table: The feature view whose embeddings should be searched.
+            requested_features: the requested document feature names.
+            queries: The embedding of each query (optional).
+            top_k: The number of documents to return for each query.
+            query_strings: The query string of each query, to search for using keyword search (optional).
+
+        Returns:
+            The documents of each query, in the format of `retrieve_online_documents_v2`.
+        """
+        n_queries = len(queries) if queries is not None else len(query_strings or [])
+        return [
+            self.retrieve_online_documents_v2(
+                config,
+                table,
+                requested_features,
+                queries[i] if queries is not None else None,
+                top_k,
+                distance_metric,
+                query_strings[i] if query_strings is not None else None,
+            )
+            for i in range(n_queries)
+        ]
+
+    def retrieve_online_documents_hybrid(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_features: List[str],
+        query: List[float],
+        query_string: str,
+        top_k: int,
+        fusion: HybridFusion,
+        distance_metric: Optional[str] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[EntityKeyProto],
+            Optional[Dict[str, ValueProto]],
+        ]
+    ]:
+        """
+        Searches for the top-k documents that best match both a query embedding and a query string.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose embeddings should be searched.
+            requested_features: the requested document feature names.
+            query: The query embedding to search for.
+            query_string: The query string to search for using keyword search.
+            top_k: The number of documents to return.
+            fusion: How to fuse the results of the vector and keyword searches.
+            distance_metric: distance metric to use for the search.
+
+        Returns:
+            The documents in the format of `retrieve_online_documents_v2`, from the best match, with their
+            fused score as the "hybrid_score" feature.
+        """
+        return retrieve_hybrid_documents(
+            lambda embedding, text, limit: self.retrieve_online_documents_v2(
+                config,
+                table,
+                requested_features,
+                embedding,
+                limit,
+                distance_metric,
+                text,
+            ),
+            query,
+            query_string,
+            top_k,
+            fusion,
+        )
+
     @abstractmethod
     def validate_data_source(
         self,
@@ -7,6 +7,7 @@ from datetime import timedelta
 from threading import Lock
 from typing import List, Optional
 
+from feast import tracing
 from feast.base_feature_view import BaseFeatureView
 from feast.data_source import DataSource
 from feast.entity import Entity
@@ -426,7 +427,8 @@ class CachingRegistry(BaseRegistry):
 
     def refresh(self, project: Optional[str] = None):
         try:
-            self.cached_registry_proto = self.proto()
+            with tracing.span("feast.registry.refresh"):
+                self.cached_registry_proto = self.proto()
             self.cached_registry_proto_created = _utc_now()
         except Exception as e:
             logger.debug(f"Error while refreshing registry: {e}", exc_info=True)
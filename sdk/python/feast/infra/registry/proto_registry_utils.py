@@ -1,5 +1,5 @@
 from functools import wraps
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from feast import utils
 from feast.base_feature_view import BaseFeatureView
@@ -27,6 +27,17 @@ from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
 
+def cached_registry_proto_key(registry: Any) -> Optional[tuple]:
+    """
+    Returns the key identifying the registry proto cached by a registry, the same as in the caches below, or None
+    if the registry doesn't cache its proto. The key changes when the cache is refreshed or committed.
+    """
+    registry_proto = getattr(registry, "cached_registry_proto", None)
+    if registry_proto is None:
+        return None
+    return (id(registry_proto), registry_proto.version_id)
+
+
 def registry_proto_cache(func):
     cache_key = None
     cache_value = None
@@ -22,6 +22,7 @@ from urllib.parse import urlparse
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
 from google.protobuf.message import Message
 
+from feast import tracing
 from feast.base_feature_view import BaseFeatureView
 from feast.data_source import DataSource
 from feast.entity import Entity
@@ -996,7 +997,8 @@ class Registry(BaseRegistry):
             else:
                 logger.info("Registry cache expired, so refreshing")
 
-            registry_proto = self._registry_store.get_registry_proto()
+            with tracing.span("feast.registry.refresh"):
+                registry_proto = self._registry_store.get_registry_proto()
             self.cached_registry_proto = registry_proto
             self.cached_registry_proto_created = _utc_now()
 
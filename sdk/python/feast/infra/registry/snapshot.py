@@ -0,0 +1,190 @@
+"""
+Registry snapshots shared by the processes of a feature server.
+
+A supervisor process refreshes the registry and publishes the serialized registry proto to a snapshot file,
+on a memory-backed file system when available. Worker processes memory-map the snapshot and parse it only
+when its version changes, so the registry store is read once per refresh instead of once per worker.
+
+A snapshot file holds a header with a magic number and the version of the snapshot, followed by the
+serialized registry proto. Snapshots are written to a temporary file which atomically replaces the
+previous one, so readers never see a partially written snapshot.
+"""
+
+import atexit
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from feast.infra.registry.base_registry import BaseRegistry
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+from feast.utils import _utc_now
+
+if TYPE_CHECKING:
+    from feast.feature_store import FeatureStore
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"FEASTREG"
+_HEADER = struct.Struct("<8sQ")
+
+
+def default_snapshot_path() -> str:
+    """Returns a snapshot path private to this process, in /dev/shm if it exists."""
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"feast-registry-{os.getpid()}.snapshot")
+
+
+class RegistrySnapshotPublisher:
+    """Publishes registry protos to a snapshot file, bumping its version whenever the registry changes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.version = 0
+        self._digest: Optional[bytes] = None
+
+    def publish(self, registry_proto: RegistryProto) -> bool:
+        """
+        Publishes a registry proto.
+
+        Returns:
+            Whether a new snapshot was written, which is not the case if the registry did not change.
+        """
+        payload = registry_proto.SerializeToString()
+        digest = hashlib.sha256(payload).digest()
+        if digest == self._digest:
+            return False
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path), prefix=".feast-registry-"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, self.version + 1))
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self.version += 1
+        self._digest = digest
+        return True
+
+    def remove(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class RegistrySnapshotReader:
+    """
+    Loads the registry snapshots of a publisher into the cache of a registry.
+
+    Args:
+        path: The path of the snapshot file.
+        loaded_version: The version of the snapshot already held by the registries this reader loads into,
+            if any. Registries inherited from the supervisor, such as those of forked workers, do not need to
+            parse the snapshot they were forked with.
+    """
+
+    def __init__(self, path: str, loaded_version: int = 0):
+        self.path = path
+        self.loaded_version = loaded_version
+        self._file_id: Optional[Tuple[int, int, int]] = None
+
+    @staticmethod
+    def attach(registry: BaseRegistry) -> None:
+        """
+        Makes a registry serve from snapshots only.
+
+        The registry cache no longer expires and is not refreshed synchronously, as in the "thread" cache
+        mode, so the registry never reads the registry store by itself.
+        """
+        if not hasattr(registry, "cached_registry_proto"):
+            raise ValueError(
+                f"{type(registry).__name__} does not cache the registry and cannot be served from snapshots."
+            )
+        registry.cached_registry_proto_ttl = timedelta(seconds=0)  # type: ignore[attr-defined]
+        registry.cache_mode = "thread"  # type: ignore[attr-defined]
+        # The lock may have been held by a refresh of the supervisor when this process was forked.
+        registry._refresh_lock = threading.Lock()  # type: ignore[attr-defined]
+
+    def load_if_changed(self, registry: BaseRegistry) -> bool:
+        """
+        Loads the snapshot into the cache of the registry if its version changed since the last load.
+
+        Returns:
+            Whether a new snapshot was loaded.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_id == self._file_id:
+            return False
+
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+                magic, version = _HEADER.unpack_from(snapshot)
+                if magic != _MAGIC:
+                    raise ValueError(f"{self.path} is not a registry snapshot")
+                self._file_id = file_id
+                if version == self.loaded_version:
+                    return False
+                registry_proto = RegistryProto.FromString(snapshot[_HEADER.size :])
+
+        registry.cached_registry_proto = registry_proto  # type: ignore[attr-defined]
+        registry.cached_registry_proto_created = _utc_now()  # type: ignore[attr-defined]
+        self.loaded_version = version
+        logger.info(f"Loaded registry snapshot version {version}")
+        return True
+
+
+def publish_registry_snapshots(
+    store: "FeatureStore", registry_ttl_sec: int
+) -> RegistrySnapshotReader:
+    """
+    Makes this process the supervisor of the registry snapshots of a feature store.
+
+    The registry is refreshed and published now, then every `registry_ttl_sec` seconds by a daemon thread
+    (never if 0). The snapshot file is removed when the process exits.
+
+    Returns:
+        A reader of the snapshots, for the workers forked from this process.
+    """
+    RegistrySnapshotReader.attach(store.registry)
+    publisher = RegistrySnapshotPublisher(default_snapshot_path())
+    atexit.register(publisher.remove)
+
+    store.refresh_registry()
+    publisher.publish(store.registry.cached_registry_proto)  # type: ignore[attr-defined]
+
+    def refresh_periodically():
+        while True:
+            time.sleep(registry_ttl_sec)
+            try:
+                store.refresh_registry()
+                if publisher.publish(store.registry.cached_registry_proto):  # type: ignore[attr-defined]
+                    logger.info(
+                        f"Published registry snapshot version {publisher.version}"
+                    )
+            except Exception:
+                logger.exception("Failed to publish the registry snapshot")
+
+    if registry_ttl_sec:
+        threading.Thread(
+            target=refresh_periodically,
+            name="feast-registry-snapshot",
+            daemon=True,
+        ).start()
+
+    return RegistrySnapshotReader(publisher.path, loaded_version=publisher.version)
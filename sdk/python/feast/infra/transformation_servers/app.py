@@ -10,6 +10,7 @@ from feast import FeatureStore
 from feast.constants import (
     DEFAULT_FEATURE_TRANSFORMATION_SERVER_PORT,
     FEATURE_STORE_YAML_ENV_NAME,
+    FEATURE_TRANSFORMATION_SERVER_MAX_WORKERS_ENV_NAME,
     FEATURE_TRANSFORMATION_SERVER_PORT_ENV_NAME,
     REGISTRY_ENV_NAME,
 )
@@ -62,4 +63,5 @@ port = int(
         DEFAULT_FEATURE_TRANSFORMATION_SERVER_PORT,
     )
 )
-store.serve_transformations(port)
+max_workers = os.environ.get(FEATURE_TRANSFORMATION_SERVER_MAX_WORKERS_ENV_NAME)
+store.serve_transformations(port, int(max_workers) if max_workers else None)
@@ -0,0 +1,160 @@
+"""
+Prometheus metrics of the serving path.
+
+Requests are timed by stage, with the following labels:
+
+- `operation`: "get_online_features", "push" or "materialize".
+- `stage`: "total" for the whole operation, and for online reads "registry" (resolution of the requested
+  features), "prepare_entities" (including "registry"), "online_read" and "convert" per feature view,
+  "on_demand_transforms" for all the on demand feature views and "on_demand_transform" per view,
+  and "serialize" for the encoding of the response by the feature server. Pushes and materializations are
+  timed per feature view by "online_write", "offline_write" and "materialize".
+- `online_store`: the type of the online store, empty for the stages that do not depend on it ("registry",
+  "on_demand_transform" and "serialize").
+- `feature_view`: the feature view or on demand feature view of per-view stages, empty otherwise.
+
+Metrics are only recorded once `enable` is called, which `feast serve --metrics` does. Until then the
+instrumented code only checks a flag.
+"""
+
+import os
+import time
+from contextlib import nullcontext
+from typing import Any, ContextManager, Optional
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+
+_enabled = False
+
+stage_duration_seconds = Histogram(
+    "feast_serving_stage_duration_seconds",
+    "Duration of the stages of Feast serving operations",
+    ["operation", "stage", "online_store", "feature_view"],
+    buckets=(
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    ),
+)
+entity_rows = Counter(
+    "feast_serving_entity_rows",
+    "Number of entity rows read from or written to the online store",
+    ["operation", "online_store", "feature_view"],
+)
+feature_values = Counter(
+    "feast_serving_feature_values",
+    "Number of feature values read from or written to the online store",
+    ["operation", "online_store", "feature_view"],
+)
+
+_NOOP = nullcontext()
+
+
+class _StageTimer:
+    __slots__ = ("_labels", "_start")
+
+    def __init__(self, labels: tuple):
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        stage_duration_seconds.labels(*self._labels).observe(
+            time.perf_counter() - self._start
+        )
+        return False
+
+
+def enable() -> None:
+    """Starts recording the serving metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stops recording the serving metrics."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def online_store_type(config: Any) -> str:
+    """Returns the type of the online store of a `RepoConfig`, as configured in feature_store.yaml."""
+    online_store = getattr(config, "online_store", None)
+    return str(getattr(online_store, "type", "") or "")
+
+
+def stage(
+    operation: str,
+    stage: str,
+    config: Any = None,
+    feature_view: str = "",
+) -> ContextManager:
+    """
+    Times a stage of a serving operation.
+
+    Args:
+        operation: The serving operation.
+        stage: The stage of the operation.
+        config: The `RepoConfig` of the feature store, to label the stage with the online store type.
+        feature_view: The feature view of per-view stages.
+
+    Returns:
+        A context manager recording the duration of its block, which does nothing if metrics are disabled.
+    """
+    if not _enabled:
+        return _NOOP
+    return _StageTimer((operation, stage, online_store_type(config), feature_view))
+
+
+def count(
+    operation: str,
+    config: Any,
+    feature_view: str,
+    rows: int,
+    values: Optional[int] = None,
+) -> None:
+    """Counts the entity rows and feature values read or written for a feature view."""
+    if not _enabled:
+        return
+    labels = (operation, online_store_type(config), feature_view)
+    entity_rows.labels(*labels).inc(rows)
+    if values is not None:
+        feature_values.labels(*labels).inc(values)
+
+
+def start_metrics_server(port: int = 8000) -> None:
+    """
+    Exposes the metrics over HTTP.
+
+    If `PROMETHEUS_MULTIPROC_DIR` is set, the metrics recorded by all the processes sharing it, such as the
+    workers of the feature server, are aggregated.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        start_http_server(port, registry=registry)
+    else:
+        start_http_server(port)
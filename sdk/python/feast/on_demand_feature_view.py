@@ -68,6 +68,14 @@ class ODFVErrorMessages:
             "set write_to_online_store=False."
         )
 
+    @staticmethod
+    def cacheable_requires_row_wise_transformation() -> str:
+        return (
+            "OnDemandFeatureView configured with cacheable=True must be a row-wise "
+            "transformation, but aggregations were specified. Either remove the "
+            "aggregations or set cacheable=False."
+        )
+
     @staticmethod
     def no_transformation_provided() -> str:
         return (
@@ -131,6 +139,8 @@ class OnDemandFeatureView(BaseFeatureView):
         tags: A dictionary of key-value pairs to store arbitrary metadata.
         owner: The owner of the on demand feature view, typically the email of the primary
             maintainer.
+        cacheable: Whether the transformation is a deterministic, row-wise function of its inputs,
+            so that its results can be memoized across requests.
     """
 
     name: str
@@ -148,6 +158,7 @@ class OnDemandFeatureView(BaseFeatureView):
     udf: Optional[FunctionType]
     udf_string: Optional[str]
     aggregations: List[Aggregation]
+    cacheable: bool
 
     def __init__(  # noqa: C901
         self,
@@ -166,6 +177,7 @@ class OnDemandFeatureView(BaseFeatureView):
         write_to_online_store: bool = False,
         singleton: bool = False,
         aggregations: Optional[List[Aggregation]] = None,
+        cacheable: bool = False,
     ):
         """
         Creates an OnDemandFeatureView object.
@@ -192,6 +204,8 @@ class OnDemandFeatureView(BaseFeatureView):
             singleton (optional): A boolean that indicates whether the transformation is executed on a singleton
                 (only applicable when mode="python").
             aggregations (optional): List of aggregations to apply before transformation.
+            cacheable (optional): A boolean that indicates whether the transformation is a deterministic,
+                row-wise function of its inputs, so that its results can be memoized across requests.
         """
         super().__init__(
             name=name,
@@ -258,6 +272,7 @@ class OnDemandFeatureView(BaseFeatureView):
                 ODFVErrorMessages.singleton_mode_requires_python(self.mode)
             )
         self.aggregations = aggregations or []
+        self.cacheable = cacheable
 
     def _add_source_to_collections(self, odfv_source: OnDemandSourceType) -> None:
         """
@@ -320,6 +335,7 @@ class OnDemandFeatureView(BaseFeatureView):
             owner=self.owner,
             write_to_online_store=self.write_to_online_store,
             singleton=self.singleton,
+            cacheable=self.cacheable,
         )
         fv.entities = self.entities
         fv.features = self.features
@@ -348,6 +364,7 @@ class OnDemandFeatureView(BaseFeatureView):
             or sorted(self.entity_columns) != sorted(other.entity_columns)
             or self.singleton != other.singleton
             or self.aggregations != other.aggregations
+            or self.cacheable != other.cacheable
         ):
             return False
 
@@ -377,6 +394,9 @@ class OnDemandFeatureView(BaseFeatureView):
         # Validate singleton mode configuration
         self._validate_singleton_config()
 
+        # Validate cacheable configuration
+        self._validate_cacheable_config()
+
         # Validate sources configuration
         self._validate_sources_config()
 
@@ -388,6 +408,13 @@ class OnDemandFeatureView(BaseFeatureView):
         if self.write_to_online_store and not self.entities:
             raise ValueError(ODFVErrorMessages.online_store_requires_entities())
 
+    def _validate_cacheable_config(self) -> None:
+        """Validate cacheable configuration."""
+        if self.cacheable and self.aggregations:
+            raise ValueError(
+                ODFVErrorMessages.cacheable_requires_row_wise_transformation()
+            )
+
     def _validate_singleton_config(self) -> None:
         """Validate singleton mode configuration."""
         if self.singleton and self.mode != "python":
@@ -507,6 +534,7 @@ class OnDemandFeatureView(BaseFeatureView):
             write_to_online_store=self.write_to_online_store,
             singleton=self.singleton if self.singleton else False,
             aggregations=self.aggregations,
+            cacheable=self.cacheable,
         )
         return OnDemandFeatureViewProto(spec=spec, meta=meta)
 
@@ -552,6 +580,7 @@ class OnDemandFeatureView(BaseFeatureView):
             write_to_online_store=optional_fields["write_to_online_store"],
             singleton=optional_fields["singleton"],
             aggregations=optional_fields["aggregations"],
+            cacheable=optional_fields["cacheable"],
         )
 
         # Set additional attributes that aren't part of the constructor
@@ -665,6 +694,7 @@ class OnDemandFeatureView(BaseFeatureView):
                 vector_index=feature.vector_index,
                 vector_length=feature.vector_length,
                 vector_search_metric=feature.vector_search_metric,
+                vector_quantization=feature.vector_quantization or None,
             )
             for feature in proto.spec.features
         ]
@@ -704,12 +734,18 @@ class OnDemandFeatureView(BaseFeatureView):
                 for aggregation_proto in spec.aggregations
             ]
 
+        # Parse cacheable
+        cacheable = False
+        if hasattr(spec, "cacheable"):
+            cacheable = spec.cacheable
+
         return {
             "write_to_online_store": write_to_online_store,
             "entities": entities,
             "entity_columns": entity_columns,
             "singleton": singleton,
             "aggregations": aggregations,
+            "cacheable": cacheable,
         }
 
     @classmethod
@@ -820,6 +856,7 @@ class OnDemandFeatureView(BaseFeatureView):
         self,
         pa_table: pyarrow.Table,
         full_feature_names: bool = False,
+        compile_pandas_udf: bool = False,
     ) -> pyarrow.Table:
         if not isinstance(pa_table, pyarrow.Table):
             raise TypeError("transform_arrow only accepts pyarrow.Table")
@@ -828,9 +865,16 @@ class OnDemandFeatureView(BaseFeatureView):
         pa_table, columns_to_cleanup = self._preprocess_arrow_table(pa_table)
 
         # Apply the transformation
-        transformed_table = self.feature_transformation.transform_arrow(
-            pa_table, self.features
-        )
+        if compile_pandas_udf and isinstance(
+            self.feature_transformation, PandasTransformation
+        ):
+            transformed_table = self.feature_transformation.transform_arrow_compiled(
+                pa_table
+            )
+        else:
+            transformed_table = self.feature_transformation.transform_arrow(
+                pa_table, self.features
+            )
 
         # Clean up temporary columns and apply final renaming
         return self._postprocess_arrow_table(
@@ -1139,6 +1183,7 @@ def on_demand_feature_view(
     write_to_online_store: bool = False,
     singleton: bool = False,
     explode: bool = False,
+    cacheable: bool = False,
 ):
     """
     Creates an OnDemandFeatureView object with the given user function as udf.
@@ -1161,6 +1206,8 @@ def on_demand_feature_view(
         singleton (optional): A boolean that indicates whether the transformation is executed on a singleton
             (only applicable when mode="python").
         explode (optional): A boolean that indicates whether the transformation explodes the input data into multiple rows.
+        cacheable (optional): A boolean that indicates whether the transformation is a deterministic, row-wise
+            function of its inputs, so that its results can be memoized across requests.
     """
 
     def mainify(obj) -> None:
@@ -1184,6 +1231,7 @@ def on_demand_feature_view(
             write_to_online_store=write_to_online_store,
             entities=entities,
             singleton=singleton,
+            cacheable=cacheable,
             udf=user_function,
             udf_string=udf_string,
         )
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Dict, List, TypeAlias, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypeAlias, Union
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 
@@ -31,6 +32,9 @@ else:
 
 TIMESTAMP_POSTFIX: str = "__ts"
 
+# Little-endian dtypes of the packed repeated fields of list values
+_PACKED_LIST_DTYPES = {"float_list_val": "<f4", "double_list_val": "<f8"}
+
 
 class OnlineResponse:
     """
@@ -97,6 +101,51 @@ class OnlineResponse:
 
         return pa.Table.from_pydict(self.to_dict(include_event_timestamps))
 
+    def to_numpy(self, feature: str, dtype: Optional[Any] = None) -> np.ndarray:
+        """
+        Converts the values of a vector feature into a matrix with a row per entity, e.g. the (k x dim) matrix
+        of the embeddings returned by `retrieve_online_documents_v2`.
+
+        Float and double lists are copied from their packed protobuf encoding into a single buffer, without
+        converting each element into a Python object.
+
+        Args:
+            feature: The name of a feature whose values are lists of numbers of the same length.
+            dtype: The dtype of the matrix. Defaults to float32 for float lists and float64 for double lists.
+
+        Returns:
+            An array of shape (number of entities, vector length).
+        """
+        feature_names = list(self.proto.metadata.feature_names.val)
+        if feature not in feature_names:
+            raise ValueError(f"Feature {feature} is not in the online response")
+        values = self.proto.results[feature_names.index(feature)].values
+        if not values:
+            return np.empty((0, 0), dtype=dtype if dtype is not None else np.float32)
+
+        kinds = {value.WhichOneof("val") for value in values}
+        if len(kinds) != 1 or next(iter(kinds)) not in _PACKED_LIST_DTYPES:
+            matrix = np.array(
+                [feast_value_type_to_python_type(value) for value in values],
+                dtype=dtype if dtype is not None else np.float32,
+            )
+            return matrix.reshape(-1, 1) if matrix.ndim == 1 else matrix
+
+        kind = kinds.pop()
+        buffers = [
+            _packed_field_payload(getattr(value, kind).SerializeToString())
+            for value in values
+        ]
+        if len({len(buffer) for buffer in buffers}) != 1:
+            raise ValueError(f"The vectors of feature {feature} have different lengths")
+        item_dtype = np.dtype(_PACKED_LIST_DTYPES[kind])
+        matrix = np.frombuffer(b"".join(buffers), dtype=item_dtype).reshape(
+            len(values), len(buffers[0]) // item_dtype.itemsize
+        )
+        return matrix.astype(
+            dtype if dtype is not None else matrix.dtype.newbyteorder("=")
+        )
+
     def to_tensor(
         self,
         kind: str = "torch",
@@ -140,3 +189,19 @@ class OnlineResponse:
                     values  # Return as-is for strings or unsupported types
                 )
         return tensor_dict
+
+
+def _packed_field_payload(message_bytes: bytes) -> bytes:
+    """Returns the payload of the packed repeated field of a serialized single field message."""
+    if not message_bytes:
+        return b""
+    # Skip the tag of the field, then read the varint length of its payload.
+    offset, length, shift = 1, 0, 0
+    while True:
+        byte = message_bytes[offset]
+        offset += 1
+        length |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    return message_bytes[offset : offset + length]
@@ -0,0 +1,167 @@
+"""
+Encodings of online feature responses for the feature server.
+
+Clients choose the encoding with the `Accept` header of their request:
+
+- `application/json` (default): the protobuf JSON mapping of `GetOnlineFeaturesResponse`.
+- `application/vnd.feast.columnar+json`: the same column-oriented document, written directly from the typed
+  value columns with orjson (if installed) instead of going through `MessageToDict`. Bytes values are base64
+  encoded.
+- `application/x-protobuf`: the serialized `GetOnlineFeaturesResponse`, lossless and the cheapest to produce.
+- `application/vnd.apache.arrow.stream`: an Arrow IPC stream with one column per feature, null where a value
+  is missing.
+"""
+
+import base64
+import json
+import math
+from typing import Any, Dict, List, Optional
+
+import pyarrow as pa
+
+from feast.online_response import OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import FieldStatus
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.type_map import feast_value_type_to_python_type
+
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.feast.columnar+json"
+PROTOBUF_MEDIA_TYPE = "application/x-protobuf"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+SUPPORTED_MEDIA_TYPES = (
+    JSON_MEDIA_TYPE,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    PROTOBUF_MEDIA_TYPE,
+    ARROW_STREAM_MEDIA_TYPE,
+)
+
+_MEDIA_TYPE_ALIASES = {
+    "application/protobuf": PROTOBUF_MEDIA_TYPE,
+    "application/vnd.google.protobuf": PROTOBUF_MEDIA_TYPE,
+    "*/*": JSON_MEDIA_TYPE,
+    "application/*": JSON_MEDIA_TYPE,
+}
+
+_STATUS_NAMES = {number: name for name, number in FieldStatus.items()}
+
+try:
+    import orjson
+
+    def _dumps(document: Any) -> bytes:
+        return orjson.dumps(document)
+
+except ImportError:
+
+    def _dumps(document: Any) -> bytes:
+        try:
+            return json.dumps(document, separators=(",", ":"), allow_nan=False).encode()
+        except ValueError:
+            # NaN and infinities aren't valid JSON, orjson writes them as null.
+            return json.dumps(
+                _replace_non_finite(document), separators=(",", ":"), allow_nan=False
+            ).encode()
+
+    def _replace_non_finite(document: Any) -> Any:
+        if isinstance(document, float):
+            return document if math.isfinite(document) else None
+        if isinstance(document, dict):
+            return {k: _replace_non_finite(v) for k, v in document.items()}
+        if isinstance(document, list):
+            return [_replace_non_finite(v) for v in document]
+        return document
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Picks the response encoding from the `Accept` header of a request.
+
+    Media ranges are tried by decreasing quality; JSON is returned if none of them is supported.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    candidates = []
+    for position, media_range in enumerate(accept.split(",")):
+        media_type, *params = [p.strip() for p in media_range.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(candidates):
+        media_type = _MEDIA_TYPE_ALIASES.get(media_type, media_type)
+        if media_type in SUPPORTED_MEDIA_TYPES:
+            return media_type
+    return JSON_MEDIA_TYPE
+
+
+def encode_online_response(response: OnlineResponse, media_type: str) -> bytes:
+    """Encodes an online response with one of the binary or columnar encodings."""
+    if media_type == PROTOBUF_MEDIA_TYPE:
+        return response.proto.SerializeToString()
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return _encode_arrow_stream(response)
+    if media_type == COLUMNAR_JSON_MEDIA_TYPE:
+        return _encode_columnar_json(response)
+    raise ValueError(f"Unsupported media type {media_type}")
+
+
+def _encode_arrow_stream(response: OnlineResponse) -> bytes:
+    table = response.to_arrow()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _encode_columnar_json(response: OnlineResponse) -> bytes:
+    # Mirrors the protobuf JSON mapping used by the default encoding, including the omission of empty fields.
+    timestamps: Dict[Any, str] = {}
+    results = []
+    for feature_vector in response.proto.results:
+        result: Dict[str, List[Any]] = {}
+        if feature_vector.values:
+            result["values"] = [_json_value(v) for v in feature_vector.values]
+        if feature_vector.statuses:
+            result["statuses"] = [_STATUS_NAMES[s] for s in feature_vector.statuses]
+        if feature_vector.event_timestamps:
+            event_timestamps = []
+            for ts in feature_vector.event_timestamps:
+                key = (ts.seconds, ts.nanos)
+                if key not in timestamps:
+                    timestamps[key] = ts.ToJsonString()
+                event_timestamps.append(timestamps[key])
+            result["event_timestamps"] = event_timestamps
+        results.append(result)
+
+    document: Dict[str, Any] = {
+        "metadata": {"feature_names": list(response.proto.metadata.feature_names.val)}
+    }
+    if results:
+        document["results"] = results
+    return _dumps(document)
+
+
+def _bytes_to_json(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def _json_value(value: ValueProto) -> Any:
+    which = value.WhichOneof("val")
+    if which is None or which == "null_val":
+        return None
+    if which == "bytes_val":
+        return _bytes_to_json(value.bytes_val)
+    if which == "bytes_list_val":
+        return [_bytes_to_json(item) for item in value.bytes_list_val.val]
+    if which in ("map_val", "map_list_val"):
+        return feast_value_type_to_python_type(value)
+    if "_list_" in which:
+        return list(getattr(value, which).val)
+    return getattr(value, which)
@@ -7,6 +7,10 @@ from starlette.authentication import (
     AuthenticationError,
 )
 
+from feast.permissions.auth.token_cache import (
+    ValidatedTokenCache,
+    unverified_expiration,
+)
 from feast.permissions.auth.token_parser import TokenParser
 from feast.permissions.user import User
 
@@ -24,23 +28,40 @@ class KubernetesTokenParser(TokenParser):
     The client `ServiceAccount` is instead used as the user name, together with the current namespace.
     """
 
-    def __init__(self):
+    def __init__(
+        self, token_cache_max_entries: int = 1024, token_cache_ttl_seconds: int = 300
+    ):
         config.load_incluster_config()
         self.v1 = client.CoreV1Api()
         self.rbac_v1 = client.RbacAuthorizationV1Api()
         self.auth_v1 = client.AuthenticationV1Api()
+        self._token_cache = ValidatedTokenCache(
+            max_entries=token_cache_max_entries, ttl_seconds=token_cache_ttl_seconds
+        )
 
     async def user_details_from_access_token(self, access_token: str) -> User:
         """
         Extract user details from the token using Token Access Review.
         Handles both service account tokens (JWTs) and user tokens (opaque tokens).
 
+        Users are cached by token until the token expires, or for `token_cache_ttl_seconds` at most, so
+        repeated requests with the same token skip the Kubernetes API calls.
+
         Returns:
             User: Current user, with associated roles, groups, and namespaces.
 
         Raises:
             AuthenticationError if any error happens.
         """
+        user = self._token_cache.get(access_token)
+        if user:
+            return user
+
+        user = self._user_details_from_access_token(access_token)
+        self._token_cache.put(access_token, user, unverified_expiration(access_token))
+        return user
+
+    def _user_details_from_access_token(self, access_token: str) -> User:
         # First, try to extract user information using Token Access Review
         groups, namespaces = self._extract_groups_and_namespaces_from_token(
             access_token
@@ -166,15 +187,15 @@ class KubernetesTokenParser(TokenParser):
             # Get all ClusterRoleBindings
             cluster_role_bindings = self.rbac_v1.list_cluster_role_binding()
 
-            for binding in cluster_role_bindings.items:
-                if binding.subjects is not None:
-                    for subject in binding.subjects:
+            for cluster_binding in cluster_role_bindings.items:
+                if cluster_binding.subjects is not None:
+                    for subject in cluster_binding.subjects:
                         # Check for direct user assignment
                         if subject.kind == "User" and subject.name == username:
-                            roles.add(binding.role_ref.name)
+                            roles.add(cluster_binding.role_ref.name)
                         # Check for group-based assignment
                         elif subject.kind == "Group" and subject.name in groups:
-                            roles.add(binding.role_ref.name)
+                            roles.add(cluster_binding.role_ref.name)
 
             logger.info(f"Found {len(roles)} roles for user {username}: {list(roles)}")
 
@@ -205,18 +226,19 @@ class KubernetesTokenParser(TokenParser):
 
             # Call Token Access Review API
             response = self.auth_v1.create_token_review(token_review)
+            status = response.status
 
-            if response.status.authenticated:
+            if status is not None and status.authenticated:
                 # Extract groups and namespaces from the response
                 # Groups are in response.status.user.groups, not response.status.groups
-                if response.status.user and hasattr(response.status.user, "groups"):
-                    groups = response.status.user.groups or []
+                if status.user and hasattr(status.user, "groups"):
+                    groups = status.user.groups or []
                 else:
                     groups = []
 
                 # Extract namespaces from the user info
-                if response.status.user:
-                    username = getattr(response.status.user, "username", "") or ""
+                if status.user:
+                    username = getattr(status.user, "username", "") or ""
 
                     if ":" in username and username.startswith(
                         "system:serviceaccount:"
@@ -256,7 +278,9 @@ class KubernetesTokenParser(TokenParser):
                     f"Token Access Review successful. Groups: {groups}, Namespaces: {namespaces}"
                 )
             else:
-                logger.warning(f"Token Access Review failed: {response.status.error}")
+                logger.warning(
+                    f"Token Access Review failed: {getattr(status, 'error', None)}"
+                )
 
         except Exception as e:
             logger.error(f"Failed to perform Token Access Review: {e}")
@@ -288,7 +312,7 @@ class KubernetesTokenParser(TokenParser):
                     if subject.kind == "Group":
                         groups.append(subject.name)
                         logger.debug(
-                            f"Found group {subject.name} in RoleBinding {rb.metadata.name}"
+                            f"Found group {subject.name} in RoleBinding {getattr(rb.metadata, 'name', None)}"
                         )
 
             # Get ClusterRoleBindings that might grant access to this namespace
@@ -300,7 +324,7 @@ class KubernetesTokenParser(TokenParser):
                         if subject.kind == "Group":
                             groups.append(subject.name)
                             logger.debug(
-                                f"Found group {subject.name} in ClusterRoleBinding {crb.metadata.name}"
+                                f"Found group {subject.name} in ClusterRoleBinding {getattr(crb.metadata, 'name', None)}"
                             )
 
             # Remove duplicates and sort
@@ -329,16 +353,19 @@ class KubernetesTokenParser(TokenParser):
         Returns:
             list[str]: List of namespace names where the user has dashboard or admin permissions
         """
-        user_namespaces = []
+        user_namespaces: list[str] = []
         try:
             # Query all RoleBindings where the user is a subject
             # This is much more efficient than scanning all namespaces
             all_role_bindings = self.rbac_v1.list_role_binding_for_all_namespaces()
 
             for rb in all_role_bindings.items:
+                if rb.metadata is None or rb.metadata.namespace is None:
+                    continue
+
                 # Check if this is a dashboard-permissions RoleBinding
                 is_dashboard_permissions = (
-                    rb.metadata.name.startswith("dashboard-permissions-")
+                    (rb.metadata.name or "").startswith("dashboard-permissions-")
                     and rb.metadata.labels
                     and rb.metadata.labels.get("opendatahub.io/dashboard") == "true"
                 )
@@ -396,13 +423,16 @@ class KubernetesTokenParser(TokenParser):
             )
 
             response = self.auth_v1.create_token_review(token_review)
+            status = response.status
 
-            if response.status.authenticated and response.status.user:
-                username = getattr(response.status.user, "username", "") or ""
+            if status is not None and status.authenticated and status.user:
+                username = getattr(status.user, "username", "") or ""
                 logger.debug(f"Extracted username from Token Access Review: {username}")
                 return username
             else:
-                logger.warning(f"Token Access Review failed: {response.status.error}")
+                logger.warning(
+                    f"Token Access Review failed: {getattr(status, 'error', None)}"
+                )
                 return ""
 
         except Exception as e:
@@ -11,6 +11,7 @@ from starlette.authentication import (
     AuthenticationError,
 )
 
+from feast.permissions.auth.token_cache import ValidatedTokenCache, get_jwks_client
 from feast.permissions.auth.token_parser import TokenParser
 from feast.permissions.auth_model import OidcAuthConfig
 from feast.permissions.oidc_service import OIDCDiscoveryService
@@ -32,6 +33,10 @@ class OidcTokenParser(TokenParser):
         self.oidc_discovery_service = OIDCDiscoveryService(
             self._auth_config.auth_discovery_url
         )
+        self._token_cache = ValidatedTokenCache(
+            max_entries=auth_config.token_cache_max_entries,
+            ttl_seconds=auth_config.token_cache_ttl_seconds,
+        )
 
     async def _validate_token(self, access_token: str):
         """
@@ -66,6 +71,10 @@ class OidcTokenParser(TokenParser):
         if user:
             return user
 
+        user = self._token_cache.get(access_token)
+        if user:
+            return user
+
         try:
             await self._validate_token(access_token)
             logger.debug("Token successfully validated.")
@@ -73,9 +82,8 @@ class OidcTokenParser(TokenParser):
             logger.error(f"Token validation failed: {e}")
             raise AuthenticationError(f"Invalid token: {e}")
 
-        optional_custom_headers = {"User-agent": "custom-user-agent"}
-        jwks_client = PyJWKClient(
-            self.oidc_discovery_service.get_jwks_url(), headers=optional_custom_headers
+        jwks_client: PyJWKClient = get_jwks_client(
+            self.oidc_discovery_service.get_jwks_url()
         )
 
         try:
@@ -111,7 +119,9 @@ class OidcTokenParser(TokenParser):
                 roles = data["resource_access"][client_id]["roles"]
 
             logger.info(f"Extracted user {current_user} and roles {roles}")
-            return User(username=current_user, roles=roles)
+            user = User(username=current_user, roles=roles)
+            self._token_cache.put(access_token, user, data.get("exp"))
+            return user
         except jwt.exceptions.InvalidTokenError:
             logger.exception("Exception while parsing the token:")
             raise AuthenticationError("Invalid token.")
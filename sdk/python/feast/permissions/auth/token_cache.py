@@ -0,0 +1,110 @@
+"""
+Caches used by the token parsers on the serving path.
+
+- JWKS clients are shared by the whole process, one per JWKS URL, so that the key set is fetched once per
+  lifespan instead of once per request. An unknown `kid` triggers a refresh of the key set, which handles key
+  rotation.
+- Users extracted from validated tokens are cached by token hash until the token expires, or for a bounded
+  time for tokens without expiration, so repeated requests with the same bearer token skip the validation.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import jwt
+from jwt import PyJWKClient
+
+from feast.permissions.user import User
+
+JWKS_CACHE_LIFESPAN_SECONDS = 300
+
+_jwks_clients: Dict[str, PyJWKClient] = {}
+_jwks_clients_lock = threading.Lock()
+
+
+def get_jwks_client(jwks_url: str) -> PyJWKClient:
+    """Returns the process-wide JWKS client of the given URL."""
+    with _jwks_clients_lock:
+        jwks_client = _jwks_clients.get(jwks_url)
+        if jwks_client is None:
+            jwks_client = PyJWKClient(
+                jwks_url,
+                cache_jwk_set=True,
+                lifespan=JWKS_CACHE_LIFESPAN_SECONDS,
+                headers={"User-agent": "custom-user-agent"},
+            )
+            _jwks_clients[jwks_url] = jwks_client
+        return jwks_client
+
+
+def unverified_expiration(access_token: str) -> Optional[float]:
+    """Returns the `exp` claim of a JWT without verifying it, or None for opaque tokens."""
+    try:
+        exp = jwt.decode(access_token, options={"verify_signature": False}).get("exp")
+    except jwt.PyJWTError:
+        return None
+    return float(exp) if exp is not None else None
+
+
+class ValidatedTokenCache:
+    """
+    A bounded, thread-safe LRU cache of the users extracted from validated tokens.
+
+    Tokens are keyed by their SHA-256 hash, so the cache never holds the tokens themselves. An entry expires
+    at the `exp` claim of its token, and at most `ttl_seconds` after it was added.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(access_token: str) -> str:
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
+    def get(self, access_token: str) -> Optional[User]:
+        if self.max_entries <= 0:
+            return None
+        key = self._key(access_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def put(
+        self, access_token: str, user: User, expiration: Optional[float] = None
+    ) -> None:
+        """
+        Adds the user of a validated token.
+
+        Args:
+            access_token: The validated token.
+            user: The user extracted from the token.
+            expiration: The `exp` claim of the token, as seconds since the epoch, if any.
+        """
+        if self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if expiration is not None:
+            expires_at = min(expires_at, expiration)
+        key = self._key(access_token)
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -19,6 +19,10 @@ from feast.repo_config import FeastConfigBaseModel
 class AuthConfig(FeastConfigBaseModel):
     type: Literal["oidc", "kubernetes", "no_auth"] = "no_auth"
 
+    # Server side cache of the users extracted from validated tokens. 0 disables it.
+    token_cache_max_entries: int = 1024
+    token_cache_ttl_seconds: int = 300
+
 
 class OidcAuthConfig(AuthConfig):
     auth_discovery_url: str
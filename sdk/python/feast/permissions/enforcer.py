@@ -1,8 +1,10 @@
 import logging
+from typing import Any, Hashable, Optional
 
 from feast.errors import FeastPermissionError
 from feast.feast_object import FeastObject
 from feast.permissions.decision import DecisionEvaluator
+from feast.permissions.matcher import _get_type
 from feast.permissions.permission import (
     AuthzedAction,
     Permission,
@@ -11,6 +13,61 @@ from feast.permissions.user import User
 
 logger = logging.getLogger(__name__)
 
+"""
+The decision of a permission check: whether the resource is permitted, and the error to raise if the
+execution is denied. A resource that is neither permitted nor denied is filtered out.
+"""
+Decision = tuple[bool, Optional[str]]
+_PERMITTED: Decision = (True, None)
+_FILTERED: Decision = (False, None)
+
+
+class PermissionDecisionCache:
+    """
+    A bounded cache of the decisions taken by `enforce_policy` for a given list of permissions.
+
+    Decisions only depend on the roles, groups and namespaces of the user, the type, name and tags of the
+    resource and the requested actions, so they can be reused until the permissions change. The cache is
+    cleared when it is full.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._decisions: dict[Hashable, Decision] = {}
+
+    def get(self, key: Hashable) -> Optional[Decision]:
+        return self._decisions.get(key)
+
+    def put(self, key: Hashable, decision: Decision) -> None:
+        if len(self._decisions) >= self.max_entries:
+            self._decisions.clear()
+        self._decisions[key] = decision
+
+    def clear(self) -> None:
+        self._decisions.clear()
+
+    def __len__(self) -> int:
+        return len(self._decisions)
+
+
+def _decision_key(
+    user: User,
+    resource: FeastObject,
+    actions: list[AuthzedAction],
+    filter_only: bool,
+) -> Hashable:
+    required_tags: Any = getattr(resource, "required_tags", None)
+    return (
+        frozenset(user.roles or ()),
+        frozenset(user.groups or ()),
+        frozenset(user.namespaces or ()),
+        _get_type(resource),
+        resource.name,
+        frozenset(required_tags.items()) if isinstance(required_tags, dict) else None,
+        frozenset(actions),
+        filter_only,
+    )
+
 
 def enforce_policy(
     permissions: list[Permission],
@@ -18,6 +75,7 @@ def enforce_policy(
     resources: list[FeastObject],
     actions: list[AuthzedAction],
     filter_only: bool = False,
+    decisions: Optional[PermissionDecisionCache] = None,
 ) -> list[FeastObject]:
     """
     Define the logic to apply the configured permissions when a given action is requested on
@@ -32,6 +90,7 @@ def enforce_policy(
         actions: The requested actions to be authorized.
         filter_only: If `True`, it removes unauthorized resources from the returned value, otherwise it raises a `FeastPermissionError` the
         first unauthorized resource. Defaults to `False`.
+        decisions: An optional cache of the decisions taken for the given `permissions`. It must be cleared whenever the permissions change.
 
     Returns:
         list[FeastObject]: A filtered list of the permitted resources.
@@ -49,64 +108,83 @@ def enforce_policy(
 
     _permitted_resources: list[FeastObject] = []
     for resource in resources:
-        logger.debug(
-            f"Enforcing permission policies for {type(resource).__name__}:{resource.name} to execute {actions}"
-        )
-        matching_permissions = [
-            p
-            for p in permissions
-            if p.match_resource(resource) and p.match_actions(actions)
-        ]
-
-        if matching_permissions:
-            evaluator = DecisionEvaluator(len(matching_permissions))
-            for p in matching_permissions:
-                permission_grant, permission_explanation = p.policy.validate_user(
-                    user=user
-                )
-                evaluator.add_grant(
-                    permission_grant,
-                    f"Permission {p.name} denied execution of {[a.value.upper() for a in actions]} to {type(resource).__name__}:{resource.name}: {permission_explanation}",
-                )
+        key = None
+        decision = None
+        if decisions is not None:
+            key = _decision_key(user, resource, actions, filter_only)
+            decision = decisions.get(key)
+        if decision is None:
+            decision = _decide(permissions, user, resource, actions, filter_only)
+            if decisions is not None:
+                decisions.put(key, decision)
 
-                if evaluator.is_decided():
-                    grant, explanations = evaluator.grant()
-                    if not grant:
-                        if filter_only and p.name_patterns:
-                            continue
-                        logger.error(f"Permission denied: {','.join(explanations)}")
-                        raise FeastPermissionError(",".join(explanations))
-                    logger.debug(
-                        f"Permission granted for {type(resource).__name__}:{resource.name}"
-                    )
-                    _permitted_resources.append(resource)
-                    break
-        else:
-            if not filter_only:
-                message = f"No permissions defined to manage {actions} on {type(resource)}/{resource.name}."
-                logger.exception(f"**PERMISSION NOT GRANTED**: {message}")
-                raise FeastPermissionError(message)
-            else:
-                # filter_only=True: Check if there are permissions for this resource type
-                resource_type_permissions = [
-                    p
-                    for p in permissions
-                    if any(isinstance(resource, t) for t in p.types)  # type: ignore
-                ]
-                if not resource_type_permissions:
-                    # No permissions exist for this resource type - should raise error
-                    message = f"No permissions defined to manage {actions} on {type(resource)}/{resource.name}."
-                    logger.exception(f"**PERMISSION NOT GRANTED**: {message}")
-                    raise FeastPermissionError(message)
-                elif not any(p.name_patterns for p in resource_type_permissions):
-                    # Permissions exist for this resource type but no name_patterns - should raise error
-                    message = f"No permissions defined to manage {actions} on {type(resource)}/{resource.name}."
-                    logger.exception(f"**PERMISSION NOT GRANTED**: {message}")
-                    raise FeastPermissionError(message)
-                else:
-                    # Permissions exist for this resource type with name_patterns - filter out this resource
-                    logger.debug(
-                        f"Filtering out {type(resource).__name__}:{resource.name} - no matching permissions"
-                    )
-                    continue
+        permitted, error = decision
+        if error is not None:
+            raise FeastPermissionError(error)
+        if permitted:
+            _permitted_resources.append(resource)
     return _permitted_resources
+
+
+def _decide(
+    permissions: list[Permission],
+    user: User,
+    resource: FeastObject,
+    actions: list[AuthzedAction],
+    filter_only: bool,
+) -> Decision:
+    logger.debug(
+        f"Enforcing permission policies for {type(resource).__name__}:{resource.name} to execute {actions}"
+    )
+    matching_permissions = [
+        p
+        for p in permissions
+        if p.match_resource(resource) and p.match_actions(actions)
+    ]
+
+    if matching_permissions:
+        evaluator = DecisionEvaluator(len(matching_permissions))
+        for p in matching_permissions:
+            permission_grant, permission_explanation = p.policy.validate_user(user=user)
+            evaluator.add_grant(
+                permission_grant,
+                f"Permission {p.name} denied execution of {[a.value.upper() for a in actions]} to {type(resource).__name__}:{resource.name}: {permission_explanation}",
+            )
+
+            if evaluator.is_decided():
+                grant, explanations = evaluator.grant()
+                if not grant:
+                    if filter_only and p.name_patterns:
+                        continue
+                    logger.error(f"Permission denied: {','.join(explanations)}")
+                    return False, ",".join(explanations)
+                logger.debug(
+                    f"Permission granted for {type(resource).__name__}:{resource.name}"
+                )
+                return _PERMITTED
+        return _FILTERED
+
+    message = f"No permissions defined to manage {actions} on {type(resource)}/{resource.name}."
+    if not filter_only:
+        logger.exception(f"**PERMISSION NOT GRANTED**: {message}")
+        return False, message
+
+    # filter_only=True: Check if there are permissions for this resource type
+    resource_type_permissions = [
+        p
+        for p in permissions
+        if any(isinstance(resource, t) for t in p.types)  # type: ignore
+    ]
+    if not resource_type_permissions:
+        # No permissions exist for this resource type - should raise error
+        logger.exception(f"**PERMISSION NOT GRANTED**: {message}")
+        return False, message
+    elif not any(p.name_patterns for p in resource_type_permissions):
+        # Permissions exist for this resource type but no name_patterns - should raise error
+        logger.exception(f"**PERMISSION NOT GRANTED**: {message}")
+        return False, message
+    # Permissions exist for this resource type with name_patterns - filter out this resource
+    logger.debug(
+        f"Filtering out {type(resource).__name__}:{resource.name} - no matching permissions"
+    )
+    return _FILTERED
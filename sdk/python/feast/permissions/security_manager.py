@@ -1,13 +1,15 @@
 import logging
 import os
+import threading
 from contextvars import ContextVar
 from typing import Callable, List, Optional, Union
 
 from feast.errors import FeastObjectNotFoundException
 from feast.feast_object import FeastObject
 from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.proto_registry_utils import cached_registry_proto_key
 from feast.permissions.action import AuthzedAction
-from feast.permissions.enforcer import enforce_policy
+from feast.permissions.enforcer import PermissionDecisionCache, enforce_policy
 from feast.permissions.permission import Permission
 from feast.permissions.user import User
 from feast.project import Project
@@ -31,6 +33,10 @@ class SecurityManager:
         self._current_user: ContextVar[Optional[User]] = ContextVar(
             "current_user", default=None
         )
+        self._decisions_lock = threading.Lock()
+        self._registry_snapshot: Optional[tuple] = None
+        self._snapshot_permissions: list[Permission] = []
+        self._decisions = PermissionDecisionCache()
 
     def set_current_user(self, current_user: User):
         """
@@ -55,6 +61,38 @@ class SecurityManager:
         """
         return self._registry.list_permissions(project=self._project)
 
+    def _permissions_and_decisions(
+        self,
+    ) -> tuple[list[Permission], PermissionDecisionCache]:
+        """
+        Returns the permissions and the cache of the decisions taken for them.
+
+        Registries that cache their content are checked for a refresh or a commit of their cache: the permissions
+        are loaded once per cached registry proto and the decisions are dropped when it changes. Otherwise the
+        permissions are loaded on every call and the decisions are kept as long as the registry returns the same
+        `Permission` instances.
+        """
+        snapshot = cached_registry_proto_key(self._registry)
+        with self._decisions_lock:
+            if snapshot is not None and snapshot == self._registry_snapshot:
+                return self._snapshot_permissions, self._decisions
+
+        if snapshot is not None:
+            permissions = self._registry.list_permissions(
+                project=self._project, allow_cache=True
+            )
+        else:
+            permissions = self.permissions
+
+        with self._decisions_lock:
+            if snapshot is not None or not _same_instances(
+                permissions, self._snapshot_permissions
+            ):
+                self._registry_snapshot = snapshot
+                self._snapshot_permissions = permissions
+                self._decisions = PermissionDecisionCache()
+            return permissions, self._decisions
+
     def assert_permissions(
         self,
         resources: list[FeastObject],
@@ -78,15 +116,21 @@ class SecurityManager:
         Raises:
             FeastPermissionError: If the current user is not authorized to execute all the requested actions on the given resources.
         """
+        permissions, decisions = self._permissions_and_decisions()
         return enforce_policy(
-            permissions=self.permissions,
+            permissions=permissions,
             user=self.current_user if self.current_user is not None else User("", []),
             resources=resources,
             actions=actions if isinstance(actions, list) else [actions],
             filter_only=filter_only,
+            decisions=decisions,
         )
 
 
+def _same_instances(left: list[Permission], right: list[Permission]) -> bool:
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+
 def assert_permissions_to_update(
     resource: FeastObject,
     getter: Union[
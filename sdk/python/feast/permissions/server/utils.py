@@ -118,7 +118,10 @@ def init_auth_manager(
                 KubernetesTokenParser,
             )
 
-            token_parser = KubernetesTokenParser()
+            token_parser = KubernetesTokenParser(
+                token_cache_max_entries=auth_config.token_cache_max_entries,
+                token_cache_ttl_seconds=auth_config.token_cache_ttl_seconds,
+            )
         elif auth_type == AuthManagerType.OIDC:
             assert isinstance(auth_config, OidcAuthConfig)
             token_parser = OidcTokenParser(auth_config=auth_config)
@@ -56,6 +56,7 @@ class FeatureSpecV2(google.protobuf.message.Message):
     VECTOR_INDEX_FIELD_NUMBER: builtins.int
     VECTOR_SEARCH_METRIC_FIELD_NUMBER: builtins.int
     VECTOR_LENGTH_FIELD_NUMBER: builtins.int
+    VECTOR_QUANTIZATION_FIELD_NUMBER: builtins.int
     name: builtins.str
     """Name of the feature. Not updatable."""
     value_type: feast.types.Value_pb2.ValueType.Enum.ValueType
@@ -71,6 +72,8 @@ class FeatureSpecV2(google.protobuf.message.Message):
     """Metric used for vector similarity search."""
     vector_length: builtins.int
     """Field indicating the vector length"""
+    vector_quantization: builtins.str
+    """Quantization of the vector index: "int8", "float16" or "binary". Empty for full-precision vectors."""
     def __init__(
         self,
         *,
@@ -81,7 +84,8 @@ class FeatureSpecV2(google.protobuf.message.Message):
         vector_index: builtins.bool = ...,
         vector_search_metric: builtins.str = ...,
         vector_length: builtins.int = ...,
+        vector_quantization: builtins.str = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal["description", b"description", "name", b"name", "tags", b"tags", "value_type", b"value_type", "vector_index", b"vector_index", "vector_length", b"vector_length", "vector_search_metric", b"vector_search_metric"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["description", b"description", "name", b"name", "tags", b"tags", "value_type", b"value_type", "vector_index", b"vector_index", "vector_length", b"vector_length", "vector_quantization", b"vector_quantization", "vector_search_metric", b"vector_search_metric"]) -> None: ...
 
 global___FeatureSpecV2 = FeatureSpecV2
@@ -110,6 +110,7 @@ class OnDemandFeatureViewSpec(google.protobuf.message.Message):
     ENTITY_COLUMNS_FIELD_NUMBER: builtins.int
     SINGLETON_FIELD_NUMBER: builtins.int
     AGGREGATIONS_FIELD_NUMBER: builtins.int
+    CACHEABLE_FIELD_NUMBER: builtins.int
     name: builtins.str
     """Name of the feature view. Must be unique. Not updated."""
     project: builtins.str
@@ -144,6 +145,8 @@ class OnDemandFeatureViewSpec(google.protobuf.message.Message):
     @property
     def aggregations(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.Aggregation_pb2.Aggregation]:
         """Aggregation definitions"""
+    cacheable: builtins.bool
+    """Whether the transformation is a deterministic function of its inputs, so that its results can be cached."""
     def __init__(
         self,
         *,
@@ -162,9 +165,10 @@ class OnDemandFeatureViewSpec(google.protobuf.message.Message):
         entity_columns: collections.abc.Iterable[feast.core.Feature_pb2.FeatureSpecV2] | None = ...,
         singleton: builtins.bool = ...,
         aggregations: collections.abc.Iterable[feast.core.Aggregation_pb2.Aggregation] | None = ...,
+        cacheable: builtins.bool = ...,
     ) -> None: ...
     def HasField(self, field_name: typing_extensions.Literal["feature_transformation", b"feature_transformation", "user_defined_function", b"user_defined_function"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["aggregations", b"aggregations", "description", b"description", "entities", b"entities", "entity_columns", b"entity_columns", "feature_transformation", b"feature_transformation", "features", b"features", "mode", b"mode", "name", b"name", "owner", b"owner", "project", b"project", "singleton", b"singleton", "sources", b"sources", "tags", b"tags", "user_defined_function", b"user_defined_function", "write_to_online_store", b"write_to_online_store"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["aggregations", b"aggregations", "cacheable", b"cacheable", "description", b"description", "entities", b"entities", "entity_columns", b"entity_columns", "feature_transformation", b"feature_transformation", "features", b"features", "mode", b"mode", "name", b"name", "owner", b"owner", "project", b"project", "singleton", b"singleton", "sources", b"sources", "tags", b"tags", "user_defined_function", b"user_defined_function", "write_to_online_store", b"write_to_online_store"]) -> None: ...
 
 global___OnDemandFeatureViewSpec = OnDemandFeatureViewSpec
 
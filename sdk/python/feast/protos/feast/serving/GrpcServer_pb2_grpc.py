@@ -30,6 +30,11 @@ class GrpcFeatureServerStub(object):
                 request_serializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesRequest.SerializeToString,
                 response_deserializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesResponse.FromString,
                 )
+        self.GetOnlineFeaturesStream = channel.stream_stream(
+                '/GrpcFeatureServer/GetOnlineFeaturesStream',
+                request_serializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesRequest.SerializeToString,
+                response_deserializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesResponse.FromString,
+                )
 
 
 class GrpcFeatureServerServicer(object):
@@ -53,6 +58,13 @@ class GrpcFeatureServerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetOnlineFeaturesStream(self, request_iterator, context):
+        """Pipelines many GetOnlineFeatures requests over one stream. Responses are returned in the order of the requests.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_GrpcFeatureServerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -71,6 +83,11 @@ def add_GrpcFeatureServerServicer_to_server(servicer, server):
                     request_deserializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesRequest.FromString,
                     response_serializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesResponse.SerializeToString,
             ),
+            'GetOnlineFeaturesStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.GetOnlineFeaturesStream,
+                    request_deserializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesRequest.FromString,
+                    response_serializer=feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'GrpcFeatureServer', rpc_method_handlers)
@@ -131,3 +148,20 @@ class GrpcFeatureServer(object):
             feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetOnlineFeaturesStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/GrpcFeatureServer/GetOnlineFeaturesStream',
+            feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesRequest.SerializeToString,
+            feast_dot_serving_dot_ServingService__pb2.GetOnlineFeaturesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
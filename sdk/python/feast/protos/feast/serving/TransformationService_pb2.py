@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)feast/serving/TransformationService.proto\x12\rfeast.serving\"+\n\tValueType\x12\x15\n\x0b\x61rrow_value\x18\x01 \x01(\x0cH\x00\x42\x07\n\x05value\"%\n#GetTransformationServiceInfoRequest\"\x9c\x01\n$GetTransformationServiceInfoResponse\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x36\n\x04type\x18\x02 \x01(\x0e\x32(.feast.serving.TransformationServiceType\x12+\n#transformation_service_type_details\x18\x03 \x01(\t\"\x88\x01\n\x18TransformFeaturesRequest\x12#\n\x1bon_demand_feature_view_name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x36\n\x14transformation_input\x18\x03 \x01(\x0b\x32\x18.feast.serving.ValueType\"T\n\x19TransformFeaturesResponse\x12\x37\n\x15transformation_output\x18\x03 \x01(\x0b\x32\x18.feast.serving.ValueType*\x94\x01\n\x19TransformationServiceType\x12\'\n#TRANSFORMATION_SERVICE_TYPE_INVALID\x10\x00\x12&\n\"TRANSFORMATION_SERVICE_TYPE_PYTHON\x10\x01\x12&\n\"TRANSFORMATION_SERVICE_TYPE_CUSTOM\x10\x64\x32\x89\x02\n\x15TransformationService\x12\x87\x01\n\x1cGetTransformationServiceInfo\x12\x32.feast.serving.GetTransformationServiceInfoRequest\x1a\x33.feast.serving.GetTransformationServiceInfoResponse\x12\x66\n\x11TransformFeatures\x12\'.feast.serving.TransformFeaturesRequest\x1a(.feast.serving.TransformFeaturesResponseBh\n\x13\x66\x65\x61st.proto.servingB\x1dTransformationServiceAPIProtoZ2github.com/feast-dev/feast/go/protos/feast/servingb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)feast/serving/TransformationService.proto\x12\rfeast.serving\"+\n\tValueType\x12\x15\n\x0b\x61rrow_value\x18\x01 \x01(\x0cH\x00\x42\x07\n\x05value\"%\n#GetTransformationServiceInfoRequest\"\x9c\x01\n$GetTransformationServiceInfoResponse\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x36\n\x04type\x18\x02 \x01(\x0e\x32(.feast.serving.TransformationServiceType\x12+\n#transformation_service_type_details\x18\x03 \x01(\t\"\x88\x01\n\x18TransformFeaturesRequest\x12#\n\x1bon_demand_feature_view_name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x36\n\x14transformation_input\x18\x03 \x01(\x0b\x32\x18.feast.serving.ValueType\"T\n\x19TransformFeaturesResponse\x12\x37\n\x15transformation_output\x18\x03 \x01(\x0b\x32\x18.feast.serving.ValueType\"\x8e\x01\n\x1dTransformFeaturesBatchRequest\x12$\n\x1con_demand_feature_view_names\x18\x01 \x03(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x36\n\x14transformation_input\x18\x03 \x01(\x0b\x32\x18.feast.serving.ValueType\"Z\n\x1eTransformFeaturesBatchResponse\x12\x38\n\x16transformation_outputs\x18\x01 \x03(\x0b\x32\x18.feast.serving.ValueType*\x94\x01\n\x19TransformationServiceType\x12\'\n#TRANSFORMATION_SERVICE_TYPE_INVALID\x10\x00\x12&\n\"TRANSFORMATION_SERVICE_TYPE_PYTHON\x10\x01\x12&\n\"TRANSFORMATION_SERVICE_TYPE_CUSTOM\x10\x64\x32\xfc\x03\n\x15TransformationService\x12\x87\x01\n\x1cGetTransformationServiceInfo\x12\x32.feast.serving.GetTransformationServiceInfoRequest\x1a\x33.feast.serving.GetTransformationServiceInfoResponse\x12\x66\n\x11TransformFeatures\x12\'.feast.serving.TransformFeaturesRequest\x1a(.feast.serving.TransformFeaturesResponse\x12u\n\x16TransformFeaturesBatch\x12,.feast.serving.TransformFeaturesBatchRequest\x1a-.feast.serving.TransformFeaturesBatchResponse\x12z\n\x17TransformFeaturesStream\x12,.feast.serving.TransformFeaturesBatchRequest\x1a-.feast.serving.TransformFeaturesBatchResponse(\x01\x30\x01\x42h\n\x13\x66\x65\x61st.proto.servingB\x1dTransformationServiceAPIProtoZ2github.com/feast-dev/feast/go/protos/feast/servingb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -22,8 +22,8 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.serving.Transformatio
 if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['DESCRIPTOR']._options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\023feast.proto.servingB\035TransformationServiceAPIProtoZ2github.com/feast-dev/feast/go/protos/feast/serving'
-  _globals['_TRANSFORMATIONSERVICETYPE']._serialized_start=529
-  _globals['_TRANSFORMATIONSERVICETYPE']._serialized_end=677
+  _globals['_TRANSFORMATIONSERVICETYPE']._serialized_start=766
+  _globals['_TRANSFORMATIONSERVICETYPE']._serialized_end=914
   _globals['_VALUETYPE']._serialized_start=60
   _globals['_VALUETYPE']._serialized_end=103
   _globals['_GETTRANSFORMATIONSERVICEINFOREQUEST']._serialized_start=105
@@ -34,6 +34,10 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_TRANSFORMFEATURESREQUEST']._serialized_end=440
   _globals['_TRANSFORMFEATURESRESPONSE']._serialized_start=442
   _globals['_TRANSFORMFEATURESRESPONSE']._serialized_end=526
-  _globals['_TRANSFORMATIONSERVICE']._serialized_start=680
-  _globals['_TRANSFORMATIONSERVICE']._serialized_end=945
+  _globals['_TRANSFORMFEATURESBATCHREQUEST']._serialized_start=529
+  _globals['_TRANSFORMFEATURESBATCHREQUEST']._serialized_end=671
+  _globals['_TRANSFORMFEATURESBATCHRESPONSE']._serialized_start=673
+  _globals['_TRANSFORMFEATURESBATCHRESPONSE']._serialized_end=763
+  _globals['_TRANSFORMATIONSERVICE']._serialized_start=917
+  _globals['_TRANSFORMATIONSERVICE']._serialized_end=1425
 # @@protoc_insertion_point(module_scope)
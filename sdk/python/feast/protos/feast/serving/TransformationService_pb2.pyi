@@ -17,7 +17,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import builtins
+import collections.abc
 import google.protobuf.descriptor
+import google.protobuf.internal.containers
 import google.protobuf.internal.enum_type_wrapper
 import google.protobuf.message
 import sys
@@ -134,3 +136,46 @@ class TransformFeaturesResponse(google.protobuf.message.Message):
     def ClearField(self, field_name: typing_extensions.Literal["transformation_output", b"transformation_output"]) -> None: ...
 
 global___TransformFeaturesResponse = TransformFeaturesResponse
+
+class TransformFeaturesBatchRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ON_DEMAND_FEATURE_VIEW_NAMES_FIELD_NUMBER: builtins.int
+    PROJECT_FIELD_NUMBER: builtins.int
+    TRANSFORMATION_INPUT_FIELD_NUMBER: builtins.int
+    @property
+    def on_demand_feature_view_names(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]:
+        """Names of the on demand feature views to apply to every input record batch."""
+    project: builtins.str
+    @property
+    def transformation_input(self) -> global___ValueType:
+        """Arrow IPC stream holding one record batch per request. All record batches share the same schema."""
+    def __init__(
+        self,
+        *,
+        on_demand_feature_view_names: collections.abc.Iterable[builtins.str] | None = ...,
+        project: builtins.str = ...,
+        transformation_input: global___ValueType | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["transformation_input", b"transformation_input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["on_demand_feature_view_names", b"on_demand_feature_view_names", "project", b"project", "transformation_input", b"transformation_input"]) -> None: ...
+
+global___TransformFeaturesBatchRequest = TransformFeaturesBatchRequest
+
+class TransformFeaturesBatchResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TRANSFORMATION_OUTPUTS_FIELD_NUMBER: builtins.int
+    @property
+    def transformation_outputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ValueType]:
+        """One Arrow IPC stream per requested on demand feature view, in the order of on_demand_feature_view_names.
+        Each stream holds one record batch per input record batch, in the order of the input.
+        """
+    def __init__(
+        self,
+        *,
+        transformation_outputs: collections.abc.Iterable[global___ValueType] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["transformation_outputs", b"transformation_outputs"]) -> None: ...
+
+global___TransformFeaturesBatchResponse = TransformFeaturesBatchResponse
@@ -24,6 +24,16 @@ class TransformationServiceStub(object):
                 request_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesRequest.SerializeToString,
                 response_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesResponse.FromString,
                 )
+        self.TransformFeaturesBatch = channel.unary_unary(
+                '/feast.serving.TransformationService/TransformFeaturesBatch',
+                request_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchRequest.SerializeToString,
+                response_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchResponse.FromString,
+                )
+        self.TransformFeaturesStream = channel.stream_stream(
+                '/feast.serving.TransformationService/TransformFeaturesStream',
+                request_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchRequest.SerializeToString,
+                response_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchResponse.FromString,
+                )
 
 
 class TransformationServiceServicer(object):
@@ -41,6 +51,20 @@ class TransformationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def TransformFeaturesBatch(self, request, context):
+        """Applies several on demand feature views to several requests in one pass.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def TransformFeaturesStream(self, request_iterator, context):
+        """Streaming variant of TransformFeaturesBatch, answering every request message with one response message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TransformationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +78,16 @@ def add_TransformationServiceServicer_to_server(servicer, server):
                     request_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesRequest.FromString,
                     response_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesResponse.SerializeToString,
             ),
+            'TransformFeaturesBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.TransformFeaturesBatch,
+                    request_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchRequest.FromString,
+                    response_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchResponse.SerializeToString,
+            ),
+            'TransformFeaturesStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.TransformFeaturesStream,
+                    request_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchRequest.FromString,
+                    response_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'feast.serving.TransformationService', rpc_method_handlers)
@@ -97,3 +131,37 @@ class TransformationService(object):
             feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def TransformFeaturesBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/feast.serving.TransformationService/TransformFeaturesBatch',
+            feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchRequest.SerializeToString,
+            feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def TransformFeaturesStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/feast.serving.TransformationService/TransformFeaturesStream',
+            feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchRequest.SerializeToString,
+            feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
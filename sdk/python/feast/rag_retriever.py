@@ -182,19 +182,21 @@ class FeastRAGRetriever(RagRetriever):
         # Retrieve documents for each query in batch
         batch_embeddings, batch_doc_ids, batch_metadata = [], [], []
 
-        for i in range(batch_size):
-            query_vector = pooled_query_vectors[i]
-            if isinstance(query, list):
-                query_text = query[i] if i < len(query) else None
-            else:
-                query_text = query
+        if isinstance(query, list):
+            query_texts = [
+                query[i] if i < len(query) else None for i in range(batch_size)
+            ]
+        else:
+            query_texts = [query] * batch_size
+
+        # Query Feast once for the raw document data of all the queries
+        responses = self.vector_store.query_batch(
+            query_vectors=pooled_query_vectors if self.search_type != "text" else None,
+            query_strings=query_texts if self.search_type != "vector" else None,
+            top_k=n_docs,
+        )
 
-            # Query Feast to get the raw document data
-            response = self.vector_store.query(
-                query_vector=query_vector if self.search_type != "text" else None,
-                query_string=query_text if self.search_type != "vector" else None,
-                top_k=n_docs,
-            )
+        for response in responses:
             results_dict = response.to_dict()
             # Dynamically get data using the configured feature names
             texts = results_dict.get(self.text_field, [])
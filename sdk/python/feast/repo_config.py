@@ -2,7 +2,7 @@ import logging
 import os
 import warnings
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 import yaml
 from pydantic import (
@@ -85,6 +85,7 @@ ONLINE_STORE_CLASS_FOR_TYPE = {
     "couchbase.online": "feast.infra.online_stores.couchbase_online_store.couchbase.CouchbaseOnlineStore",
     "milvus": "feast.infra.online_stores.milvus_online_store.milvus.MilvusOnlineStore",
     "hybrid": "feast.infra.online_stores.hybrid_online_store.hybrid_online_store.HybridOnlineStore",
+    "faiss": "feast.infra.online_stores.faiss_online_store.FaissOnlineStore",
     **LEGACY_ONLINE_STORE_CLASS_FOR_TYPE,
 }
 
@@ -191,6 +192,32 @@ class MaterializationConfig(BaseModel):
         If false, feature retrieval jobs will pull all feature values within the specified time range. """
 
 
+class OnDemandTransformationConfig(BaseModel):
+    """Configuration options for executing on demand feature views during online retrieval."""
+
+    executor: Literal["sequential", "thread", "process"] = "sequential"
+    """ str: How on demand feature views without dependencies on each other are executed within a request.
+        "sequential" runs them one after another, "thread" runs them concurrently on a thread pool (suited to
+        pandas transformations that release the GIL) and "process" runs them on a process pool (suited to
+        CPU-bound python mode transformations). """
+
+    max_workers: Optional[StrictInt] = None
+    """ int: Maximum number of workers of the thread or process pool. Defaults to the executor's own default. """
+
+    timeout_seconds: Optional[float] = None
+    """ float: Time budget for all on demand feature views of a single request when a pool is used.
+        If exceeded, the request fails with an OnDemandFeatureViewTimeoutError. """
+
+    result_cache_max_entries: StrictInt = 10000
+    """ int: Maximum number of rows memoized by the process-wide result cache of on demand feature views
+        declared with `cacheable=True`. """
+
+    compile_pandas_udfs: StrictBool = False
+    """ bool: Whether pandas mode on demand feature views made of simple column expressions are compiled into
+        Arrow compute plans, skipping the conversion to and from pandas on every request. Udfs that can't be
+        compiled, or whose compiled plan doesn't reproduce the pandas output, keep running through pandas. """
+
+
 class RepoConfig(FeastBaseModel):
     """Repo config. Typically loaded from `feature_store.yaml`"""
 
@@ -253,6 +280,11 @@ class RepoConfig(FeastBaseModel):
     )
     """ MaterializationConfig: Configuration options for feature materialization behavior. """
 
+    on_demand_transformation_config: OnDemandTransformationConfig = Field(
+        OnDemandTransformationConfig(), alias="on_demand_transformation"
+    )
+    """ OnDemandTransformationConfig: Configuration options for on demand feature view execution at serving time. """
+
     def __init__(self, **data: Any):
         super().__init__(**data)
 
@@ -0,0 +1,82 @@
+"""
+OpenTelemetry tracing of Feast operations.
+
+Spans are created with the `feast` tracer of the OpenTelemetry API, so they are exported by the tracer provider
+configured by the application, and are non-recording until one is configured. If the OpenTelemetry API is not
+installed, `span` returns a no-op context manager.
+
+Spans carry the following attributes, when they apply:
+
+- `feast.project`: the project of the feature store.
+- `feast.online_store`: the type of the online store.
+- `feast.feature_view`: the feature view or on demand feature view of the span.
+- `feast.entity_count`: the number of entity rows.
+- `feast.feature_count`: the number of requested features.
+"""
+
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional
+
+try:
+    from opentelemetry import trace
+
+    _tracer: Any = trace.get_tracer("feast")
+except ImportError:
+    _tracer = None
+
+_NOOP = nullcontext()
+
+
+def is_enabled() -> bool:
+    """Returns whether the OpenTelemetry API is installed."""
+    return _tracer is not None
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager:
+    """
+    Starts a span as the current span, ending it when the returned context manager exits.
+
+    Exceptions raised in the span are recorded on it. Attributes whose value is None are left out.
+    """
+    if _tracer is None:
+        return _NOOP
+    return _tracer.start_as_current_span(
+        name,
+        attributes={k: v for k, v in attributes.items() if v is not None}
+        if attributes
+        else None,
+    )
+
+
+def online_request_attributes(
+    config: Any, features: Any, entity_rows: Any
+) -> Optional[Dict[str, Any]]:
+    """Returns the attributes of the spans of a `get_online_features` request."""
+    if _tracer is None:
+        return None
+    return {
+        "feast.project": config.project,
+        "feast.online_store": getattr(config.online_store, "type", None),
+        "feast.entity_count": entity_row_count(entity_rows),
+        "feast.feature_count": feature_count(features),
+    }
+
+
+def entity_row_count(entity_rows: Any) -> int:
+    """Returns the number of entity rows of a `get_online_features` request, in row or column format."""
+    if isinstance(entity_rows, list):
+        return len(entity_rows)
+    for values in entity_rows.values():
+        # Columns are either sequences or RepeatedValue protos.
+        return len(getattr(values, "val", values))
+    return 0
+
+
+def feature_count(features: Any) -> int:
+    """Returns the number of features requested by feature references or a feature service."""
+    if isinstance(features, list):
+        return len(features)
+    return sum(
+        len(projection.features)
+        for projection in getattr(features, "feature_view_projections", [])
+    )
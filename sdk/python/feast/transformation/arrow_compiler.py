@@ -0,0 +1,345 @@
+"""
+Compilation of pandas transformations into Arrow compute plans.
+
+Pandas on demand feature views convert every request from Arrow to pandas and back. Many of them are
+simple column expressions (arithmetic, comparisons, casts, null handling, string case mapping), which
+Arrow can evaluate directly. This module traces such a udf once with symbolic inputs, records the
+expression assigned to each output column and replays it with `pyarrow.compute` kernels on later
+requests. Udfs that use anything the tracer doesn't understand are not compiled and keep running
+through pandas.
+"""
+
+import logging
+import threading
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pyarrow
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+
+class _UnsupportedOperation(Exception):
+    pass
+
+
+class _Expression:
+    """A node of a traced column expression: a column reference, a literal, or an Arrow compute call."""
+
+    def __init__(
+        self,
+        function: Optional[str] = None,
+        args: Tuple[Any, ...] = (),
+        column: Optional[str] = None,
+        options: Optional[pc.FunctionOptions] = None,
+    ):
+        self.function = function
+        self.args = args
+        self.column = column
+        self.options = options
+
+    def evaluate(self, table: pyarrow.Table) -> Any:
+        if self.column is not None:
+            return table[self.column]
+        evaluated = [
+            a.evaluate(table) if isinstance(a, _Expression) else a for a in self.args
+        ]
+        return pc.call_function(self.function, evaluated, options=self.options)
+
+
+def _expression_of(value: Any) -> Any:
+    if isinstance(value, _TracedSeries):
+        return value.expression
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    raise _UnsupportedOperation(f"Unsupported operand of type {type(value)}")
+
+
+def _binary(
+    function: str,
+    reflected: bool = False,
+    true_division: bool = False,
+    null_result: Optional[bool] = None,
+):
+    def operator(self, other):
+        left, right = self.expression, _expression_of(other)
+        if reflected:
+            left, right = right, left
+        if true_division:
+            # pandas always returns floats for '/', Arrow keeps integer division for integers.
+            left = _Expression(
+                "cast", (left,), options=pc.CastOptions.unsafe(pyarrow.float64())
+            )
+            right = _Expression(
+                "cast", (right,), options=pc.CastOptions.unsafe(pyarrow.float64())
+            )
+        expression = _Expression(function, (left, right))
+        if null_result is not None:
+            # pandas comparisons with missing values are False (True for '!='), Arrow's are null.
+            expression = _Expression("coalesce", (expression, null_result))
+        return _TracedSeries(expression)
+
+    return operator
+
+
+_ASTYPE_TO_ARROW = {
+    float: pyarrow.float64(),
+    "float": pyarrow.float64(),
+    "float64": pyarrow.float64(),
+    "float32": pyarrow.float32(),
+    int: pyarrow.int64(),
+    "int": pyarrow.int64(),
+    "int64": pyarrow.int64(),
+    "int32": pyarrow.int32(),
+    str: pyarrow.string(),
+    "str": pyarrow.string(),
+    bool: pyarrow.bool_(),
+    "bool": pyarrow.bool_(),
+}
+
+
+class _TracedStringMethods:
+    def __init__(self, series: "_TracedSeries"):
+        self._series = series
+
+    def _unary(self, function: str) -> "_TracedSeries":
+        return _TracedSeries(_Expression(function, (self._series.expression,)))
+
+    def lower(self):
+        return self._unary("utf8_lower")
+
+    def upper(self):
+        return self._unary("utf8_upper")
+
+    def strip(self):
+        return self._unary("utf8_trim_whitespace")
+
+    def len(self):
+        return self._unary("utf8_length")
+
+
+class _TracedSeries:
+    """Stands in for a pandas Series while tracing, recording the operations applied to it."""
+
+    def __init__(self, expression: _Expression):
+        self.expression = expression
+
+    __add__ = _binary("add")
+    __radd__ = _binary("add", reflected=True)
+    __sub__ = _binary("subtract")
+    __rsub__ = _binary("subtract", reflected=True)
+    __mul__ = _binary("multiply")
+    __rmul__ = _binary("multiply", reflected=True)
+    __truediv__ = _binary("divide", true_division=True)
+    __rtruediv__ = _binary("divide", reflected=True, true_division=True)
+    __pow__ = _binary("power")
+    __eq__ = _binary("equal", null_result=False)  # type: ignore[assignment]
+    __ne__ = _binary("not_equal", null_result=True)  # type: ignore[assignment]
+    __lt__ = _binary("less", null_result=False)
+    __le__ = _binary("less_equal", null_result=False)
+    __gt__ = _binary("greater", null_result=False)
+    __ge__ = _binary("greater_equal", null_result=False)
+    __and__ = _binary("and_kleene")
+    __or__ = _binary("or_kleene")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __neg__(self):
+        return _TracedSeries(_Expression("negate", (self.expression,)))
+
+    def __invert__(self):
+        return _TracedSeries(_Expression("invert", (self.expression,)))
+
+    def __abs__(self):
+        return _TracedSeries(_Expression("abs", (self.expression,)))
+
+    def __bool__(self):
+        raise _UnsupportedOperation("Data dependent control flow can't be compiled")
+
+    def abs(self):
+        return abs(self)
+
+    def round(self, decimals: int = 0):
+        return _TracedSeries(
+            _Expression(
+                "round",
+                (self.expression,),
+                options=pc.RoundOptions(ndigits=decimals, round_mode="half_to_even"),
+            )
+        )
+
+    def fillna(self, value):
+        return _TracedSeries(
+            _Expression("coalesce", (self.expression, _expression_of(value)))
+        )
+
+    def isna(self):
+        return _TracedSeries(
+            _Expression(
+                "is_null",
+                (self.expression,),
+                options=pc.NullOptions(nan_is_null=True),
+            )
+        )
+
+    isnull = isna
+
+    def notna(self):
+        return ~self.isna()
+
+    notnull = notna
+
+    def astype(self, dtype):
+        if dtype not in _ASTYPE_TO_ARROW:
+            raise _UnsupportedOperation(f"Unsupported astype target {dtype}")
+        # Like pandas, casts truncate fractional floats and wrap overflowing integers instead of failing.
+        return _TracedSeries(
+            _Expression(
+                "cast",
+                (self.expression,),
+                options=pc.CastOptions.unsafe(_ASTYPE_TO_ARROW[dtype]),
+            )
+        )
+
+    @property
+    def str(self):
+        return _TracedStringMethods(self)
+
+    def __getattr__(self, name):
+        raise _UnsupportedOperation(f"Unsupported Series attribute {name}")
+
+
+class _TracedDataFrame:
+    """Stands in for a pandas DataFrame while tracing, recording the expression of every column."""
+
+    def __init__(self, columns: Optional[Dict[str, _Expression]] = None):
+        self.columns_: Dict[str, _Expression] = dict(columns or {})
+
+    def __getitem__(self, key):
+        if not isinstance(key, str) or key not in self.columns_:
+            raise _UnsupportedOperation(f"Unsupported column selection {key}")
+        return _TracedSeries(self.columns_[key])
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, str):
+            raise _UnsupportedOperation(f"Unsupported column assignment {key}")
+        expression = _expression_of(value)
+        if not isinstance(expression, _Expression):
+            raise _UnsupportedOperation("Scalar column assignments can't be compiled")
+        self.columns_[key] = expression
+
+    def __getattr__(self, name):
+        raise _UnsupportedOperation(f"Unsupported DataFrame attribute {name}")
+
+
+class _TracingPandasModule(types.ModuleType):
+    """Replaces `pd` in the globals of a traced udf, so that empty output frames are traced as well."""
+
+    def __init__(self):
+        super().__init__("pandas")
+
+    def DataFrame(self, data=None, *args, **kwargs):
+        if args or kwargs or data not in (None, {}):
+            raise _UnsupportedOperation("Only empty DataFrames can be traced")
+        return _TracedDataFrame()
+
+    def __getattr__(self, name):
+        raise _UnsupportedOperation(f"Unsupported pandas attribute {name}")
+
+
+class ArrowComputePlan:
+    """A pandas transformation compiled into Arrow compute expressions, one per output column."""
+
+    def __init__(
+        self, columns: Dict[str, _Expression], schema: Optional[pyarrow.Schema] = None
+    ):
+        self.columns = columns
+        self.schema = schema
+
+    def execute(self, table: pyarrow.Table) -> pyarrow.Table:
+        arrays = []
+        for expression in self.columns.values():
+            array = expression.evaluate(table)
+            if not isinstance(array, (pyarrow.Array, pyarrow.ChunkedArray)):
+                array = pyarrow.repeat(array, table.num_rows)
+            arrays.append(array)
+        result = pyarrow.Table.from_arrays(arrays, names=list(self.columns))
+        return result.cast(self.schema) if self.schema is not None else result
+
+
+def compile_pandas_udf(
+    udf: Callable[[Any], Any], input_column_names: List[str]
+) -> Optional[ArrowComputePlan]:
+    """
+    Traces a pandas udf into an Arrow compute plan.
+
+    Args:
+        udf: The pandas udf, taking and returning a DataFrame.
+        input_column_names: The columns of the input DataFrame.
+
+    Returns:
+        The compiled plan, or None if the udf uses operations that can't be compiled.
+    """
+    try:
+        traced_udf = types.FunctionType(
+            udf.__code__,
+            {**udf.__globals__, "pd": _TracingPandasModule()},
+            udf.__name__,
+            udf.__defaults__,
+            udf.__closure__,
+        )
+        inputs = _TracedDataFrame(
+            {name: _Expression(column=name) for name in input_column_names}
+        )
+        output = traced_udf(inputs)
+    except Exception as e:
+        logger.debug(f"Pandas udf {udf.__name__} can't be compiled to Arrow: {e}")
+        return None
+    if not isinstance(output, _TracedDataFrame) or not output.columns_:
+        return None
+    return ArrowComputePlan(output.columns_)
+
+
+_compiled_plans: Dict[Tuple[Any, ...], Optional[ArrowComputePlan]] = {}
+_compiled_plans_lock = threading.Lock()
+
+
+def transform_arrow_compiled(
+    udf: Callable[[Any], Any], udf_string: str, pa_table: pyarrow.Table
+) -> pyarrow.Table:
+    """
+    Applies a pandas udf to an Arrow table, through its compiled Arrow compute plan when it has one.
+
+    Plans are compiled once per udf and input schema. On first use, the plan is validated against the pandas
+    execution of the udf on the same table; plans that don't produce identical results are discarded. Tables
+    with missing values are validated separately from tables without, so that a plan is never trusted with
+    nulls before its null semantics were checked against pandas.
+    """
+    has_nulls = any(column.null_count for column in pa_table.columns)
+    key = (udf_string, udf.__code__.co_code, pa_table.schema, has_nulls)
+    with _compiled_plans_lock:
+        cached = key in _compiled_plans
+        plan = _compiled_plans.get(key)
+    if cached and plan is None:
+        return pyarrow.Table.from_pandas(udf(pa_table.to_pandas()))
+    if plan is not None:
+        try:
+            return plan.execute(pa_table)
+        except Exception as e:
+            # Plans are validated on one table; others may hold values that its Arrow functions reject.
+            logger.debug(f"Compiled plan of {udf.__name__} failed, running pandas: {e}")
+            return pyarrow.Table.from_pandas(udf(pa_table.to_pandas()))
+
+    expected = pyarrow.Table.from_pandas(udf(pa_table.to_pandas()))
+    plan = compile_pandas_udf(udf, pa_table.column_names)
+    if plan is not None:
+        try:
+            plan.schema = expected.schema
+            if not plan.execute(pa_table).equals(expected):
+                plan = None
+        except Exception as e:
+            logger.debug(f"Compiled plan of {udf.__name__} failed validation: {e}")
+            plan = None
+    with _compiled_plans_lock:
+        _compiled_plans[key] = plan
+    return expected
@@ -9,6 +9,7 @@ from feast.field import Field, from_value_type
 from feast.protos.feast.core.Transformation_pb2 import (
     UserDefinedFunctionV2 as UserDefinedFunctionProto,
 )
+from feast.transformation.arrow_compiler import transform_arrow_compiled
 from feast.transformation.base import Transformation
 from feast.transformation.mode import TransformationMode
 from feast.type_map import (
@@ -96,6 +97,13 @@ class PandasTransformation(Transformation):
         output_df_pandas = self.udf(pa_table.to_pandas())
         return pyarrow.Table.from_pandas(output_df_pandas)
 
+    def transform_arrow_compiled(self, pa_table: pyarrow.Table) -> pyarrow.Table:
+        """
+        Applies the udf like `transform_arrow`, evaluating it with Arrow compute kernels instead of pandas when
+        it can be compiled into an Arrow compute plan.
+        """
+        return transform_arrow_compiled(self.udf, self.udf_string, pa_table)
+
     def transform(self, inputs: pd.DataFrame) -> pd.DataFrame:
         return self.udf(inputs)
 
@@ -0,0 +1,235 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import pyarrow
+
+if TYPE_CHECKING:
+    from feast.on_demand_feature_view import OnDemandFeatureView
+
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+
+
+@dataclass
+class TransformationCacheStats:
+    """Hit and miss counters of the transformation result cache for one on demand feature view."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TransformationResultCache:
+    """
+    A bounded, thread-safe LRU memo of on demand feature view outputs.
+
+    Entries are keyed by the name of the on demand feature view and the values of every input column of a
+    single row, entity join keys included, since the transformation receives all of them. Each on demand feature view is tracked with a version derived from its transformation,
+    schema and registry update timestamp; when the version changes, all entries of that view are dropped.
+    Only views declared with `cacheable=True`, i.e. deterministic row-wise transformations, should be
+    transformed through this cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bool, Hashable], Tuple[Any, ...]]" = (
+            OrderedDict()
+        )
+        self._columns: Dict[Tuple[str, bool], List[str]] = {}
+        self._versions: Dict[str, str] = {}
+        self._stats: Dict[str, TransformationCacheStats] = {}
+        self._lock = threading.Lock()
+
+    def transform(
+        self,
+        odfv: "OnDemandFeatureView",
+        inputs: Union[pyarrow.Table, Dict[str, List[Any]]],
+        full_feature_names: bool = False,
+    ) -> Dict[str, List[Any]]:
+        """
+        Transforms the inputs with the given on demand feature view, only running the transformation
+        for rows whose input values haven't been seen before.
+
+        Args:
+            odfv: The on demand feature view to apply.
+            inputs: A dictionary of lists (python mode) or a pyarrow table (pandas and substrait modes).
+            full_feature_names: Whether the output columns are prefixed with the feature view name.
+
+        Returns:
+            The transformed features, as a dictionary of lists.
+        """
+        if isinstance(inputs, pyarrow.Table):
+            num_rows = inputs.num_rows
+            input_columns = {
+                c: inputs.column(c).to_pylist() for c in inputs.column_names
+            }
+        else:
+            num_rows = len(next(iter(inputs.values()))) if inputs else 0
+            input_columns = dict(inputs)
+        if not input_columns:
+            # Without input values, rows can't be told apart.
+            return _transform_rows(
+                odfv, inputs, list(range(num_rows)), full_feature_names
+            )
+        column_names = tuple(sorted(input_columns))
+        row_keys: List[Tuple[str, bool, Hashable]] = [
+            (odfv.name, full_feature_names, (column_names, _make_hashable(row)))
+            for row in zip(*(input_columns[c] for c in column_names))
+        ]
+
+        rows: List[Optional[Tuple[Any, ...]]] = [None] * num_rows
+        with self._lock:
+            self._check_version(odfv)
+            stats = self._stats.setdefault(odfv.name, TransformationCacheStats())
+            output_columns = self._columns.get((odfv.name, full_feature_names))
+            missed_row_indices: Dict[Tuple[str, bool, Hashable], List[int]] = {}
+            for i, key in enumerate(row_keys):
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    rows[i] = cached
+                    stats.hits += 1
+                else:
+                    missed_row_indices.setdefault(key, []).append(i)
+                    stats.misses += 1
+
+        if missed_row_indices:
+            # Every distinct missed row is transformed once.
+            indices = [row_indices[0] for row_indices in missed_row_indices.values()]
+            transformed = _transform_rows(odfv, inputs, indices, full_feature_names)
+            output_columns = list(transformed.keys())
+            transformed_rows = list(zip(*transformed.values()))
+            if len(transformed_rows) != len(indices):
+                raise ValueError(
+                    f"On demand feature view {odfv.name} is declared cacheable but did not return "
+                    f"one output row per input row."
+                )
+            with self._lock:
+                self._columns[(odfv.name, full_feature_names)] = output_columns
+                for (key, row_indices), row in zip(
+                    missed_row_indices.items(), transformed_rows
+                ):
+                    for i in row_indices:
+                        rows[i] = row
+                    self._entries[key] = row
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return {
+            column: [row[idx] for row in rows]  # type: ignore[index]
+            for idx, column in enumerate(output_columns or [])
+        }
+
+    def _check_version(self, odfv: "OnDemandFeatureView") -> None:
+        version = transformation_version(odfv)
+        if self._versions.get(odfv.name) != version:
+            self._invalidate(odfv.name)
+            self._versions[odfv.name] = version
+
+    def invalidate(self, odfv_name: Optional[str] = None) -> None:
+        """Drops the cached results of one on demand feature view, or of all of them if no name is given."""
+        with self._lock:
+            if odfv_name is None:
+                self._entries.clear()
+                self._columns.clear()
+                self._versions.clear()
+            else:
+                self._invalidate(odfv_name)
+                self._versions.pop(odfv_name, None)
+
+    def _invalidate(self, odfv_name: str) -> None:
+        for entry_key in [k for k in self._entries if k[0] == odfv_name]:
+            del self._entries[entry_key]
+        for columns_key in [k for k in self._columns if k[0] == odfv_name]:
+            del self._columns[columns_key]
+
+    def stats(self) -> Dict[str, TransformationCacheStats]:
+        """Returns a snapshot of the hit and miss counters, by on demand feature view name."""
+        with self._lock:
+            return {
+                name: TransformationCacheStats(s.hits, s.misses)
+                for name, s in self._stats.items()
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_result_cache: Optional[TransformationResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_transformation_result_cache(
+    max_entries: Optional[int] = None,
+) -> TransformationResultCache:
+    """Returns the process-wide transformation result cache, resizing it if `max_entries` is given."""
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = TransformationResultCache(
+                max_entries or DEFAULT_CACHE_MAX_ENTRIES
+            )
+        elif max_entries is not None:
+            _result_cache.max_entries = max_entries
+        return _result_cache
+
+
+def transformation_version(odfv: "OnDemandFeatureView") -> str:
+    """Returns a digest that changes whenever the definition of the on demand feature view changes."""
+    transformation = odfv.feature_transformation
+    hasher = hashlib.sha256()
+    hasher.update(odfv.mode.encode())
+    hasher.update((getattr(transformation, "udf_string", None) or "").encode())
+    substrait_plan = getattr(transformation, "substrait_plan", None)
+    if substrait_plan:
+        hasher.update(substrait_plan)
+    for feature in odfv.features:
+        hasher.update(f"{feature.name}:{feature.dtype}".encode())
+    if odfv.last_updated_timestamp:
+        hasher.update(odfv.last_updated_timestamp.isoformat().encode())
+    return hasher.hexdigest()
+
+
+def _make_hashable(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _make_hashable(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return frozenset(value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _transform_rows(
+    odfv: "OnDemandFeatureView",
+    inputs: Union[pyarrow.Table, Dict[str, List[Any]]],
+    indices: List[int],
+    full_feature_names: bool,
+) -> Dict[str, List[Any]]:
+    output_column_names = {f.name for f in odfv.features} | {
+        f"{odfv.projection.name_to_use()}__{f.name}" for f in odfv.features
+    }
+    if isinstance(inputs, pyarrow.Table):
+        transformed = odfv.transform_arrow(inputs.take(indices), full_feature_names)
+        return {
+            c: transformed.column(c).to_pylist()
+            for c in transformed.column_names
+            if c in output_column_names
+        }
+
+    subset = {k: [v[i] for i in indices] for k, v in inputs.items()}
+    return {
+        k: v if isinstance(v, list) else [v]
+        for k, v in odfv.transform_dict(subset).items()
+        if k in output_column_names
+    }
@@ -1,17 +1,24 @@
 import logging
 import sys
 from concurrent import futures
+from concurrent.futures import wait
+from typing import Dict, List, Optional, Tuple
 
 import grpc
 import pyarrow as pa
 from grpc_reflection.v1alpha import reflection
 
-from feast.errors import OnDemandFeatureViewNotFoundException
+from feast.errors import (
+    OnDemandFeatureViewNotFoundException,
+    OnDemandFeatureViewTimeoutError,
+)
 from feast.feature_store import FeatureStore
+from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.protos.feast.serving.TransformationService_pb2 import (
     DESCRIPTOR,
     TRANSFORMATION_SERVICE_TYPE_PYTHON,
     GetTransformationServiceInfoResponse,
+    TransformFeaturesBatchResponse,
     TransformFeaturesResponse,
     ValueType,
 )
@@ -19,6 +26,11 @@ from feast.protos.feast.serving.TransformationService_pb2_grpc import (
     TransformationServiceServicer,
     add_TransformationServiceServicer_to_server,
 )
+from feast.transformation.arrow_compiler import compile_pandas_udf
+from feast.utils import (
+    _apply_on_demand_transformation_from_proto,
+    _get_on_demand_executor,
+)
 from feast.version import get_version
 
 log = logging.getLogger(__name__)
@@ -28,6 +40,7 @@ class TransformationServer(TransformationServiceServicer):
     def __init__(self, fs: FeatureStore) -> None:
         super().__init__()
         self.fs = fs
+        self._row_wise: Dict[Tuple[str, Tuple[str, ...]], bool] = {}
 
     def GetTransformationServiceInfo(self, request, context):
         response = GetTransformationServiceInfoResponse(
@@ -47,12 +60,9 @@ class TransformationServer(TransformationServiceServicer):
 
         df = pa.ipc.open_file(request.transformation_input.arrow_value).read_all()
 
-        if odfv.mode != "pandas":
-            raise Exception(
-                f'OnDemandFeatureView mode "{odfv.mode}" not supported by TransformationServer.'
-            )
+        _check_mode(odfv)
 
-        result_arrow = odfv.transform_arrow(df, True)
+        result_arrow = self._transform(odfv, df)
         sink = pa.BufferOutputStream()
         writer = pa.ipc.new_file(sink, result_arrow.schema)
         writer.write_table(result_arrow)
@@ -64,9 +74,154 @@ class TransformationServer(TransformationServiceServicer):
             transformation_output=ValueType(arrow_value=buf)
         )
 
+    def TransformFeaturesBatch(self, request, context):
+        odfvs = []
+        for name in request.on_demand_feature_view_names:
+            try:
+                odfv = self.fs.get_on_demand_feature_view(name)
+            except OnDemandFeatureViewNotFoundException:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                raise
+            _check_mode(odfv)
+            odfvs.append(odfv)
+
+        reader = pa.ipc.open_stream(request.transformation_input.arrow_value)
+        batches = list(reader)
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+
+        # Row-wise views are applied once to the concatenated requests, other views to every request on its own,
+        # since they would otherwise mix rows of unrelated requests.
+        inputs = [
+            [table]
+            if self._is_row_wise(odfv, table)
+            else [pa.Table.from_batches([batch], table.schema) for batch in batches]
+            for odfv in odfvs
+        ]
+        results = iter(
+            self._transform_all(
+                [(odfv, t) for odfv, tables in zip(odfvs, inputs) for t in tables]
+            )
+        )
+
+        outputs = []
+        for tables in inputs:
+            transformed = [next(results) for _ in tables]
+            if len(tables) == 1 and len(batches) != 1:
+                transformed = _split(transformed[0], batches)
+            outputs.append(ValueType(arrow_value=_write_stream(transformed)))
+        return TransformFeaturesBatchResponse(transformation_outputs=outputs)
+
+    def TransformFeaturesStream(self, request_iterator, context):
+        for request in request_iterator:
+            yield self.TransformFeaturesBatch(request, context)
+
+    def _transform(self, odfv: OnDemandFeatureView, table: pa.Table) -> pa.Table:
+        return odfv.transform_arrow(
+            table,
+            True,
+            self.fs.config.on_demand_transformation_config.compile_pandas_udfs,
+        )
+
+    def _is_row_wise(self, odfv: OnDemandFeatureView, table: pa.Table) -> bool:
+        """
+        Whether every output row of a view only depends on the matching input row.
+
+        Views are row-wise if they are declared cacheable, or if their udf compiles to an Arrow compute plan,
+        which is only made of element-wise kernels.
+        """
+        if odfv.cacheable:
+            return True
+        transformation = odfv.feature_transformation
+        key = (transformation.udf_string, tuple(table.column_names))
+        if key not in self._row_wise:
+            self._row_wise[key] = (
+                compile_pandas_udf(transformation.udf, table.column_names) is not None
+            )
+        return self._row_wise[key]
+
+    def _transform_all(
+        self, transformations: List[Tuple[OnDemandFeatureView, pa.Table]]
+    ) -> List[pa.Table]:
+        """
+        Applies on demand feature views to tables, on the configured on demand executor if any.
+
+        The configured timeout bounds the whole batch of transformations, not each of them.
+        """
+        config = self.fs.config.on_demand_transformation_config
+        executor = _get_on_demand_executor(config)
+        if executor is None or len(transformations) < 2:
+            return [self._transform(odfv, table) for odfv, table in transformations]
+
+        if config.executor == "process":
+            pending = [
+                executor.submit(
+                    _apply_on_demand_transformation_from_proto,
+                    odfv.to_proto().SerializeToString(),
+                    None,
+                    table,
+                    True,
+                    config.compile_pandas_udfs,
+                )
+                for odfv, table in transformations
+            ]
+        else:
+            pending = [
+                executor.submit(self._transform, odfv, table)
+                for odfv, table in transformations
+            ]
+        _, not_done = wait(pending, timeout=config.timeout_seconds)
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            raise OnDemandFeatureViewTimeoutError(
+                sorted(
+                    {
+                        odfv.name
+                        for (odfv, _), future in zip(transformations, pending)
+                        if future in not_done
+                    }
+                ),
+                config.timeout_seconds,  # type: ignore[arg-type]
+            )
+        return [future.result() for future in pending]
+
+
+def _split(result_arrow: pa.Table, batches: List[pa.RecordBatch]) -> List[pa.Table]:
+    """Splits the output of a row-wise transformation applied to the concatenated requests into one table per request."""
+    outputs = []
+    offset = 0
+    for batch in batches:
+        outputs.append(result_arrow.slice(offset, batch.num_rows))
+        offset += batch.num_rows
+    return outputs
+
+
+def _check_mode(odfv: OnDemandFeatureView) -> None:
+    if odfv.mode != "pandas":
+        raise Exception(
+            f'OnDemandFeatureView mode "{odfv.mode}" not supported by TransformationServer.'
+        )
+
+
+def _write_stream(tables: List[pa.Table]) -> bytes:
+    sink = pa.BufferOutputStream()
+    schema = tables[0].schema if tables else pa.schema([])
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for table in tables:
+            # Each request is answered with exactly one record batch, even if empty.
+            table = table.cast(schema)
+            writer.write_batch(
+                pa.RecordBatch.from_arrays(
+                    [column.combine_chunks() for column in table.columns],
+                    schema=schema,
+                )
+            )
+    return sink.getvalue().to_pybytes()
+
 
-def start_server(store: FeatureStore, port: int):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+def start_server(store: FeatureStore, port: int, max_workers: Optional[int] = None):
+    # Without an explicit size, the pool is sized to the number of CPUs of the machine.
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
     add_TransformationServiceServicer_to_server(TransformationServer(store), server)
     service_names_available_for_reflection = (
         DESCRIPTOR.services_by_name["TransformationService"].full_name,
@@ -1,9 +1,19 @@
 import copy
+import functools
 import itertools
+import json
 import os
+import threading
 import typing
 import warnings
 from collections import Counter, defaultdict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import (
@@ -25,12 +35,14 @@ import pyarrow
 from dateutil.tz import tzlocal
 from google.protobuf.timestamp_pb2 import Timestamp
 
+from feast import metrics, tracing
 from feast.aggregation import aggregation_specs_to_agg_ops
 from feast.constants import FEAST_FS_YAML_FILE_PATH_ENV_NAME
 from feast.entity import Entity
 from feast.errors import (
     FeatureNameCollisionError,
     FeatureViewNotFoundException,
+    OnDemandFeatureViewTimeoutError,
     RequestDataNotFoundInEntityRowsException,
 )
 from feast.field import Field
@@ -44,6 +56,10 @@ from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import FloatList as FloatListProto
 from feast.protos.feast.types.Value_pb2 import RepeatedValue as RepeatedValueProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.transformation.result_cache import (
+    TransformationResultCache,
+    get_transformation_result_cache,
+)
 from feast.type_map import python_values_to_proto_values
 from feast.types import ComplexFeastType, PrimitiveFeastType, from_feast_to_pyarrow_type
 from feast.value_type import ValueType
@@ -55,6 +71,7 @@ if typing.TYPE_CHECKING:
     from feast.feature_view import FeatureView
     from feast.infra.registry.base_registry import BaseRegistry
     from feast.on_demand_feature_view import OnDemandFeatureView
+    from feast.repo_config import OnDemandTransformationConfig
 
 APPLICATION_NAME = "feast-dev/feast"
 USER_AGENT = "{}/{}".format(APPLICATION_NAME, get_version())
@@ -636,6 +653,7 @@ def _augment_response_with_on_demand_transforms(
     feature_refs: List[str],
     requested_on_demand_feature_views: List["OnDemandFeatureView"],
     full_feature_names: bool,
+    on_demand_config: Optional["OnDemandTransformationConfig"] = None,
 ):
     """Computes on demand feature values and adds them to the result rows.
 
@@ -650,6 +668,8 @@ def _augment_response_with_on_demand_transforms(
         full_feature_names: A boolean that provides the option to add the feature view prefixes to the feature names,
             changing them from the format "feature" to "feature_view__feature" (e.g., "daily_transactions" changes to
             "customer_fv__daily_transactions").
+        on_demand_config: Optional configuration controlling whether independent on demand feature views
+            are executed concurrently on a thread or process pool, and with which time budget.
     """
     from feast.online_response import OnlineResponse
 
@@ -670,12 +690,59 @@ def _augment_response_with_on_demand_transforms(
     initial_response_arrow: Optional[pyarrow.Table] = None
     initial_response_dict: Optional[Dict[str, List[Any]]] = None
 
-    # Apply on demand transformations and augment the result rows
-    odfv_result_names = set()
-    for odfv_name, _feature_refs in odfv_feature_refs.items():
-        odfv = requested_odfv_map[odfv_name]
-        if not odfv.write_to_online_store:
+    odfvs_to_transform = [
+        (requested_odfv_map[odfv_name], _feature_refs)
+        for odfv_name, _feature_refs in odfv_feature_refs.items()
+        if not requested_odfv_map[odfv_name].write_to_online_store
+    ]
+    for odfv, _ in odfvs_to_transform:
+        if odfv.mode not in {"python", "pandas", "substrait"}:
+            raise Exception(
+                f"Invalid OnDemandFeatureMode: {odfv.mode}. Expected one of 'pandas', 'python', or 'substrait'."
+            )
+
+    # Aggregations rewrite the inputs seen by the on demand feature views that follow them,
+    # so only views without aggregations are independent of each other and can run concurrently.
+    executor = _get_on_demand_executor(on_demand_config)
+    result_cache = (
+        get_transformation_result_cache(
+            on_demand_config.result_cache_max_entries if on_demand_config else None
+        )
+        if any(odfv.cacheable for odfv, _ in odfvs_to_transform)
+        else None
+    )
+    compile_pandas_udfs = bool(
+        on_demand_config and on_demand_config.compile_pandas_udfs
+    )
+    if (
+        executor is not None
+        and len(odfvs_to_transform) > 1
+        and not any(odfv.aggregations for odfv, _ in odfvs_to_transform)
+    ):
+        if any(odfv.mode == "python" for odfv, _ in odfvs_to_transform):
+            initial_response_dict = initial_response.to_dict()
+        if any(odfv.mode != "python" for odfv, _ in odfvs_to_transform):
+            initial_response_arrow = initial_response.to_arrow()
+        transformed_results = _transform_on_demand_feature_views_concurrently(
+            executor,
+            on_demand_config.executor,  # type: ignore[union-attr]
+            on_demand_config.timeout_seconds,  # type: ignore[union-attr]
+            odfvs_to_transform,
+            initial_response_dict,
+            initial_response_arrow,
+            full_feature_names,
+            result_cache,
+            compile_pandas_udfs,
+        )
+    else:
+        # Apply on demand transformations sequentially
+        transformed_results = []
+        transformed_features: Union[pyarrow.Table, Dict[str, List[Any]]]
+        for odfv, _feature_refs in odfvs_to_transform:
             # Apply aggregations if configured.
+            # Note: aggregations and transformation configs are mutually exclusive
+            # TODO: Fix to make it work for having both aggregation and transformation
+            #  ticket: https://github.com/feast-dev/feast/issues/5689
             if odfv.aggregations:
                 if odfv.mode == "python":
                     if initial_response_dict is None:
@@ -686,7 +753,8 @@ def _augment_response_with_on_demand_transforms(
                         odfv.entities,
                         odfv.mode,
                     )
-                elif odfv.mode in {"pandas", "substrait"}:
+                    transformed_features = initial_response_dict
+                else:
                     if initial_response_arrow is None:
                         initial_response_arrow = initial_response.to_arrow()
                     initial_response_arrow = _apply_aggregations_to_response(
@@ -695,77 +763,277 @@ def _augment_response_with_on_demand_transforms(
                         odfv.entities,
                         odfv.mode,
                     )
+                    transformed_features = initial_response_arrow
+                transformed_results.append(
+                    _convert_on_demand_features_to_proto(
+                        odfv, _feature_refs, transformed_features
+                    )
+                )
+                continue
 
-            # Apply transformation. Note: aggregations and transformation configs are mutually exclusive
-            # TODO: Fix to make it work for having both aggregation and transformation
-            #  ticket: https://github.com/feast-dev/feast/issues/5689
-            elif odfv.mode == "python":
+            if odfv.mode == "python":
                 if initial_response_dict is None:
                     initial_response_dict = initial_response.to_dict()
-                transformed_features_dict: Dict[str, List[Any]] = odfv.transform_dict(
-                    initial_response_dict
-                )
-            elif odfv.mode in {"pandas", "substrait"}:
-                if initial_response_arrow is None:
-                    initial_response_arrow = initial_response.to_arrow()
-                transformed_features_arrow = odfv.transform_arrow(
-                    initial_response_arrow, full_feature_names
+            elif initial_response_arrow is None:
+                initial_response_arrow = initial_response.to_arrow()
+            transformed_results.append(
+                _transform_on_demand_feature_view(
+                    odfv,
+                    _feature_refs,
+                    initial_response_dict,
+                    initial_response_arrow,
+                    full_feature_names,
+                    result_cache,
+                    compile_pandas_udfs,
                 )
-            else:
-                raise Exception(
-                    f"Invalid OnDemandFeatureMode: {odfv.mode}. Expected one of 'pandas', 'python', or 'substrait'."
+            )
+
+    # Augment the result rows in the order the on demand feature views were requested
+    for selected_subset, proto_values in transformed_results:
+        online_features_response.metadata.feature_names.val.extend(selected_subset)
+        for feature_idx in range(len(selected_subset)):
+            online_features_response.results.append(
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=proto_values[feature_idx],
+                    statuses=[FieldStatus.PRESENT] * len(proto_values[feature_idx]),
+                    event_timestamps=[Timestamp()] * len(proto_values[feature_idx]),
                 )
+            )
+
 
-            transformed_features = (
-                transformed_features_dict
+def _transform_on_demand_feature_view(
+    odfv: "OnDemandFeatureView",
+    feature_refs: List[str],
+    initial_response_dict: Optional[Dict[str, List[Any]]],
+    initial_response_arrow: Optional[pyarrow.Table],
+    full_feature_names: bool,
+    result_cache: Optional[TransformationResultCache] = None,
+    compile_pandas_udfs: bool = False,
+) -> Tuple[List[str], List[List[ValueProto]]]:
+    """Applies the transformation of a single on demand feature view and converts the requested outputs to protos.
+
+    Cacheable on demand feature views are transformed through `result_cache`, if given, so that only rows with
+    unseen input values are computed.
+    """
+    transformed_features: Union[pyarrow.Table, Dict[str, List[Any]]]
+    with (
+        metrics.stage(
+            "get_online_features", "on_demand_transform", feature_view=odfv.name
+        ),
+        tracing.span(
+            "feast.on_demand_feature_view.transform",
+            {"feast.feature_view": odfv.name},
+        ),
+    ):
+        if result_cache is not None and odfv.cacheable:
+            transformed_features = result_cache.transform(
+                odfv,
+                initial_response_dict
                 if odfv.mode == "python"
-                else transformed_features_arrow
+                else initial_response_arrow,  # type: ignore[arg-type]
+                full_feature_names,
             )
-            transformed_columns = (
-                transformed_features.column_names
-                if isinstance(transformed_features, pyarrow.Table)
-                else transformed_features
+        else:
+            transformed_features = _apply_on_demand_transformation(
+                odfv,
+                initial_response_dict,
+                initial_response_arrow,
+                full_feature_names,
+                compile_pandas_udfs,
             )
-            selected_subset = [f for f in transformed_columns if f in _feature_refs]
-
-            proto_values = []
-            schema_dict = {k.name: k.dtype for k in odfv.schema}
-            for selected_feature in selected_subset:
-                feature_vector = transformed_features[selected_feature]
-                selected_feature_type = schema_dict.get(selected_feature, None)
-                feature_type: ValueType = ValueType.UNKNOWN
-                if selected_feature_type is not None:
-                    if isinstance(
-                        selected_feature_type, (ComplexFeastType, PrimitiveFeastType)
-                    ):
-                        feature_type = selected_feature_type.to_value_type()
-                    elif not isinstance(selected_feature_type, ValueType):
-                        raise TypeError(
-                            f"Unexpected type for feature_type: {type(feature_type)}"
-                        )
-
-                proto_values.append(
-                    python_values_to_proto_values(
-                        feature_vector
-                        if isinstance(feature_vector, list)
-                        else [feature_vector]
-                        if odfv.mode == "python"
-                        else feature_vector.to_numpy(),
-                        feature_type,
-                    )
+    return _convert_on_demand_features_to_proto(
+        odfv, feature_refs, transformed_features
+    )
+
+
+def _apply_on_demand_transformation(
+    odfv: "OnDemandFeatureView",
+    initial_response_dict: Optional[Dict[str, List[Any]]],
+    initial_response_arrow: Optional[pyarrow.Table],
+    full_feature_names: bool,
+    compile_pandas_udfs: bool = False,
+) -> Union[pyarrow.Table, Dict[str, List[Any]]]:
+    if odfv.mode == "python":
+        assert initial_response_dict is not None
+        return odfv.transform_dict(initial_response_dict)
+    return odfv.transform_arrow(
+        initial_response_arrow, full_feature_names, compile_pandas_udfs
+    )
+
+
+def _apply_on_demand_transformation_from_proto(
+    odfv_proto: bytes,
+    initial_response_dict: Optional[Dict[str, List[Any]]],
+    initial_response_arrow: Optional[pyarrow.Table],
+    full_feature_names: bool,
+    compile_pandas_udfs: bool = False,
+) -> Union[pyarrow.Table, Dict[str, List[Any]]]:
+    """Process pool entrypoint.
+
+    On demand feature views are shipped as serialized protos since their udfs are dill-encoded, and
+    transformed features are returned as plain python or arrow data since Feast protos are not picklable.
+    """
+    return _apply_on_demand_transformation(
+        _deserialize_on_demand_feature_view(odfv_proto),
+        initial_response_dict,
+        initial_response_arrow,
+        full_feature_names,
+        compile_pandas_udfs,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _deserialize_on_demand_feature_view(odfv_proto: bytes) -> "OnDemandFeatureView":
+    from feast.on_demand_feature_view import OnDemandFeatureView
+    from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+        OnDemandFeatureView as OnDemandFeatureViewProto,
+    )
+
+    proto = OnDemandFeatureViewProto()
+    proto.ParseFromString(odfv_proto)
+    return OnDemandFeatureView.from_proto(proto)
+
+
+def _convert_on_demand_features_to_proto(
+    odfv: "OnDemandFeatureView",
+    feature_refs: List[str],
+    transformed_features: Union[pyarrow.Table, Dict[str, List[Any]]],
+) -> Tuple[List[str], List[List[ValueProto]]]:
+    transformed_columns = (
+        transformed_features.column_names
+        if isinstance(transformed_features, pyarrow.Table)
+        else transformed_features
+    )
+    selected_subset = [f for f in transformed_columns if f in feature_refs]
+
+    proto_values = []
+    schema_dict = {k.name: k.dtype for k in odfv.schema}
+    for selected_feature in selected_subset:
+        feature_vector = transformed_features[selected_feature]
+        selected_feature_type = schema_dict.get(selected_feature, None)
+        feature_type: ValueType = ValueType.UNKNOWN
+        if selected_feature_type is not None:
+            if isinstance(
+                selected_feature_type, (ComplexFeastType, PrimitiveFeastType)
+            ):
+                feature_type = selected_feature_type.to_value_type()
+            elif not isinstance(selected_feature_type, ValueType):
+                raise TypeError(
+                    f"Unexpected type for feature_type: {type(feature_type)}"
                 )
 
-            odfv_result_names |= set(selected_subset)
+        proto_values.append(
+            python_values_to_proto_values(
+                feature_vector
+                if isinstance(feature_vector, list)
+                else [feature_vector]
+                if odfv.mode == "python"
+                else feature_vector.to_numpy(),
+                feature_type,
+            )
+        )
+    return selected_subset, proto_values
+
 
-            online_features_response.metadata.feature_names.val.extend(selected_subset)
-            for feature_idx in range(len(selected_subset)):
-                online_features_response.results.append(
-                    GetOnlineFeaturesResponse.FeatureVector(
-                        values=proto_values[feature_idx],
-                        statuses=[FieldStatus.PRESENT] * len(proto_values[feature_idx]),
-                        event_timestamps=[Timestamp()] * len(proto_values[feature_idx]),
-                    )
+_ON_DEMAND_EXECUTORS: Dict[Tuple[str, Optional[int]], Executor] = {}
+_ON_DEMAND_EXECUTORS_LOCK = threading.Lock()
+
+
+def _get_on_demand_executor(
+    on_demand_config: Optional["OnDemandTransformationConfig"],
+) -> Optional[Executor]:
+    """Returns the process-wide pool used to run on demand feature views, or None when they run sequentially."""
+    if on_demand_config is None or on_demand_config.executor == "sequential":
+        return None
+
+    key = (on_demand_config.executor, on_demand_config.max_workers)
+    with _ON_DEMAND_EXECUTORS_LOCK:
+        executor = _ON_DEMAND_EXECUTORS.get(key)
+        if executor is None:
+            if on_demand_config.executor == "process":
+                executor = ProcessPoolExecutor(max_workers=on_demand_config.max_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=on_demand_config.max_workers,
+                    thread_name_prefix="feast-odfv",
                 )
+            _ON_DEMAND_EXECUTORS[key] = executor
+    return executor
+
+
+def _transform_on_demand_feature_views_concurrently(
+    executor: Executor,
+    executor_type: str,
+    timeout_seconds: Optional[float],
+    odfvs_to_transform: List[Tuple["OnDemandFeatureView", List[str]]],
+    initial_response_dict: Optional[Dict[str, List[Any]]],
+    initial_response_arrow: Optional[pyarrow.Table],
+    full_feature_names: bool,
+    result_cache: Optional[TransformationResultCache] = None,
+    compile_pandas_udfs: bool = False,
+) -> List[Tuple[List[str], List[List[ValueProto]]]]:
+    futures: Dict[int, Future] = {}
+    for i, (odfv, _feature_refs) in enumerate(odfvs_to_transform):
+        if executor_type == "process":
+            if result_cache is not None and odfv.cacheable:
+                # Cached results live in this process, so cacheable views are transformed inline below.
+                continue
+            futures[i] = executor.submit(
+                _apply_on_demand_transformation_from_proto,
+                odfv.to_proto().SerializeToString(),
+                initial_response_dict if odfv.mode == "python" else None,
+                initial_response_arrow if odfv.mode != "python" else None,
+                full_feature_names,
+                compile_pandas_udfs,
+            )
+        else:
+            futures[i] = executor.submit(
+                _transform_on_demand_feature_view,
+                odfv,
+                _feature_refs,
+                initial_response_dict,
+                initial_response_arrow,
+                full_feature_names,
+                result_cache,
+                compile_pandas_udfs,
+            )
+
+    results: List[Tuple[List[str], List[List[ValueProto]]]] = [([], [])] * len(
+        odfvs_to_transform
+    )
+    for i, (odfv, _feature_refs) in enumerate(odfvs_to_transform):
+        if i not in futures:
+            results[i] = _transform_on_demand_feature_view(
+                odfv,
+                _feature_refs,
+                initial_response_dict,
+                initial_response_arrow,
+                full_feature_names,
+                result_cache,
+                compile_pandas_udfs,
+            )
+
+    _, not_done = wait(futures.values(), timeout=timeout_seconds)
+    if not_done:
+        for future in not_done:
+            future.cancel()
+        raise OnDemandFeatureViewTimeoutError(
+            [
+                odfvs_to_transform[i][0].name
+                for i, future in futures.items()
+                if future in not_done
+            ],
+            timeout_seconds,  # type: ignore[arg-type]
+        )
+    for i, future in futures.items():
+        if executor_type == "process":
+            odfv, _feature_refs = odfvs_to_transform[i]
+            results[i] = _convert_on_demand_features_to_proto(
+                odfv, _feature_refs, future.result()
+            )
+        else:
+            results[i] = future.result()
+    return results
 
 
 def _get_entity_maps(
@@ -1285,17 +1553,18 @@ def _prepare_entities_to_read_from_online_store(
 ):
     from feast.feature_view import DUMMY_ENTITY, DUMMY_ENTITY_ID, DUMMY_ENTITY_VAL
 
-    (
-        feature_refs,
-        requested_on_demand_feature_views,
-        entity_name_to_join_key_map,
-        entity_type_map,
-        join_keys_set,
-        grouped_refs,
-        requested_result_row_names,
-        needed_request_data,
-        entityless_case,
-    ) = _get_online_request_context(registry, project, features, full_feature_names)
+    with metrics.stage("get_online_features", "registry"):
+        (
+            feature_refs,
+            requested_on_demand_feature_views,
+            entity_name_to_join_key_map,
+            entity_type_map,
+            join_keys_set,
+            grouped_refs,
+            requested_result_row_names,
+            needed_request_data,
+            entityless_case,
+        ) = _get_online_request_context(registry, project, features, full_feature_names)
 
     # Extract Sequence from RepeatedValue Protobuf.
     entity_value_lists: Dict[str, Union[List[Any], List[ValueProto]]] = {
@@ -1463,10 +1732,36 @@ def _serialize_vector_to_float_list(vector: List[float]) -> ValueProto:
     return ValueProto(float_list_val=FloatListProto(val=vector))
 
 
+def _vector_to_value_proto(vector: Union[str, Sequence[float], None]) -> ValueProto:
+    """
+    Converts a vector returned by an online store into a float list value.
+
+    Vectors returned as text, such as the "[0.1,0.2]" representation of pgvector, are parsed once here rather
+    than by every caller. Other strings are kept as is.
+    """
+    if vector is None:
+        return ValueProto()
+    values: Sequence[float]
+    if isinstance(vector, str):
+        try:
+            parsed = json.loads(vector)
+        except ValueError:
+            parsed = None
+        if not isinstance(parsed, list):
+            return ValueProto(string_val=vector)
+        values = parsed
+    elif hasattr(vector, "tolist"):
+        # NumPy arrays are converted to Python floats at once.
+        values = vector.tolist()
+    else:
+        values = vector
+    return ValueProto(float_list_val=FloatListProto(val=values))
+
+
 def _build_retrieve_online_document_record(
     entity_key: Union[str, bytes],
     feature_value: Union[str, bytes],
-    vector_value: Union[str, List[float]],
+    vector_value: Union[str, Sequence[float], None],
     distance_value: float,
     event_timestamp: datetime,
     entity_key_serialization_version: int,
@@ -1496,10 +1791,7 @@ def _build_retrieve_online_document_record(
     else:
         feature_value_proto.ParseFromString(feature_value)
 
-    if isinstance(vector_value, str):
-        vector_value_proto = ValueProto(string_val=vector_value)
-    else:
-        vector_value_proto = ValueProto(float_list_val=FloatListProto(val=vector_value))
+    vector_value_proto = _vector_to_value_proto(vector_value)
 
     distance_value_proto = ValueProto(float_val=distance_value)
     return (
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import List, Optional, Union
 
 import numpy as np
 
@@ -70,18 +70,48 @@ class FeastVectorStore:
         """
         query_list = query_vector.tolist() if query_vector is not None else None
 
-        distance_metric = None
-        for field in self.rag_view.schema:
-            if hasattr(field, "vector_index") and field.vector_index:
-                if hasattr(field, "vector_search_metric"):
-                    distance_metric = field.vector_search_metric
-                    break
-
         return self.store.retrieve_online_documents_v2(
             features=self.features,
             query=query_list,
             query_string=query_string,
             query_image_bytes=query_image_bytes,
             top_k=top_k,
-            distance_metric=distance_metric,
+            distance_metric=self._distance_metric(),
         )
+
+    def query_batch(
+        self,
+        query_vectors: Optional[Union[np.ndarray, List[np.ndarray]]] = None,
+        query_strings: Optional[List[Optional[str]]] = None,
+        top_k: int = 10,
+    ) -> List[OnlineResponse]:
+        """Query the Feast vector store with several text queries at once.
+
+        Args:
+            query_vectors: Optional vectors to use for similarity search, one per query
+            query_strings: Optional string queries for keyword/semantic search, one per query
+            top_k: Number of results to return for each query
+
+        Returns:
+            An OnlineResponse per query
+        """
+        query_list = (
+            [np.asarray(vector).tolist() for vector in query_vectors]
+            if query_vectors is not None
+            else None
+        )
+
+        return self.store.retrieve_online_documents_v2_batch(
+            features=self.features,
+            queries=query_list,
+            query_strings=query_strings,
+            top_k=top_k,
+            distance_metric=self._distance_metric(),
+        )
+
+    def _distance_metric(self) -> Optional[str]:
+        for field in self.rag_view.schema:
+            if hasattr(field, "vector_index") and field.vector_index:
+                if hasattr(field, "vector_search_metric"):
+                    return field.vector_search_metric
+        return None
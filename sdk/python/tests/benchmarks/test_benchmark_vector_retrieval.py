@@ -0,0 +1,51 @@
+from contextlib import ExitStack
+
+import numpy as np
+import pytest
+
+from tests.utils.vector_retrieval_benchmark import (
+    build_index,
+    recall_at_k,
+    synthetic_dataset,
+    vector_backends,
+)
+
+TOP_K = 10
+DATASET = synthetic_dataset(num_vectors=2000, num_queries=50, dimension=32, clusters=8)
+
+
+@pytest.fixture(scope="module")
+def ground_truth():
+    return DATASET.ground_truth(TOP_K)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", vector_backends(), ids=lambda backend: backend.name)
+def test_vector_retrieval(backend, ground_truth, benchmark):
+    """
+    Benchmarks the vector searches of an online store, and checks their recall@k.
+
+    Searches must be much faster than building the index, which catches stores rebuilding their index on
+    every search.
+    """
+    with ExitStack() as stack:
+        try:
+            index = stack.enter_context(build_index(backend, DATASET, TOP_K))
+        except Exception as e:
+            pytest.skip(f"{backend.name} is not available: {e}")
+
+        recall = np.mean(
+            [
+                recall_at_k(index.search(query), neighbors.tolist(), TOP_K)
+                for query, neighbors in zip(DATASET.queries, ground_truth)
+            ]
+        )
+        benchmark.extra_info.update(
+            recall=recall,
+            build_seconds=index.build_seconds,
+            memory_mb=index.memory_mb,
+        )
+        benchmark(index.search, DATASET.queries[0])
+
+        assert recall >= (0.99 if backend.exact else 0.5)
+        assert benchmark.stats.stats.median * 10 < index.build_seconds
@@ -0,0 +1,285 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource, RepoConfig
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Float64
+
+faiss_online_store = pytest.importorskip("feast.infra.online_stores.faiss_online_store")
+FaissOnlineStore = faiss_online_store.FaissOnlineStore
+
+DIMENSION = 4
+
+
+def _repo_config(tmp_path, **kwargs) -> RepoConfig:
+    return RepoConfig(
+        provider="local",
+        project="test",
+        entity_key_serialization_version=3,
+        registry=str(tmp_path / "registry.db"),
+        online_store={
+            "type": "faiss",
+            "dimension": DIMENSION,
+            "index_path": str(tmp_path / "index.faiss"),
+            **kwargs,
+        },
+    )
+
+
+@pytest.fixture
+def feature_view():
+    return FeatureView(
+        name="vectors",
+        entities=[Entity(name="item", join_keys=["item_id"])],
+        schema=[Field(name=f"x{i}", dtype=Float64) for i in range(DIMENSION)],
+        source=FileSource(name="source", path="test.parquet"),
+    )
+
+
+def _entity_key(i: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["item_id"], entity_values=[ValueProto(int64_val=i)]
+    )
+
+
+def _write(store, config, feature_view, vectors, first_key=0):
+    store.online_write_batch(
+        config,
+        feature_view,
+        [
+            (
+                _entity_key(first_key + i),
+                {f"x{j}": ValueProto(double_val=v) for j, v in enumerate(vector)},
+                datetime.now(),
+                None,
+            )
+            for i, vector in enumerate(vectors)
+        ],
+        None,
+    )
+
+
+def _read_vector(store, config, feature_view, i):
+    _, features = store.online_read(config, feature_view, [_entity_key(i)])[0]
+    return [features[f"x{j}"].double_val for j in range(DIMENSION)]
+
+
+@pytest.mark.parametrize("index_type", ["Flat", "HNSW", "IVFFlat", "IVFPQ"])
+def test_upserts_replace_vectors(tmp_path, feature_view, index_type):
+    config = _repo_config(
+        tmp_path, index_type=index_type, nlist=2, nprobe=2, pq_m=2, pq_nbits=4
+    )
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+
+    vectors = np.random.default_rng(0).random((1000, DIMENSION))
+    _write(store, config, feature_view, vectors)
+    _write(store, config, feature_view, [[0.5] * DIMENSION], first_key=3)
+
+    assert _read_vector(store, config, feature_view, 3) == pytest.approx(
+        [0.5] * DIMENSION, abs=0.25
+    )
+
+    def search(vector):
+        results = store.retrieve_online_documents(
+            config, feature_view, [], list(vector), top_k=20
+        )
+        return [result[1].entity_values[0].int64_val for result in results]
+
+    # The previous vector of the entity is no longer searchable.
+    assert 3 not in search(vectors[3])
+    assert search([0.5] * DIMENSION).count(3) == 1
+
+
+@pytest.mark.parametrize("index_type", ["Flat", "HNSW"])
+def test_last_row_of_duplicate_entity_keys_is_written(
+    tmp_path, feature_view, index_type
+):
+    config = _repo_config(tmp_path, index_type=index_type)
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+
+    store.online_write_batch(
+        config,
+        feature_view,
+        [
+            (
+                _entity_key(0),
+                {f"x{j}": ValueProto(double_val=value) for j in range(DIMENSION)},
+                datetime.now(),
+                None,
+            )
+            for value in (2.0, 3.0)
+        ],
+        None,
+    )
+
+    assert store._index.ntotal == 1
+    assert _read_vector(store, config, feature_view, 0) == [3.0] * DIMENSION
+    results = store.retrieve_online_documents(
+        config, feature_view, [], [2.0] * DIMENSION, top_k=5
+    )
+    assert [list(result[3].float_list_val.val) for result in results] == [
+        [3.0] * DIMENSION
+    ]
+
+
+def test_ivf_index_is_trained_once_enough_vectors_are_written(tmp_path, feature_view):
+    config = _repo_config(tmp_path, index_type="IVFFlat", nlist=2)
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+
+    vectors = np.random.default_rng(0).random((100, DIMENSION))
+    _write(store, config, feature_view, vectors[:50])
+    assert not isinstance(store._index, faiss_online_store.faiss.IndexIVF)
+
+    _write(store, config, feature_view, vectors[50:], first_key=50)
+    assert isinstance(store._index, faiss_online_store.faiss.IndexIVFFlat)
+    assert store._index.ntotal == 100
+    assert _read_vector(store, config, feature_view, 7) == pytest.approx(vectors[7])
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_index_is_shared_through_its_file(tmp_path, feature_view, mmap):
+    config = _repo_config(tmp_path, index_type="Flat", mmap=mmap)
+    writer = FaissOnlineStore()
+    writer.update(config, [], [feature_view], [], [], partial=False)
+    _write(writer, config, feature_view, [[1.0, 2.0, 3.0, 4.0]])
+
+    reader = FaissOnlineStore()
+    assert _read_vector(reader, config, feature_view, 0) == [1.0, 2.0, 3.0, 4.0]
+
+    _write(writer, config, feature_view, [[5.0, 6.0, 7.0, 8.0]])
+    assert _read_vector(reader, config, feature_view, 0) == [5.0, 6.0, 7.0, 8.0]
+
+    # Applying the same feature view keeps the index.
+    writer.update(config, [], [feature_view], [], [], partial=False)
+    assert _read_vector(writer, config, feature_view, 0) == [5.0, 6.0, 7.0, 8.0]
+
+
+def test_index_files_are_versioned_with_their_manifest(tmp_path, feature_view):
+    config = _repo_config(tmp_path, index_type="Flat", quantization="float16")
+    writer = FaissOnlineStore()
+    writer.update(config, [], [feature_view], [], [], partial=False)
+    reader = FaissOnlineStore()
+    _write(writer, config, feature_view, [[1.0, 2.0, 3.0, 4.0]])
+    assert _read_vector(reader, config, feature_view, 0) == [1.0, 2.0, 3.0, 4.0]
+
+    for i in range(1, 4):
+        _write(writer, config, feature_view, [[float(i)] * DIMENSION], first_key=i)
+
+    # Only the saved version and the previous one are kept.
+    assert sorted(path.name for path in tmp_path.glob("index.faiss*")) == [
+        "index.faiss.4",
+        "index.faiss.4.vectors.npy",
+        "index.faiss.5",
+        "index.faiss.5.vectors.npy",
+        "index.faiss.json",
+    ]
+    # The reader loads the version of the manifest along with its entity keys.
+    assert _read_vector(reader, config, feature_view, 3) == [3.0] * DIMENSION
+    assert reader._index.ntotal == len(reader._in_memory_store.entity_keys) == 4
+
+    writer.teardown(config, [feature_view], [])
+    assert list(tmp_path.glob("index.faiss*")) == []
+
+
+def test_batched_retrieval(tmp_path, feature_view):
+    config = _repo_config(tmp_path, index_type="Flat")
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+    vectors = np.eye(DIMENSION)
+    _write(store, config, feature_view, vectors)
+
+    results = store.retrieve_online_documents_batch(
+        config, feature_view, [], vectors.tolist(), top_k=1
+    )
+
+    assert [query_results[0][4].float_val for query_results in results] == [0.0] * 4
+    assert [
+        list(query_results[0][3].float_list_val.val) for query_results in results
+    ] == vectors.tolist()
+
+
+def test_batched_retrieval_v2(tmp_path, feature_view):
+    config = _repo_config(tmp_path, index_type="Flat")
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+    _write(store, config, feature_view, np.eye(DIMENSION))
+
+    results = store.retrieve_online_documents_v2_batch(
+        config, feature_view, ["x0", "x1"], [[0, 1, 0, 0], [1, 0, 0, 0]], top_k=2
+    )
+
+    assert [
+        [entity_key.entity_values[0].int64_val for _, entity_key, _ in query_results]
+        for query_results in results
+    ] == [[1, 0], [0, 1]]
+    _, _, features = results[1][0]
+    assert set(features) == {"x0", "x1", "distance"}
+    assert features["x0"].double_val == 1.0
+    assert features["distance"].float_val == 0.0
+
+
+@pytest.mark.parametrize(
+    "index_type, quantization",
+    [
+        ("Flat", "int8"),
+        ("Flat", "float16"),
+        ("Flat", "binary"),
+        ("HNSW", "int8"),
+        ("IVFFlat", "int8"),
+    ],
+)
+def test_quantized_indexes_are_rescored_with_full_precision_vectors(
+    tmp_path, feature_view, index_type, quantization
+):
+    config = _repo_config(
+        tmp_path, index_type=index_type, quantization=quantization, nlist=2, nprobe=2
+    )
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+    vectors = np.random.default_rng(0).uniform(-1, 1, (100, DIMENSION))
+    _write(store, config, feature_view, vectors)
+
+    assert store._vectors.shape == (100, DIMENSION)
+    assert _read_vector(store, config, feature_view, 7) == pytest.approx(vectors[7])
+
+    results = store.retrieve_online_documents_v2(
+        config, feature_view, ["x0"], list(vectors[7]), top_k=3
+    )
+    _, entity_key, features = results[0]
+    assert entity_key.entity_values[0].int64_val == 7
+    assert features["distance"].float_val == pytest.approx(0.0, abs=1e-6)
+    distances = [features["distance"].float_val for _, _, features in results]
+    assert distances == sorted(distances)
+
+    reader = FaissOnlineStore()
+    assert _read_vector(reader, config, feature_view, 7) == pytest.approx(vectors[7])
+
+
+def test_quantized_ivf_index_is_trained_on_full_precision_vectors(
+    tmp_path, feature_view
+):
+    config = _repo_config(tmp_path, index_type="IVFFlat", nlist=2, quantization="int8")
+    store = FaissOnlineStore()
+    store.update(config, [], [feature_view], [], [], partial=False)
+    _write(
+        store, config, feature_view, np.random.default_rng(0).random((100, DIMENSION))
+    )
+
+    assert isinstance(store._index, faiss_online_store.faiss.IndexIVFScalarQuantizer)
+    assert store._index.ntotal == 100
+
+
+@pytest.mark.parametrize(
+    "index_type, quantization", [("HNSW", "binary"), ("IVFPQ", "int8")]
+)
+def test_unsupported_quantizations(tmp_path, feature_view, index_type, quantization):
+    config = _repo_config(tmp_path, index_type=index_type, quantization=quantization)
+
+    with pytest.raises(ValueError):
+        FaissOnlineStore().update(config, [], [feature_view], [], [], partial=False)
@@ -0,0 +1,88 @@
+import pytest
+
+from feast.infra.online_stores.hybrid_search import (
+    HybridFusion,
+    fuse_documents,
+    fuse_rankings,
+    retrieve_hybrid_documents,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+
+
+def _document(i: int, **features):
+    return (
+        None,
+        EntityKeyProto(join_keys=["item_id"], entity_values=[ValueProto(int64_val=i)]),
+        {name: ValueProto(double_val=value) for name, value in features.items()},
+    )
+
+
+def test_reciprocal_rank_fusion():
+    fused = fuse_rankings(
+        [("a", 0.1), ("b", 0.2), ("c", 0.3)],
+        [("c", 9.0), ("b", 5.0)],
+        HybridFusion(rrf_k=1),
+        top_k=2,
+    )
+
+    # b: 0.5 * (1/3 + 1/3), c: 0.5 * (1/4 + 1/2), a: 0.5 * 1/2
+    assert fused == [("c", pytest.approx(0.375)), ("b", pytest.approx(1 / 3))]
+
+
+def test_weighted_fusion_normalizes_each_ranking():
+    fusion = HybridFusion(method="weighted", vector_weight=0.8)
+    vector_ranking = [("a", 0.0), ("b", 5.0), ("c", 10.0)]
+    text_ranking = [("c", 0.9), ("a", 0.3)]
+
+    assert fuse_rankings(vector_ranking, text_ranking, fusion, top_k=3) == [
+        ("a", pytest.approx(0.8)),
+        ("b", pytest.approx(0.4)),
+        ("c", pytest.approx(0.2)),
+    ]
+    # Rankings with a single score give every candidate the full weight.
+    assert fuse_rankings([("a", 3.0)], [], fusion, top_k=3) == [
+        ("a", pytest.approx(0.8))
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"method": "max"}, {"vector_weight": 1.5}, {"rrf_k": -1}, {"oversample": 0}],
+)
+def test_invalid_fusion(kwargs):
+    with pytest.raises(ValueError):
+        HybridFusion(**kwargs)
+
+
+def test_documents_found_by_both_searches_are_merged():
+    vector_documents = [_document(1, distance=0.1), _document(2, distance=0.2)]
+    text_documents = [_document(2, text_rank=0.9, title=1.0)]
+
+    fused = fuse_documents(vector_documents, text_documents, HybridFusion(), top_k=2)
+
+    assert [entity_key.entity_values[0].int64_val for _, entity_key, _ in fused] == [
+        2,
+        1,
+    ]
+    assert set(fused[0][2]) == {"distance", "text_rank", "title", "hybrid_score"}
+    assert (
+        fused[0][2]["hybrid_score"].double_val > fused[1][2]["hybrid_score"].double_val
+    )
+
+
+def test_searches_retrieve_oversampled_candidates():
+    calls = []
+
+    def retrieve(embedding, query_string, limit):
+        calls.append((embedding, query_string, limit))
+        return [_document(i, distance=i) for i in range(limit)]
+
+    fused = retrieve_hybrid_documents(
+        retrieve, [0.1], "feast", top_k=2, fusion=HybridFusion(oversample=3)
+    )
+
+    assert sorted(calls, key=str) == sorted(
+        [([0.1], None, 6), (None, "feast", 6)], key=str
+    )
+    assert len(fused) == 2
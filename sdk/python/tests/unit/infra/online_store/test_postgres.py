@@ -0,0 +1,194 @@
+import pytest
+from psycopg import sql
+
+from feast import Field
+from feast.infra.online_stores.postgres_online_store.postgres import (
+    PostgreSQLOnlineStoreConfig,
+    _create_vector_index,
+    _hybrid_candidates_query,
+    _nearest_vectors,
+    _vector_distance,
+    _vector_search_settings,
+)
+from feast.types import Array, Float32
+
+
+def _config(**kwargs) -> PostgreSQLOnlineStoreConfig:
+    return PostgreSQLOnlineStoreConfig(
+        host="localhost",
+        database="feast",
+        user="feast",
+        password="feast",
+        vector_enabled=True,
+        **kwargs,
+    )
+
+
+def _embedding_field(**kwargs) -> Field:
+    return Field(
+        name="embedding",
+        dtype=Array(Float32),
+        vector_index=True,
+        vector_length=3,
+        **kwargs,
+    )
+
+
+def _normalize(statement) -> str:
+    return " ".join(statement.as_string(None).split())
+
+
+def test_hnsw_index_is_partial_and_matches_the_field_metric():
+    statement = _create_vector_index(
+        _config(vector_index_type="hnsw", hnsw_m=32),
+        "project_docs",
+        _embedding_field(vector_search_metric="COSINE"),
+    )
+
+    assert _normalize(statement) == (
+        'CREATE INDEX IF NOT EXISTS "project_docs_embedding_hnsw_cosine" ON "project_docs" '
+        "USING hnsw ((vector_value::vector(3)) vector_cosine_ops) WITH (m = 32, ef_construction = 64) "
+        "WHERE feature_name = 'embedding';"
+    )
+
+
+def test_ivfflat_index():
+    statement = _create_vector_index(
+        _config(vector_index_type="ivfflat", ivfflat_lists=1000),
+        "project_docs",
+        _embedding_field(),
+    )
+
+    assert "USING ivfflat ((vector_value::vector(3)) vector_l2_ops)" in _normalize(
+        statement
+    )
+    assert "WITH (lists = 1000)" in _normalize(statement)
+
+
+@pytest.mark.parametrize(
+    "config, field",
+    [
+        (
+            _config(vector_index_type="ivfflat"),
+            _embedding_field(vector_search_metric="L1"),
+        ),
+        (
+            _config(vector_index_type="hnsw"),
+            Field(name="embedding", dtype=Array(Float32), vector_index=True),
+        ),
+    ],
+)
+def test_unsupported_indexes(config, field):
+    with pytest.raises(ValueError):
+        _create_vector_index(config, "project_docs", field)
+
+
+def test_search_uses_the_index_expression():
+    distance, vector_filter = _vector_distance(_embedding_field(), "cosine")
+
+    assert _normalize(distance) == "(vector_value::vector(3)) <=> %s::vector"
+    assert _normalize(vector_filter) == "WHERE feature_name = 'embedding'"
+
+
+def test_batched_search_compares_each_query_embedding():
+    distance, _ = _vector_distance(
+        _embedding_field(), "L2", query=sql.SQL("q.embedding")
+    )
+
+    assert _normalize(distance) == "(vector_value::vector(3)) <-> q.embedding::vector"
+
+
+def test_search_settings():
+    assert _vector_search_settings(_config()) == {}
+    assert _vector_search_settings(_config(hnsw_ef_search=100, ivfflat_probes=10)) == {
+        "hnsw.ef_search": 100,
+        "ivfflat.probes": 10,
+    }
+
+
+def test_hybrid_candidates_are_ranked_by_both_searches():
+    statement = _normalize(
+        _hybrid_candidates_query(
+            "project_docs",
+            _embedding_field(),
+            "L2",
+            candidates=20,
+            rescore_oversample=None,
+            text_search=True,
+        )
+    )
+
+    assert statement.startswith(
+        "( SELECT 'vector' AS search, entity_key, distance AS score FROM ( SELECT entity_key, feature_name, "
+        "value, vector_value, (vector_value::vector(3)) <-> %s::vector AS distance, event_ts, created_ts "
+        "FROM \"project_docs\" WHERE feature_name = 'embedding' ORDER BY distance LIMIT 20 ) d ) UNION ALL"
+    )
+    assert "GROUP BY entity_key ORDER BY score DESC LIMIT 20" in statement
+    assert "UNION ALL" not in _normalize(
+        _hybrid_candidates_query(
+            "project_docs",
+            _embedding_field(),
+            "L2",
+            candidates=20,
+            rescore_oversample=None,
+            text_search=False,
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "quantization, expected",
+    [
+        (
+            "float16",
+            'CREATE INDEX IF NOT EXISTS "project_docs_embedding_hnsw_cosine_float16" ON "project_docs" '
+            "USING hnsw ((vector_value::halfvec(3)) halfvec_cosine_ops)",
+        ),
+        (
+            "binary",
+            'CREATE INDEX IF NOT EXISTS "project_docs_embedding_hnsw_cosine_binary" ON "project_docs" '
+            "USING hnsw ((binary_quantize(vector_value::vector(3))::bit(3)) bit_hamming_ops)",
+        ),
+    ],
+)
+def test_quantized_indexes(quantization, expected):
+    statement = _create_vector_index(
+        _config(vector_index_type="hnsw"),
+        "project_docs",
+        _embedding_field(
+            vector_search_metric="COSINE", vector_quantization=quantization
+        ),
+    )
+
+    assert _normalize(statement).startswith(expected)
+
+
+def test_int8_quantization_is_not_supported():
+    with pytest.raises(ValueError):
+        _create_vector_index(
+            _config(vector_index_type="hnsw"),
+            "project_docs",
+            _embedding_field(vector_quantization="int8"),
+        )
+
+
+def test_quantized_search_rescores_candidates_with_full_precision_vectors():
+    statement = _normalize(
+        _nearest_vectors(
+            "project_docs",
+            _embedding_field(vector_quantization="binary"),
+            "L2",
+            top_k=5,
+            rescore_oversample=10,
+        )
+    )
+
+    assert statement.startswith(
+        "SELECT d.* FROM (SELECT %s::vector AS embedding) q CROSS JOIN LATERAL ("
+    )
+    assert (
+        "ORDER BY (binary_quantize(vector_value::vector(3))::bit(3)) <~> "
+        "binary_quantize(q.embedding::vector(3))::bit(3) LIMIT 50 ) candidates"
+    ) in statement
+    assert statement.endswith("ORDER BY distance LIMIT 5 ) d")
+    assert "(vector_value::vector(3)) <-> q.embedding::vector AS distance" in statement
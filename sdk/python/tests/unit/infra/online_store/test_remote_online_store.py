@@ -1,12 +1,21 @@
+import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
 
 from feast import Entity, FeatureView, Field, FileSource, RepoConfig
 from feast.infra.online_stores.remote import RemoteOnlineStore, RemoteOnlineStoreConfig
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FeatureList,
+    FieldStatus,
+    GetOnlineFeaturesResponse,
+    GetOnlineFeaturesResponseMetadata,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import RepeatedValue
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.types import Float32, Int64, String
 from feast.value_type import ValueType
@@ -351,3 +360,190 @@ class TestRemoteOnlineStoreRetrieveDocuments:
 
         assert remote_store._is_feature_present(response_json, 0, 0)
         assert not remote_store._is_feature_present(response_json, 0, 1)
+
+
+class TestRemoteOnlineStoreRead:
+    """Test suite for online_read and get_online_features."""
+
+    @pytest.fixture
+    def config(self):
+        return RepoConfig(
+            project="test_project",
+            online_store=RemoteOnlineStoreConfig(
+                type="remote", path="http://localhost:6566"
+            ),
+            registry="dummy_registry",
+        )
+
+    @pytest.fixture
+    def feature_view(self):
+        entity = Entity(
+            name="user_id", description="User ID", value_type=ValueType.INT64
+        )
+        return FeatureView(
+            name="test_feature_view",
+            entities=[entity],
+            ttl=timedelta(days=1),
+            schema=[
+                Field(name="user_id", dtype=Int64),
+                Field(name="feature1", dtype=Float32),
+            ],
+            source=FileSource(path="test.parquet", timestamp_field="event_timestamp"),
+        )
+
+    @pytest.fixture
+    def response_proto(self):
+        timestamp = Timestamp(seconds=1672531200)
+        return GetOnlineFeaturesResponse(
+            metadata=GetOnlineFeaturesResponseMetadata(
+                feature_names=FeatureList(val=["user_id", "feature1"])
+            ),
+            results=[
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[ValueProto(int64_val=1), ValueProto(int64_val=2)],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.PRESENT],
+                    event_timestamps=[timestamp, timestamp],
+                ),
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[ValueProto(float_val=0.5), ValueProto()],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.NOT_FOUND],
+                    event_timestamps=[timestamp, timestamp],
+                ),
+            ],
+        )
+
+    @staticmethod
+    def _entity_keys():
+        return [
+            EntityKeyProto(
+                join_keys=["user_id"], entity_values=[ValueProto(int64_val=i)]
+            )
+            for i in (1, 2)
+        ]
+
+    @staticmethod
+    def _expected_rows():
+        return [
+            (
+                datetime(2023, 1, 1, tzinfo=timezone.utc),
+                {"feature1": ValueProto(float_val=0.5)},
+            ),
+            (datetime(2023, 1, 1, tzinfo=timezone.utc), {"feature1": ValueProto()}),
+        ]
+
+    @patch("feast.infra.online_stores.remote.get_remote_online_features")
+    def test_online_read_protobuf(
+        self, mock_get_remote_online_features, config, feature_view, response_proto
+    ):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/x-protobuf"}
+        mock_response.content = response_proto.SerializeToString()
+        mock_get_remote_online_features.return_value = mock_response
+
+        result = RemoteOnlineStore().online_read(
+            config=config,
+            table=feature_view,
+            entity_keys=self._entity_keys(),
+            requested_features=["feature1"],
+        )
+
+        assert result == self._expected_rows()
+
+    @patch("feast.infra.online_stores.remote.get_remote_online_features")
+    def test_online_read_json_uses_declared_types(
+        self, mock_get_remote_online_features, config, feature_view
+    ):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.text = json.dumps(
+            {
+                "metadata": {"feature_names": ["user_id", "feature1"]},
+                "results": [
+                    {
+                        "values": [1, 2],
+                        "statuses": ["PRESENT", "PRESENT"],
+                        "event_timestamps": [
+                            "2023-01-01T00:00:00Z",
+                            "2023-01-01T00:00:00Z",
+                        ],
+                    },
+                    {
+                        "values": [0.5, None],
+                        "statuses": ["PRESENT", "NOT_FOUND"],
+                        "event_timestamps": [
+                            "2023-01-01T00:00:00Z",
+                            "2023-01-01T00:00:00Z",
+                        ],
+                    },
+                ],
+            }
+        )
+        mock_get_remote_online_features.return_value = mock_response
+
+        result = RemoteOnlineStore().online_read(
+            config=config,
+            table=feature_view,
+            entity_keys=self._entity_keys(),
+            requested_features=["feature1"],
+        )
+
+        # Float32 features are decoded as float values rather than inferred as doubles.
+        assert result == self._expected_rows()
+
+    @patch("feast.infra.online_stores.remote.get_remote_online_features")
+    def test_get_online_features_single_request(
+        self, mock_get_remote_online_features, config, response_proto
+    ):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/x-protobuf"}
+        mock_response.content = response_proto.SerializeToString()
+        mock_get_remote_online_features.return_value = mock_response
+
+        response = RemoteOnlineStore().get_online_features(
+            config=config,
+            features=["test_feature_view:feature1", "other_view:feature2"],
+            entity_rows=[{"user_id": 1}, {"user_id": 2}],
+            registry=Mock(),
+            project="test_project",
+        )
+
+        mock_get_remote_online_features.assert_called_once()
+        assert json.loads(mock_get_remote_online_features.call_args[1]["req_body"]) == {
+            "features": ["test_feature_view:feature1", "other_view:feature2"],
+            "entities": {"user_id": [1, 2]},
+            "full_feature_names": False,
+        }
+        assert response.proto == response_proto
+
+    async def test_get_online_features_async(self, config, response_proto):
+        httpx = pytest.importorskip("httpx")
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=response_proto.SerializeToString(),
+                headers={"content-type": "application/x-protobuf"},
+            )
+
+        store = RemoteOnlineStore()
+        store._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        store._async_client_loop = asyncio.get_running_loop()
+
+        response = await store.get_online_features_async(
+            config=config,
+            features=["test_feature_view:feature1"],
+            entity_rows={"user_id": RepeatedValue(val=[ValueProto(int64_val=1)])},
+            registry=Mock(),
+            project="test_project",
+        )
+        await store.close()
+
+        assert len(requests) == 1
+        assert requests[0].headers["accept"] == "application/x-protobuf"
+        assert json.loads(requests[0].content)["entities"] == {"user_id": [1]}
+        assert response.proto == response_proto
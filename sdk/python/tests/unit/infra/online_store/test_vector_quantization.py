@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource
+from feast.infra.online_stores.sqlite import _quantize_vector, _vector_quantization
+from feast.infra.online_stores.vector_quantization import (
+    exact_distances,
+    rescore,
+    rescore_candidates,
+)
+from feast.types import Array, Float32
+
+VECTORS = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [-1.0, 0.0]])
+
+
+def _feature_view(quantization):
+    return FeatureView(
+        name="docs",
+        entities=[Entity(name="item", join_keys=["item_id"])],
+        schema=[
+            Field(
+                name="embedding",
+                dtype=Array(Float32),
+                vector_index=True,
+                vector_quantization=quantization,
+            )
+        ],
+        source=FileSource(name="source", path="test.parquet"),
+    )
+
+
+def test_rescore_candidates():
+    assert rescore_candidates(5, None) == 20
+    assert rescore_candidates(5, 10) == 50
+    assert rescore_candidates(5, 0) == 20
+
+
+@pytest.mark.parametrize(
+    "metric, expected_order",
+    [("L2", [0, 2, 1]), ("COSINE", [2, 0, 1]), ("IP", [2, 0, 1])],
+)
+def test_rescore_ranks_candidates_by_exact_distance(metric, expected_order):
+    order, distances = rescore([1.0, 0.5], VECTORS, metric, top_k=3)
+
+    assert order.tolist() == expected_order
+    assert distances.tolist() == pytest.approx(
+        exact_distances([1.0, 0.5], VECTORS, metric)[expected_order].tolist()
+    )
+
+
+def test_exact_distances():
+    assert exact_distances([1.0, 0.0], VECTORS, "L2").tolist() == [0.0, 2.0, 1.0, 4.0]
+    assert exact_distances([1.0, 0.0], VECTORS, "cosine").tolist() == pytest.approx(
+        [1.0, 0.0, 2**-0.5, -1.0]
+    )
+    with pytest.raises(ValueError):
+        exact_distances([1.0, 0.0], VECTORS, "L1")
+
+
+def test_sqlite_quantization():
+    assert _vector_quantization(_feature_view("int8")) == "int8"
+    assert _quantize_vector("?", "binary") == "vec_quantize_binary(?)"
+    with pytest.raises(ValueError):
+        _vector_quantization(_feature_view("float16"))
+
+
+def test_milvus_quantized_indexes_and_rescoring():
+    milvus = pytest.importorskip("feast.infra.online_stores.milvus_online_store.milvus")
+    online_store = milvus.MilvusOnlineStoreConfig(index_type="IVF_FLAT", nlist=16)
+    field = _feature_view("binary").schema[0]
+
+    assert milvus._vector_index_params(field, online_store) == (
+        "IVF_RABITQ",
+        {"nlist": 16},
+    )
+    assert milvus._is_quantized(_feature_view("int8"), "embedding")
+    assert not milvus._is_quantized(_feature_view(None), "embedding")
+
+    hits = [
+        {"id": i, "distance": 0.0, "entity": {"embedding": vector.tolist()}}
+        for i, vector in enumerate(VECTORS)
+    ]
+    rescored = milvus._rescore_hits(hits, "embedding", [-1.0, 0.1], "L2", top_k=2)
+
+    assert [hit["id"] for hit in rescored] == [3, 1]
+    assert rescored[0]["distance"] == pytest.approx(0.01)
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+import pytest
+
+from feast.entity import Entity
+from feast.infra.registry.registry import Registry
+from feast.infra.registry.snapshot import (
+    RegistrySnapshotPublisher,
+    RegistrySnapshotReader,
+)
+from feast.repo_config import RegistryConfig
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = Registry(
+        "project",
+        RegistryConfig(path=str(tmp_path / "registry.db"), cache_ttl_seconds=60),
+        None,
+    )
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+    return registry
+
+
+def _worker_registry(tmp_path):
+    worker = Registry(
+        "project",
+        RegistryConfig(path=str(tmp_path / "worker.db"), cache_ttl_seconds=60),
+        None,
+    )
+    RegistrySnapshotReader.attach(worker)
+    return worker
+
+
+def test_snapshots_are_loaded_when_their_version_changes(registry, tmp_path):
+    publisher = RegistrySnapshotPublisher(str(tmp_path / "registry.snapshot"))
+    reader = RegistrySnapshotReader(publisher.path)
+    worker = _worker_registry(tmp_path)
+
+    assert publisher.publish(registry.cached_registry_proto)
+    assert reader.load_if_changed(worker)
+    assert [e.name for e in worker.list_entities("project", allow_cache=True)] == [
+        "driver"
+    ]
+
+    # Unchanged registries are neither published nor loaded again.
+    loaded = worker.cached_registry_proto
+    assert not publisher.publish(registry.cached_registry_proto)
+    assert not reader.load_if_changed(worker)
+    assert worker.cached_registry_proto is loaded
+
+    registry.apply_entity(Entity(name="rider", join_keys=["rider_id"]), "project")
+    assert publisher.publish(registry.cached_registry_proto)
+    assert publisher.version == 2
+    assert reader.load_if_changed(worker)
+    assert sorted(
+        e.name for e in worker.list_entities("project", allow_cache=True)
+    ) == [
+        "driver",
+        "rider",
+    ]
+
+
+def test_forked_registries_skip_the_snapshot_they_hold(registry, tmp_path):
+    publisher = RegistrySnapshotPublisher(str(tmp_path / "registry.snapshot"))
+    publisher.publish(registry.cached_registry_proto)
+    reader = RegistrySnapshotReader(publisher.path, loaded_version=publisher.version)
+
+    assert not reader.load_if_changed(registry)
+
+
+def test_attached_registries_never_refresh_by_themselves(tmp_path):
+    worker = _worker_registry(tmp_path)
+
+    assert worker.cached_registry_proto_ttl == timedelta(seconds=0)
+    assert worker.cache_mode == "thread"
+
+
+def test_missing_snapshot_is_not_loaded(registry, tmp_path):
+    reader = RegistrySnapshotReader(str(tmp_path / "missing.snapshot"))
+
+    assert not reader.load_if_changed(registry)
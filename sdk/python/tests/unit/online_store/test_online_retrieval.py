@@ -4,7 +4,7 @@ import random
 import sqlite3
 import sys
 import time
-from typing import Any
+from typing import Any, List
 
 import numpy as np
 import pandas as pd
@@ -12,14 +12,14 @@ import pytest
 import sqlite_vec
 from pandas.testing import assert_frame_equal
 
-from feast import FeatureStore, RepoConfig
+from feast import FeatureStore, FeatureView, Field, RepoConfig
 from feast.errors import FeatureViewNotFoundException
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import FloatList as FloatListProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RegistryConfig
 from feast.torch_wrapper import get_torch
-from feast.types import ValueType
+from feast.types import String, ValueType
 from feast.utils import _utc_now
 from tests.integration.feature_repos.universal.feature_views import TAGS
 from tests.utils.cli_repo_creator import CliRunner, get_example_repo
@@ -1043,6 +1043,201 @@ def test_sqlite_get_online_documents_v2_search() -> None:
         assert result["distance"] == [-1.8458267450332642, -1.8458267450332642]
 
 
+def test_sqlite_text_search_index_is_maintained_on_write() -> None:
+    """Test that rewritten documents replace their entries in the text search index"""
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        store.config.online_store.text_search_enabled = True
+        store.config.entity_key_serialization_version = 3
+        document_embeddings_fv = store.get_feature_view(name="document_embeddings")
+        provider = store._get_provider()
+
+        def write(content: str) -> None:
+            provider.online_write_batch(
+                config=store.config,
+                table=document_embeddings_fv,
+                data=[
+                    (
+                        EntityKeyProto(
+                            join_keys=["item_id"],
+                            entity_values=[ValueProto(int64_val=i)],
+                        ),
+                        {
+                            "Embeddings": ValueProto(
+                                float_list_val=FloatListProto(val=[0.1] * 8)
+                            ),
+                            "content": ValueProto(string_val=f"{content} {i}"),
+                            "title": ValueProto(string_val=f"Title {i}"),
+                        },
+                        _utc_now(),
+                        _utc_now(),
+                    )
+                    for i in range(3)
+                ],
+                progress=None,
+            )
+
+        def search(query_string: str) -> List[str]:
+            return store.retrieve_online_documents_v2(
+                features=["document_embeddings:content"],
+                query_string=query_string,
+                top_k=10,
+            ).to_dict()["content"]
+
+        write("original")
+        assert sorted(search("content: original")) == [
+            "original 0",
+            "original 1",
+            "original 2",
+        ]
+
+        write("rewritten")
+        assert search("content: original") == []
+        assert sorted(search("content: rewritten")) == [
+            "rewritten 0",
+            "rewritten 1",
+            "rewritten 2",
+        ]
+
+        conn = provider._online_store._conn
+        fts_table = f"{store.project}_document_embeddings_fts"
+        assert conn.execute(f"SELECT count(*) FROM {fts_table}").fetchone() == (3,)
+
+        store.apply([], objects_to_delete=[document_embeddings_fv], partial=False)
+        assert (
+            conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = ?", (fts_table,)
+            ).fetchone()
+            is None
+        )
+
+
+def test_sqlite_text_search_index_follows_feature_view_schema() -> None:
+    """Test that the text search index is rebuilt when the string fields of a feature view change"""
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        store.config.online_store.text_search_enabled = True
+        store.config.entity_key_serialization_version = 3
+        provider = store._get_provider()
+
+        def write(feature_view: FeatureView, values: dict) -> None:
+            provider.online_write_batch(
+                config=store.config,
+                table=feature_view,
+                data=[
+                    (
+                        EntityKeyProto(
+                            join_keys=["item_id"],
+                            entity_values=[ValueProto(int64_val=i)],
+                        ),
+                        {
+                            name: ValueProto(string_val=f"{value} {i}")
+                            for name, value in values.items()
+                        },
+                        _utc_now(),
+                        _utc_now(),
+                    )
+                    for i in range(2)
+                ],
+                progress=None,
+            )
+
+        document_embeddings_fv = store.get_feature_view(name="document_embeddings")
+        write(document_embeddings_fv, {"content": "original", "title": "Title"})
+
+        # The title is replaced with a summary.
+        store.apply(
+            [
+                FeatureView(
+                    name="document_embeddings",
+                    entities=[store.get_entity("item_id")],
+                    schema=[
+                        f for f in document_embeddings_fv.schema if f.name != "title"
+                    ]
+                    + [Field(name="summary", dtype=String)],
+                    source=document_embeddings_fv.batch_source,
+                    ttl=document_embeddings_fv.ttl,
+                )
+            ]
+        )
+        document_embeddings_fv = store.get_feature_view(name="document_embeddings")
+        write(document_embeddings_fv, {"content": "rewritten", "summary": "concise"})
+
+        result = store.retrieve_online_documents_v2(
+            features=[
+                "document_embeddings:content",
+                "document_embeddings:summary",
+            ],
+            query_string="summary: concise",
+            top_k=10,
+        ).to_dict()
+        assert sorted(result["summary"]) == ["concise 0", "concise 1"]
+        assert sorted(result["content"]) == ["rewritten 0", "rewritten 1"]
+
+        conn = provider._online_store._conn
+        fts_table = f"{store.project}_document_embeddings_fts"
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({fts_table})")]
+        assert columns == ["entity_key", "fv_rowid", "content", "summary"]
+
+
+def test_sqlite_retrieve_online_documents_v2_batch() -> None:
+    """Test that a batch of keyword searches returns the documents of each query"""
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        store.config.online_store.text_search_enabled = True
+        store.config.entity_key_serialization_version = 3
+        document_embeddings_fv = store.get_feature_view(name="document_embeddings")
+        store._get_provider().online_write_batch(
+            config=store.config,
+            table=document_embeddings_fv,
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["item_id"],
+                        entity_values=[ValueProto(int64_val=i)],
+                    ),
+                    {
+                        "Embeddings": ValueProto(
+                            float_list_val=FloatListProto(val=[0.1] * 8)
+                        ),
+                        "content": ValueProto(string_val=content),
+                        "title": ValueProto(string_val=f"Title {i}"),
+                    },
+                    _utc_now(),
+                    _utc_now(),
+                )
+                for i, content in enumerate(["red apple", "green apple", "red car"])
+            ],
+            progress=None,
+        )
+
+        responses = store.retrieve_online_documents_v2_batch(
+            features=["document_embeddings:content"],
+            query_strings=["content: car", "content: apple", "content: boat"],
+            top_k=10,
+        )
+
+        assert [sorted(r.to_dict()["content"]) for r in responses] == [
+            ["red car"],
+            ["green apple", "red apple"],
+            [],
+        ]
+
+        with pytest.raises(ValueError):
+            store.retrieve_online_documents_v2_batch(
+                features=["document_embeddings:content"],
+                queries=[[0.1] * 8],
+                query_strings=["content: car", "content: apple"],
+                top_k=10,
+            )
+
+
 @pytest.mark.skip(reason="Skipping this test as CI struggles with it")
 def test_local_milvus() -> None:
     import random
@@ -1283,6 +1478,26 @@ def test_milvus_lite_retrieve_online_documents_v2() -> None:
                 f"Embedding {i} contains non-numeric values: {[type(x) for x in embedding[:5]]}"
             )
 
+        # A batch of queries is searched at once, with the results of each query in order
+        batch_results = store.retrieve_online_documents_v2_batch(
+            features=[
+                "embedded_documents:item_id",
+                "embedded_documents:sentence_chunks",
+            ],
+            queries=np.stack([query_embedding, query_embedding + 5]),
+            top_k=3,
+        )
+        assert len(batch_results) == 2
+        assert (
+            batch_results[0].to_dict()["item_id"]
+            == store.retrieve_online_documents_v2(
+                features=["embedded_documents:item_id"],
+                query=query_embedding,
+                top_k=3,
+            ).to_dict()["item_id"]
+        )
+        assert len(batch_results[1].to_dict()["sentence_chunks"]) == 3
+
 
 def test_milvus_stored_writes_with_explode() -> None:
     """
@@ -1714,3 +1929,20 @@ def test_milvus_keyword_search() -> None:
         assert len(result_hybrid["content"]) > 0
         assert any("Feast" in content for content in result_hybrid["content"])
         assert len(result_hybrid["vector"]) > 0
+
+        # Test hybrid search fusing the vector and keyword search rankings
+        result_fused = store.retrieve_online_documents_hybrid(
+            features=[
+                "text_documents:content",
+                "text_documents:title",
+            ],
+            query=list(data[2][1]["vector"].float_list_val.val),
+            query_string="Milvus",
+            top_k=3,
+        ).to_dict()
+
+        assert result_fused["title"][0] == "Using Milvus with Feast"
+        assert len(result_fused["title"]) == 3
+        assert result_fused["hybrid_score"] == sorted(
+            result_fused["hybrid_score"], reverse=True
+        )
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import time
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +12,7 @@ from starlette.authentication import (
 
 from feast.permissions.auth.kubernetes_token_parser import KubernetesTokenParser
 from feast.permissions.auth.oidc_token_parser import OidcTokenParser
+from feast.permissions.auth.token_cache import ValidatedTokenCache
 from feast.permissions.user import User
 
 _CLIENT_ID = "test"
@@ -263,3 +265,74 @@ def test_k8s_inter_server_comm(
             for r in roles:
                 assertpy.assert_that(user.has_matching_role([r])).is_true()
             assertpy.assert_that(user.has_matching_role(["foo"])).is_false()
+
+
+@pytest.mark.parametrize("expired", [False, True])
+@patch(
+    "feast.permissions.auth.oidc_token_parser.OAuth2AuthorizationCodeBearer.__call__"
+)
+@patch("feast.permissions.auth.oidc_token_parser.PyJWKClient.get_signing_key_from_jwt")
+@patch("feast.permissions.auth.oidc_token_parser.jwt.decode")
+@patch("feast.permissions.oidc_service.OIDCDiscoveryService._fetch_discovery_data")
+def test_oidc_validated_tokens_are_cached(
+    mock_discovery_data, mock_jwt, mock_signing_key, mock_oauth2, expired, oidc_config
+):
+    mock_discovery_data.return_value = {
+        "authorization_endpoint": "https://localhost:8080/realms/master/protocol/openid-connect/auth",
+        "token_endpoint": "https://localhost:8080/realms/master/protocol/openid-connect/token",
+        "jwks_uri": "https://localhost:8080/realms/master/protocol/openid-connect/certs",
+    }
+    mock_jwt.return_value = {
+        "preferred_username": "my-name",
+        "resource_access": {_CLIENT_ID: {"roles": ["reader"]}},
+        "exp": time.time() + (-1 if expired else 3600),
+    }
+
+    token_parser = OidcTokenParser(auth_config=oidc_config)
+    for _ in range(2):
+        user = asyncio.run(
+            token_parser.user_details_from_access_token(access_token="aaa-bbb-ccc")
+        )
+        assertpy.assert_that(user.username).is_equal_to("my-name")
+
+    # Tokens are validated again once they expire.
+    assertpy.assert_that(mock_signing_key.call_count).is_equal_to(2 if expired else 1)
+    assertpy.assert_that(mock_oauth2.call_count).is_equal_to(2 if expired else 1)
+
+
+@patch("feast.permissions.auth.kubernetes_token_parser.config.load_incluster_config")
+@patch("feast.permissions.auth.kubernetes_token_parser.jwt.decode")
+@patch(
+    "feast.permissions.auth.kubernetes_token_parser.client.RbacAuthorizationV1Api.list_namespaced_role_binding"
+)
+def test_k8s_validated_tokens_are_cached(
+    mock_rb, mock_jwt, mock_config, rolebindings, monkeypatch, sa_name, sa_namespace
+):
+    monkeypatch.setattr(
+        "feast.permissions.auth.kubernetes_token_parser.KubernetesTokenParser._read_namespace_from_file",
+        lambda self: "my-namespace",
+    )
+    mock_jwt.return_value = {"sub": f"system:serviceaccount:{sa_namespace}:{sa_name}"}
+    mock_rb.return_value = rolebindings["items"]
+
+    token_parser = KubernetesTokenParser()
+    users = [
+        asyncio.run(token_parser.user_details_from_access_token(access_token=token))
+        for token in ["aaa-bbb-ccc", "aaa-bbb-ccc", "ddd-eee-fff"]
+    ]
+
+    assertpy.assert_that({user.username for user in users}).is_equal_to(
+        {f"{sa_namespace}:{sa_name}"}
+    )
+    assertpy.assert_that(mock_rb.call_count).is_equal_to(2)
+
+
+def test_validated_token_cache_is_bounded():
+    cache = ValidatedTokenCache(max_entries=2, ttl_seconds=60)
+    for token in ["a", "b", "c"]:
+        cache.put(token, User(username=token, roles=[]))
+    cache.put("expired", User(username="expired", roles=[]), time.time() - 1)
+
+    assertpy.assert_that(cache.get("a")).is_none()
+    assertpy.assert_that(cache.get("c").username).is_equal_to("c")
+    assertpy.assert_that(cache.get("expired")).is_none()
@@ -1,15 +1,23 @@
+from unittest.mock import Mock
+
 import assertpy
 import pytest
 
 from feast.entity import Entity
 from feast.errors import FeastObjectNotFoundException, FeastPermissionError
+from feast.feature_view import FeatureView
+from feast.infra.registry.base_registry import BaseRegistry
 from feast.permissions.action import READ, AuthzedAction
+from feast.permissions.permission import Permission
+from feast.permissions.policy import RoleBasedPolicy
 from feast.permissions.security_manager import (
+    SecurityManager,
     assert_permissions,
     assert_permissions_to_update,
     permitted_resources,
 )
 from feast.permissions.user import User
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 
 
 @pytest.mark.parametrize(
@@ -326,3 +334,61 @@ def test_update_entity(
     else:
         with pytest.raises(FeastPermissionError):
             assert_permissions_to_update(resource=entity, getter=getter, project="")
+
+
+def test_decisions_are_cached(security_manager, users, feature_views, monkeypatch):
+    monkeypatch.delenv("INTRA_COMMUNICATION_BASE64", False)
+    sm = security_manager
+    sm.set_current_user(users.get("r"))
+    match_resource = Permission.match_resource
+    calls = []
+
+    def counting_match_resource(self, resource):
+        calls.append(self.name)
+        return match_resource(self, resource)
+
+    monkeypatch.setattr(Permission, "match_resource", counting_match_resource)
+
+    for _ in range(3):
+        assertpy.assert_that(
+            sm.assert_permissions(feature_views, AuthzedAction.DESCRIBE)
+        ).is_equal_to(feature_views)
+        with pytest.raises(FeastPermissionError):
+            sm.assert_permissions(feature_views, AuthzedAction.UPDATE)
+
+    # Only the first round evaluates the permissions, for the first resource denied the update.
+    assertpy.assert_that(len(calls)).is_equal_to(
+        (len(feature_views) + 1) * len(sm.permissions)
+    )
+
+
+def test_decisions_are_dropped_on_registry_refresh(users, feature_views, monkeypatch):
+    monkeypatch.delenv("INTRA_COMMUNICATION_BASE64", False)
+    reader = Permission(
+        name="reader",
+        types=FeatureView,
+        policy=RoleBasedPolicy(roles=["reader"]),
+        actions=[AuthzedAction.DESCRIBE],
+    )
+    writer = Permission(
+        name="writer",
+        types=FeatureView,
+        policy=RoleBasedPolicy(roles=["writer"]),
+        actions=[AuthzedAction.DESCRIBE],
+    )
+    registry = Mock(spec=BaseRegistry)
+    registry.cached_registry_proto = RegistryProto()
+    registry.list_permissions = Mock(return_value=[reader])
+    sm = SecurityManager(project="any", registry=registry)
+    sm.set_current_user(users.get("w"))
+
+    for _ in range(2):
+        with pytest.raises(FeastPermissionError):
+            sm.assert_permissions(feature_views, AuthzedAction.DESCRIBE)
+    assertpy.assert_that(registry.list_permissions.call_count).is_equal_to(1)
+
+    registry.cached_registry_proto = RegistryProto(version_id="refreshed")
+    registry.list_permissions = Mock(return_value=[writer])
+    assertpy.assert_that(
+        sm.assert_permissions(feature_views, AuthzedAction.DESCRIBE)
+    ).is_equal_to(feature_views)
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from feast.aggregation import Aggregation
+from feast.aggregation.tiling import (
+    apply_sawtooth_window_tiling,
+    convert_cumulative_to_windowed,
+    deduplicate_keep_latest,
+)
+
+WINDOW = timedelta(minutes=30)
+HOP = timedelta(minutes=5)
+FUNCTIONS = ["sum", "count", "mean", "min", "max", "last", "std"]
+
+
+def _events() -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    num_events = 500
+    start = datetime(2025, 1, 1)
+    return pd.DataFrame(
+        {
+            "customer_id": rng.integers(0, 5, num_events),
+            "event_timestamp": [
+                start + timedelta(seconds=int(s))
+                for s in rng.integers(0, 2 * 3600, num_events)
+            ],
+            "amount": rng.normal(100, 20, num_events).round(2),
+        }
+    )
+
+
+def _expected(events: pd.DataFrame, customer_id: int, window_end: pd.Timestamp):
+    in_window = events[
+        (events["customer_id"] == customer_id)
+        & (events["event_timestamp"] >= window_end - WINDOW)
+        & (events["event_timestamp"] < window_end)
+    ].sort_values("event_timestamp")["amount"]
+    return {
+        "sum": in_window.sum(),
+        "count": len(in_window),
+        "mean": in_window.mean() if len(in_window) else 0.0,
+        "min": in_window.min(),
+        "max": in_window.max(),
+        "last": in_window.iloc[-1] if len(in_window) else np.nan,
+        "std": in_window.std() if len(in_window) > 1 else 0.0,
+    }
+
+
+def _windowed(events: pd.DataFrame) -> pd.DataFrame:
+    aggregations = [
+        Aggregation(column="amount", function=function, time_window=WINDOW)
+        for function in FUNCTIONS
+    ]
+    tiles = apply_sawtooth_window_tiling(
+        df=events,
+        aggregations=aggregations,
+        group_by_keys=["customer_id"],
+        timestamp_col="event_timestamp",
+        window_size=WINDOW,
+        hop_size=HOP,
+    )
+    return convert_cumulative_to_windowed(
+        tiles_df=tiles,
+        entity_keys=["customer_id"],
+        timestamp_col="event_timestamp",
+        window_size=WINDOW,
+        aggregations=aggregations,
+    )
+
+
+def test_windowed_aggregations_match_raw_events():
+    events = _events()
+
+    windowed = _windowed(events)
+
+    # One row per entity and hop, ordered by entity and window end
+    assert len(windowed) == 5 * 24
+    assert windowed["customer_id"].is_monotonic_increasing
+    for _, row in windowed.iterrows():
+        expected = _expected(events, row["customer_id"], row["event_timestamp"])
+        for function in FUNCTIONS:
+            np.testing.assert_allclose(
+                row[f"{function}_amount_1800s"],
+                expected[function],
+                err_msg=f"{function} at {row['event_timestamp']}",
+            )
+
+
+def test_tiles_without_entity_keys_give_no_windows():
+    events = _events()
+    aggregations = [Aggregation(column="amount", function="sum", time_window=WINDOW)]
+    tiles = apply_sawtooth_window_tiling(
+        df=events,
+        aggregations=aggregations,
+        group_by_keys=["customer_id"],
+        timestamp_col="event_timestamp",
+        window_size=WINDOW,
+        hop_size=HOP,
+    )
+
+    def windowed(tiles_df):
+        return convert_cumulative_to_windowed(
+            tiles_df=tiles_df,
+            entity_keys=["customer_id"],
+            timestamp_col="event_timestamp",
+            window_size=WINDOW,
+            aggregations=aggregations,
+        )
+
+    empty = windowed(tiles.assign(customer_id=None))
+
+    assert empty.empty
+    assert list(empty.columns) == list(windowed(tiles).columns)
+
+
+def test_deduplicate_keep_latest():
+    windowed = _windowed(_events())
+
+    latest = deduplicate_keep_latest(windowed, ["customer_id"], "event_timestamp")
+
+    assert latest["customer_id"].tolist() == [0, 1, 2, 3, 4]
+    assert (latest["event_timestamp"] == windowed["event_timestamp"].max()).all()
+
+
+def test_unsupported_aggregation():
+    with pytest.raises(ValueError, match="median"):
+        apply_sawtooth_window_tiling(
+            df=_events(),
+            aggregations=[
+                Aggregation(column="amount", function="median", time_window=WINDOW)
+            ],
+            group_by_keys=["customer_id"],
+            timestamp_col="event_timestamp",
+            window_size=WINDOW,
+            hop_size=HOP,
+        )
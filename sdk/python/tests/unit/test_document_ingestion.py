@@ -0,0 +1,149 @@
+import os
+import threading
+from datetime import timedelta
+
+import pytest
+
+from feast import Entity, FeatureStore, FeatureView, Field, FileSource, RepoConfig
+from feast.document_ingestion import IngestionCheckpoint, TextChunker
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.types import Array, Float32, String, ValueType
+
+DOCUMENTS = [
+    {
+        "document_id": f"doc{i}",
+        "title": f"Document {i}",
+        "text": " ".join(f"word{i}_{j}" for j in range(30)),
+    }
+    for i in range(10)
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test_document_ingestion",
+            registry=os.path.join(tmp_path, "registry.db"),
+            provider="local",
+            entity_key_serialization_version=3,
+            online_store=SqliteOnlineStoreConfig(
+                path=os.path.join(tmp_path, "online.db")
+            ),
+        )
+    )
+    chunk = Entity(name="chunk", join_keys=["chunk_id"], value_type=ValueType.STRING)
+    chunks_fv = FeatureView(
+        name="document_chunks",
+        entities=[chunk],
+        schema=[
+            Field(name="vector", dtype=Array(Float32), vector_index=True),
+            Field(name="text", dtype=String),
+            Field(name="title", dtype=String),
+            Field(name="document_id", dtype=String),
+        ],
+        source=FileSource(
+            path="document_chunks.parquet", timestamp_field="event_timestamp"
+        ),
+        ttl=timedelta(days=1),
+    )
+    store.apply([chunk, chunks_fv])
+    return store
+
+
+def _embed(texts):
+    return [[float(len(text)), float(text.count(" "))] for text in texts]
+
+
+def test_text_chunker_splits_text_at_whitespace_with_overlap():
+    text = " ".join(f"word{i}" for i in range(100))
+
+    chunks = TextChunker(chunk_size=50, chunk_overlap=10)(text)
+
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert all(chunk.split(" ")[0] in text.split(" ") for chunk in chunks)
+    assert chunks[0].startswith("word0 ") and chunks[-1].endswith(" word99")
+    # Each chunk starts with the last words of the previous one.
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.split(" ")[0] in previous.split(" ")
+    assert TextChunker(chunk_size=5, chunk_overlap=0)("abcdefghij") == [
+        "abcde",
+        "fghij",
+    ]
+    assert TextChunker()("   ") == []
+
+
+def test_documents_are_chunked_embedded_and_written(store):
+    result = store.ingest_documents(
+        "document_chunks",
+        DOCUMENTS,
+        embedder=_embed,
+        chunker=TextChunker(chunk_size=100, chunk_overlap=20),
+        embedding_batch_size=3,
+        write_batch_size=5,
+        num_workers=3,
+        max_queue_size=2,
+    )
+
+    chunks = TextChunker(chunk_size=100, chunk_overlap=20)(DOCUMENTS[4]["text"])
+    assert result.documents == 10
+    assert result.chunks == 10 * len(chunks)
+    assert result.skipped_documents == 0
+
+    response = store.get_online_features(
+        features=[
+            "document_chunks:vector",
+            "document_chunks:text",
+            "document_chunks:title",
+        ],
+        entity_rows=[{"chunk_id": f"doc4-{i}"} for i in range(len(chunks))],
+    ).to_dict()
+    assert response["text"] == chunks
+    assert response["title"] == ["Document 4"] * len(chunks)
+    assert response["vector"] == [list(vector) for vector in _embed(chunks)]
+
+
+def test_interrupted_ingestion_is_resumed_from_its_checkpoint(store, tmp_path):
+    checkpoint_path = os.path.join(tmp_path, "checkpoint.jsonl")
+    embedded = []
+    lock = threading.Lock()
+
+    def failing_embed(texts):
+        with lock:
+            embedded.extend(texts)
+            if len(embedded) > 6:
+                raise RuntimeError("Embedding service unavailable")
+        return _embed(texts)
+
+    with pytest.raises(RuntimeError, match="Embedding service unavailable"):
+        store.ingest_documents(
+            "document_chunks",
+            DOCUMENTS,
+            embedder=failing_embed,
+            chunker=TextChunker(chunk_size=1000),
+            embedding_batch_size=1,
+            write_batch_size=1,
+            num_workers=2,
+            checkpoint_path=checkpoint_path,
+        )
+    completed = len(IngestionCheckpoint(checkpoint_path))
+    assert 0 < completed < len(DOCUMENTS)
+
+    result = store.ingest_documents(
+        "document_chunks",
+        DOCUMENTS,
+        embedder=_embed,
+        chunker=TextChunker(chunk_size=1000),
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert result.skipped_documents == completed
+    assert result.documents == len(DOCUMENTS) - completed
+    assert len(IngestionCheckpoint(checkpoint_path)) == len(DOCUMENTS)
+
+
+def test_embedder_must_return_an_embedding_per_text(store):
+    with pytest.raises(ValueError):
+        store.ingest_documents(
+            "document_chunks", DOCUMENTS, embedder=lambda texts: _embed(texts)[:1]
+        )
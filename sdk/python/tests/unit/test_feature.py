@@ -1,5 +1,7 @@
+import pytest
+
 from feast.field import Feature, Field
-from feast.types import Float32
+from feast.types import Array, Float32
 from feast.value_type import ValueType
 
 
@@ -30,3 +32,25 @@ def test_field_serialization_with_description():
 
     field = Field.from_proto(serialized_field)
     assert field.description == expected_description
+
+
+def test_field_serialization_with_vector_quantization():
+    field = Field(
+        name="embedding",
+        dtype=Array(Float32),
+        vector_index=True,
+        vector_quantization="int8",
+    )
+
+    field_from_proto = Field.from_proto(field.to_proto())
+
+    assert field_from_proto.vector_quantization == "int8"
+    assert field_from_proto == field
+    assert Field.from_proto(Field(name="x", dtype=Float32).to_proto()) == Field(
+        name="x", dtype=Float32
+    )
+
+
+def test_unsupported_vector_quantization():
+    with pytest.raises(ValueError):
+        Field(name="embedding", dtype=Array(Float32), vector_quantization="int4")
@@ -11,20 +11,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import base64
 import json
+import threading
 import time
 from collections import Counter
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 
 from feast.data_source import PushMode
-from feast.errors import PushSourceNotFoundException
-from feast.feature_server import get_app
+from feast.entity import Entity
+from feast.errors import (
+    OnlineWriteQueueFullError,
+    OnlineWriteUnavailableError,
+    PushSourceNotFoundException,
+)
+from feast.feature_server import OnlineWriteBatcher, get_app
+from feast.infra.registry.registry import Registry
+from feast.infra.registry.snapshot import (
+    RegistrySnapshotPublisher,
+    RegistrySnapshotReader,
+)
 from feast.online_response import OnlineResponse
 from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.repo_config import RegistryConfig
 from feast.utils import _utc_now
 from tests.foo_provider import FooProvider
 from tests.utils.cli_repo_creator import CliRunner, get_example_repo
@@ -88,6 +103,55 @@ def test_get_online_features_async_supported(async_online_read, mock_fs_factory)
     assert fs.get_online_features_async.await_count == int(async_online_read)
 
 
+def test_get_online_features_protobuf_response(mock_fs_factory):
+    fs = mock_fs_factory(online_read=False)
+    client = TestClient(get_app(fs))
+
+    response = client.post(
+        "/get-online-features",
+        json=get_online_features_body(),
+        headers={"Accept": "application/x-protobuf"},
+    )
+
+    assert response.headers["content-type"] == "application/x-protobuf"
+    assert GetOnlineFeaturesResponse.FromString(response.content) == (
+        GetOnlineFeaturesResponse(results=[])
+    )
+
+
+def test_retrieve_online_documents_with_query_image(mock_fs_factory):
+    fs = mock_fs_factory()
+    fs.retrieve_online_documents_v2 = MagicMock(
+        return_value=OnlineResponse(GetOnlineFeaturesResponse(results=[]))
+    )
+    client = TestClient(get_app(fs))
+    body = {
+        "features": ["images:embedding"],
+        "top_k": 3,
+        "query_image_bytes": base64.b64encode(b"image").decode(),
+        "query_image_model": "resnet50",
+    }
+
+    with patch(
+        "feast.feature_server.utils._get_feature_views_to_use",
+        return_value=([], []),
+    ):
+        response = client.post(
+            "/retrieve-online-documents", json={**body, "api_version": 2}
+        )
+        assert response.status_code == 200
+        fs.retrieve_online_documents_v2.assert_called_once_with(
+            features=["images:embedding"],
+            query=None,
+            top_k=3,
+            query_image_bytes=b"image",
+            query_image_model="resnet50",
+        )
+
+        with pytest.raises(ValueError, match="api_version 2"):
+            client.post("/retrieve-online-documents", json=body)
+
+
 @pytest.mark.parametrize(
     "online_write,push_mode,async_count",
     [
@@ -164,6 +228,66 @@ def test_push_source_does_not_exist(test_client):
         )
 
 
+def test_push_source_index_is_rebuilt_on_registry_refresh():
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        fvs = store._fvs_for_push_source_or_raise("driver_locations_push", True)
+        assert [fv.name for fv in fvs] == ["pushed_driver_locations"]
+
+        with patch.object(
+            store, "list_feature_views", wraps=store.list_feature_views
+        ) as list_feature_views:
+            assert (
+                store._fvs_for_push_source_or_raise("driver_locations_push", True)
+                is fvs
+            )
+            assert list_feature_views.call_count == 0
+
+            store.refresh_registry()
+            store._fvs_for_push_source_or_raise("driver_locations_push", True)
+            assert list_feature_views.call_count == 1
+
+
+@pytest.mark.parametrize("forked", [False, True])
+def test_health_with_registry_snapshots(forked, tmp_path):
+    registry = Registry(
+        "project",
+        RegistryConfig(path=str(tmp_path / "registry.db"), cache_ttl_seconds=60),
+        None,
+    )
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+    publisher = RegistrySnapshotPublisher(str(tmp_path / "registry.snapshot"))
+    publisher.publish(registry.cached_registry_proto)
+
+    fs = MagicMock()
+    fs.repo_path = str(tmp_path)
+    fs.config.feature_server = None
+    fs.initialize = AsyncMock()
+    fs.close = AsyncMock()
+    # Forked workers hold the registry of the supervisor, and skip its current snapshot.
+    fs.registry = (
+        registry
+        if forked
+        else Registry(
+            "project",
+            RegistryConfig(path=str(tmp_path / "worker.db"), cache_ttl_seconds=60),
+            None,
+        )
+    )
+    reader = RegistrySnapshotReader(
+        publisher.path, loaded_version=publisher.version if forked else 0
+    )
+
+    with TestClient(
+        get_app(fs, registry_ttl_sec=0, registry_snapshot=reader)
+    ) as client:
+        assert client.get("/health").status_code == 200
+    assert fs.registry.list_entities("project", allow_cache=True)[0].name == "driver"
+    fs.refresh_registry.assert_not_called()
+
+
 def test_materialize_endpoint_logic():
     """Test the materialization endpoint logic without HTTP requests"""
     from datetime import datetime
@@ -664,3 +788,193 @@ def load_artifacts(app: FastAPI):
     assert lookup_tables["sentiment_labels"]["LABEL_1"] == "neutral"
     assert lookup_tables["sentiment_labels"]["LABEL_2"] == "positive"
     assert lookup_tables["emoji_sentiment"]["😊"] == "positive"
+
+
+def _online_batcher_store():
+    feature_view = SimpleNamespace(
+        name="driver_locations",
+        entity_columns=[SimpleNamespace(name="driver_id")],
+        batch_source=SimpleNamespace(timestamp_field="event_timestamp"),
+    )
+    return SimpleNamespace(
+        _fvs_for_push_source_or_raise=MagicMock(return_value=[feature_view]),
+        write_to_online_store=MagicMock(),
+    )
+
+
+def _online_batcher(store, durability="written", **cfg):
+    return OnlineWriteBatcher(
+        store=store,
+        cfg=SimpleNamespace(
+            **{
+                "batch_size": 1000,
+                "batch_interval_ms": 20,
+                "max_queued_rows": 1000,
+                "max_concurrent_writes": 2,
+                "durability": durability,
+                **cfg,
+            }
+        ),
+    )
+
+
+def _driver_push(driver_id: int, lat: float, ts: str):
+    return pd.DataFrame(
+        {"driver_id": [driver_id], "driver_lat": [lat], "event_timestamp": [ts]}
+    )
+
+
+async def test_online_batcher_coalesces_pushes_and_keeps_latest_rows():
+    store = _online_batcher_store()
+    batcher = _online_batcher(store)
+    pushes = [
+        _driver_push(1, 1.0, "2025-01-01T00:00:02"),
+        _driver_push(2, 2.0, "2025-01-01T00:00:00"),
+        _driver_push(1, 3.0, "2025-01-01T00:00:01"),
+        _driver_push(2, 4.0, "2025-01-01T00:00:00"),
+    ]
+
+    written = await asyncio.gather(
+        *[batcher.push("driver_locations_push", df, True, True) for df in pushes]
+    )
+    batcher.shutdown()
+
+    assert written == [True] * len(pushes)
+    assert store.write_to_online_store.call_count == 1
+    df = store.write_to_online_store.call_args.args[1]
+    # The latest event of driver 1, and the last push of driver 2 for the same event time.
+    assert sorted(zip(df["driver_id"], df["driver_lat"])) == [(1, 1.0), (2, 4.0)]
+
+
+def test_online_batcher_rejects_pushes_when_full():
+    store = _online_batcher_store()
+    batcher = _online_batcher(
+        store, durability="accepted", batch_interval_ms=60_000, max_queued_rows=2
+    )
+
+    for driver_id in (1, 2):
+        batcher.enqueue(
+            "driver_locations_push",
+            _driver_push(driver_id, 1.0, "2025-01-01"),
+            True,
+            True,
+        )
+    with pytest.raises(OnlineWriteQueueFullError) as e:
+        batcher.enqueue(
+            "driver_locations_push", _driver_push(3, 1.0, "2025-01-01"), True, True
+        )
+    assert e.value.http_status_code() == 429
+
+    batcher.shutdown()
+    assert store.write_to_online_store.call_count == 1
+    with pytest.raises(OnlineWriteUnavailableError):
+        batcher.enqueue(
+            "driver_locations_push", _driver_push(3, 1.0, "2025-01-01"), True, True
+        )
+
+
+def test_online_batcher_retries_accepted_pushes():
+    store = _online_batcher_store()
+    store_is_back = threading.Event()
+
+    def write_to_online_store(*args, **kwargs):
+        if store.write_to_online_store.call_count == 1:
+            raise Exception("store is down")
+        store_is_back.wait(timeout=3.0)
+
+    store.write_to_online_store.side_effect = write_to_online_store
+    batcher = _online_batcher(store, durability="accepted")
+    batcher.RETRY_DELAY_SECONDS = 0.1
+
+    batcher.enqueue(
+        "driver_locations_push", _driver_push(1, 1.0, "2025-01-01"), True, True
+    )
+    # Wait for the retry of the failed write
+    deadline = time.time() + 3.0
+    while time.time() < deadline and store.write_to_online_store.call_count < 2:
+        time.sleep(0.01)
+    with pytest.raises(OnlineWriteUnavailableError) as e:
+        batcher.enqueue(
+            "driver_locations_push", _driver_push(2, 1.0, "2025-01-01"), True, True
+        )
+    assert e.value.http_status_code() == 503
+
+    store_is_back.set()
+    batcher.shutdown()
+    assert store.write_to_online_store.call_count == 2
+    retried = store.write_to_online_store.call_args.args[1]
+    assert retried["driver_id"].tolist() == [1]
+
+
+def test_online_batcher_drops_batches_failing_after_max_retries():
+    store = _online_batcher_store()
+    store.write_to_online_store.side_effect = Exception("schema mismatch")
+    batcher = _online_batcher(store, durability="accepted")
+    batcher.RETRY_DELAY_SECONDS = 0.01
+    batcher.MAX_RETRIES = 2
+
+    batcher.enqueue(
+        "driver_locations_push", _driver_push(1, 1.0, "2025-01-01"), True, True
+    )
+    # The first write and its two retries fail, then the batch is dropped.
+    deadline = time.time() + 3.0
+    while time.time() < deadline and (
+        store.write_to_online_store.call_count < 3 or batcher._failing
+    ):
+        time.sleep(0.01)
+    assert store.write_to_online_store.call_count == 3
+    assert not batcher._failing
+
+    store.write_to_online_store.side_effect = None
+    batcher.enqueue(
+        "driver_locations_push", _driver_push(2, 1.0, "2025-01-01"), True, True
+    )
+    batcher.shutdown()
+    assert store.write_to_online_store.call_count == 4
+    assert store.write_to_online_store.call_args.args[1]["driver_id"].tolist() == [2]
+
+
+def test_online_batcher_ranks_rows_without_timestamp_first():
+    store = _online_batcher_store()
+    batcher = _online_batcher(store)
+    batch = pd.concat(
+        [
+            _driver_push(1, 1.0, "2025-01-01T00:00:01"),
+            _driver_push(1, 2.0, "not a timestamp"),
+        ],
+        ignore_index=True,
+    )
+
+    batcher.enqueue("driver_locations_push", batch, True, True).result(timeout=3.0)
+    batcher.shutdown()
+
+    df = store.write_to_online_store.call_args.args[1]
+    assert df["driver_lat"].tolist() == [1.0]
+
+
+@pytest.mark.parametrize(
+    "durability,expected_status", [("written", 200), ("accepted", 202)]
+)
+def test_push_with_online_batching(durability, expected_status, mock_fs_factory):
+    fs = mock_fs_factory(online_write=True)
+    batcher_store = _online_batcher_store()
+    fs._fvs_for_push_source_or_raise = batcher_store._fvs_for_push_source_or_raise
+    fs.config.feature_server = SimpleNamespace(
+        online_push_batching_enabled=True,
+        online_push_batching_batch_size=1,
+        online_push_batching_batch_interval_ms=10,
+        online_push_batching_max_queued_rows=100,
+        online_push_batching_max_concurrent_writes=1,
+        online_push_batching_durability=durability,
+    )
+
+    client = TestClient(get_app(fs))
+    response = client.post("/push", json=push_body(PushMode.ONLINE))
+    assert response.status_code == expected_status
+
+    assert fs.push.call_count == 0
+    assert fs.push_async.await_count == 0
+    deadline = time.time() + 3.0
+    while time.time() < deadline and fs.write_to_online_store.call_count < 1:
+        time.sleep(0.01)
+    assert fs.write_to_online_store.call_count == 1
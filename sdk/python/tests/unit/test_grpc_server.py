@@ -0,0 +1,142 @@
+import asyncio
+from concurrent import futures
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+import pytest
+
+from feast.infra.contrib.grpc_server import AsyncGrpcFeatureServer, GrpcFeatureServer
+from feast.online_response import OnlineResponse
+from feast.protos.feast.serving.GrpcServer_pb2_grpc import (
+    GrpcFeatureServerStub,
+    add_GrpcFeatureServerServicer_to_server,
+)
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FeatureList,
+    GetOnlineFeaturesRequest,
+    GetOnlineFeaturesResponse,
+    GetOnlineFeaturesResponseMetadata,
+)
+from feast.protos.feast.types.Value_pb2 import RepeatedValue
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from tests.foo_provider import FooProvider
+
+
+def _response(features, entity_rows, full_feature_names):
+    # Echoes the requested driver ids, so that responses can be matched to requests.
+    return OnlineResponse(
+        GetOnlineFeaturesResponse(
+            metadata=GetOnlineFeaturesResponseMetadata(
+                feature_names=FeatureList(val=features)
+            ),
+            results=[
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=entity_rows["driver_id"].val
+                )
+            ],
+        )
+    )
+
+
+def _mock_fs(online_read: bool):
+    fs = MagicMock()
+    fs._get_provider.return_value = FooProvider.with_async_support(
+        online_read=online_read
+    )
+    fs.get_online_features = MagicMock(side_effect=_response)
+
+    async def get_online_features_async(*args):
+        # Finish the requests in reverse order to check that streamed responses keep the request order.
+        await asyncio.sleep(0.01 * (5 - args[1]["driver_id"].val[0].int64_val))
+        return _response(*args)
+
+    fs.get_online_features_async = AsyncMock(side_effect=get_online_features_async)
+    fs.initialize = AsyncMock()
+    fs.close = AsyncMock()
+    return fs
+
+
+def _request(driver_id: int) -> GetOnlineFeaturesRequest:
+    return GetOnlineFeaturesRequest(
+        features=FeatureList(val=["driver_hourly_stats:conv_rate"]),
+        entities={"driver_id": RepeatedValue(val=[ValueProto(int64_val=driver_id)])},
+    )
+
+
+def _driver_ids(responses):
+    return [response.results[0].values[0].int64_val for response in responses]
+
+
+@pytest.mark.parametrize("online_read", [True, False])
+async def test_async_grpc_server(online_read):
+    fs = _mock_fs(online_read)
+    server = grpc.aio.server()
+    servicer = AsyncGrpcFeatureServer(fs, registry_ttl_sec=60, stream_window=2)
+    add_GrpcFeatureServerServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    await servicer.start()
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+            stub = GrpcFeatureServerStub(channel)
+
+            response = await stub.GetOnlineFeatures(_request(1))
+            streamed = [
+                response
+                async for response in stub.GetOnlineFeaturesStream(
+                    iter([_request(i) for i in range(5)])
+                )
+            ]
+    finally:
+        await server.stop(grace=None)
+        await servicer.stop()
+
+    assert _driver_ids([response]) == [1]
+    assert _driver_ids(streamed) == [0, 1, 2, 3, 4]
+    assert fs.get_online_features_async.await_count == (6 if online_read else 0)
+    assert fs.get_online_features.call_count == (0 if online_read else 6)
+    fs.close.assert_awaited_once()
+
+
+def test_grpc_server_stream():
+    fs = _mock_fs(online_read=False)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    servicer = GrpcFeatureServer(fs, registry_ttl_sec=60)
+    add_GrpcFeatureServerServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        with grpc.insecure_channel(f"localhost:{port}") as channel:
+            streamed = list(
+                GrpcFeatureServerStub(channel).GetOnlineFeaturesStream(
+                    iter([_request(i) for i in range(3)])
+                )
+            )
+    finally:
+        servicer._shuting_down = True
+        servicer._active_timer.cancel()
+        server.stop(grace=None)
+
+    assert _driver_ids(streamed) == [0, 1, 2]
+
+
+async def test_async_grpc_server_stream_read_error():
+    servicer = AsyncGrpcFeatureServer(
+        _mock_fs(online_read=True), registry_ttl_sec=60, stream_window=2
+    )
+
+    async def requests():
+        yield _request(1)
+        raise RuntimeError("Client cancelled the stream")
+
+    async def read_stream():
+        return [
+            response
+            async for response in servicer.GetOnlineFeaturesStream(
+                requests(), MagicMock()
+            )
+        ]
+
+    # The error is raised rather than leaving the handler waiting for more requests.
+    with pytest.raises(RuntimeError, match="Client cancelled the stream"):
+        await asyncio.wait_for(read_stream(), timeout=5)
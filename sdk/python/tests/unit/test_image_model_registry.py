@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from feast.image_utils import ImageEmbeddingBatcher, ImageModelRegistry
+
+
+class FakeExtractor:
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.batches = []
+
+    def extract_embedding(self, image_bytes: bytes):
+        if image_bytes == b"invalid":
+            raise ValueError("Failed to extract embedding from image")
+        return [float(len(image_bytes))]
+
+    def batch_extract_embeddings(self, image_bytes_list):
+        self.batches.append(len(image_bytes_list))
+        return [self.extract_embedding(image_bytes) for image_bytes in image_bytes_list]
+
+
+def test_models_are_loaded_once_and_evicted_least_recently_used():
+    loaded = []
+
+    def loader(model_name):
+        loaded.append(model_name)
+        return FakeExtractor(model_name)
+
+    registry = ImageModelRegistry(max_models=2, loader=loader)
+    registry.warm_up(["resnet34", "resnet50"])
+    assert registry.extract_embedding(b"abc", "resnet34") == [3.0]
+    assert loaded == ["resnet34", "resnet50"]
+
+    # resnet50 is the least recently used model.
+    registry.get("vit_base_patch16_224")
+    registry.get("resnet34")
+    assert loaded == ["resnet34", "resnet50", "vit_base_patch16_224"]
+    registry.get("resnet50")
+    assert loaded == ["resnet34", "resnet50", "vit_base_patch16_224", "resnet50"]
+    registry.clear()
+
+
+def test_concurrent_requests_are_embedded_together():
+    extractor = FakeExtractor("resnet34")
+    batcher = ImageEmbeddingBatcher(extractor, max_batch_size=8, batch_interval_ms=200)
+    barrier = threading.Barrier(8)
+
+    def embed(i):
+        barrier.wait()
+        return batcher.extract_embedding(b"x" * i)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        embeddings = list(executor.map(embed, range(1, 9)))
+
+    assert embeddings == [[float(i)] for i in range(1, 9)]
+    assert sum(extractor.batches) == 8
+    assert len(extractor.batches) < 8
+    batcher.close()
+
+
+def test_invalid_images_only_fail_their_own_request():
+    batcher = ImageEmbeddingBatcher(
+        FakeExtractor("resnet34"), max_batch_size=2, batch_interval_ms=200
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        valid = executor.submit(batcher.extract_embedding, b"ab")
+        invalid = executor.submit(batcher.extract_embedding, b"invalid")
+
+        assert valid.result() == [2.0]
+        with pytest.raises(ValueError):
+            invalid.result()
+    batcher.close()
@@ -0,0 +1,104 @@
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from feast import metrics
+from feast.feature_server import get_app
+from tests.unit.test_feature_server import get_online_features_body, push_body
+from tests.utils.cli_repo_creator import CliRunner, get_example_repo
+
+FEATURE_VIEW = "pushed_driver_locations"
+
+
+def _stage_count(operation, stage, online_store="sqlite", feature_view=""):
+    return (
+        REGISTRY.get_sample_value(
+            "feast_serving_stage_duration_seconds_count",
+            {
+                "operation": operation,
+                "stage": stage,
+                "online_store": online_store,
+                "feature_view": feature_view,
+            },
+        )
+        or 0
+    )
+
+
+def _counter(name, operation, feature_view=FEATURE_VIEW):
+    return (
+        REGISTRY.get_sample_value(
+            f"{name}_total",
+            {
+                "operation": operation,
+                "online_store": "sqlite",
+                "feature_view": feature_view,
+            },
+        )
+        or 0
+    )
+
+
+@pytest.fixture
+def client():
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        yield TestClient(get_app(store))
+    metrics.disable()
+
+
+def _snapshot():
+    return {
+        "total": _stage_count("get_online_features", "total"),
+        "registry": _stage_count("get_online_features", "registry", online_store=""),
+        "online_read": _stage_count(
+            "get_online_features", "online_read", feature_view=FEATURE_VIEW
+        ),
+        "convert": _stage_count(
+            "get_online_features", "convert", feature_view=FEATURE_VIEW
+        ),
+        "serialize": _stage_count("get_online_features", "serialize", online_store=""),
+        "push": _stage_count("push", "total"),
+        "online_write": _stage_count("push", "online_write", feature_view=FEATURE_VIEW),
+        "read_rows": _counter("feast_serving_entity_rows", "get_online_features"),
+        "read_values": _counter("feast_serving_feature_values", "get_online_features"),
+        "written_rows": _counter("feast_serving_entity_rows", "push"),
+    }
+
+
+def test_stages_are_recorded_when_enabled(client):
+    metrics.enable()
+    before = _snapshot()
+
+    assert client.post("/push", json=push_body()).status_code == 200
+    assert (
+        client.post("/get-online-features", json=get_online_features_body()).status_code
+        == 200
+    )
+
+    after = _snapshot()
+    increments = {key: after[key] - before[key] for key in before}
+    assert increments == {
+        "total": 1,
+        "registry": 1,
+        "online_read": 1,
+        "convert": 1,
+        "serialize": 1,
+        "push": 1,
+        "online_write": 1,
+        "read_rows": 1,
+        "read_values": 2,
+        "written_rows": 1,
+    }
+
+
+def test_nothing_is_recorded_when_disabled(client):
+    metrics.disable()
+    before = _snapshot()
+
+    client.post("/push", json=push_body())
+    client.post("/get-online-features", json=get_online_features_body())
+
+    assert _snapshot() == before
@@ -0,0 +1,113 @@
+"""Tests for concurrent execution of on demand feature views in online serving."""
+
+import time
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from feast import RequestSource
+from feast.errors import OnDemandFeatureViewTimeoutError
+from feast.field import Field
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FieldStatus,
+    GetOnlineFeaturesResponse,
+)
+from feast.repo_config import OnDemandTransformationConfig
+from feast.type_map import python_values_to_proto_values
+from feast.types import Float64, Int64
+from feast.utils import _augment_response_with_on_demand_transforms
+from feast.value_type import ValueType
+
+request_source = RequestSource(
+    name="counter_source",
+    schema=[Field(name="counter", dtype=Int64)],
+)
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_doubled", dtype=Float64)],
+    mode="pandas",
+)
+def pandas_view(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["counter_doubled"] = inputs["counter"] * 2.0
+    return df
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_plus_one", dtype=Int64)],
+    mode="python",
+)
+def python_view(inputs: dict[str, Any]) -> dict[str, Any]:
+    return {"counter_plus_one": [c + 1 for c in inputs["counter"]]}
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_slow", dtype=Int64)],
+    mode="python",
+)
+def slow_python_view(inputs: dict[str, Any]) -> dict[str, Any]:
+    time.sleep(1)
+    return {"counter_slow": inputs["counter"]}
+
+
+def _response_with_request_data() -> GetOnlineFeaturesResponse:
+    response = GetOnlineFeaturesResponse()
+    response.metadata.feature_names.val.append("counter")
+    values = python_values_to_proto_values([1, 2, 3], ValueType.INT64)
+    response.results.append(
+        GetOnlineFeaturesResponse.FeatureVector(
+            values=values, statuses=[FieldStatus.PRESENT] * len(values)
+        )
+    )
+    return response
+
+
+def _augment(odfvs, feature_refs, config=None) -> dict:
+    response = _response_with_request_data()
+    _augment_response_with_on_demand_transforms(
+        response, feature_refs, odfvs, False, config
+    )
+    return {
+        name: [getattr(v, v.WhichOneof("val")) for v in result.values]
+        for name, result in zip(response.metadata.feature_names.val, response.results)
+    }
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_execution_matches_sequential(executor):
+    odfvs = [pandas_view, python_view]
+    feature_refs = ["pandas_view:counter_doubled", "python_view:counter_plus_one"]
+
+    sequential = _augment(odfvs, feature_refs)
+    concurrent = _augment(
+        odfvs,
+        feature_refs,
+        OnDemandTransformationConfig(executor=executor, max_workers=2),
+    )
+
+    assert sequential == {
+        "counter": [1, 2, 3],
+        "counter_doubled": [2.0, 4.0, 6.0],
+        "counter_plus_one": [2, 3, 4],
+    }
+    assert list(concurrent) == list(sequential)
+    assert concurrent == sequential
+
+
+def test_concurrent_execution_timeout():
+    config = OnDemandTransformationConfig(
+        executor="thread", max_workers=2, timeout_seconds=0.05
+    )
+
+    with pytest.raises(OnDemandFeatureViewTimeoutError, match="slow_python_view"):
+        _augment(
+            [python_view, slow_python_view],
+            ["python_view:counter_plus_one", "slow_python_view:counter_slow"],
+            config,
+        )
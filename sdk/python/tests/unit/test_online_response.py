@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from feast.online_response import OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FeatureList,
+    GetOnlineFeaturesResponse,
+    GetOnlineFeaturesResponseMetadata,
+)
+from feast.protos.feast.types.Value_pb2 import DoubleList, FloatList, Int64List
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.utils import _vector_to_value_proto
+
+
+def _response(values) -> OnlineResponse:
+    return OnlineResponse(
+        GetOnlineFeaturesResponse(
+            metadata=GetOnlineFeaturesResponseMetadata(
+                feature_names=FeatureList(val=["embedding"])
+            ),
+            results=[GetOnlineFeaturesResponse.FeatureVector(values=values)],
+        )
+    )
+
+
+def test_to_numpy_float_lists():
+    embeddings = np.random.default_rng(0).random((3, 200), dtype=np.float32)
+    response = _response(
+        [ValueProto(float_list_val=FloatList(val=e.tolist())) for e in embeddings]
+    )
+
+    matrix = response.to_numpy("embedding")
+
+    assert matrix.dtype == np.float32
+    np.testing.assert_array_equal(matrix, embeddings)
+    assert response.to_numpy("embedding", dtype=np.float64).dtype == np.float64
+
+
+def test_to_numpy_double_and_int_lists():
+    doubles = _response([ValueProto(double_list_val=DoubleList(val=[0.1, 0.2]))])
+    ints = _response([ValueProto(int64_list_val=Int64List(val=[1, 2]))] * 2)
+
+    np.testing.assert_array_equal(doubles.to_numpy("embedding"), [[0.1, 0.2]])
+    assert doubles.to_numpy("embedding").dtype == np.float64
+    np.testing.assert_array_equal(ints.to_numpy("embedding"), [[1, 2], [1, 2]])
+
+
+def test_to_numpy_errors():
+    ragged = _response(
+        [
+            ValueProto(float_list_val=FloatList(val=[1.0])),
+            ValueProto(float_list_val=FloatList(val=[1.0, 2.0])),
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        ragged.to_numpy("embedding")
+    with pytest.raises(ValueError):
+        ragged.to_numpy("missing")
+    assert _response([]).to_numpy("embedding").shape == (0, 0)
+
+
+@pytest.mark.parametrize(
+    "vector, expected",
+    [
+        ("[0.5,1.5]", [0.5, 1.5]),
+        (np.array([0.5, 1.5]), [0.5, 1.5]),
+        ([0.5, 1.5], [0.5, 1.5]),
+    ],
+)
+def test_vectors_are_returned_as_float_lists(vector, expected):
+    assert list(_vector_to_value_proto(vector).float_list_val.val) == expected
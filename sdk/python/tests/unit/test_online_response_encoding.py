@@ -0,0 +1,167 @@
+import importlib
+import json
+import math
+import sys
+
+import pyarrow as pa
+import pytest
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from feast import online_response_encoding, proto_json
+from feast.online_response import OnlineResponse
+from feast.online_response_encoding import (
+    ARROW_STREAM_MEDIA_TYPE,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    PROTOBUF_MEDIA_TYPE,
+    encode_online_response,
+    negotiate_media_type,
+)
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FeatureList,
+    FieldStatus,
+    GetOnlineFeaturesResponse,
+    GetOnlineFeaturesResponseMetadata,
+)
+from feast.protos.feast.types.Value_pb2 import FloatList, StringList
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+
+
+def _response() -> OnlineResponse:
+    timestamp = Timestamp(seconds=1672531200, nanos=500)
+    return OnlineResponse(
+        GetOnlineFeaturesResponse(
+            metadata=GetOnlineFeaturesResponseMetadata(
+                feature_names=FeatureList(
+                    val=["driver_id", "rating", "tags", "photo", "embedding"]
+                )
+            ),
+            results=[
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[ValueProto(int64_val=1001), ValueProto(int64_val=1002)],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.PRESENT],
+                    event_timestamps=[Timestamp(), Timestamp()],
+                ),
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[ValueProto(double_val=4.5), ValueProto()],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.NOT_FOUND],
+                    event_timestamps=[timestamp, timestamp],
+                ),
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[
+                        ValueProto(string_list_val=StringList(val=["a", "b"])),
+                        ValueProto(string_list_val=StringList(val=[])),
+                    ],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.PRESENT],
+                    event_timestamps=[timestamp, timestamp],
+                ),
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[ValueProto(bytes_val=b"\x00\xff"), ValueProto()],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.NULL_VALUE],
+                    event_timestamps=[timestamp, timestamp],
+                ),
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[
+                        ValueProto(float_list_val=FloatList(val=[0.25, 0.5])),
+                        ValueProto(float_list_val=FloatList(val=[1.0, 2.0])),
+                    ],
+                    statuses=[FieldStatus.PRESENT, FieldStatus.PRESENT],
+                    event_timestamps=[timestamp, timestamp],
+                ),
+            ],
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "accept,expected",
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("text/html", JSON_MEDIA_TYPE),
+        ("application/x-protobuf", PROTOBUF_MEDIA_TYPE),
+        ("application/protobuf", PROTOBUF_MEDIA_TYPE),
+        (
+            "application/json;q=0.5, application/vnd.apache.arrow.stream",
+            ARROW_STREAM_MEDIA_TYPE,
+        ),
+        (
+            "application/x-protobuf;q=0, application/vnd.feast.columnar+json",
+            COLUMNAR_JSON_MEDIA_TYPE,
+        ),
+    ],
+)
+def test_negotiate_media_type(accept, expected):
+    assert negotiate_media_type(accept) == expected
+
+
+def test_columnar_json_matches_protobuf_json_mapping():
+    # The default encoding of the feature server uses the patched JSON mapping of Feast protos.
+    proto_json.patch()
+    response = _response()
+
+    encoded = encode_online_response(response, COLUMNAR_JSON_MEDIA_TYPE)
+
+    document = json.loads(encoded)
+    expected = MessageToDict(
+        response.proto, preserving_proto_field_name=True, float_precision=18
+    )
+    # Bytes are base64 encoded, the way the protobuf JSON mapping writes bytes fields.
+    assert document["results"][3]["values"] == ["AP8=", None]
+    document["results"][3]["values"] = expected["results"][3]["values"]
+    assert document == expected
+
+
+def test_protobuf_round_trip():
+    response = _response()
+
+    encoded = encode_online_response(response, PROTOBUF_MEDIA_TYPE)
+
+    assert GetOnlineFeaturesResponse.FromString(encoded) == response.proto
+
+
+def test_arrow_stream():
+    encoded = encode_online_response(_response(), ARROW_STREAM_MEDIA_TYPE)
+
+    table = pa.ipc.open_stream(encoded).read_all()
+    assert table["driver_id"].to_pylist() == [1001, 1002]
+    assert table["rating"].to_pylist() == [4.5, None]
+    assert table["tags"].to_pylist() == [["a", "b"], []]
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_columnar_json_writes_non_finite_floats_as_null(monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    encoding = importlib.reload(online_response_encoding)
+    response = OnlineResponse(
+        GetOnlineFeaturesResponse(
+            metadata=GetOnlineFeaturesResponseMetadata(
+                feature_names=FeatureList(val=["rating", "embedding"])
+            ),
+            results=[
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[ValueProto(double_val=math.nan), ValueProto(double_val=1.5)]
+                ),
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=[
+                        ValueProto(float_list_val=FloatList(val=[math.inf, 0.5])),
+                        ValueProto(float_list_val=FloatList(val=[-math.inf])),
+                    ]
+                ),
+            ],
+        )
+    )
+
+    try:
+        encoded = encoding.encode_online_response(response, COLUMNAR_JSON_MEDIA_TYPE)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(online_response_encoding)
+
+    document = json.loads(encoded, parse_constant=pytest.fail)
+    assert [result["values"] for result in document["results"]] == [
+        [None, 1.5],
+        [[None, 0.5], [None]],
+    ]
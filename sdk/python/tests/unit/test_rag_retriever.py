@@ -269,14 +269,14 @@ def test_retrieve_with_text_search(rag_retriever):
         text_field=rag_retriever.text_field,
     )
 
-    # Mock the vector store's query method
+    # Mock the vector store's query_batch method
     mock_response = MagicMock()
     mock_response.to_dict.return_value = {
         "content": ["doc1 content", "doc2 content"],
         "item_id": [1, 2],
         "Embeddings": [np.random.rand(8).tolist(), np.random.rand(8).tolist()],
     }
-    text_retriever.vector_store.query = Mock(return_value=mock_response)
+    text_retriever.vector_store.query_batch = Mock(return_value=[mock_response])
 
     # Test text search with query string only
     # Create empty question hidden states since we're only doing text search
@@ -293,11 +293,11 @@ def test_retrieve_with_text_search(rag_retriever):
     assert len(doc_dicts[0]["text"]) == 2  # Two documents
     assert len(doc_dicts[0]["id"]) == 2  # Two document IDs
 
-    # Verify that vector_store.query was called with text parameter only
-    text_retriever.vector_store.query.assert_called_once()
-    call_args = text_retriever.vector_store.query.call_args[1]
-    assert call_args["query_vector"] is None  # No vector search
-    assert call_args["query_string"] == "test query"  # Text search was used
+    # Verify that vector_store.query_batch was called with text parameter only
+    text_retriever.vector_store.query_batch.assert_called_once()
+    call_args = text_retriever.vector_store.query_batch.call_args[1]
+    assert call_args["query_vectors"] is None  # No vector search
+    assert call_args["query_strings"] == ["test query"]  # Text search was used
     assert call_args["top_k"] == 2  # Correct number of documents requested
 
 
@@ -324,14 +324,14 @@ def test_retrieve_with_vector_search(rag_retriever):
         1, 8, 8
     )  # (batch_size, seq_len, hidden_dim)
 
-    # Mock the vector store's query method
+    # Mock the vector store's query_batch method
     mock_response = MagicMock()
     mock_response.to_dict.return_value = {
         "content": ["doc1 content", "doc2 content"],
         "item_id": [1, 2],
         "Embeddings": [np.random.rand(8).tolist(), np.random.rand(8).tolist()],
     }
-    vector_retriever.vector_store.query = Mock(return_value=mock_response)
+    vector_retriever.vector_store.query_batch = Mock(return_value=[mock_response])
 
     # Test vector search with hidden states only
     doc_embeds, doc_ids, doc_dicts = vector_retriever.retrieve(
@@ -347,11 +347,11 @@ def test_retrieve_with_vector_search(rag_retriever):
     assert len(doc_dicts[0]["text"]) == 2  # Two documents
     assert len(doc_dicts[0]["id"]) == 2  # Two document IDs
 
-    # Verify that vector_store.query was called with vector parameter only
-    vector_retriever.vector_store.query.assert_called_once()
-    call_args = vector_retriever.vector_store.query.call_args[1]
-    assert call_args["query_vector"] is not None  # Vector search was used
-    assert call_args["query_string"] is None  # No text search
+    # Verify that vector_store.query_batch was called with vector parameter only
+    vector_retriever.vector_store.query_batch.assert_called_once()
+    call_args = vector_retriever.vector_store.query_batch.call_args[1]
+    assert len(call_args["query_vectors"]) == 1  # Vector search was used
+    assert call_args["query_strings"] is None  # No text search
     assert call_args["top_k"] == 2  # Correct number of documents requested
 
 
@@ -362,14 +362,14 @@ def test_retrieve_with_hybrid_search(rag_retriever):
         1, 8, 8
     )  # (batch_size, seq_len, hidden_dim)
 
-    # Mock the vector store's query method
+    # Mock the vector store's query_batch method
     mock_response = MagicMock()
     mock_response.to_dict.return_value = {
         "content": ["doc1 content", "doc2 content"],
         "item_id": [1, 2],
         "Embeddings": [np.random.rand(8).tolist(), np.random.rand(8).tolist()],
     }
-    rag_retriever.vector_store.query = Mock(return_value=mock_response)
+    rag_retriever.vector_store.query_batch = Mock(return_value=[mock_response])
 
     # Test hybrid search with both vector and text query
     doc_embeds, doc_ids, doc_dicts = rag_retriever.retrieve(
@@ -383,11 +383,11 @@ def test_retrieve_with_hybrid_search(rag_retriever):
     assert len(doc_dicts[0]["text"]) == 2  # Two documents
     assert len(doc_dicts[0]["id"]) == 2  # Two document IDs
 
-    # Verify that vector_store.query was called with both vector and text parameters
-    rag_retriever.vector_store.query.assert_called_once()
-    call_args = rag_retriever.vector_store.query.call_args[1]
-    assert call_args["query_vector"] is not None  # Vector search was used
-    assert call_args["query_string"] == "test query"  # Text search was used
+    # Verify that vector_store.query_batch was called with both vector and text parameters
+    rag_retriever.vector_store.query_batch.assert_called_once()
+    call_args = rag_retriever.vector_store.query_batch.call_args[1]
+    assert len(call_args["query_vectors"]) == 1  # Vector search was used
+    assert call_args["query_strings"] == ["test query"]  # Text search was used
     assert call_args["top_k"] == 2  # Correct number of documents requested
 
 
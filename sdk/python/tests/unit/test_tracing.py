@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from feast import tracing
+from tests.unit.test_feature_server import push_body
+from tests.utils.cli_repo_creator import CliRunner, get_example_repo
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+in_memory = pytest.importorskip(
+    "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+)
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "_tracer", provider.get_tracer("feast"))
+    return exporter
+
+
+@pytest.fixture
+def store():
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        yield store
+
+
+FEATURES = [
+    "pushed_driver_locations:driver_lat",
+    "pushed_driver_locations:driver_long",
+]
+
+
+def test_online_read_spans(store, exporter):
+    store.get_online_features(
+        features=FEATURES, entity_rows=[{"driver_id": 123}, {"driver_id": 456}]
+    )
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    store_span = spans["feast.feature_store.get_online_features"]
+    provider_span = spans["feast.provider.get_online_features"]
+    online_store_span = spans["feast.online_store.get_online_features"]
+    read_span = spans["feast.online_store.online_read"]
+
+    assert provider_span.parent.span_id == store_span.context.span_id
+    assert online_store_span.parent.span_id == provider_span.context.span_id
+    assert read_span.parent.span_id == online_store_span.context.span_id
+    assert dict(store_span.attributes) == {
+        "feast.project": store.project,
+        "feast.online_store": "sqlite",
+        "feast.entity_count": 2,
+        "feast.feature_count": 2,
+    }
+    assert dict(read_span.attributes) == {
+        "feast.online_store": "sqlite",
+        "feast.feature_view": "pushed_driver_locations",
+        "feast.entity_count": 2,
+        "feast.feature_count": 2,
+    }
+
+
+def test_errors_are_recorded_on_spans(store, exporter):
+    with pytest.raises(Exception):
+        store.get_online_features(
+            features=["missing_view:feature"], entity_rows=[{"driver_id": 123}]
+        )
+
+    (span,) = [
+        span
+        for span in exporter.get_finished_spans()
+        if span.name == "feast.feature_store.get_online_features"
+    ]
+    assert not span.status.is_ok
+    assert span.events[0].name == "exception"
+
+
+def test_spans_are_noops_without_opentelemetry(store, monkeypatch):
+    monkeypatch.setattr(tracing, "_tracer", None)
+
+    assert not tracing.is_enabled()
+    assert tracing.online_request_attributes(store.config, FEATURES, []) is None
+    store.push("driver_locations_push", _push_df())
+    store.get_online_features(features=FEATURES, entity_rows=[{"driver_id": 123}])
+
+
+def _push_df():
+    df = pd.DataFrame(push_body()["df"])
+    df["event_timestamp"] = pd.to_datetime(df["event_timestamp"])
+    df["created_timestamp"] = pd.to_datetime(df["created_timestamp"])
+    return df
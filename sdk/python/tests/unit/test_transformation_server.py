@@ -0,0 +1,174 @@
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feast import RequestSource
+from feast.errors import OnDemandFeatureViewTimeoutError
+from feast.field import Field
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.protos.feast.serving.TransformationService_pb2 import (
+    TransformFeaturesBatchRequest,
+    TransformFeaturesRequest,
+    ValueType,
+)
+from feast.repo_config import OnDemandTransformationConfig
+from feast.transformation_server import TransformationServer
+from feast.types import Float64, Int64
+
+request_source = RequestSource(
+    name="counter_source",
+    schema=[Field(name="counter", dtype=Int64)],
+)
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_doubled", dtype=Float64)],
+    mode="pandas",
+)
+def counter_doubled(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["counter_doubled"] = inputs["counter"] * 2.0
+    return df
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_total", dtype=Int64)],
+    mode="pandas",
+)
+def counter_total(inputs: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({"counter_total": [inputs["counter"].sum()]})
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_centered", dtype=Float64)],
+    mode="pandas",
+)
+def counter_centered(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["counter_centered"] = inputs["counter"] - inputs["counter"].mean()
+    return df
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="counter_slow", dtype=Int64)],
+    mode="pandas",
+)
+def counter_slow(inputs: pd.DataFrame) -> pd.DataFrame:
+    counter_slow = inputs["counter"].cumsum()
+    time.sleep(0.5)
+    return pd.DataFrame({"counter_slow": counter_slow})
+
+
+def _server(executor: str = "sequential", **config) -> TransformationServer:
+    odfvs = {
+        odfv.name: odfv
+        for odfv in (counter_doubled, counter_total, counter_centered, counter_slow)
+    }
+    store = SimpleNamespace(
+        config=SimpleNamespace(
+            on_demand_transformation_config=OnDemandTransformationConfig(
+                **{"executor": executor, "max_workers": 2, **config}
+            )
+        ),
+        get_on_demand_feature_view=lambda name: odfvs[name],
+    )
+    return TransformationServer(store)  # type: ignore[arg-type]
+
+
+def _batch_request(
+    *requests, odfv_names=("counter_doubled", "counter_total")
+) -> TransformFeaturesBatchRequest:
+    schema = pa.schema([("counter", pa.int64())])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for counters in requests:
+            writer.write_batch(pa.record_batch([pa.array(counters)], schema=schema))
+    return TransformFeaturesBatchRequest(
+        on_demand_feature_view_names=list(odfv_names),
+        transformation_input=ValueType(arrow_value=sink.getvalue().to_pybytes()),
+    )
+
+
+def _read_outputs(response):
+    return [
+        [batch.to_pydict() for batch in pa.ipc.open_stream(output.arrow_value)]
+        for output in response.transformation_outputs
+    ]
+
+
+@pytest.mark.parametrize("executor", ["sequential", "thread"])
+def test_transform_features_batch(executor):
+    response = _server(executor).TransformFeaturesBatch(
+        _batch_request([1, 2], [3], [4, 5, 6]), None
+    )
+
+    doubled, total = _read_outputs(response)
+    assert [batch["counter_doubled__counter_doubled"] for batch in doubled] == [
+        [2.0, 4.0],
+        [6.0],
+        [8.0, 10.0, 12.0],
+    ]
+    # Transformations that aren't row-wise are applied to every request on its own.
+    assert [batch["counter_total__counter_total"] for batch in total] == [
+        [3],
+        [3],
+        [15],
+    ]
+
+
+def test_cross_row_transformations_keeping_the_row_count_see_one_request():
+    response = _server().TransformFeaturesBatch(
+        _batch_request([1, 3], [10, 20, 30], odfv_names=["counter_centered"]), None
+    )
+
+    (centered,) = _read_outputs(response)
+    assert [batch["counter_centered__counter_centered"] for batch in centered] == [
+        [-1.0, 1.0],
+        [-10.0, 0.0, 10.0],
+    ]
+
+
+def test_timeout_bounds_the_whole_batch():
+    server = _server("thread", max_workers=1, timeout_seconds=0.7)
+    request = _batch_request([1], [2], [3], odfv_names=["counter_slow"])
+
+    start = time.monotonic()
+    with pytest.raises(OnDemandFeatureViewTimeoutError):
+        server.TransformFeaturesBatch(request, None)
+    assert time.monotonic() - start < 1.2
+
+
+def test_transform_features_stream():
+    requests = [_batch_request([1]), _batch_request([2, 3])]
+
+    responses = list(_server().TransformFeaturesStream(iter(requests), None))
+
+    assert [
+        _read_outputs(response)[0][0]["counter_doubled__counter_doubled"]
+        for response in responses
+    ] == [[2.0], [4.0, 6.0]]
+
+
+def test_transform_features():
+    sink = pa.BufferOutputStream()
+    table = pa.table({"counter": [1, 2]})
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    response = _server().TransformFeatures(
+        TransformFeaturesRequest(
+            on_demand_feature_view_name="counter_doubled",
+            transformation_input=ValueType(arrow_value=sink.getvalue().to_pybytes()),
+        ),
+        None,
+    )
+
+    output = pa.ipc.open_file(response.transformation_output.arrow_value).read_all()
+    assert output["counter_doubled__counter_doubled"].to_pylist() == [2.0, 4.0]
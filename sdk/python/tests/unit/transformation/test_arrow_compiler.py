@@ -0,0 +1,165 @@
+import pandas as pd
+import pyarrow as pa
+
+from feast import RequestSource
+from feast.field import Field
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.transformation.arrow_compiler import (
+    ArrowComputePlan,
+    compile_pandas_udf,
+    transform_arrow_compiled,
+)
+from feast.types import Bool, Float64, Int64, String
+
+request_source = RequestSource(
+    name="purchase_source",
+    schema=[
+        Field(name="amount", dtype=Int64),
+        Field(name="discount", dtype=Float64),
+        Field(name="category", dtype=String),
+    ],
+)
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[
+        Field(name="net_amount", dtype=Float64),
+        Field(name="is_large", dtype=Bool),
+        Field(name="category_normalized", dtype=String),
+    ],
+    mode="pandas",
+)
+def purchase_features(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["net_amount"] = (inputs["amount"] * (1 - inputs["discount"].fillna(0.0))).round(
+        2
+    )
+    df["is_large"] = inputs["amount"] / 2 > 50
+    df["category_normalized"] = inputs["category"].str.strip().str.lower()
+    return df
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="amount_rank", dtype=Float64)],
+    mode="pandas",
+)
+def amount_rank(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["amount_rank"] = inputs["amount"].rank()
+    return df
+
+
+def _table() -> pa.Table:
+    return pa.table(
+        {
+            "amount": [10, 200, 150],
+            "discount": [0.1, None, 0.25],
+            "category": [" Books", "GAMES ", "toys"],
+        }
+    )
+
+
+def test_compiled_plan_matches_pandas():
+    udf = purchase_features.feature_transformation.udf
+    table = _table()
+    expected = pa.Table.from_pandas(udf(table.to_pandas()))
+
+    plan = compile_pandas_udf(udf, table.column_names)
+
+    assert plan is not None
+    assert list(plan.columns) == ["net_amount", "is_large", "category_normalized"]
+    plan.schema = expected.schema
+    assert plan.execute(table).equals(expected)
+
+
+def test_unsupported_udf_is_not_compiled():
+    udf = amount_rank.feature_transformation.udf
+
+    assert compile_pandas_udf(udf, _table().column_names) is None
+
+
+def test_transform_arrow_compiled_matches_transform_arrow():
+    for odfv in (purchase_features, amount_rank):
+        expected = odfv.transform_arrow(_table())
+        for _ in range(2):
+            # The first call compiles and validates the plan, the second one runs it.
+            assert odfv.transform_arrow(_table(), compile_pandas_udf=True).equals(
+                expected
+            )
+
+
+def test_plans_are_cached_per_input_schema():
+    transformation = purchase_features.feature_transformation
+    table = _table()
+    transform_arrow_compiled(transformation.udf, transformation.udf_string, table)
+
+    casted = table.cast(
+        pa.schema(
+            [
+                ("amount", pa.int32()),
+                ("discount", pa.float64()),
+                ("category", pa.string()),
+            ]
+        )
+    )
+    result = transform_arrow_compiled(
+        transformation.udf, transformation.udf_string, casted
+    )
+
+    assert result.equals(pa.Table.from_pandas(transformation.udf(casted.to_pandas())))
+
+
+def test_compiled_plans_reproduce_pandas_null_semantics():
+    def udf(inputs: pd.DataFrame) -> pd.DataFrame:
+        df = pd.DataFrame()
+        df["big"] = inputs["x"] > 5.0
+        df["not_five"] = inputs["x"] != 5.0
+        df["doubled"] = inputs["x"] * 2
+        return df
+
+    without_nulls = pa.table({"x": [1.0, 7.0]})
+    with_nulls = pa.table({"x": [None, 7.0, 5.0]})
+    # The plan is compiled and validated on a table without nulls, then used on tables with nulls.
+    for table in (without_nulls, without_nulls, with_nulls, with_nulls):
+        result = transform_arrow_compiled(udf, "udf_with_nulls", table)
+        assert result.equals(pa.Table.from_pandas(udf(table.to_pandas())))
+
+    plan = compile_pandas_udf(udf, with_nulls.column_names)
+    assert plan is not None
+    result = plan.execute(with_nulls)
+    assert result["big"].to_pylist() == [False, True, False]
+    assert result["not_five"].to_pylist() == [True, True, False]
+    assert result["doubled"].to_pylist() == [None, 14.0, 10.0]
+
+
+def test_compiled_casts_truncate_like_pandas():
+    def udf(inputs: pd.DataFrame) -> pd.DataFrame:
+        df = pd.DataFrame()
+        df["x_int"] = inputs["x"].astype("int64")
+        return df
+
+    # The plan is validated on whole floats, then used on fractional ones.
+    for values in ([1.0, 2.0], [1.0, 2.0], [1.5, 2.7], [-1.5, 2.7]):
+        table = pa.table({"x": values})
+        result = transform_arrow_compiled(udf, "udf_with_cast", table)
+        assert result.equals(pa.Table.from_pandas(udf(table.to_pandas())))
+
+
+def test_failing_compiled_plans_fall_back_to_pandas(monkeypatch):
+    def udf(inputs: pd.DataFrame) -> pd.DataFrame:
+        df = pd.DataFrame()
+        df["doubled"] = inputs["x"] * 2
+        return df
+
+    table = pa.table({"x": [1.0, 2.0]})
+    transform_arrow_compiled(udf, "udf_with_failing_plan", table)
+
+    def fail(self, pa_table):
+        raise pa.ArrowInvalid("failed")
+
+    monkeypatch.setattr(ArrowComputePlan, "execute", fail)
+    result = transform_arrow_compiled(udf, "udf_with_failing_plan", table)
+
+    assert result["doubled"].to_pylist() == [2.0, 4.0]
@@ -0,0 +1,142 @@
+import copy
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+from feast import RequestSource
+from feast.field import Field
+from feast.on_demand_feature_view import OnDemandFeatureView, on_demand_feature_view
+from feast.transformation.result_cache import TransformationResultCache
+from feast.types import Float64, Int64, String
+
+request_source = RequestSource(
+    name="text_source",
+    schema=[Field(name="text", dtype=String), Field(name="weight", dtype=Int64)],
+)
+
+calls: list[int] = []
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="normalized_text", dtype=String)],
+    mode="python",
+    cacheable=True,
+)
+def normalize_text(inputs: dict[str, Any]) -> dict[str, Any]:
+    calls.append(len(inputs["text"]))
+    return {"normalized_text": [t.strip().lower() for t in inputs["text"]]}
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="weight_doubled", dtype=Float64)],
+    mode="pandas",
+    cacheable=True,
+)
+def double_weight(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["weight_doubled"] = inputs["weight"] * 2.0
+    return df
+
+
+def test_python_mode_only_transforms_unseen_rows():
+    calls.clear()
+    cache = TransformationResultCache(max_entries=10)
+
+    first = cache.transform(
+        normalize_text, {"text": [" A", "b ", " A"], "weight": [1, 2, 1]}
+    )
+    second = cache.transform(normalize_text, {"text": ["b ", "C"], "weight": [2, 3]})
+
+    assert first == {"normalized_text": ["a", "b", "a"]}
+    assert second == {"normalized_text": ["b", "c"]}
+    # Duplicate rows within a request are transformed once, seen rows are not transformed again.
+    assert calls == [2, 1]
+    stats = cache.stats()["normalize_text"]
+    assert (stats.hits, stats.misses) == (1, 4)
+    assert stats.hit_rate == 0.2
+
+
+def test_pandas_mode_with_arrow_inputs():
+    cache = TransformationResultCache()
+    table = pa.table({"text": ["a", "b"], "weight": [1, 2], "unused": [5, 6]})
+
+    assert cache.transform(double_weight, table) == {"weight_doubled": [2.0, 4.0]}
+    assert cache.transform(double_weight, table) == {"weight_doubled": [2.0, 4.0]}
+    assert cache.stats()["double_weight"].hits == 2
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="labeled_text", dtype=String)],
+    mode="python",
+    cacheable=True,
+)
+def label_text(inputs: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "labeled_text": [
+            f"{user_id}:{text}"
+            for user_id, text in zip(inputs.get("user_id", []), inputs["text"])
+        ]
+    }
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="call_count", dtype=Int64)],
+    mode="python",
+    cacheable=True,
+)
+def count_calls(inputs: dict[str, Any]) -> dict[str, Any]:
+    calls.append(1)
+    return {"call_count": [len(calls)]}
+
+
+def test_join_keys_are_part_of_the_cache_key():
+    cache = TransformationResultCache()
+
+    result = cache.transform(
+        label_text, {"user_id": [1, 2], "text": ["a", "a"], "weight": [1, 1]}
+    )
+
+    assert result == {"labeled_text": ["1:a", "2:a"]}
+    assert cache.stats()["label_text"].misses == 2
+
+
+def test_rows_without_inputs_are_not_cached():
+    calls.clear()
+    cache = TransformationResultCache()
+
+    cache.transform(count_calls, {})
+    cache.transform(count_calls, {})
+
+    assert calls == [1, 1]
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded():
+    cache = TransformationResultCache(max_entries=2)
+    cache.transform(normalize_text, {"text": ["a", "b", "c"], "weight": [1, 2, 3]})
+
+    assert len(cache) == 2
+
+
+def test_cache_is_invalidated_when_definition_changes():
+    calls.clear()
+    cache = TransformationResultCache()
+    inputs = {"text": ["a"], "weight": [1]}
+    cache.transform(normalize_text, inputs)
+
+    updated = copy.copy(normalize_text)
+    updated.last_updated_timestamp = datetime(2025, 1, 1)
+    cache.transform(updated, inputs)
+
+    assert calls == [1, 1]
+    assert len(cache) == 1
+
+
+def test_cacheable_survives_proto_round_trip():
+    assert OnDemandFeatureView.from_proto(normalize_text.to_proto()).cacheable
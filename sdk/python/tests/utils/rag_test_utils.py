@@ -130,6 +130,11 @@ class MockVectorStore:
         }
         return mock_response
 
+    def query_batch(self, query_vectors=None, query_strings=None, top_k=5):
+        """Mock query_batch method that returns predefined results for each query."""
+        queries = query_vectors if query_vectors is not None else query_strings
+        return [self.query(top_k=top_k) for _ in queries]
+
     def close(self):
         """Mock close method."""
         if hasattr(self, "client"):
@@ -0,0 +1,551 @@
+"""
+Benchmarks vector retrieval across online stores.
+
+Each backend (an online store and its index configuration) is loaded with the vectors of a dataset and searched
+with its queries through `retrieve_online_documents_v2`, or `retrieve_online_documents` for the stores that do not
+implement it. For each backend, the benchmark reports:
+
+- recall@k: the fraction of the exact top k neighbors, by L2 distance, that the search returns.
+- QPS and the p50 and p99 latencies of sequential searches.
+- The index build time: creating the index and writing all the vectors.
+- The memory of the index: the growth of the resident memory of the process while building it.
+
+All the backends run in-process with embedded or in-memory stores, except pgvector, which is benchmarked when the
+standard libpq environment variables (PGHOST, PGPORT, PGDATABASE, PGUSER, PGPASSWORD) point to a database.
+Backends whose dependencies are missing are reported with their error.
+
+Datasets are either synthetic, with normalized gaussian vectors optionally drawn around clusters, or loaded from
+standard embedding datasets: .fvecs files (SIFT, GIST) or .npy files, whose first vectors are used as queries.
+
+Run it with:
+
+    python -m tests.utils.vector_retrieval_benchmark --num-vectors 10000 --dimension 128
+    python -m tests.utils.vector_retrieval_benchmark --dataset sift_base.fvecs --backend faiss-hnsw
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import click
+import numpy as np
+import psutil
+from tabulate import tabulate
+
+from feast import Entity, FeatureView, Field, FileSource, RepoConfig
+from feast.infra.online_stores.helpers import get_online_store_from_config
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import FloatList
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Array, Float32, Float64, Int64
+from feast.utils import _utc_now
+from feast.value_type import ValueType
+
+VECTOR_FEATURE = "vector"
+
+
+@dataclass
+class VectorDataset:
+    """Vectors to index and queries to search them with, compared by L2 distance."""
+
+    name: str
+    vectors: np.ndarray
+    queries: np.ndarray
+
+    @property
+    def dimension(self) -> int:
+        return self.vectors.shape[1]
+
+    def ground_truth(self, top_k: int) -> np.ndarray:
+        """Returns the ids of the exact top k neighbors of each query."""
+        neighbors = []
+        for query in self.queries:
+            distances = ((self.vectors - query) ** 2).sum(axis=1)
+            neighbors.append(np.argsort(distances, kind="stable")[:top_k])
+        return np.array(neighbors)
+
+
+def synthetic_dataset(
+    num_vectors: int,
+    num_queries: int,
+    dimension: int,
+    clusters: int = 0,
+    seed: int = 0,
+) -> VectorDataset:
+    """
+    Returns a dataset of normalized gaussian vectors.
+
+    With clusters, vectors and queries are drawn around random centroids, like the embeddings of documents on a
+    few topics, which makes approximate indexes miss more neighbors than uniformly spread vectors.
+    """
+    rng = np.random.default_rng(seed)
+
+    def sample(n: int) -> np.ndarray:
+        vectors = rng.standard_normal((n, dimension))
+        if clusters:
+            centroids = rng.standard_normal((clusters, dimension)) * 3
+            vectors += centroids[rng.integers(0, clusters, n)]
+        return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(
+            np.float32
+        )
+
+    name = f"clustered-{clusters}" if clusters else "gaussian"
+    return VectorDataset(
+        name=name, vectors=sample(num_vectors), queries=sample(num_queries)
+    )
+
+
+def load_dataset(
+    path: str, num_queries: int, num_vectors: Optional[int] = None
+) -> VectorDataset:
+    """
+    Loads a standard embedding dataset from a .fvecs or .npy file.
+
+    The first `num_queries` vectors are used as queries and the following `num_vectors` are indexed.
+    """
+    if path.endswith(".fvecs"):
+        raw = np.fromfile(path, dtype=np.int32)
+        dimension = raw[0]
+        vectors = raw.reshape(-1, dimension + 1)[:, 1:].view(np.float32)
+    elif path.endswith(".npy"):
+        vectors = np.load(path, mmap_mode="r")
+    else:
+        raise ValueError(f"Unsupported dataset file {path}, expected .fvecs or .npy")
+
+    end = num_queries + num_vectors if num_vectors else None
+    return VectorDataset(
+        name=os.path.basename(path),
+        vectors=np.asarray(vectors[num_queries:end], dtype=np.float32),
+        queries=np.asarray(vectors[:num_queries], dtype=np.float32),
+    )
+
+
+@dataclass
+class VectorBackend:
+    """
+    An online store configuration to benchmark.
+
+    Attributes:
+        name: The name of the backend.
+        online_store: The online store config. "{path}" in its values is replaced with a temporary directory.
+        vector_per_feature: Whether every dimension is a feature, for stores building their vectors from all the
+            features of a feature view, rather than a single vector feature.
+        vector_quantization: The quantization of the vector field.
+        metric: The distance metric of the searches, as named by the store.
+        documents_v2: Whether to search with `retrieve_online_documents_v2`, or `retrieve_online_documents`.
+        exact: Whether searches compare the query to every vector, so that they return the exact neighbors.
+    """
+
+    name: str
+    online_store: Dict[str, Any]
+    vector_per_feature: bool = False
+    vector_quantization: Optional[str] = None
+    metric: str = "L2"
+    documents_v2: bool = True
+    exact: bool = False
+
+
+def vector_backends() -> List[VectorBackend]:
+    """Returns the backends that can be benchmarked in this environment."""
+    backends = [
+        VectorBackend(
+            name="sqlite-vec",
+            online_store={
+                "type": "sqlite",
+                "path": "{path}/online.db",
+                "vector_enabled": True,
+            },
+            exact=True,
+        ),
+        VectorBackend(
+            name="sqlite-vec-int8",
+            online_store={
+                "type": "sqlite",
+                "path": "{path}/online.db",
+                "vector_enabled": True,
+            },
+            vector_quantization="int8",
+        ),
+        VectorBackend(
+            name="faiss-flat",
+            online_store={"type": "faiss", "index_type": "Flat"},
+            vector_per_feature=True,
+            exact=True,
+        ),
+        VectorBackend(
+            name="faiss-hnsw",
+            online_store={"type": "faiss", "index_type": "HNSW"},
+            vector_per_feature=True,
+        ),
+        VectorBackend(
+            name="faiss-hnsw-int8",
+            online_store={
+                "type": "faiss",
+                "index_type": "HNSW",
+                "quantization": "int8",
+            },
+            vector_per_feature=True,
+        ),
+        VectorBackend(
+            name="faiss-ivfflat",
+            online_store={"type": "faiss", "index_type": "IVFFlat", "nlist": 64},
+            vector_per_feature=True,
+        ),
+        VectorBackend(
+            name="milvus-lite-flat",
+            online_store={
+                "type": "milvus",
+                "path": "{path}/milvus.db",
+                "index_type": "FLAT",
+                "metric_type": "L2",
+            },
+            exact=True,
+        ),
+        VectorBackend(
+            name="milvus-lite-ivf-flat",
+            online_store={
+                "type": "milvus",
+                "path": "{path}/milvus.db",
+                "index_type": "IVF_FLAT",
+                "metric_type": "L2",
+                "nlist": 64,
+            },
+        ),
+        VectorBackend(
+            name="qdrant-memory",
+            online_store={
+                "type": "qdrant",
+                "location": ":memory:",
+                "similarity": "l2",
+            },
+            metric="l2",
+            documents_v2=False,
+        ),
+    ]
+    if os.environ.get("PGHOST"):
+        for index_type in ("hnsw", "ivfflat"):
+            backends.append(
+                VectorBackend(
+                    name=f"pgvector-{index_type}",
+                    online_store={
+                        "type": "postgres",
+                        "host": os.environ["PGHOST"],
+                        "port": int(os.environ.get("PGPORT", 5432)),
+                        "database": os.environ.get("PGDATABASE", "postgres"),
+                        "user": os.environ.get("PGUSER", "postgres"),
+                        "password": os.environ.get("PGPASSWORD", ""),
+                        "vector_enabled": True,
+                        "vector_index_type": index_type,
+                    },
+                )
+            )
+    return backends
+
+
+@dataclass
+class BenchmarkResult:
+    backend: str
+    dataset: str
+    num_vectors: int
+    dimension: int
+    top_k: int
+    recall: Optional[float] = None
+    qps: Optional[float] = None
+    latency_p50_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    build_seconds: Optional[float] = None
+    memory_mb: Optional[float] = None
+    error: Optional[str] = None
+    latencies_ms: List[float] = field(default_factory=list, repr=False)
+
+
+def _repo_config(backend: VectorBackend, dimension: int, repo_path: str) -> RepoConfig:
+    online_store = {
+        key: value.format(path=repo_path) if isinstance(value, str) else value
+        for key, value in backend.online_store.items()
+    }
+    if online_store["type"] == "faiss":
+        online_store.update(
+            dimension=dimension, index_path=os.path.join(repo_path, "index.faiss")
+        )
+    if online_store["type"] == "milvus":
+        online_store["embedding_dim"] = dimension
+    return RepoConfig(
+        provider="local",
+        project="vector_benchmark",
+        registry=os.path.join(repo_path, "registry.db"),
+        entity_key_serialization_version=3,
+        online_store=online_store,
+    )
+
+
+def _feature_view(backend: VectorBackend, dimension: int) -> FeatureView:
+    schema = [Field(name="item_id", dtype=Int64)]
+    if backend.vector_per_feature:
+        schema += [Field(name=f"x{i}", dtype=Float64) for i in range(dimension)]
+    else:
+        schema += [
+            Field(
+                name=VECTOR_FEATURE,
+                dtype=Array(Float32),
+                vector_index=True,
+                vector_length=dimension,
+                vector_search_metric=backend.metric,
+                vector_quantization=backend.vector_quantization,
+            )
+        ]
+    return FeatureView(
+        name="vector_benchmark",
+        entities=[
+            Entity(name="item", join_keys=["item_id"], value_type=ValueType.INT64)
+        ],
+        schema=schema,
+        source=FileSource(name="vector_benchmark_source", path="unused.parquet"),
+        ttl=timedelta(days=1),
+    )
+
+
+def _features(backend: VectorBackend, vector: np.ndarray) -> Dict[str, ValueProto]:
+    if backend.vector_per_feature:
+        return {f"x{i}": ValueProto(double_val=v) for i, v in enumerate(vector)}
+    return {VECTOR_FEATURE: ValueProto(float_list_val=FloatList(val=vector.tolist()))}
+
+
+def _entity_key(item_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["item_id"], entity_values=[ValueProto(int64_val=item_id)]
+    )
+
+
+def _search_function(
+    backend: VectorBackend,
+    online_store: Any,
+    config: RepoConfig,
+    table: FeatureView,
+    top_k: int,
+) -> Callable[[np.ndarray], List[int]]:
+    """Returns a function searching the top k neighbors of a query and returning their ids."""
+    requested_features = [] if backend.vector_per_feature else [VECTOR_FEATURE]
+
+    def search(query: np.ndarray) -> List[int]:
+        if backend.documents_v2:
+            documents = online_store.retrieve_online_documents_v2(
+                config,
+                table,
+                requested_features,
+                query.tolist(),
+                top_k,
+                distance_metric=backend.metric,
+            )
+        else:
+            documents = online_store.retrieve_online_documents(
+                config,
+                table,
+                requested_features,
+                query.tolist(),
+                top_k,
+                distance_metric=backend.metric,
+            )
+        return [
+            document[1].entity_values[0].int64_val
+            for document in documents
+            if document[1] is not None
+        ]
+
+    return search
+
+
+@dataclass
+class VectorIndex:
+    """The index of a backend, loaded with the vectors of a dataset."""
+
+    search: Callable[[np.ndarray], List[int]]
+    build_seconds: float
+    memory_mb: float
+
+
+@contextmanager
+def build_index(
+    backend: VectorBackend,
+    dataset: VectorDataset,
+    top_k: int = 10,
+    write_batch_size: int = 1000,
+) -> Iterator[VectorIndex]:
+    """Creates the index of a backend in a temporary directory, writes the vectors of a dataset, then drops it."""
+    with tempfile.TemporaryDirectory() as repo_path:
+        config = _repo_config(backend, dataset.dimension, repo_path)
+        online_store = get_online_store_from_config(config.online_store)
+        table = _feature_view(backend, dataset.dimension)
+
+        process = psutil.Process()
+        memory_before = process.memory_info().rss
+        build_start = time.perf_counter()
+        online_store.update(config, [], [table], [], [], partial=False)
+        try:
+            timestamp = _utc_now()
+            for start in range(0, len(dataset.vectors), write_batch_size):
+                online_store.online_write_batch(
+                    config,
+                    table,
+                    [
+                        (
+                            _entity_key(start + i),
+                            _features(backend, vector),
+                            timestamp,
+                            None,
+                        )
+                        for i, vector in enumerate(
+                            dataset.vectors[start : start + write_batch_size]
+                        )
+                    ],
+                    None,
+                )
+            yield VectorIndex(
+                search=_search_function(backend, online_store, config, table, top_k),
+                build_seconds=time.perf_counter() - build_start,
+                memory_mb=(process.memory_info().rss - memory_before) / 2**20,
+            )
+        finally:
+            online_store.teardown(config, [table], [])
+
+
+def recall_at_k(ids: Sequence[int], neighbors: Sequence[int], top_k: int) -> float:
+    """Returns the fraction of the exact top k neighbors among the top k ids returned by a search."""
+    return len(set(ids[:top_k]) & set(neighbors)) / top_k
+
+
+def run_benchmark(
+    backend: VectorBackend,
+    dataset: VectorDataset,
+    top_k: int = 10,
+    write_batch_size: int = 1000,
+    ground_truth: Optional[np.ndarray] = None,
+) -> BenchmarkResult:
+    """
+    Builds the index of a backend with the vectors of a dataset and searches it with each query of the dataset.
+
+    Errors are reported in the result, so that a missing dependency only fails its backend.
+    """
+    result = BenchmarkResult(
+        backend=backend.name,
+        dataset=dataset.name,
+        num_vectors=len(dataset.vectors),
+        dimension=dataset.dimension,
+        top_k=top_k,
+    )
+    if ground_truth is None:
+        ground_truth = dataset.ground_truth(top_k)
+
+    recalls = []
+    try:
+        with build_index(backend, dataset, top_k, write_batch_size) as index:
+            result.build_seconds = index.build_seconds
+            result.memory_mb = index.memory_mb
+            # The first search warms up the connections and caches of the store.
+            index.search(dataset.queries[0])
+            for query, neighbors in zip(dataset.queries, ground_truth):
+                query_start = time.perf_counter()
+                ids = index.search(query)
+                result.latencies_ms.append((time.perf_counter() - query_start) * 1000)
+                recalls.append(recall_at_k(ids, neighbors.tolist(), top_k))
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    latencies = np.array(result.latencies_ms)
+    result.recall = float(np.mean(recalls))
+    result.qps = len(latencies) / (latencies.sum() / 1000)
+    result.latency_p50_ms = float(np.percentile(latencies, 50))
+    result.latency_p99_ms = float(np.percentile(latencies, 99))
+    return result
+
+
+def run_benchmarks(
+    backends: Sequence[VectorBackend],
+    dataset: VectorDataset,
+    top_k: int = 10,
+    write_batch_size: int = 1000,
+) -> List[BenchmarkResult]:
+    """Benchmarks several backends on the same dataset, computing its exact neighbors once."""
+    ground_truth = dataset.ground_truth(top_k)
+    return [
+        run_benchmark(backend, dataset, top_k, write_batch_size, ground_truth)
+        for backend in backends
+    ]
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    columns = [
+        "backend",
+        "dataset",
+        "num_vectors",
+        "dimension",
+        "top_k",
+        "recall",
+        "qps",
+        "latency_p50_ms",
+        "latency_p99_ms",
+        "build_seconds",
+        "memory_mb",
+        "error",
+    ]
+    rows = []
+    for result in results:
+        values = asdict(result)
+        rows.append([values[column] for column in columns])
+    return tabulate(rows, headers=columns, floatfmt=".3f")
+
+
+@click.command(name="run")
+@click.option(
+    "--dataset",
+    default=None,
+    help="A .fvecs or .npy embedding dataset. Synthetic vectors are generated if not set.",
+)
+@click.option("--num-vectors", default=10000, show_default=True)
+@click.option("--num-queries", default=100, show_default=True)
+@click.option("--dimension", default=128, show_default=True)
+@click.option(
+    "--clusters",
+    default=0,
+    show_default=True,
+    help="The number of clusters of synthetic vectors, 0 for uniformly spread vectors.",
+)
+@click.option("--top-k", default=10, show_default=True)
+@click.option("--write-batch-size", default=1000, show_default=True)
+@click.option(
+    "--backend",
+    "backend_names",
+    multiple=True,
+    help="The backends to benchmark, all of them if not set.",
+)
+def benchmark_vector_retrieval(
+    dataset: Optional[str],
+    num_vectors: int,
+    num_queries: int,
+    dimension: int,
+    clusters: int,
+    top_k: int,
+    write_batch_size: int,
+    backend_names: Sequence[str],
+):
+    vector_dataset = (
+        load_dataset(dataset, num_queries, num_vectors)
+        if dataset
+        else synthetic_dataset(num_vectors, num_queries, dimension, clusters)
+    )
+    backends = [
+        backend
+        for backend in vector_backends()
+        if not backend_names or backend.name in backend_names
+    ]
+    results = run_benchmarks(backends, vector_dataset, top_k, write_batch_size)
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    benchmark_vector_retrieval()
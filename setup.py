@@ -102,7 +102,7 @@ POSTGRES_C_REQUIRED = [
     "psycopg[c,pool]>=3.0.0,<4",
 ]
 
-OPENTELEMETRY = ["prometheus_client", "psutil"]
+OPENTELEMETRY = ["prometheus_client", "psutil", "opentelemetry-api"]
 
 MYSQL_REQUIRED = ["pymysql", "types-PyMySQL"]
 
@@ -159,7 +159,7 @@ COUCHBASE_REQUIRED = [
 
 MSSQL_REQUIRED = ["ibis-framework[mssql]>=10.0.0"]
 
-FAISS_REQUIRED = ["faiss-cpu>=1.7.0,<=1.10.0"]
+FAISS_REQUIRED = ["faiss-cpu>=1.7.3,<=1.10.0"]
 QDRANT_REQUIRED = ["qdrant-client>=1.12.0"]
 
 GO_REQUIRED = ["cffi>=1.15.0"]
@@ -177,6 +177,8 @@ CLICKHOUSE_REQUIRED = ["clickhouse-connect>=0.7.19"]
 
 MCP_REQUIRED = ["fastapi_mcp"]
 
+HTTP2_REQUIRED = ["httpx[http2]>=0.27.0"]
+
 RAG_REQUIRED = [
     "transformers>=4.36.0",
     "datasets>=3.6.0",
@@ -375,6 +377,7 @@ setup(
         "nlp": NLP_REQUIRED,
         "clickhouse": CLICKHOUSE_REQUIRED,
         "mcp": MCP_REQUIRED,
+        "http2": HTTP2_REQUIRED,
         "rag": RAG_REQUIRED,
         "image": IMAGE_REQUIRED,
         "ray": RAY_REQUIRED,